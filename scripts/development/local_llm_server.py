@@ -0,0 +1,402 @@
+#!/usr/bin/env python3
+"""
+Local LLM Stand-in Server
+OpenAI-compatible stand-in for the Groq API for offline load and latency testing.
+
+Serves /v1/models and /v1/chat/completions (streaming and non-streaming) with
+configurable latency distributions, token-rate streaming, injected 429s and
+timeouts, and canned or templated responses. Evaluation prompts (PoC/PoD/HHFE)
+get a valid HHFE score JSON whose scores are derived from the prompt, so runs
+are reproducible.
+
+Point the Syntheverse services at it:
+    python scripts/development/local_llm_server.py --port 8999 --latency lognormal:-0.5,0.4
+    export GROQ_BASE_URL=http://localhost:8999/v1
+    export GROQ_API_KEY=gsk_local_stand_in_key_for_testing
+"""
+
+import re
+import sys
+import json
+import time
+import uuid
+import random
+import hashlib
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List, Optional
+
+# Prompts containing any of these are answered with HHFE score JSON
+EVALUATION_MARKERS = re.compile(r"HHFE|Hydrogen-Holographic|PoC Reviewer|PoD Reviewer|EVALUATE THIS CONTRIBUTION", re.IGNORECASE)
+
+DEFAULT_MODELS = ["llama-3.1-8b-instant", "llama-3.3-70b-versatile", "local-stand-in"]
+
+DEFAULT_CANNED_RESPONSE = (
+    "Within the Syntheverse Whole Brain AI framework (Gina × Leo × Pru), the retrieved context "
+    "describes hydrogen-holographic fractal coherence across recursive scales. This is a local "
+    "stand-in answer for load testing."
+)
+
+DEFAULT_HHFE_TEMPLATE = """```json
+{{
+    "coherence": {coherence},
+    "density": {density},
+    "redundancy": {redundancy},
+    "metals": {metals},
+    "pod_score": {pod_score},
+    "tier": "{tier}",
+    "epoch": "{epoch}",
+    "tier_justification": "Local stand-in evaluation (deterministic scores from prompt hash).",
+    "redundancy_analysis": "Local stand-in evaluation - no archive comparison performed.",
+    "status": "{status}"
+}}
+```"""
+
+
+def parse_latency(spec: str) -> Callable[[random.Random], float]:
+    """
+    Parse a latency distribution spec into a sampler (seconds).
+
+    Supported specs:
+        fixed:S               constant S seconds
+        uniform:A,B           uniform between A and B
+        normal:MEAN,STD       normal, clipped at 0
+        lognormal:MU,SIGMA    log-normal (heavy tail, like real LLM APIs)
+
+    Args:
+        spec: Distribution spec
+
+    Returns:
+        Function drawing a latency from a random.Random instance
+    """
+    kind, _, params = spec.partition(":")
+    values = [float(v) for v in params.split(",") if v.strip()] if params else []
+    kind = kind.strip().lower()
+
+    if kind == "fixed" and len(values) == 1:
+        return lambda rng: max(0.0, values[0])
+    if kind == "uniform" and len(values) == 2:
+        return lambda rng: rng.uniform(values[0], values[1])
+    if kind == "normal" and len(values) == 2:
+        return lambda rng: max(0.0, rng.gauss(values[0], values[1]))
+    if kind == "lognormal" and len(values) == 2:
+        return lambda rng: rng.lognormvariate(values[0], values[1])
+    raise ValueError(f"Invalid latency spec: {spec!r} (expected fixed:S, uniform:A,B, normal:M,S or lognormal:MU,SIGMA)")
+
+
+def hhfe_scores(prompt: str) -> Dict:
+    """
+    Derive deterministic HHFE scores from a prompt.
+
+    Args:
+        prompt: Full prompt text
+
+    Returns:
+        Template fields (coherence, density, redundancy, pod_score, metals, tier, epoch, status)
+    """
+    seed = int(hashlib.sha256(prompt.encode("utf-8")).hexdigest()[:16], 16)
+    rng = random.Random(seed)
+
+    coherence = rng.randint(4000, 9800)
+    density = rng.randint(4000, 9800)
+    redundancy = rng.randint(0, 4000)
+    pod_score = round(((coherence + density) / 2) * ((10000 - redundancy) / 10000), 2)
+
+    metals = ["gold"] if rng.random() < 0.5 else []
+    if rng.random() < 0.5:
+        metals.append("silver")
+    if rng.random() < 0.3 or not metals:
+        metals.append("copper")
+
+    tier = "gold" if pod_score >= 8000 else "silver" if pod_score >= 6000 else "copper"
+    epoch = "founder" if density >= 8000 else "pioneer" if pod_score >= 6000 else "community"
+
+    return {
+        "coherence": coherence,
+        "density": density,
+        "redundancy": redundancy,
+        "pod_score": pod_score,
+        "metals": json.dumps(metals),
+        "tier": tier,
+        "epoch": epoch,
+        "status": "approved" if pod_score >= 4000 else "rejected",
+    }
+
+
+class StandInConfig:
+    """Behaviour of the stand-in server."""
+
+    def __init__(
+        self,
+        latency: str = "fixed:0.2",
+        tokens_per_second: float = 200.0,
+        rate_limit_probability: float = 0.0,
+        timeout_probability: float = 0.0,
+        timeout_hang: float = 600.0,
+        canned_response: str = DEFAULT_CANNED_RESPONSE,
+        hhfe_template: str = DEFAULT_HHFE_TEMPLATE,
+        models: Optional[List[str]] = None,
+        seed: Optional[int] = None
+    ):
+        """
+        Args:
+            latency: Time-to-first-token distribution spec (see parse_latency)
+            tokens_per_second: Generation rate for streaming and total response time
+            rate_limit_probability: Probability of answering 429 Too Many Requests
+            timeout_probability: Probability of hanging without a response
+            timeout_hang: Seconds a timed-out request hangs before the connection is closed
+            canned_response: Answer for non-evaluation prompts ({query} is filled in)
+            hhfe_template: Answer template for evaluation prompts (fields from hhfe_scores)
+            models: Model ids reported by /v1/models
+            seed: Random seed for latency and fault injection (None for nondeterministic)
+        """
+        self.latency_spec = latency
+        self.sample_latency = parse_latency(latency)
+        self.tokens_per_second = tokens_per_second
+        self.rate_limit_probability = rate_limit_probability
+        self.timeout_probability = timeout_probability
+        self.timeout_hang = timeout_hang
+        self.canned_response = canned_response
+        self.hhfe_template = hhfe_template
+        self.models = models or list(DEFAULT_MODELS)
+        self.rng = random.Random(seed)
+        self.rng_lock = threading.Lock()
+
+        self.stats_lock = threading.Lock()
+        self.stats = {"requests": 0, "completions": 0, "streamed": 0, "rate_limited": 0, "timed_out": 0, "tokens": 0}
+
+    def draw(self) -> Dict:
+        """Draw the fate of one request: injected fault and time to first token."""
+        with self.rng_lock:
+            roll = self.rng.random()
+            ttft = self.sample_latency(self.rng)
+        if roll < self.rate_limit_probability:
+            fault = "rate_limit"
+        elif roll < self.rate_limit_probability + self.timeout_probability:
+            fault = "timeout"
+        else:
+            fault = None
+        return {"fault": fault, "ttft": ttft}
+
+    def count(self, key: str, amount: int = 1):
+        with self.stats_lock:
+            self.stats[key] += amount
+
+    def render_response(self, messages: List[Dict]) -> str:
+        """Render the answer for a chat request."""
+        prompt = "\n".join(str(m.get("content", "")) for m in messages)
+        if EVALUATION_MARKERS.search(prompt):
+            return self.hhfe_template.format(**hhfe_scores(prompt))
+        query = str(messages[-1].get("content", "")) if messages else ""
+        return self.canned_response.replace("{query}", query[:200])
+
+
+def split_tokens(text: str) -> List[str]:
+    """Split text into pseudo-tokens (words with their trailing whitespace)."""
+    return re.findall(r"\S+\s*|\s+", text)
+
+
+def make_handler(config: StandInConfig):
+    """Build the request handler class bound to a config."""
+
+    class StandInHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        server_version = "SyntheverseLocalLLM/1.0"
+
+        def log_message(self, format, *args):
+            # Keep load tests quiet; stats are available at /stats
+            pass
+
+        def _send_json(self, status: int, payload: Dict, headers: Optional[Dict] = None):
+            body = json.dumps(payload).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            for key, value in (headers or {}).items():
+                self.send_header(key, value)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            path = self.path.split("?", 1)[0].rstrip("/")
+            if path in ("/v1/models", "/openai/v1/models"):
+                created = int(time.time())
+                self._send_json(200, {
+                    "object": "list",
+                    "data": [{"id": m, "object": "model", "created": created, "owned_by": "local"} for m in config.models]
+                })
+            elif path == "/health":
+                self._send_json(200, {"status": "healthy", "latency": config.latency_spec})
+            elif path == "/stats":
+                with config.stats_lock:
+                    self._send_json(200, dict(config.stats))
+            else:
+                self._send_json(404, {"error": {"message": f"Unknown path {self.path}", "type": "invalid_request_error"}})
+
+        def do_POST(self):
+            path = self.path.split("?", 1)[0].rstrip("/")
+            if path not in ("/v1/chat/completions", "/openai/v1/chat/completions"):
+                self._send_json(404, {"error": {"message": f"Unknown path {self.path}", "type": "invalid_request_error"}})
+                return
+
+            try:
+                length = int(self.headers.get("Content-Length", 0))
+                request = json.loads(self.rfile.read(length) or b"{}")
+                messages = request["messages"]
+            except (ValueError, KeyError) as e:
+                self._send_json(400, {"error": {"message": f"Invalid request: {e}", "type": "invalid_request_error"}})
+                return
+
+            config.count("requests")
+            fate = config.draw()
+
+            if fate["fault"] == "rate_limit":
+                config.count("rate_limited")
+                self._send_json(429, {
+                    "error": {"message": "Rate limit reached (injected by local stand-in)", "type": "rate_limit_exceeded"}
+                }, headers={"Retry-After": "1"})
+                return
+
+            if fate["fault"] == "timeout":
+                config.count("timed_out")
+                time.sleep(config.timeout_hang)
+                self.close_connection = True
+                return
+
+            content = config.render_response(messages)
+            max_tokens = request.get("max_tokens")
+            tokens = split_tokens(content)
+            if max_tokens:
+                tokens = tokens[:int(max_tokens)]
+            model = request.get("model") or config.models[0]
+            prompt_tokens = sum(len(split_tokens(str(m.get("content", "")))) for m in messages)
+
+            time.sleep(fate["ttft"])
+            if request.get("stream"):
+                self._stream(tokens, model)
+                config.count("streamed")
+            else:
+                if config.tokens_per_second > 0:
+                    time.sleep(len(tokens) / config.tokens_per_second)
+                self._send_json(200, {
+                    "id": f"chatcmpl-{uuid.uuid4().hex[:24]}",
+                    "object": "chat.completion",
+                    "created": int(time.time()),
+                    "model": model,
+                    "choices": [{
+                        "index": 0,
+                        "message": {"role": "assistant", "content": "".join(tokens)},
+                        "finish_reason": "stop"
+                    }],
+                    "usage": {
+                        "prompt_tokens": prompt_tokens,
+                        "completion_tokens": len(tokens),
+                        "total_tokens": prompt_tokens + len(tokens)
+                    }
+                })
+            config.count("completions")
+            config.count("tokens", len(tokens))
+
+        def _stream(self, tokens: List[str], model: str):
+            """Send tokens as server-sent events at the configured token rate."""
+            completion_id = f"chatcmpl-{uuid.uuid4().hex[:24]}"
+            created = int(time.time())
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.send_header("Cache-Control", "no-cache")
+            self.send_header("Connection", "close")
+            self.end_headers()
+            self.close_connection = True
+
+            def _chunk(delta: Dict, finish_reason: Optional[str] = None) -> bytes:
+                payload = {
+                    "id": completion_id,
+                    "object": "chat.completion.chunk",
+                    "created": created,
+                    "model": model,
+                    "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}]
+                }
+                return f"data: {json.dumps(payload)}\n\n".encode("utf-8")
+
+            interval = 1.0 / config.tokens_per_second if config.tokens_per_second > 0 else 0.0
+            try:
+                self.wfile.write(_chunk({"role": "assistant", "content": ""}))
+                for token in tokens:
+                    self.wfile.write(_chunk({"content": token}))
+                    self.wfile.flush()
+                    if interval:
+                        time.sleep(interval)
+                self.wfile.write(_chunk({}, finish_reason="stop"))
+                self.wfile.write(b"data: [DONE]\n\n")
+                self.wfile.flush()
+            except (BrokenPipeError, ConnectionResetError):
+                # Client gave up (e.g. a hedged request that lost)
+                pass
+
+    return StandInHandler
+
+
+def create_server(host: str = "127.0.0.1", port: int = 8999, config: Optional[StandInConfig] = None) -> ThreadingHTTPServer:
+    """
+    Create (but do not start) a stand-in server.
+
+    Args:
+        host: Bind address
+        port: Port (0 picks a free port)
+        config: Server behaviour (defaults to StandInConfig())
+
+    Returns:
+        ThreadingHTTPServer; call serve_forever() or run it in a thread
+    """
+    server = ThreadingHTTPServer((host, port), make_handler(config or StandInConfig()))
+    server.daemon_threads = True
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="OpenAI-compatible local LLM stand-in for load and latency testing")
+    parser.add_argument("--host", default="127.0.0.1", help="Bind address (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8999, help="Port (default: 8999)")
+    parser.add_argument("--latency", default="fixed:0.2",
+                        help="Time-to-first-token distribution: fixed:S, uniform:A,B, normal:M,S or lognormal:MU,SIGMA")
+    parser.add_argument("--tokens-per-second", type=float, default=200.0, help="Generation rate (0 for instant)")
+    parser.add_argument("--rate-limit-probability", type=float, default=0.0, help="Probability of a 429 response")
+    parser.add_argument("--timeout-probability", type=float, default=0.0, help="Probability of hanging without a response")
+    parser.add_argument("--timeout-hang", type=float, default=600.0, help="Seconds a timed-out request hangs")
+    parser.add_argument("--response-file", help="Text file with the canned answer for non-evaluation prompts ({query} is filled in)")
+    parser.add_argument("--hhfe-template-file", help="Template file for evaluation answers (fields: coherence, density, "
+                                                     "redundancy, pod_score, metals, tier, epoch, status)")
+    parser.add_argument("--seed", type=int, help="Random seed for latency and fault injection")
+    args = parser.parse_args()
+
+    try:
+        config = StandInConfig(
+            latency=args.latency,
+            tokens_per_second=args.tokens_per_second,
+            rate_limit_probability=args.rate_limit_probability,
+            timeout_probability=args.timeout_probability,
+            timeout_hang=args.timeout_hang,
+            canned_response=open(args.response_file, encoding="utf-8").read() if args.response_file else DEFAULT_CANNED_RESPONSE,
+            hhfe_template=open(args.hhfe_template_file, encoding="utf-8").read() if args.hhfe_template_file else DEFAULT_HHFE_TEMPLATE,
+            seed=args.seed
+        )
+    except (ValueError, OSError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    server = create_server(args.host, args.port, config)
+    print(f"Local LLM stand-in listening on http://{args.host}:{server.server_address[1]}/v1")
+    print(f"  latency={args.latency} tokens/s={args.tokens_per_second} "
+          f"429={args.rate_limit_probability} timeout={args.timeout_probability}")
+    print(f"  export GROQ_BASE_URL=http://{args.host}:{server.server_address[1]}/v1")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Replay recorded PoC evaluation traffic against the evaluation pipeline.
+
+Submits every record of a trace (recorded with POC_EVALUATION_TRACE=<file>)
+to a fresh PoCServer that answers with the recorded LLM responses instead of
+the Groq API, and reports the non-LLM overhead per stage. State is written to
+a temporary directory, so the real archive is never touched.
+
+Usage:
+    python scripts/development/replay_evaluations.py trace.jsonl
+    python scripts/development/replay_evaluations.py trace.jsonl --pace recorded --limit 50 --json results.json
+"""
+
+import sys
+import json
+import time
+import shutil
+import logging
+import argparse
+import tempfile
+from pathlib import Path
+from typing import Dict, List
+
+project_root = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(project_root / "src" / "core"))
+sys.path.insert(0, str(project_root / "src"))
+
+from layer2.poc_server import PoCServer
+from layer2.evaluation_trace import PACE_FAST, PACE_RECORDED, ReplayResponder, load_trace
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile (0 for an empty list)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = min(len(ordered) - 1, max(0, int(round(pct / 100.0 * (len(ordered) - 1)))))
+    return ordered[rank]
+
+
+def summarize(samples: Dict[str, List[float]]) -> Dict[str, Dict[str, float]]:
+    """Mean/p50/p95/max in milliseconds for each stage."""
+    summary = {}
+    for stage, values in samples.items():
+        if not values:
+            continue
+        summary[stage] = {
+            "mean_ms": sum(values) / len(values) * 1000,
+            "p50_ms": percentile(values, 50) * 1000,
+            "p95_ms": percentile(values, 95) * 1000,
+            "max_ms": max(values) * 1000,
+        }
+    return summary
+
+
+def replay(records: List[Dict], pace: str, work_dir: Path) -> Dict:
+    """
+    Replay trace records through a fresh PoCServer.
+
+    Args:
+        records: Trace records with recorded responses
+        pace: PACE_FAST or PACE_RECORDED
+        work_dir: Directory for the replay archive and tokenomics state
+
+    Returns:
+        Replay report
+    """
+    responder = ReplayResponder(records, pace=pace)
+    server = PoCServer(
+        groq_api_key="replay",
+        output_dir=str(work_dir / "poc_reports"),
+        tokenomics_state_file=str(work_dir / "l2_tokenomics_state.json"),
+        archive_file=str(work_dir / "poc_archive.json"),
+        llm_responder=responder
+    )
+
+    replayed = {"submit": [], "prepare": [], "llm": [], "post": [], "overhead": []}
+    recorded = {"prepare": [], "llm": [], "post": []}
+    failures = []
+
+    wall_start = time.perf_counter()
+    for record in records:
+        # submit_contribution evaluates automatically, as in production
+        responder.expect(record)
+        submit_start = time.perf_counter()
+        submitted = server.submit_contribution(
+            submission_hash=record["submission_hash"],
+            title=record.get("title", ""),
+            contributor=record.get("contributor", "replay"),
+            text_content=record.get("text_content", ""),
+            category=record.get("category")
+        )
+        submit_time = time.perf_counter() - submit_start
+
+        evaluation = submitted.get("evaluation")
+        if not submitted.get("success") or not evaluation:
+            error = submitted.get("error") or submitted.get("evaluation_error", "Evaluation failed")
+            failures.append({"submission_hash": record["submission_hash"], "error": error})
+            continue
+
+        timings = evaluation["timings"]
+        # Time spent in submission outside evaluate_contribution (archive add, recognition)
+        replayed["submit"].append(max(0.0, submit_time - timings["total"]))
+        for stage in ("prepare", "llm", "post"):
+            replayed[stage].append(timings[stage])
+        replayed["overhead"].append(submit_time - timings["llm"])
+        for stage in ("prepare", "llm", "post"):
+            if stage in record.get("timings", {}):
+                recorded[stage].append(record["timings"][stage])
+    wall_time = time.perf_counter() - wall_start
+
+    evaluated = len(replayed["overhead"])
+    return {
+        "pace": pace,
+        "records": len(records),
+        "evaluated": evaluated,
+        "failed": failures,
+        "wall_time_s": wall_time,
+        "throughput_per_s": evaluated / wall_time if wall_time > 0 else 0.0,
+        "prompt_matches": responder.prompt_matches,
+        "prompt_mismatches": responder.prompt_mismatches,
+        "replayed": summarize(replayed),
+        "recorded": summarize(recorded),
+    }
+
+
+def print_report(report: Dict):
+    print(f"\nReplayed {report['evaluated']}/{report['records']} evaluations at {report['pace']} pace "
+          f"in {report['wall_time_s']:.2f}s ({report['throughput_per_s']:.1f}/s)")
+    print(f"Prompts matching the recording: {report['prompt_matches']} "
+          f"(mismatched: {report['prompt_mismatches']})")
+    print(f"\n{'stage':<10} {'mean ms':>10} {'p50 ms':>10} {'p95 ms':>10} {'max ms':>10} {'recorded p50':>14}")
+    for stage, stats in report["replayed"].items():
+        recorded = report["recorded"].get(stage, {}).get("p50_ms")
+        recorded_text = f"{recorded:.1f}" if recorded is not None else "-"
+        print(f"{stage:<10} {stats['mean_ms']:>10.1f} {stats['p50_ms']:>10.1f} {stats['p95_ms']:>10.1f} "
+              f"{stats['max_ms']:>10.1f} {recorded_text:>14}")
+    for failure in report["failed"]:
+        print(f"FAILED {failure['submission_hash'][:16]}...: {failure['error']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay recorded PoC evaluations without the LLM")
+    parser.add_argument("trace", help="JSONL trace recorded with POC_EVALUATION_TRACE")
+    parser.add_argument("--pace", choices=[PACE_FAST, PACE_RECORDED], default=PACE_FAST,
+                        help="fast: answer immediately; recorded: wait the recorded LLM time")
+    parser.add_argument("--limit", type=int, help="Replay only the first N records")
+    parser.add_argument("--work-dir", help="Directory for replay state (default: temporary, removed afterwards)")
+    parser.add_argument("--json", dest="json_output", help="Write the report as JSON to this file")
+    parser.add_argument("--verbose", action="store_true", help="Show pipeline logs")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING)
+
+    records = load_trace(args.trace)
+    if args.limit:
+        records = records[:args.limit]
+    if not records:
+        print(f"No replayable records in {args.trace}", file=sys.stderr)
+        sys.exit(1)
+
+    work_dir = Path(args.work_dir) if args.work_dir else Path(tempfile.mkdtemp(prefix="poc_replay_"))
+    work_dir.mkdir(parents=True, exist_ok=True)
+    try:
+        report = replay(records, args.pace, work_dir)
+    finally:
+        if not args.work_dir:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    print_report(report)
+    if args.json_output:
+        with open(args.json_output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nReport written to {args.json_output}")
+
+
+if __name__ == "__main__":
+    main()
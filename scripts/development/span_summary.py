@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Summarize PoC pipeline spans recorded with SYNTHEVERSE_TRACE_FILE.
+
+Prints count, mean, p50/p95/p99 and max latency per stage (span name),
+e.g. submit.upload, evaluate.redundancy_report, evaluate.llm_call.
+
+Usage:
+    SYNTHEVERSE_TRACING=1 SYNTHEVERSE_TRACE_FILE=spans.jsonl python src/api/poc-api/app.py
+    python scripts/development/span_summary.py spans.jsonl
+    python scripts/development/span_summary.py spans.jsonl --prefix evaluate. --json summary.json
+"""
+
+import sys
+import json
+import argparse
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(project_root / "src" / "core"))
+sys.path.insert(0, str(project_root / "src"))
+
+from core.utils.tracing import summarize_span_file
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Per-stage latency summary of a span file")
+    parser.add_argument("span_file", help="JSON-lines span file written by the tracer")
+    parser.add_argument("--prefix", default="", help="Only show stages starting with this prefix")
+    parser.add_argument("--json", dest="json_output", help="Write the summary as JSON to this file")
+    args = parser.parse_args()
+
+    summary = {
+        name: stats for name, stats in summarize_span_file(args.span_file).items()
+        if name.startswith(args.prefix)
+    }
+    if not summary:
+        print(f"No spans in {args.span_file}", file=sys.stderr)
+        sys.exit(1)
+
+    width = max(len(name) for name in summary)
+    print(f"{'stage':<{width}} {'count':>7} {'mean ms':>10} {'p50 ms':>10} {'p95 ms':>10} {'p99 ms':>10} {'max ms':>10}")
+    for name, stats in summary.items():
+        print(f"{name:<{width}} {stats['count']:>7} {stats['mean_ms']:>10.1f} {stats['p50_ms']:>10.1f} "
+              f"{stats['p95_ms']:>10.1f} {stats['p99_ms']:>10.1f} {stats['max_ms']:>10.1f}")
+
+    if args.json_output:
+        with open(args.json_output, "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=2)
+        print(f"\nSummary written to {args.json_output}")
+
+
+if __name__ == "__main__":
+    main()
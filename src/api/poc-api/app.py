@@ -7,7 +7,7 @@ import os
 import sys
 import logging
 from pathlib import Path
-from flask import Flask, jsonify, request, send_from_directory
+from flask import Flask, Response, g, jsonify, request, send_from_directory, stream_with_context
 from flask_cors import CORS
 from werkzeug.utils import secure_filename
 import hashlib
@@ -26,9 +26,14 @@ base_dir = project_root
 from core.layer2.poc_server import PoCServer
 from core.layer2.poc_archive import ContributionStatus, MetalType
 from core.layer2.tokenomics_state import Epoch
+from core.layer2.progress_bus import iter_progress_sse
+from core.layer2.certificate_cache import CertificateCache, CertificateError, certificate_inputs
 
 # Load GROQ_API_KEY using centralized utility
-from core.utils import load_groq_api_key
+from core.utils import load_groq_api_key, is_admin_token, UploadTooLargeError, finalize_upload, ingest_upload
+from core.utils import get_tracer
+from core.utils.metrics import CONTENT_TYPE as METRICS_CONTENT_TYPE, flask_metrics, render_metrics
+from core.utils.profiling import get_profiler, flask_profiling
 
 # Set up logger
 logger = logging.getLogger(__name__)
@@ -198,6 +203,9 @@ CORS(app)  # Enable CORS for Next.js frontend
 # Disable dotenv loading to avoid permission issues
 app.config['FLASK_SKIP_DOTENV'] = True
 
+# Request latency and in-flight metrics (scraped at /metrics)
+flask_metrics(app, "poc-api")
+
 # Initialize PoC Server
 logger.info("Starting PoC API server initialization...")
 try:
@@ -216,10 +224,12 @@ try:
         groq_api_key=groq_key,
         output_dir=str(base_dir / "test_outputs" / "poc_reports"),
         tokenomics_state_file=str(base_dir / "test_outputs" / "l2_tokenomics_state.json"),
-        archive_file=str(base_dir / "test_outputs" / "poc_archive.json")
+        archive_file=str(base_dir / "test_outputs" / "poc_archive.json"),
+        trace_file=os.getenv("POC_EVALUATION_TRACE")  # Record evaluations for replay benchmarks
     )
     logger.info(f"Archive file path: {base_dir / 'test_outputs' / 'poc_archive.json'}")
     logger.info(f"Archive file exists: {(base_dir / 'test_outputs' / 'poc_archive.json').exists()}")
+    poc_server.register_metrics()
     logger.info("PoC Server initialized successfully")
 except Exception as e:
     logger.warning(f"Failed to initialize PoC Server: {e}")
@@ -238,9 +248,63 @@ if pdf_generator_available:
 else:
     pdf_generator = None
 
+# Rendered certificates are cached by input hash and pre-rendered when a contribution qualifies
+certificate_cache = None
+if pdf_generator and poc_server:
+    try:
+        certificate_cache = CertificateCache(
+            cache_dir=str(base_dir / "test_outputs" / "certificate_cache"),
+            renderer=pdf_generator.generate_certificate_pdf,
+            max_entries=int(os.getenv("POC_CERTIFICATE_CACHE_ENTRIES", "1000"))
+        )
+        poc_server.add_evaluation_listener(certificate_cache.schedule_contribution)
+        logger.info("Certificate cache initialized")
+    except Exception as e:
+        logger.warning(f"Failed to initialize certificate cache: {e}")
+        certificate_cache = None
+
 UPLOAD_FOLDER = 'uploads'
 os.makedirs(UPLOAD_FOLDER, exist_ok=True)
 
+# Uploads are streamed to disk in chunks; oversized requests are refused before the body is read
+try:
+    MAX_UPLOAD_BYTES = int(os.getenv('POC_MAX_UPLOAD_MB', '50')) * 1024 * 1024
+except ValueError:
+    MAX_UPLOAD_BYTES = 50 * 1024 * 1024
+# Allowance for the other form fields sent alongside the PDF
+app.config['MAX_CONTENT_LENGTH'] = MAX_UPLOAD_BYTES + 1024 * 1024
+
+
+# Per-stage latency spans (SYNTHEVERSE_TRACING / SYNTHEVERSE_TRACE_FILE, or /api/admin/tracing)
+tracer = get_tracer()
+
+
+@app.before_request
+def start_request_span():
+    """Open a span per request, named by route so hashes in URLs don't multiply stage names."""
+    if tracer.enabled and request.url_rule is not None:
+        span = tracer.span(f"http {request.method} {request.url_rule.rule}")
+        g.trace_span = span.__enter__()
+
+
+@app.teardown_request
+def end_request_span(exc):
+    span = g.pop('trace_span', None)
+    if span is not None:
+        span.__exit__(type(exc) if exc else None, exc, None)
+
+
+# On-demand profiling (/api/admin/profile, or SIGUSR2 to toggle a 30s sampling session)
+profiler = get_profiler(os.getenv("SYNTHEVERSE_PROFILE_DIR") or str(base_dir / "test_outputs" / "profiles"))
+flask_profiling(app, profiler)
+profiler.install_signal_handler()
+
+
+@app.errorhandler(413)
+def upload_too_large(e):
+    """Return a JSON error for request bodies over MAX_CONTENT_LENGTH."""
+    return jsonify({"error": f"Upload exceeds the {MAX_UPLOAD_BYTES // (1024 * 1024)} MB limit"}), 413
+
 
 @app.route('/api/archive/statistics', methods=['GET'])
 def get_archive_statistics():
@@ -367,7 +431,7 @@ def get_contribution(submission_hash):
             "status": contrib["status"],
             "category": contrib.get("category"),
             "metals": contrib.get("metals", []),
-            "metadata": contrib.get("metadata", {}),
+            "metadata": _with_live_progress(submission_hash, contrib),
             "created_at": contrib.get("created_at"),
             "updated_at": contrib.get("updated_at"),
             "contributor_stats": {
@@ -400,12 +464,59 @@ def get_submission_status(submission_hash):
             "updated_at": contrib.get("updated_at"),
         }
 
+        # Queue position and estimated wait while the evaluation is scheduled
+        queue = poc_server.get_queue_position(submission_hash)
+        if queue:
+            status_data["queue"] = queue
+
+        progress = poc_server.progress_bus.latest(submission_hash)
+        if progress:
+            status_data["progress"] = progress
+
         return jsonify(status_data)
     except Exception as e:
         app.logger.error(f"Error in get_submission_status: {str(e)}")
         return jsonify({"error": str(e)}), 500
 
 
+@app.route('/api/status/<submission_hash>/stream', methods=['GET'])
+def stream_submission_status(submission_hash):
+    """Stream evaluation progress as Server-Sent Events (replaces status polling)."""
+    if not poc_server:
+        return jsonify({"error": "PoC Server not initialized"}), 503
+
+    # Clients choose the submission hash and open the stream before submitting,
+    # so a hash that is not archived yet is treated as pending
+    contrib = poc_server.archive.get_contribution(submission_hash)
+    status = contrib["status"] if contrib else ContributionStatus.PENDING.value
+
+    # EventSource reconnects send Last-Event-ID; ?after= allows resuming manually
+    last_event_id = request.headers.get('Last-Event-ID') or request.args.get('after') or '0'
+    after_seq = int(last_event_id) if last_event_id.isdigit() else 0
+
+    return Response(
+        stream_with_context(iter_progress_sse(poc_server.progress_bus, submission_hash, status, after_seq)),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+
+
+def _with_live_progress(submission_hash, contrib):
+    """Contribution metadata with the latest in-memory progress message while it is being evaluated."""
+    metadata = dict(contrib.get("metadata", {}))
+    progress = poc_server.progress_bus.latest(submission_hash)
+    if progress and not progress["final"]:
+        metadata["evaluation_status"] = progress["stage"]
+        metadata["progress"] = progress["message"]
+    return metadata
+
+
+def _force_requested(params):
+    """Whether a request asks for a forced re-evaluation (force=true)."""
+    value = (params or {}).get('force', False)
+    return value is True or str(value).lower() in ('1', 'true', 'yes')
+
+
 @app.route('/api/submit', methods=['POST'])
 def submit_contribution():
     """Submit a new contribution."""
@@ -413,6 +524,12 @@ def submit_contribution():
         if not poc_server:
             return jsonify({"error": "PoC Server not initialized"}), 503
 
+        if request.content_length and request.content_length > app.config['MAX_CONTENT_LENGTH']:
+            return upload_too_large(None)
+
+        # SHA-256 of the uploaded PDF, reused as the text extraction cache key
+        pdf_sha256 = None
+
         # Handle both JSON and form-data requests
         if request.content_type and 'application/json' in request.content_type:
             # JSON request
@@ -423,6 +540,7 @@ def submit_contribution():
             text_content = data.get('text_content', '')
             pdf_path = data.get('pdf_path')
             category = data.get('category', 'scientific')
+            force = _force_requested(data)
         else:
             # Form-data request (for file uploads)
             submission_hash = request.form.get('submission_hash')
@@ -430,41 +548,49 @@ def submit_contribution():
             contributor = request.form.get('contributor')
             text_content = request.form.get('text_content', '')
             category = request.form.get('category', 'scientific')
+            force = _force_requested(request.form)
 
             # Handle file upload
             pdf_path = None
             # Accept both `pdf` (tests) and `file` (legacy)
             upload = request.files.get('pdf') or request.files.get('file')
             if upload and upload.filename and upload.filename.lower().endswith('.pdf'):
-                # If submission_hash isn't provided, generate one deterministically enough for tracing.
-                # Prefer a stable hash of (title, contributor, file bytes) when possible.
+                # Stream to disk in one pass, hashing (title, contributor, file bytes) on the way
+                # so a missing submission_hash is stable for tracing.
+                try:
+                    with tracer.span("submit.upload") as span:
+                        ingested = ingest_upload(
+                            upload.stream,
+                            UPLOAD_FOLDER,
+                            hash_prefix=(title or "").encode("utf-8") + b"\n" + (contributor or "").encode("utf-8") + b"\n",
+                            max_bytes=MAX_UPLOAD_BYTES
+                        )
+                        span.set_attribute("bytes", ingested.size)
+                except UploadTooLargeError as e:
+                    return jsonify({"error": str(e)}), 413
+
                 if not submission_hash:
-                    file_bytes = upload.read()
-                    upload.stream.seek(0)
-                    submission_hash = hashlib.sha256(
-                        (title or "").encode("utf-8") + b"\n" +
-                        (contributor or "").encode("utf-8") + b"\n" +
-                        file_bytes
-                    ).hexdigest()
-
-                filename = secure_filename(f"{submission_hash}_{upload.filename}")
-                filepath = os.path.join(UPLOAD_FOLDER, filename)
-                upload.save(filepath)
-                pdf_path = filepath
+                    submission_hash = ingested.submission_hash
+
+                finalize_upload(ingested, secure_filename(f"{submission_hash}_{upload.filename}"))
+                pdf_path = ingested.path
+                pdf_sha256 = ingested.content_sha256
 
         # Require core fields; submission_hash is optional (can be generated from PDF)
         if not title or not contributor:
             return jsonify({"error": "Missing required fields"}), 400
 
-        # If submission_hash is still missing (no PDF provided), generate one from content + current time
+        # If submission_hash is still missing (no PDF provided), derive one from the client's
+        # Idempotency-Key so retries map to the same submission, else from the current time
         if not submission_hash:
+            idempotency_key = request.headers.get('Idempotency-Key') or datetime.utcnow().isoformat()
             submission_hash = hashlib.sha256(
-                f"{title}|{contributor}|{datetime.utcnow().isoformat()}".encode("utf-8")
+                f"{title}|{contributor}|{idempotency_key}".encode("utf-8")
             ).hexdigest()
 
         # If we have a PDF but no text content, extract text from PDF
         if pdf_path and not text_content.strip():
-            extracted_text = poc_server._extract_text_from_pdf(pdf_path)
+            extracted_text = poc_server._extract_text_from_pdf(pdf_path, digest=pdf_sha256)
             if extracted_text:
                 text_content = extracted_text
             else:
@@ -488,6 +614,7 @@ def submit_contribution():
             submission_hash.endswith('-123')
         )
 
+        # submit_contribution evaluates once; resubmissions reuse that evaluation unless forced
         result = poc_server.submit_contribution(
             submission_hash=submission_hash,
             title=title,
@@ -495,24 +622,21 @@ def submit_contribution():
             text_content=text_content,
             pdf_path=pdf_path,
             category=category,
-            is_test=is_test_submission
+            is_test=is_test_submission,
+            force=force
         )
+        if not result.get("success"):
+            return jsonify({"error": result.get("error", "Submission failed")}), 400
 
-        # Automatically evaluate the contribution
-        try:
-            eval_result = poc_server.evaluate_contribution(
-                submission_hash=submission_hash,
-                progress_callback=None
-            )
-            final_status = eval_result.get("status", result["status"])
-        except Exception as eval_error:
-            print(f"Auto-evaluation failed for {submission_hash}: {eval_error}")
-            final_status = result["status"]
+        evaluation = result.get("evaluation") or {}
+        if result.get("evaluation_error"):
+            print(f"Auto-evaluation failed for {submission_hash}: {result['evaluation_error']}")
 
         return jsonify({
             "success": True,
             "submission_hash": result["submission_hash"],
-            "status": final_status
+            "status": evaluation.get("status", result["status"]),
+            "reused": evaluation.get("reused", False)
         })
     except Exception as e:
         return jsonify({"error": str(e)}), 500
@@ -524,10 +648,13 @@ def evaluate_contribution(submission_hash):
     try:
         if not poc_server:
             return jsonify({"error": "PoC Server not initialized"}), 503
-        result = poc_server.evaluate_contribution(
-            submission_hash=submission_hash,
-            progress_callback=None
-        )
+        # Admin re-evaluations jump ahead of the regular queue. Concurrent requests share
+        # one evaluation; a finished one is returned unless ?force=true is given.
+        result = poc_server.schedule_evaluation(
+            submission_hash,
+            admin=is_admin_token(request.headers.get('X-Admin-Token')),
+            force=_force_requested(request.args)
+        ).wait()
 
         # Convert MetalType enums to strings for JSON serialization
         def convert_metals(obj):
@@ -547,13 +674,13 @@ def evaluate_contribution(submission_hash):
         return jsonify({"error": str(e), "success": False}), 500
 
 
-@app.route('/api/certificate/<submission_hash>', methods=['POST'])
+@app.route('/api/certificate/<submission_hash>', methods=['GET', 'POST'])
 def generate_certificate(submission_hash):
-    """Generate PoC certificate PDF for a qualified contribution."""
+    """Download the PoC certificate PDF of a qualified contribution (rendered once per evaluation)."""
     try:
         if not poc_server:
             return jsonify({"error": "PoC Server not initialized"}), 503
-        if not pdf_generator_available or not pdf_generator:
+        if not pdf_generator_available or not pdf_generator or not certificate_cache:
             return jsonify({"error": "Certificate generation not available (PDF generator not installed)"}), 503
 
         # Get contribution details
@@ -561,45 +688,18 @@ def generate_certificate(submission_hash):
         if not contribution:
             return jsonify({"error": "Contribution not found"}), 404
 
-        # Check if contribution is qualified
-        if contribution.get('status') != 'qualified':
-            return jsonify({"error": "Contribution is not qualified for certification"}), 400
-
-        # Get evaluation and allocation data
-        evaluation_data = contribution.get('metadata', {})
-        allocations = evaluation_data.get('allocations', [])
-
-        if not allocations:
-            return jsonify({"error": "No allocations found for this contribution"}), 400
-
-        # Use the first allocation (primary metal)
-        allocation = allocations[0]['allocation']
-
-        # Prepare submission data for PDF generation
-        submission_data = {
-            'submission_hash': submission_hash,
-            'title': contribution.get('title', 'Unknown'),
-            'contributor': contribution.get('contributor', 'Unknown'),
-            'category': contribution.get('category', 'general'),
-            'status': contribution.get('status', 'unknown'),
-            'timestamp': contribution.get('created_at', 'Unknown')
-        }
-
-        # Prepare allocation data for PDF generation
-        allocation_data = {
-            'epoch': allocation.get('epoch', 'unknown'),
-            'tier': allocation.get('tier', 'unknown'),
-            'pod_score': evaluation_data.get('pod_score', 0),
-            'reward': allocation.get('reward', 0)
-        }
+        try:
+            submission_data, allocation_data = certificate_inputs(contribution)
+        except CertificateError as e:
+            return jsonify({"error": str(e)}), 400
 
-        # Generate certificate PDF
-        pdf_path = pdf_generator.generate_certificate_pdf(submission_data, allocation_data)
+        # Cached PDF, or wait for its (possibly already queued) render
+        pdf_path = certificate_cache.get(submission_data, allocation_data, timeout=120)
 
         # Return the PDF file
         return send_from_directory(
-            str(Path(pdf_path).parent),
-            Path(pdf_path).name,
+            str(pdf_path.parent),
+            pdf_path.name,
             as_attachment=True,
             download_name=f"poc_certificate_{submission_hash[:8]}.pdf"
         )
@@ -1068,6 +1168,57 @@ def cleanup_test_submissions():
         return jsonify({"success": False, "error": str(e)}), 500
 
 
+@app.route('/metrics', methods=['GET'])
+def metrics():
+    """Prometheus metrics."""
+    return Response(render_metrics(), content_type=METRICS_CONTENT_TYPE)
+
+
+@app.route('/api/admin/tracing', methods=['GET', 'POST'])
+def admin_tracing():
+    """
+    Per-stage latency summary (GET) or switch tracing on/off (POST {"enabled": bool, "reset": bool}).
+
+    Requires the X-Admin-Token header.
+    """
+    if not is_admin_token(request.headers.get('X-Admin-Token')):
+        return jsonify({"error": "Admin token required"}), 403
+
+    if request.method == 'POST':
+        data = request.get_json(silent=True) or {}
+        if data.get('reset'):
+            tracer.reset()
+        if 'enabled' in data:
+            if data['enabled']:
+                tracer.enable()
+            else:
+                tracer.disable()
+    return jsonify(tracer.status())
+
+
+@app.route('/api/admin/profile', methods=['GET', 'POST'])
+def admin_profile():
+    """
+    Profiler status (GET) or start/stop a profiling session (POST).
+
+    POST body: {"action": "start" | "stop", "mode": "sampling" | "cprofile",
+                "seconds": float, "requests": int}
+
+    Requires the X-Admin-Token header.
+    """
+    if not is_admin_token(request.headers.get('X-Admin-Token')):
+        return jsonify({"error": "Admin token required"}), 403
+
+    if request.method == 'GET':
+        return jsonify(profiler.status())
+    try:
+        return jsonify(profiler.command(request.get_json(silent=True) or {}))
+    except RuntimeError as e:
+        return jsonify({"error": str(e)}), 409
+    except (TypeError, ValueError) as e:
+        return jsonify({"error": str(e)}), 400
+
+
 @app.route('/api/admin/clear-memory', methods=['POST'])
 def clear_memory():
     """Completely clear all contributions from memory and archive."""
@@ -1085,10 +1236,13 @@ def clear_memory():
         poc_server.archive.archive["by_metal"] = {
             metal.value: [] for metal in MetalType
         }
+        poc_server.archive.archive["test_submissions"] = []
         poc_server.archive.archive["metadata"]["total_contributions"] = 0
 
         # Save the cleared archive
         poc_server.archive.save_archive()
+        if certificate_cache:
+            certificate_cache.clear()
 
         # Clear tokenomics allocations and reset epoch balances
         poc_server.tokenomics.state["allocation_history"] = []
@@ -1606,10 +1760,13 @@ def register_poc_blockchain():
 
 @app.route('/health', methods=['GET'])
 def health():
-    """Health check endpoint."""
+    """Health check endpoint (includes startup readiness)."""
+    startup = poc_server.get_startup_status() if poc_server else {"ready": False}
     return jsonify({
-        "status": "ok",
+        "status": "ok" if startup["ready"] else "starting",
         "service": "poc-api",
+        "ready": startup["ready"],
+        "startup": startup,
         "timestamp": datetime.utcnow().isoformat() + "Z"
     })
 
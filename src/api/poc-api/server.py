@@ -6,9 +6,10 @@ Connects to PoC Server backend
 import os
 import sys
 from pathlib import Path
-from fastapi import FastAPI, HTTPException, UploadFile, File, Form
+from fastapi import FastAPI, HTTPException, UploadFile, File, Form, Header, Query, Body
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from starlette.concurrency import run_in_threadpool
 from typing import Optional, List
 import uuid
 
@@ -17,6 +18,10 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from layer2.poc_server import PoCServer
 from layer2.poc_archive import ContributionStatus, MetalType
+from layer2.progress_bus import iter_progress_sse
+from core.utils import is_admin_token, get_tracer, get_profiler
+from core.utils.metrics import CONTENT_TYPE as METRICS_CONTENT_TYPE, asgi_metrics_middleware, render_metrics
+from core.utils.profiling import asgi_profiling_middleware
 
 app = FastAPI(title="Syntheverse PoC API", version="1.0.0")
 
@@ -29,14 +34,24 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Request latency and in-flight metrics (scraped at /metrics)
+app.middleware("http")(asgi_metrics_middleware("poc-api"))
+
+# On-demand profiling (/api/admin/profile, or SIGUSR2 to toggle a 30s sampling session)
+profiler = get_profiler(os.getenv("SYNTHEVERSE_PROFILE_DIR") or "test_outputs/profiles")
+app.middleware("http")(asgi_profiling_middleware(profiler))
+profiler.install_signal_handler()
+
 # Initialize PoC Server
 try:
     poc_server = PoCServer(
         groq_api_key=None,  # Uses GROQ_API_KEY env var
         output_dir="test_outputs/poc_reports",
         tokenomics_state_file="test_outputs/l2_tokenomics_state.json",
-        archive_file="test_outputs/poc_archive.json"
+        archive_file="test_outputs/poc_archive.json",
+        trace_file=os.getenv("POC_EVALUATION_TRACE")  # Record evaluations for replay benchmarks
     )
+    poc_server.register_metrics()
     print("✓ PoC Server initialized successfully")
 except Exception as e:
     print(f"⚠️  Warning: Failed to initialize PoC Server: {e}")
@@ -48,6 +63,65 @@ async def root():
     return {"message": "Syntheverse PoC API", "status": "running"}
 
 
+@app.get("/health")
+async def health():
+    """Health check with startup readiness."""
+    startup = poc_server.get_startup_status() if poc_server else {"ready": False}
+    return {"status": "ok" if startup["ready"] else "starting", "ready": startup["ready"], "startup": startup}
+
+
+@app.get("/metrics")
+async def metrics():
+    """Prometheus metrics."""
+    return Response(render_metrics(), media_type=METRICS_CONTENT_TYPE)
+
+
+@app.get("/api/admin/tracing")
+async def get_tracing(x_admin_token: Optional[str] = Header(None)):
+    """Per-stage latency summary of the submission pipeline."""
+    if not is_admin_token(x_admin_token):
+        raise HTTPException(status_code=403, detail="Admin token required")
+    return get_tracer().status()
+
+
+@app.post("/api/admin/tracing")
+async def set_tracing(payload: Optional[dict] = Body(None), x_admin_token: Optional[str] = Header(None)):
+    """Switch tracing on/off ({"enabled": bool}) and optionally reset the summary ({"reset": true})."""
+    if not is_admin_token(x_admin_token):
+        raise HTTPException(status_code=403, detail="Admin token required")
+    tracer = get_tracer()
+    payload = payload or {}
+    if payload.get("reset"):
+        tracer.reset()
+    if "enabled" in payload:
+        if payload["enabled"]:
+            tracer.enable()
+        else:
+            tracer.disable()
+    return tracer.status()
+
+
+@app.get("/api/admin/profile")
+async def get_profile(x_admin_token: Optional[str] = Header(None)):
+    """Profiler status and the files of the last profiling session."""
+    if not is_admin_token(x_admin_token):
+        raise HTTPException(status_code=403, detail="Admin token required")
+    return profiler.status()
+
+
+@app.post("/api/admin/profile")
+async def set_profile(payload: Optional[dict] = Body(None), x_admin_token: Optional[str] = Header(None)):
+    """Start ({"action": "start", "mode", "seconds", "requests"}) or stop ({"action": "stop"}) profiling."""
+    if not is_admin_token(x_admin_token):
+        raise HTTPException(status_code=403, detail="Admin token required")
+    try:
+        return profiler.command(payload or {})
+    except RuntimeError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    except (TypeError, ValueError) as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
 @app.get("/api/archive/statistics")
 async def get_archive_statistics():
     """Get archive statistics."""
@@ -103,6 +177,57 @@ async def get_contribution(submission_hash: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.get("/api/status/{submission_hash}")
+async def get_submission_status(submission_hash: str):
+    """Status, queue position and latest progress event of a submission (polling fallback to the stream)."""
+    if not poc_server:
+        raise HTTPException(status_code=503, detail="PoC Server not initialized")
+    contribution = poc_server.archive.get_contribution(submission_hash)
+    if not contribution:
+        raise HTTPException(status_code=404, detail="Contribution not found")
+
+    status = {
+        "submission_hash": contribution["submission_hash"],
+        "status": contribution["status"],
+        "metals": contribution.get("metals", []),
+        "updated_at": contribution.get("updated_at"),
+    }
+    queue = poc_server.get_queue_position(submission_hash)
+    if queue:
+        status["queue"] = queue
+    progress = poc_server.progress_bus.latest(submission_hash)
+    if progress:
+        status["progress"] = progress
+    return status
+
+
+@app.get("/api/status/{submission_hash}/stream")
+async def stream_submission_status(
+    submission_hash: str,
+    after: int = Query(0, ge=0),
+    last_event_id: Optional[str] = Header(None)
+):
+    """
+    Stream evaluation progress as Server-Sent Events.
+
+    The stream may be opened before the submission is archived (clients choose the
+    submission hash), so progress from the very first stage is delivered.
+    """
+    if not poc_server:
+        raise HTTPException(status_code=503, detail="PoC Server not initialized")
+    contribution = poc_server.archive.get_contribution(submission_hash)
+    status = contribution["status"] if contribution else ContributionStatus.PENDING.value
+
+    # EventSource reconnects send Last-Event-ID
+    after_seq = int(last_event_id) if last_event_id and last_event_id.isdigit() else after
+    # Sync generator: Starlette iterates it in a worker thread, so waiting never blocks the event loop
+    return StreamingResponse(
+        iter_progress_sse(poc_server.progress_bus, submission_hash, status, after_seq),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
 @app.post("/api/submit")
 async def submit_contribution(
     submission_hash: Optional[str] = Form(None),
@@ -110,9 +235,10 @@ async def submit_contribution(
     contributor: str = Form(...),
     category: Optional[str] = Form("scientific"),
     text_content: Optional[str] = Form(None),
-    file: Optional[UploadFile] = File(None)
+    file: Optional[UploadFile] = File(None),
+    force: bool = Form(False)
 ):
-    """Submit a new contribution."""
+    """Submit a new contribution (resubmissions reuse the finished evaluation unless forced)."""
     if not poc_server:
         raise HTTPException(status_code=503, detail="PoC Server not initialized")
     
@@ -129,32 +255,53 @@ async def submit_contribution(
             file_content = await file.read()
             content = f"[File: {file.filename}]\n\n{file_content.decode('utf-8', errors='ignore')}"
         
-        # Submit contribution
-        result = poc_server.submit_contribution(
+        # Submit contribution (evaluates before returning; runs off the event loop)
+        result = await run_in_threadpool(
+            poc_server.submit_contribution,
             submission_hash=submission_hash,
             title=title,
             contributor=contributor,
             text_content=content,
-            category=category
+            category=category,
+            force=force
         )
+        if not result.get("success"):
+            raise HTTPException(status_code=400, detail=result.get("error", "Submission failed"))
         
+        evaluation = result.get("evaluation") or {}
         return {
             "success": True,
             "submission_hash": result["submission_hash"],
-            "status": result["status"]
+            "status": evaluation.get("status", result["status"]),
+            "reused": evaluation.get("reused", False)
         }
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.post("/api/evaluate/{submission_hash}")
-async def evaluate_contribution(submission_hash: str):
-    """Evaluate a contribution."""
+def evaluate_contribution(
+    submission_hash: str,
+    force: bool = Query(False),
+    x_admin_token: Optional[str] = Header(None)
+):
+    """
+    Evaluate a contribution (admin re-evaluations jump ahead of the queue).
+
+    Concurrent requests share one evaluation; a finished one is returned unless force is set.
+    Plain def: FastAPI runs it in a worker thread, so waiting for the evaluation never blocks the event loop.
+    """
     if not poc_server:
         raise HTTPException(status_code=503, detail="PoC Server not initialized")
     
     try:
-        result = poc_server.evaluate_contribution(submission_hash)
+        result = poc_server.schedule_evaluation(
+            submission_hash,
+            admin=is_admin_token(x_admin_token),
+            force=force
+        ).wait()
         return result
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
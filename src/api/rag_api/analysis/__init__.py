@@ -12,6 +12,9 @@ Main Components:
 - EmbeddingValidator: Quality validation
 - SimilarityAnalyzer: Similarity analysis
 - EmbeddingSearch: Proper embedding-based search
+- ExactVectorIndex / IVFVectorIndex / HNSWVectorIndex: Exact and approximate vector indexes
+- EmbeddingStore: Memory-mapped binary embedding corpus
+- SemanticAnswerCache: Answer reuse for semantically equivalent queries
 """
 
 from .embedding_analyzer import EmbeddingAnalyzer
@@ -20,6 +23,12 @@ from .pca_reducer import PCAReducer
 from .embedding_validator import EmbeddingValidator
 from .similarity_analyzer import SimilarityAnalyzer
 from .embedding_search import EmbeddingSearch
+from .vector_index import (
+    VectorIndex, ExactVectorIndex, IVFVectorIndex, HNSWVectorIndex,
+    build_vector_index, load_vector_index
+)
+from .embedding_store import EmbeddingStore, convert_json_to_store, is_embedding_store
+from .semantic_cache import SemanticAnswerCache, normalize_query
 from .utils import load_embeddings_from_dir, extract_embeddings_array, normalize_embeddings
 from .logger import get_logger
 
@@ -30,6 +39,17 @@ __all__ = [
     'EmbeddingValidator',
     'SimilarityAnalyzer',
     'EmbeddingSearch',
+    'VectorIndex',
+    'ExactVectorIndex',
+    'IVFVectorIndex',
+    'HNSWVectorIndex',
+    'build_vector_index',
+    'load_vector_index',
+    'EmbeddingStore',
+    'convert_json_to_store',
+    'is_embedding_store',
+    'SemanticAnswerCache',
+    'normalize_query',
     'load_embeddings_from_dir',
     'extract_embeddings_array',
     'normalize_embeddings',
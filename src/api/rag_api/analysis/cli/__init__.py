@@ -5,6 +5,8 @@ Provides command-line interfaces for:
 - analyze_embeddings.py: Comprehensive embedding analysis
 - visualize_embeddings.py: Generate visualization plots
 - validate_embeddings.py: Run validation checks
+- benchmark_index.py: Vector index recall/latency benchmark
+- convert_embeddings.py: JSON embeddings to/from the binary embedding store
 """
 
 __all__ = []
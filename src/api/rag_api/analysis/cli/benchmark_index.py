@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+CLI tool for benchmarking approximate vector indexes.
+
+Builds an IVF or HNSW index over the embeddings, then measures recall@k
+against brute-force search and per-query latency for a sweep of
+recall/latency settings (IVF n_probe, HNSW ef_search).
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from analysis.vector_index import ExactVectorIndex, IVFVectorIndex, HNSWVectorIndex, hnswlib
+from analysis.utils import load_embeddings_from_dir
+from analysis.logger import setup_analysis_logging
+
+
+def parse_sweep(value: str):
+    return [int(v) for v in value.split(',') if v.strip()]
+
+
+def measure(index, queries: np.ndarray, truth, top_k: int, **search_params):
+    """Recall@k against the exact results and per-query latency (ms)."""
+    latencies = []
+    hits = 0
+    for query, expected in zip(queries, truth):
+        started = time.perf_counter()
+        results = index.search(query, top_k, **search_params)
+        latencies.append((time.perf_counter() - started) * 1000)
+        hits += len(expected & {i for i, _ in results})
+    latencies = np.array(latencies)
+    return {
+        'recall': hits / max(1, sum(len(t) for t in truth)),
+        'mean_ms': float(latencies.mean()),
+        'p50_ms': float(np.percentile(latencies, 50)),
+        'p95_ms': float(np.percentile(latencies, 95)),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark approximate vector index recall and latency against brute force",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # IVF over the corpus embeddings, sweeping n_probe
+  python benchmark_index.py --embeddings-dir ./data/vectorized/embeddings --index ivf --sweep 1,4,8,16,32
+
+  # HNSW (requires hnswlib), sweeping ef_search, saving the index
+  python benchmark_index.py --embeddings-dir ./embeddings --index hnsw --sweep 16,64,256 --save index.npz
+
+  # Synthetic corpus at scale
+  python benchmark_index.py --synthetic 1000000 --dim 384 --index ivf --output-file ivf_1m.json
+        """
+    )
+
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument('--embeddings-dir', help='Directory containing embedding JSON files')
+    source.add_argument('--synthetic', type=int, help='Benchmark on N random clustered vectors instead')
+
+    parser.add_argument('--dim', type=int, default=384, help='Dimension of synthetic vectors (default: 384)')
+    parser.add_argument('--index', choices=['ivf', 'hnsw'], default='ivf', help='Index type (default: ivf)')
+    parser.add_argument('--sweep', type=parse_sweep, default=None,
+                        help='Comma-separated n_probe (ivf) or ef_search (hnsw) values')
+    parser.add_argument('--n-lists', type=int, default=None, help='IVF lists (default: about 4 * sqrt(n))')
+    parser.add_argument('--M', type=int, default=16, help='HNSW graph degree (default: 16)')
+    parser.add_argument('--ef-construction', type=int, default=200, help='HNSW build candidates (default: 200)')
+    parser.add_argument('--queries', type=int, default=200, help='Number of queries (default: 200)')
+    parser.add_argument('--noise', type=float, default=0.05,
+                        help='Gaussian noise added to sampled corpus vectors to form queries (default: 0.05)')
+    parser.add_argument('--top-k', type=int, default=10, help='Results per query (default: 10)')
+    parser.add_argument('--seed', type=int, default=42, help='Random seed (default: 42)')
+    parser.add_argument('--save', help='Save the built index to this file')
+    parser.add_argument('--output-file', help='Write the results as JSON')
+    parser.add_argument('--verbose', action='store_true', help='Enable verbose logging')
+
+    args = parser.parse_args()
+
+    setup_analysis_logging(level='DEBUG' if args.verbose else 'WARNING')
+    rng = np.random.default_rng(args.seed)
+
+    print("=" * 80)
+    print("Vector Index Benchmark")
+    print("=" * 80)
+
+    if args.index == 'hnsw' and hnswlib is None:
+        print("❌ hnswlib is not installed (pip install hnswlib)")
+        return 1
+
+    try:
+        if args.synthetic:
+            centers = rng.normal(0, 1, (max(1, args.synthetic // 1000), args.dim)).astype(np.float32)
+            matrix = centers[rng.integers(0, len(centers), args.synthetic)]
+            matrix += rng.normal(0, 0.5, matrix.shape).astype(np.float32)
+            exact = ExactVectorIndex(matrix, copy=False)
+            print(f"✓ Generated {len(exact)} synthetic vectors of dimension {args.dim}")
+        else:
+            embeddings_data = load_embeddings_from_dir(args.embeddings_dir)
+            if not embeddings_data:
+                print("❌ No embeddings found in the specified directory")
+                return 1
+            exact = ExactVectorIndex.from_chunks(embeddings_data)
+            print(f"✓ Loaded {len(exact)} embeddings of dimension {exact.dim}")
+
+        # Queries: corpus vectors with noise, so each has close but non-identical neighbours
+        sampled = exact.matrix[rng.choice(len(exact), min(args.queries, len(exact)), replace=False)]
+        queries = sampled + rng.normal(0, args.noise, sampled.shape).astype(np.float32)
+
+        started = time.perf_counter()
+        truth = [{i for i, _ in exact.search(query, args.top_k)} for query in queries]
+        exact_result = measure(exact, queries, truth, args.top_k)
+        print(f"✓ Exact search: {exact_result['mean_ms']:.3f} ms/query "
+              f"(ground truth in {time.perf_counter() - started:.1f}s)")
+
+        print(f"\nBuilding {args.index} index...")
+        started = time.perf_counter()
+        if args.index == 'ivf':
+            index = IVFVectorIndex(exact.matrix, exact.ids, n_lists=args.n_lists, seed=args.seed)
+            sweep = args.sweep or [1, 2, 4, 8, 16, 32, 64]
+            sweep_param = 'n_probe'
+        else:
+            index = HNSWVectorIndex(exact.matrix, exact.ids, M=args.M, ef_construction=args.ef_construction)
+            sweep = args.sweep or [16, 32, 64, 128, 256]
+            sweep_param = 'ef_search'
+        build_seconds = time.perf_counter() - started
+        print(f"✓ Built in {build_seconds:.1f}s: {index.stats()}")
+
+        if args.save:
+            index.save(args.save)
+            print(f"✓ Index saved to {args.save}")
+
+        print("\n" + "-" * 80)
+        print(f"{sweep_param:>10} {'recall@' + str(args.top_k):>10} {'mean ms':>10} {'p50 ms':>10} {'p95 ms':>10} {'speedup':>9}")
+        print("-" * 80)
+        rows = []
+        for value in sweep:
+            if args.index == 'ivf':
+                result = measure(index, queries, truth, args.top_k, n_probe=value)
+            else:
+                index.ef_search = value
+                result = measure(index, queries, truth, args.top_k)
+            result[sweep_param] = value
+            result['speedup'] = exact_result['mean_ms'] / max(result['mean_ms'], 1e-9)
+            rows.append(result)
+            print(f"{value:>10} {result['recall']:>10.4f} {result['mean_ms']:>10.3f} "
+                  f"{result['p50_ms']:>10.3f} {result['p95_ms']:>10.3f} {result['speedup']:>8.1f}x")
+        print("=" * 80)
+
+        if args.output_file:
+            output_path = Path(args.output_file)
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            report = {
+                'vectors': len(exact),
+                'dim': exact.dim,
+                'queries': len(queries),
+                'top_k': args.top_k,
+                'index': index.stats(),
+                'build_seconds': build_seconds,
+                'exact': exact_result,
+                'sweep': rows,
+            }
+            with open(output_path, 'w') as f:
+                json.dump(report, f, indent=2)
+            print(f"✓ Results saved to {output_path}")
+
+        return 0
+
+    except Exception as e:
+        print(f"❌ Benchmark failed: {e}")
+        import traceback
+        if args.verbose:
+            traceback.print_exc()
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
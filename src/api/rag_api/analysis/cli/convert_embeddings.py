@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+CLI tool for converting between embedding JSON files and the binary embedding store.
+
+The RAG API maps the store at startup instead of parsing JSON; the JSON
+files remain available as an export for inspection and other tools.
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from analysis.embedding_store import EmbeddingStore, convert_json_to_store, DTYPES
+from analysis.logger import setup_analysis_logging
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Convert embedding JSON files to a memory-mapped embedding store, or export a store to JSON",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Convert the vectorizer's JSON output to a store next to it
+  python convert_embeddings.py --embeddings-dir ./data/vectorized/embeddings --store-dir ./data/vectorized/store
+
+  # Half-precision store (half the size; the index converts to float32 in memory)
+  python convert_embeddings.py --embeddings-dir ./embeddings --store-dir ./store --dtype float16
+
+  # Export a store back to per-PDF JSON files
+  python convert_embeddings.py --store-dir ./data/vectorized/store --export-json ./embeddings_json
+        """
+    )
+
+    parser.add_argument('--store-dir', required=True, help='Embedding store directory')
+    action = parser.add_mutually_exclusive_group(required=True)
+    action.add_argument('--embeddings-dir', help='Directory of embedding JSON files to convert into the store')
+    action.add_argument('--export-json', help='Directory to export the store to as JSON files')
+    parser.add_argument('--dtype', choices=DTYPES, default='float32', help='Embedding dtype on disk (default: float32)')
+    parser.add_argument('--embedding-model', help='Embedding model name to record in the manifest')
+    parser.add_argument('--verbose', action='store_true', help='Enable verbose logging')
+
+    args = parser.parse_args()
+
+    setup_analysis_logging(level='DEBUG' if args.verbose else 'INFO')
+
+    print("=" * 80)
+    print("Embedding Store Conversion")
+    print("=" * 80)
+
+    try:
+        started = time.perf_counter()
+        if args.embeddings_dir:
+            if not Path(args.embeddings_dir).exists():
+                print(f"❌ Embeddings directory not found: {args.embeddings_dir}")
+                return 1
+            store = convert_json_to_store(args.embeddings_dir, args.store_dir, dtype=args.dtype,
+                                          embedding_model=args.embedding_model)
+            if len(store) == 0:
+                print("⚠ No embeddings found in the specified directory")
+            print(f"✓ Wrote {args.store_dir} in {time.perf_counter() - started:.1f}s: {store.stats()}")
+        else:
+            store = EmbeddingStore(args.store_dir)
+            files = store.export_json(args.export_json)
+            print(f"✓ Exported {len(store)} chunks to {files} JSON files in {args.export_json} "
+                  f"({time.perf_counter() - started:.1f}s)")
+        return 0
+
+    except Exception as e:
+        print(f"❌ Conversion failed: {e}")
+        import traceback
+        if args.verbose:
+            traceback.print_exc()
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
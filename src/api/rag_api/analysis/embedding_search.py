@@ -16,6 +16,8 @@ except ImportError:
 
 from .logger import get_logger
 from .utils import extract_embeddings_array, compute_cosine_similarity_batch
+from .vector_index import VectorIndex
+from .semantic_cache import normalize_query
 
 
 class EmbeddingSearch:
@@ -26,7 +28,7 @@ class EmbeddingSearch:
     """
 
     def __init__(self, model_name: str = "all-MiniLM-L6-v2",
-                 device: str = "cpu", logger=None):
+                 device: str = "cpu", logger=None, query_cache=None):
         """
         Initialize embedding search with sentence transformer model.
 
@@ -34,11 +36,17 @@ class EmbeddingSearch:
             model_name: Sentence transformer model name
             device: Device to run model on ('cpu' or 'cuda')
             logger: Optional logger instance
+            query_cache: Optional cache with get(key) / put(key, value) (e.g. core.utils.TTLCache)
+                for query embeddings, keyed by normalized query text
         """
         self.model_name = model_name
         self.device = device
         self.logger = logger or get_logger(__name__)
         self.model = None
+        self.query_cache = query_cache
+        # Optional callable encoding one query as part of a batch of concurrent ones
+        # (e.g. core.utils.MicroBatcher over encode_queries); used for normalized embeddings
+        self.query_batcher = None
 
         if SentenceTransformer is None:
             raise ImportError("sentence-transformers is required for EmbeddingSearch. Install with: pip install sentence-transformers")
@@ -70,53 +78,132 @@ class EmbeddingSearch:
             ValueError: If query is empty or invalid
             RuntimeError: If model is not loaded or generation fails
         """
-        if not query or not isinstance(query, str):
-            raise ValueError("Query must be a non-empty string")
-
-        query = query.strip()
-        if not query:
-            raise ValueError("Query cannot be empty after stripping whitespace")
-
-        if len(query) > 10000:  # Reasonable limit
-            self.logger.warning(f"Query is very long ({len(query)} chars), truncating")
-            query = query[:10000]
-
+        query = self._clean_query(query)
         if self.model is None:
             raise RuntimeError("Sentence transformer model not loaded. Call __init__ first.")
 
+        cache_key = (self.model_name, normalize_query(query), normalize)
+        if self.query_cache is not None:
+            cached = self.query_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
         try:
             self.logger.debug(f"Generating embedding for query: {query[:50]}...")
-
-            # Use model's built-in normalization if requested
-            embedding = self.model.encode(
-                query,
-                convert_to_numpy=True,
-                normalize_embeddings=normalize,
-                show_progress_bar=False  # Disable for cleaner output
-            )
-
-            # Additional validation
-            if not isinstance(embedding, np.ndarray):
-                raise RuntimeError("Model did not return numpy array")
-
-            if embedding.ndim != 1:
-                raise RuntimeError(f"Expected 1D embedding, got {embedding.ndim}D")
-
-            if np.any(~np.isfinite(embedding)):
-                self.logger.warning("Query embedding contains non-finite values")
-                embedding = np.nan_to_num(embedding, nan=0.0, posinf=1.0, neginf=-1.0)
-
+            if normalize and self.query_batcher is not None:
+                embedding = self.query_batcher(query)
+            else:
+                embedding = self.encode_queries([query], normalize=normalize)[0]
             self.logger.debug(f"Query embedding generated, shape: {embedding.shape}")
+            self._cache_embedding(cache_key, embedding)
             return embedding
 
         except Exception as e:
             self.logger.error(f"Failed to generate query embedding: {e}")
             raise RuntimeError(f"Query embedding generation failed: {e}") from e
 
+    def generate_query_embeddings(self, queries: List[str], normalize: bool = True) -> np.ndarray:
+        """
+        Generate embeddings for several queries with one model call.
+
+        Args:
+            queries: Search query texts
+            normalize: Whether to normalize the embeddings
+
+        Returns:
+            Array with one embedding row per query
+
+        Raises:
+            ValueError: If there are no queries or one is empty or invalid
+            RuntimeError: If model is not loaded or generation fails
+        """
+        if not queries:
+            raise ValueError("At least one query is required")
+        cleaned = [self._clean_query(query) for query in queries]
+        if self.model is None:
+            raise RuntimeError("Sentence transformer model not loaded. Call __init__ first.")
+
+        embeddings = [None] * len(cleaned)
+        missing: Dict[tuple, List[int]] = {}  # Cache key -> positions of queries to encode
+        for i, query in enumerate(cleaned):
+            cache_key = (self.model_name, normalize_query(query), normalize)
+            cached = self.query_cache.get(cache_key) if self.query_cache is not None else None
+            if cached is not None:
+                embeddings[i] = cached
+            else:
+                missing.setdefault(cache_key, []).append(i)
+
+        if missing:
+            try:
+                encoded = self.encode_queries([cleaned[positions[0]] for positions in missing.values()], normalize)
+            except Exception as e:
+                self.logger.error(f"Failed to generate query embeddings: {e}")
+                raise RuntimeError(f"Query embedding generation failed: {e}") from e
+            for (cache_key, positions), embedding in zip(missing.items(), encoded):
+                self._cache_embedding(cache_key, embedding)
+                for i in positions:
+                    embeddings[i] = embedding
+        return np.stack(embeddings)
+
+    def encode_queries(self, queries: List[str], normalize: bool = True) -> np.ndarray:
+        """
+        Encode cleaned query texts in a single batch (no caching).
+
+        Args:
+            queries: Query texts
+            normalize: Whether to normalize the embeddings
+
+        Returns:
+            Array with one embedding row per query
+        """
+        # Use model's built-in normalization if requested
+        embeddings = self.model.encode(
+            list(queries),
+            batch_size=max(1, len(queries)),
+            convert_to_numpy=True,
+            normalize_embeddings=normalize,
+            show_progress_bar=False  # Disable for cleaner output
+        )
+
+        # Additional validation
+        if not isinstance(embeddings, np.ndarray):
+            raise RuntimeError("Model did not return numpy array")
+
+        if embeddings.ndim != 2 or len(embeddings) != len(queries):
+            raise RuntimeError(f"Expected {len(queries)} embedding rows, got shape {embeddings.shape}")
+
+        if np.any(~np.isfinite(embeddings)):
+            self.logger.warning("Query embedding contains non-finite values")
+            embeddings = np.nan_to_num(embeddings, nan=0.0, posinf=1.0, neginf=-1.0)
+
+        if len(queries) > 1:
+            self.logger.debug(f"Encoded a batch of {len(queries)} queries")
+        return embeddings
+
+    def _clean_query(self, query: str) -> str:
+        if not query or not isinstance(query, str):
+            raise ValueError("Query must be a non-empty string")
+
+        query = query.strip()
+        if not query:
+            raise ValueError("Query cannot be empty after stripping whitespace")
+
+        if len(query) > 10000:  # Reasonable limit
+            self.logger.warning(f"Query is very long ({len(query)} chars), truncating")
+            query = query[:10000]
+        return query
+
+    def _cache_embedding(self, cache_key: tuple, embedding: np.ndarray):
+        if self.query_cache is not None:
+            # Shared between requests: read-only so no caller can change the cached vector
+            embedding.setflags(write=False)
+            self.query_cache.put(cache_key, embedding)
+
     def search_by_embedding(self, query_embedding: np.ndarray,
                            embeddings_data: List[Dict],
                            top_k: int = 10,
-                           min_score: float = 0.0) -> List[Dict[str, Any]]:
+                           min_score: float = 0.0,
+                           index: Optional[VectorIndex] = None) -> List[Dict[str, Any]]:
         """
         Search embeddings by cosine similarity to query embedding.
 
@@ -125,6 +212,8 @@ class EmbeddingSearch:
             embeddings_data: List of embedding dictionaries to search
             top_k: Number of top results to return
             min_score: Minimum similarity score threshold
+            index: Prebuilt exact or approximate index over embeddings_data
+                (avoids rebuilding the corpus array per query)
 
         Returns:
             List of search results with scores and metadata
@@ -135,21 +224,53 @@ class EmbeddingSearch:
         if len(query_embedding.shape) != 1:
             raise ValueError("Query embedding must be 1D")
 
-        # Extract target embeddings
-        target_embeddings = extract_embeddings_array(embeddings_data)
-
         self.logger.info(f"Searching {len(embeddings_data)} embeddings with top_k={top_k}")
 
-        # Compute similarities
-        similarities = compute_cosine_similarity_batch(query_embedding, target_embeddings)
+        if index is not None:
+            hits = index.search(query_embedding, top_k)
+        else:
+            # Extract target embeddings
+            target_embeddings = extract_embeddings_array(embeddings_data)
 
-        # Get top k results
-        top_indices = np.argsort(similarities)[::-1][:top_k]
+            # Compute similarities
+            similarities = compute_cosine_similarity_batch(query_embedding, target_embeddings)
 
-        results = []
-        for rank, idx in enumerate(top_indices, 1):
-            score = float(similarities[idx])
+            # Get top k results
+            top_indices = np.argsort(similarities)[::-1][:top_k]
+            hits = [(int(idx), float(similarities[idx])) for idx in top_indices]
+
+        results = self._hit_results(hits, embeddings_data, min_score)
+        self.logger.info(f"Found {len(results)} results above threshold {min_score}")
+        return results
+
+    def search_by_embeddings(self, query_embeddings: np.ndarray,
+                             embeddings_data: List[Dict],
+                             index: VectorIndex,
+                             top_k: int = 10,
+                             min_score: float = 0.0) -> List[List[Dict[str, Any]]]:
+        """
+        Search for several query embeddings at once (one matrix-matrix product on exact indexes).
 
+        Args:
+            query_embeddings: Query embeddings, one row per query
+            embeddings_data: List of embedding dictionaries to search
+            index: Prebuilt index over embeddings_data
+            top_k: Number of top results per query
+            min_score: Minimum similarity score threshold
+
+        Returns:
+            One list of search results per query
+        """
+        if not embeddings_data:
+            return [[] for _ in query_embeddings]
+        self.logger.info(f"Searching {len(embeddings_data)} embeddings for {len(query_embeddings)} queries")
+        return [self._hit_results(hits, embeddings_data, min_score)
+                for hits in index.search_batch(query_embeddings, top_k)]
+
+    def _hit_results(self, hits: List[Tuple[int, float]], embeddings_data: List[Dict],
+                     min_score: float) -> List[Dict[str, Any]]:
+        results = []
+        for rank, (idx, score) in enumerate(hits, 1):
             # Apply minimum score filter
             if score < min_score:
                 continue
@@ -165,12 +286,11 @@ class EmbeddingSearch:
                 'chunk_index': chunk.get('chunk_index', 0)
             }
             results.append(result)
-
-        self.logger.info(f"Found {len(results)} results above threshold {min_score}")
         return results
 
     def search_by_text(self, query: str, embeddings_data: List[Dict],
-                      top_k: int = 10, min_score: float = 0.0) -> List[Dict[str, Any]]:
+                      top_k: int = 10, min_score: float = 0.0,
+                      index: Optional[VectorIndex] = None) -> List[Dict[str, Any]]:
         """
         Search embeddings by text query (convenience method).
 
@@ -179,12 +299,31 @@ class EmbeddingSearch:
             embeddings_data: List of embedding dictionaries to search
             top_k: Number of top results to return
             min_score: Minimum similarity score threshold
+            index: Prebuilt index over embeddings_data
 
         Returns:
             List of search results
         """
         query_embedding = self.generate_query_embedding(query)
-        return self.search_by_embedding(query_embedding, embeddings_data, top_k, min_score)
+        return self.search_by_embedding(query_embedding, embeddings_data, top_k, min_score, index=index)
+
+    def search_by_texts(self, queries: List[str], embeddings_data: List[Dict], index: VectorIndex,
+                        top_k: int = 10, min_score: float = 0.0) -> List[List[Dict[str, Any]]]:
+        """
+        Search for several text queries with one encoding batch and one index pass.
+
+        Args:
+            queries: Text queries
+            embeddings_data: List of embedding dictionaries to search
+            index: Prebuilt index over embeddings_data
+            top_k: Number of top results per query
+            min_score: Minimum similarity score threshold
+
+        Returns:
+            One list of search results per query
+        """
+        query_embeddings = self.generate_query_embeddings(queries)
+        return self.search_by_embeddings(query_embeddings, embeddings_data, index, top_k, min_score)
 
     def search_by_multiple_queries(self, queries: List[str],
                                  embeddings_data: List[Dict],
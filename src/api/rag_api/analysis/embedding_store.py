@@ -0,0 +1,404 @@
+"""
+Embedding Store - Binary corpus format with memory-mapped loading.
+
+A store is a directory:
+
+    manifest.json           format version, dtype, dimension, counts, PDF names
+    embeddings.npy          (n, dim) float32 or float16 matrix, rows L2-normalized
+    text.bin                UTF-8 chunk texts, back to back
+    text_offsets.npy        (n + 1) int64 byte offsets into text.bin
+    metadata_columns.json   metadata keys and the distinct values of each key
+    metadata_codes.npy      (n, keys) int32 value position per chunk and key (-1: absent)
+    pdf_index.npy           (n,) int32 position of each chunk's PDF in the manifest
+    chunk_index.npy         (n,) int32 chunk index within its PDF
+
+Opening a store maps the files instead of parsing them, so startup is
+independent of corpus size and the pages are shared by every worker process
+that maps the same store. Chunk texts and metadata are decoded only when a
+chunk is accessed (LazyChunks), so a searcher holds little beyond the mapped
+embedding matrix. Per-PDF JSON files remain available as an export.
+"""
+
+import os
+import json
+import shutil
+import numpy as np
+from datetime import datetime
+from pathlib import Path
+from collections.abc import Mapping, Sequence
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from .logger import get_logger
+
+FORMAT_VERSION = 2
+MANIFEST = "manifest.json"
+DTYPES = ("float32", "float16")
+
+
+def is_embedding_store(path: str) -> bool:
+    """Whether path is an embedding store directory."""
+    return (Path(path) / MANIFEST).is_file()
+
+
+def _map_bytes(path: Path) -> np.ndarray:
+    """Read-only byte map of a file (np.memmap rejects empty files)."""
+    if path.stat().st_size == 0:
+        return np.zeros(0, dtype=np.uint8)
+    return np.memmap(path, dtype=np.uint8, mode='r')
+
+
+class LazyChunks(Sequence):
+    """
+    Read-only list of a store's chunks, decoded on access.
+
+    Indexing returns a fresh chunk dictionary, so nothing but the positions
+    stays resident; iteration decodes one chunk at a time.
+    """
+
+    def __init__(self, store: 'EmbeddingStore', positions: Optional[np.ndarray] = None,
+                 include_embeddings: bool = True):
+        self.store = store
+        self.positions = positions
+        self.include_embeddings = include_embeddings
+
+    def __len__(self) -> int:
+        return len(self.store) if self.positions is None else len(self.positions)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("chunk index out of range")
+        position = i if self.positions is None else int(self.positions[i])
+        return self.store.chunk(position, self.include_embeddings)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for i in range(len(self)):
+            yield self[i]
+
+
+class PdfChunks(Mapping):
+    """PDF name -> LazyChunks of that PDF's chunks, computed on access."""
+
+    def __init__(self, store: 'EmbeddingStore'):
+        self.store = store
+
+    def __getitem__(self, pdf: str) -> LazyChunks:
+        try:
+            pdf_position = self.store.pdfs.index(pdf)
+        except ValueError:
+            raise KeyError(pdf)
+        return LazyChunks(self.store, np.flatnonzero(self.store.pdf_index == pdf_position))
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.store.pdfs)
+
+    def __len__(self) -> int:
+        return len(self.store.pdfs)
+
+
+class EmbeddingStore:
+    """
+    Memory-mapped chunk corpus: embeddings, texts and metadata.
+
+    Chunks are addressed by position; chunk(i) returns the same dictionary
+    shape as the per-PDF JSON files ('text', 'embedding', 'metadata',
+    'chunk_index', 'pdf_filename'), with the embedding as a view into the
+    mapped matrix.
+    """
+
+    def __init__(self, path: str, mmap: bool = True, logger=None):
+        """
+        Open a store.
+
+        Args:
+            path: Store directory
+            mmap: Map the files (False reads them into memory)
+            logger: Optional logger instance
+
+        Raises:
+            ValueError: If path is not a store of a supported format version
+        """
+        self.path = Path(path)
+        self.logger = logger or get_logger(__name__)
+        manifest_file = self.path / MANIFEST
+        if not manifest_file.is_file():
+            raise ValueError(f"Not an embedding store (no {MANIFEST}): {path}")
+        with open(manifest_file, 'r', encoding='utf-8') as f:
+            self.manifest = json.load(f)
+        if self.manifest.get('format_version') != FORMAT_VERSION:
+            raise ValueError(f"Unsupported embedding store format {self.manifest.get('format_version')} "
+                             f"(expected {FORMAT_VERSION}); rewrite it with analysis/cli/convert_embeddings.py")
+
+        mode = 'r' if mmap else None
+        self.embeddings = np.load(self.path / "embeddings.npy", mmap_mode=mode)
+        self.text_offsets = np.load(self.path / "text_offsets.npy", mmap_mode=mode)
+        self.metadata_codes = np.load(self.path / "metadata_codes.npy", mmap_mode=mode)
+        self.pdf_index = np.load(self.path / "pdf_index.npy", mmap_mode=mode)
+        self.chunk_index = np.load(self.path / "chunk_index.npy", mmap_mode=mode)
+        if mmap:
+            self._text = _map_bytes(self.path / "text.bin")
+        else:
+            self._text = np.fromfile(self.path / "text.bin", dtype=np.uint8)
+        with open(self.path / "metadata_columns.json", 'r', encoding='utf-8') as f:
+            columns = json.load(f)
+        self.metadata_keys: List[str] = columns['keys']
+        self._metadata_values: List[List[Any]] = columns['values']
+        self.pdfs: List[str] = self.manifest['pdfs']
+
+        if len(self.embeddings) != self.manifest['count']:
+            raise ValueError(f"Embedding store {path} is incomplete: "
+                             f"{len(self.embeddings)} of {self.manifest['count']} embeddings")
+
+    def __len__(self) -> int:
+        return len(self.embeddings)
+
+    @property
+    def dim(self) -> int:
+        return int(self.manifest['dim'])
+
+    @property
+    def normalized(self) -> bool:
+        return bool(self.manifest.get('normalized', False))
+
+    def text(self, i: int) -> str:
+        """Text of chunk i."""
+        return bytes(self._text[self.text_offsets[i]:self.text_offsets[i + 1]]).decode('utf-8')
+
+    def metadata(self, i: int) -> Dict[str, Any]:
+        """Metadata of chunk i."""
+        return {
+            key: self._metadata_values[column][code]
+            for column, (key, code) in enumerate(zip(self.metadata_keys, self.metadata_codes[i].tolist()))
+            if code >= 0
+        }
+
+    def pdf_filename(self, i: int) -> str:
+        """PDF (embedding file stem) chunk i came from."""
+        return self.pdfs[int(self.pdf_index[i])]
+
+    def chunk(self, i: int, include_embedding: bool = True) -> Dict[str, Any]:
+        """Chunk i as a dictionary in the JSON file layout."""
+        chunk = {
+            'text': self.text(i),
+            'metadata': self.metadata(i),
+            'chunk_index': int(self.chunk_index[i]),
+            'pdf_filename': self.pdf_filename(i),
+        }
+        if include_embedding:
+            chunk['embedding'] = self.embeddings[i]
+        return chunk
+
+    def iter_chunks(self, include_embeddings: bool = True) -> Iterator[Dict[str, Any]]:
+        """All chunks in store order."""
+        for i in range(len(self)):
+            yield self.chunk(i, include_embeddings)
+
+    def chunks(self, include_embeddings: bool = True) -> List[Dict[str, Any]]:
+        """All chunks as a list (embeddings stay views into the mapped matrix)."""
+        return list(self.iter_chunks(include_embeddings))
+
+    def lazy_chunks(self, include_embeddings: bool = True) -> LazyChunks:
+        """All chunks as a list-like view decoding each chunk on access."""
+        return LazyChunks(self, include_embeddings=include_embeddings)
+
+    def chunks_by_pdf(self) -> PdfChunks:
+        """PDF name -> lazy view of its chunks."""
+        return PdfChunks(self)
+
+    def stats(self) -> Dict[str, Any]:
+        """Chunk and PDF counts, dimension, dtype and on-disk size."""
+        size = sum(f.stat().st_size for f in self.path.iterdir() if f.is_file())
+        return {
+            'chunks': len(self),
+            'pdfs': len(self.pdfs),
+            'dim': self.dim,
+            'dtype': self.manifest['dtype'],
+            'bytes': size,
+        }
+
+    def export_json(self, output_dir: str, indent: Optional[int] = 2) -> int:
+        """
+        Write one JSON file per PDF in the vectorizer's JSON layout.
+
+        Args:
+            output_dir: Directory for the JSON files
+            indent: JSON indentation (None for compact files)
+
+        Returns:
+            Number of files written
+        """
+        output_path = Path(output_dir)
+        output_path.mkdir(parents=True, exist_ok=True)
+        by_pdf: Dict[int, List[int]] = {}
+        for i, pdf in enumerate(self.pdf_index):
+            by_pdf.setdefault(int(pdf), []).append(i)
+
+        for pdf, rows in by_pdf.items():
+            file_chunks = [
+                {
+                    'text': self.text(i),
+                    'embedding': self.embeddings[i].astype(np.float32).tolist(),
+                    'metadata': self.metadata(i),
+                    'chunk_index': int(self.chunk_index[i]),
+                }
+                for i in rows
+            ]
+            with open(output_path / f"{self.pdfs[pdf]}.json", 'w', encoding='utf-8') as f:
+                json.dump(file_chunks, f, indent=indent, ensure_ascii=False)
+        return len(by_pdf)
+
+    @classmethod
+    def write(cls, path: str, chunks: Iterable[Dict], dtype: str = "float32",
+              embedding_model: Optional[str] = None, logger=None) -> 'EmbeddingStore':
+        """
+        Write chunks to a new store, replacing any store at path.
+
+        Args:
+            path: Store directory
+            chunks: Chunk dictionaries with 'text', 'embedding', 'metadata',
+                'chunk_index' and 'pdf_filename'; chunks without an embedding are skipped
+            dtype: Embedding dtype on disk ('float32' or 'float16')
+            embedding_model: Model name recorded in the manifest
+            logger: Optional logger instance
+
+        Returns:
+            The written store, opened
+
+        Raises:
+            ValueError: For an unsupported dtype or embeddings of different dimensions
+        """
+        logger = logger or get_logger(__name__)
+        if dtype not in DTYPES:
+            raise ValueError(f"Unsupported embedding dtype: {dtype} (use one of {DTYPES})")
+
+        chunks = [chunk for chunk in chunks if chunk.get('embedding') is not None]
+        dims = {len(chunk['embedding']) for chunk in chunks}
+        if len(dims) > 1:
+            raise ValueError(f"Embeddings have different dimensions: {sorted(dims)}")
+        dim = dims.pop() if dims else 0
+
+        path = Path(path)
+        tmp = path.parent / f".{path.name}.tmp-{os.getpid()}"
+        shutil.rmtree(tmp, ignore_errors=True)
+        tmp.mkdir(parents=True)
+
+        matrix = np.lib.format.open_memmap(tmp / "embeddings.npy", mode='w+', dtype=dtype, shape=(len(chunks), dim))
+        text_offsets = np.zeros(len(chunks) + 1, dtype=np.int64)
+        # Metadata is dictionary-encoded per key: values repeated across chunks
+        # (PDF title, source, producer...) are stored once
+        metadata_keys: Dict[str, int] = {}
+        value_codes: List[Dict[str, int]] = []
+        metadata_values: List[List[Any]] = []
+        metadata_codes = np.full((len(chunks), 0), -1, dtype=np.int32)
+        pdf_index = np.zeros(len(chunks), dtype=np.int32)
+        chunk_index = np.zeros(len(chunks), dtype=np.int32)
+        pdfs: Dict[str, int] = {}
+
+        with open(tmp / "text.bin", 'wb') as text_file:
+            for i, chunk in enumerate(chunks):
+                vector = np.asarray(chunk['embedding'], dtype=np.float32)
+                norm = np.linalg.norm(vector)
+                matrix[i] = vector / norm if norm > 0 else vector
+
+                text = chunk.get('text', '').encode('utf-8')
+                text_file.write(text)
+                text_offsets[i + 1] = text_offsets[i] + len(text)
+
+                for key, value in (chunk.get('metadata') or {}).items():
+                    column = metadata_keys.get(key)
+                    if column is None:
+                        column = metadata_keys[key] = len(metadata_keys)
+                        value_codes.append({})
+                        metadata_values.append([])
+                        metadata_codes = np.hstack([metadata_codes, np.full((len(chunks), 1), -1, dtype=np.int32)])
+                    encoded = json.dumps(value, sort_keys=True, default=str)
+                    code = value_codes[column].get(encoded)
+                    if code is None:
+                        code = value_codes[column][encoded] = len(metadata_values[column])
+                        metadata_values[column].append(json.loads(encoded))
+                    metadata_codes[i, column] = code
+
+                pdf_index[i] = pdfs.setdefault(chunk.get('pdf_filename', 'unknown'), len(pdfs))
+                chunk_index[i] = chunk.get('chunk_index', 0)
+        matrix.flush()
+        del matrix
+
+        np.save(tmp / "text_offsets.npy", text_offsets)
+        np.save(tmp / "metadata_codes.npy", metadata_codes)
+        with open(tmp / "metadata_columns.json", 'w', encoding='utf-8') as f:
+            json.dump({'keys': list(metadata_keys), 'values': metadata_values}, f, ensure_ascii=False)
+        np.save(tmp / "pdf_index.npy", pdf_index)
+        np.save(tmp / "chunk_index.npy", chunk_index)
+        manifest = {
+            'format_version': FORMAT_VERSION,
+            'count': len(chunks),
+            'dim': dim,
+            'dtype': dtype,
+            'normalized': True,
+            'pdfs': list(pdfs),
+            'embedding_model': embedding_model,
+            'created_at': datetime.now().isoformat(),
+        }
+        # Manifest last: a directory without it is never mistaken for a complete store
+        with open(tmp / MANIFEST, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2)
+
+        # Swap directories; processes that mapped the old files keep reading them until they reopen
+        old = path.parent / f".{path.name}.old-{os.getpid()}"
+        if path.exists():
+            os.replace(path, old)
+        os.replace(tmp, path)
+        shutil.rmtree(old, ignore_errors=True)
+
+        logger.info(f"Wrote embedding store {path}: {len(chunks)} chunks from {len(pdfs)} PDFs, dim {dim}, {dtype}")
+        return cls(str(path), logger=logger)
+
+
+def load_json_chunks(embeddings_dir: str, logger=None) -> List[Dict]:
+    """
+    Read per-PDF embedding JSON files (sorted by name), tagging chunks with their PDF.
+
+    Args:
+        embeddings_dir: Directory of embedding JSON files
+        logger: Optional logger instance
+
+    Returns:
+        Chunk dictionaries
+    """
+    logger = logger or get_logger(__name__)
+    chunks = []
+    for json_file in sorted(Path(embeddings_dir).glob("*.json")):
+        try:
+            with open(json_file, 'r', encoding='utf-8') as f:
+                file_chunks = json.load(f)
+        except Exception as e:
+            logger.warning(f"Error loading {json_file}: {e}")
+            continue
+        for chunk in file_chunks:
+            chunk['pdf_filename'] = json_file.stem
+            chunks.append(chunk)
+    return chunks
+
+
+def convert_json_to_store(embeddings_dir: str, store_dir: str, dtype: str = "float32",
+                          embedding_model: Optional[str] = None, logger=None) -> EmbeddingStore:
+    """
+    Convert a directory of per-PDF embedding JSON files to a store.
+
+    Args:
+        embeddings_dir: Directory of embedding JSON files
+        store_dir: Store directory to write
+        dtype: Embedding dtype on disk ('float32' or 'float16')
+        embedding_model: Model name recorded in the manifest
+        logger: Optional logger instance
+
+    Returns:
+        The written store
+    """
+    return EmbeddingStore.write(
+        store_dir, load_json_chunks(embeddings_dir, logger), dtype=dtype,
+        embedding_model=embedding_model, logger=logger
+    )
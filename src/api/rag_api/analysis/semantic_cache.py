@@ -0,0 +1,137 @@
+"""
+Semantic Cache - Reuse answers for queries that mean the same thing.
+
+A cached answer is returned when a new query's embedding has at least the
+configured cosine similarity to a cached query asked with the same scope
+(LLM, top_k and other answer-shaping parameters). Entries expire after a
+time to live and the least recently used entry is evicted beyond the size
+limit.
+"""
+
+import time
+import itertools
+import threading
+import numpy as np
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from .logger import get_logger
+
+
+def normalize_query(query: str) -> str:
+    """Cache key form of a query: lower case with collapsed whitespace."""
+    return " ".join(query.lower().split())
+
+
+class SemanticAnswerCache:
+    """
+    Bounded, thread-safe cache of answers keyed by query embedding and scope.
+    """
+
+    def __init__(self, threshold: float = 0.95, max_entries: int = 256,
+                 ttl: Optional[float] = 600.0, on_lookup: Optional[Callable[[bool], None]] = None,
+                 clock: Callable[[], float] = time.monotonic, logger=None):
+        """
+        Initialize cache.
+
+        Args:
+            threshold: Minimum cosine similarity between queries for a hit
+            max_entries: Maximum number of cached answers (0 disables the cache)
+            ttl: Seconds an answer stays valid (None: no expiry)
+            on_lookup: Called with True/False after every lookup (e.g. to record metrics)
+            clock: Time source (monotonic seconds)
+            logger: Optional logger instance
+        """
+        self.threshold = threshold
+        self.max_entries = max(0, max_entries)
+        self.ttl = ttl
+        self.on_lookup = on_lookup
+        self.clock = clock
+        self.logger = logger or get_logger(__name__)
+        # entry id -> (scope, unit query embedding, value, expires_at)
+        self._entries: "OrderedDict[int, tuple]" = OrderedDict()
+        self._ids = itertools.count()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expired = 0
+
+    @staticmethod
+    def _unit(embedding: np.ndarray) -> np.ndarray:
+        vector = np.asarray(embedding, dtype=np.float32).ravel()
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm > 0 else vector
+
+    def lookup(self, embedding: np.ndarray, scope: Hashable) -> Optional[Any]:
+        """
+        Cached value of the most similar query in scope, if similar enough.
+
+        Args:
+            embedding: Query embedding
+            scope: Parameters the cached answer must have been produced with
+
+        Returns:
+            The cached value, or None
+        """
+        query = self._unit(embedding)
+        value = None
+        with self._lock:
+            now = self.clock()
+            expired = [key for key, entry in self._entries.items() if entry[3] is not None and now >= entry[3]]
+            for key in expired:
+                del self._entries[key]
+            self.expired += len(expired)
+
+            candidates = [(key, entry) for key, entry in self._entries.items()
+                          if entry[0] == scope and entry[1].shape == query.shape]
+            if candidates:
+                similarities = np.stack([entry[1] for _, entry in candidates]) @ query
+                best = int(np.argmax(similarities))
+                if similarities[best] >= self.threshold:
+                    key, entry = candidates[best]
+                    self._entries.move_to_end(key)
+                    value = entry[2]
+                    self.logger.debug(f"Semantic cache hit (similarity {similarities[best]:.3f})")
+            if value is not None:
+                self.hits += 1
+            else:
+                self.misses += 1
+        if self.on_lookup is not None:
+            self.on_lookup(value is not None)
+        return value
+
+    def store(self, embedding: np.ndarray, scope: Hashable, value: Any):
+        """Cache value for a query embedding and scope."""
+        if self.max_entries == 0:
+            return
+        expires_at = self.clock() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            self._entries[next(self._ids)] = (scope, self._unit(embedding), value, expires_at)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        """Remove all entries (counters are kept)."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, Any]:
+        """Size, limits and lookup counters."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'ttl_seconds': self.ttl,
+                'threshold': self.threshold,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'evictions': self.evictions,
+                'expired': self.expired,
+            }
@@ -9,13 +9,15 @@ import numpy as np
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Tuple
 
+from .embedding_store import EmbeddingStore, is_embedding_store
+
 
 def load_embeddings_from_dir(embeddings_dir: str) -> List[Dict]:
     """
-    Load all embeddings from JSON files in a directory.
+    Load all embeddings from JSON files in a directory, or from an embedding store.
 
     Args:
-        embeddings_dir: Path to directory containing embedding JSON files
+        embeddings_dir: Path to directory containing embedding JSON files or an embedding store
 
     Returns:
         List of embedding dictionaries
@@ -28,6 +30,9 @@ def load_embeddings_from_dir(embeddings_dir: str) -> List[Dict]:
     if not embeddings_path.exists():
         raise ValueError(f"Embeddings directory not found: {embeddings_dir}")
 
+    if is_embedding_store(embeddings_dir):
+        return EmbeddingStore(embeddings_dir).chunks()
+
     all_embeddings = []
 
     for json_file in embeddings_path.glob("*.json"):
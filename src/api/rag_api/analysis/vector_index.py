@@ -0,0 +1,617 @@
+"""
+Vector Index - Resident embedding indexes for repeated similarity search.
+
+All indexes keep vectors as contiguous float32 with L2-normalized rows, so
+cosine similarity is an inner product, and share one interface: search()
+returns (chunk position, score) pairs, save() / load_vector_index() persist
+them.
+
+- ExactVectorIndex: brute force, one matrix-vector product per query
+- IVFVectorIndex: inverted file over spherical k-means centroids; a query
+  scans the n_probe closest lists (recall/latency trade-off)
+- HNSWVectorIndex: hnswlib graph index (optional dependency); ef_search
+  trades recall for latency
+
+build_vector_index() picks exact search for small corpora and an
+approximate index above a size threshold.
+"""
+
+import json
+import numpy as np
+from collections import Counter
+from pathlib import Path
+from typing import List, Dict, Optional, Tuple
+
+try:
+    import hnswlib
+except ImportError:
+    hnswlib = None
+
+from .logger import get_logger
+
+# Below this many vectors exact search is fast enough and has perfect recall
+EXACT_THRESHOLD = 20000
+
+# Rows per block when assigning vectors to centroids (bounds temporary memory)
+ASSIGN_BATCH = 65536
+
+
+def _embedded_chunks(chunks: List[Dict], logger) -> Tuple[np.ndarray, np.ndarray]:
+    """Float32 embedding matrix and chunk positions of the chunks with a usable embedding."""
+    embedded = [(i, chunk['embedding']) for i, chunk in enumerate(chunks) if chunk.get('embedding') is not None]
+    if not embedded:
+        return np.zeros((0, 0), dtype=np.float32), np.zeros(0, dtype=np.int64)
+
+    dims = Counter(len(embedding) for _, embedding in embedded)
+    dim = dims.most_common(1)[0][0]
+    if len(dims) > 1:
+        skipped = sum(count for d, count in dims.items() if d != dim)
+        logger.warning(f"Skipping {skipped} embeddings with a dimension other than {dim}")
+        embedded = [(i, embedding) for i, embedding in embedded if len(embedding) == dim]
+
+    matrix = np.empty((len(embedded), dim), dtype=np.float32)
+    for row, (_, embedding) in enumerate(embedded):
+        matrix[row] = embedding
+    ids = np.fromiter((i for i, _ in embedded), dtype=np.int64, count=len(embedded))
+    return matrix, ids
+
+
+def _normalized(embeddings: np.ndarray, copy: bool = True, normalized: bool = False) -> np.ndarray:
+    """Contiguous float32 matrix with unit-length rows (zero rows stay zero)."""
+    if normalized:
+        # Rows already unit length (e.g. a memory-mapped embedding store): use float32 input as is
+        matrix = np.ascontiguousarray(embeddings, dtype=np.float32)
+        if matrix.ndim != 2:
+            raise ValueError("Embeddings must be a 2D array")
+        return matrix
+    if copy:
+        matrix = np.array(embeddings, dtype=np.float32, order='C')
+    else:
+        matrix = np.require(embeddings, dtype=np.float32, requirements=['C', 'W'])
+    if matrix.size == 0:
+        return matrix.reshape(0, matrix.shape[-1] if matrix.ndim == 2 else 0)
+    if matrix.ndim != 2:
+        raise ValueError("Embeddings must be a 2D array")
+
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1  # Avoid division by zero
+    matrix /= norms
+    return matrix
+
+
+def _top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """Positions of the k highest scores, best first."""
+    k = min(k, len(scores))
+    if k < len(scores):
+        top = np.argpartition(-scores, k - 1)[:k]
+    else:
+        top = np.arange(len(scores))
+    return top[np.argsort(-scores[top], kind='stable')]
+
+
+class VectorIndex:
+    """Interface shared by the vector indexes."""
+
+    kind = 'base'
+
+    def __init__(self, dim: int, logger=None):
+        self.dim = dim
+        self.logger = logger or get_logger(__name__)
+        # Free-form metadata saved with the index (e.g. the corpus it was built from)
+        self.meta: Dict = {}
+
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+    def search(self, query_embedding: np.ndarray, top_k: int = 10) -> List[Tuple[int, float]]:
+        """
+        Top-k chunks by cosine similarity.
+
+        Args:
+            query_embedding: Query vector of the index dimension
+            top_k: Number of results
+
+        Returns:
+            (chunk position, score) pairs, best first
+
+        Raises:
+            ValueError: If the query is not a vector of the index dimension
+        """
+        raise NotImplementedError
+
+    def search_batch(self, query_embeddings: np.ndarray, top_k: int = 10) -> List[List[Tuple[int, float]]]:
+        """
+        Top-k chunks for each of several queries.
+
+        Args:
+            query_embeddings: Query vectors, one row per query
+            top_k: Number of results per query
+
+        Returns:
+            One list of (chunk position, score) pairs per query, best first
+
+        Raises:
+            ValueError: If the queries are not rows of the index dimension
+        """
+        return [self.search(query, top_k) for query in self._prepare_queries(query_embeddings)]
+
+    def _prepare_queries(self, query_embeddings: np.ndarray) -> np.ndarray:
+        queries = np.asarray(query_embeddings, dtype=np.float32)
+        if queries.ndim != 2:
+            raise ValueError("Query embeddings must be 2D (one row per query)")
+        if len(self) and queries.shape[1] != self.dim:
+            raise ValueError(f"Query dimension {queries.shape[1]} does not match index dimension {self.dim}")
+        norms = np.linalg.norm(queries, axis=1, keepdims=True)
+        return queries / np.where(norms > 0, norms, 1.0)
+
+    def _prepare_query(self, query_embedding: np.ndarray) -> np.ndarray:
+        query = np.asarray(query_embedding, dtype=np.float32)
+        if query.ndim != 1:
+            raise ValueError("Query embedding must be 1D")
+        if len(self) and query.shape[0] != self.dim:
+            raise ValueError(f"Query dimension {query.shape[0]} does not match index dimension {self.dim}")
+        norm = np.linalg.norm(query)
+        return query / norm if norm > 0 else query
+
+    def params(self) -> Dict:
+        """Tunable parameters of the index."""
+        return {}
+
+    def stats(self) -> Dict:
+        """Index type, size, dimension and parameters."""
+        return {'type': self.kind, 'vectors': len(self), 'dim': self.dim, **self.params()}
+
+    def _arrays(self) -> Dict[str, np.ndarray]:
+        raise NotImplementedError
+
+    def save(self, path: str):
+        """
+        Save the index to a .npz file (HNSW also writes <path>.hnsw).
+
+        Args:
+            path: Output file
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        header = {'kind': self.kind, 'dim': self.dim, 'params': self.params(), 'meta': self.meta}
+        # Written through a file object so numpy does not append its own suffix
+        with open(path, 'wb') as f:
+            np.savez(f, header=np.array(json.dumps(header)), **self._arrays())
+        self.logger.info(f"Saved {self.kind} index ({len(self)} vectors) to {path}")
+
+
+class ExactVectorIndex(VectorIndex):
+    """
+    Brute-force cosine similarity index over a pre-normalized float32 matrix.
+
+    Search results refer to chunk positions in the list the index was built
+    from; chunks without a usable embedding are left out of the index.
+    """
+
+    kind = 'exact'
+
+    def __init__(self, embeddings: np.ndarray, ids: Optional[np.ndarray] = None,
+                 copy: bool = True, normalized: bool = False, logger=None):
+        """
+        Initialize index.
+
+        Args:
+            embeddings: Array of shape (n, dim)
+            ids: Chunk position of each row (defaults to 0..n-1)
+            copy: Copy the embeddings; if False a contiguous float32 array is normalized in place
+            normalized: Rows are already unit length; float32 input (including
+                read-only memory maps) is used without copying
+            logger: Optional logger instance
+        """
+        matrix = _normalized(embeddings, copy, normalized)
+        super().__init__(matrix.shape[1], logger)
+        self.matrix = matrix
+        if ids is None:
+            ids = np.arange(len(matrix))
+        self.ids = np.asarray(ids, dtype=np.int64)
+        if len(self.ids) != len(matrix):
+            raise ValueError(f"Got {len(self.ids)} ids for {len(matrix)} embeddings")
+
+    @classmethod
+    def from_chunks(cls, chunks: List[Dict], logger=None) -> 'ExactVectorIndex':
+        """
+        Build an index from chunk dictionaries with an 'embedding' field.
+
+        Chunks without an embedding, or whose dimension differs from the
+        corpus' most common one, are skipped.
+
+        Args:
+            chunks: Chunk dictionaries
+            logger: Optional logger instance
+
+        Returns:
+            ExactVectorIndex over the embedded chunks
+        """
+        logger = logger or get_logger(__name__)
+        matrix, ids = _embedded_chunks(chunks, logger)
+        return cls(matrix, ids, copy=False, logger=logger)
+
+    def __len__(self) -> int:
+        return len(self.matrix)
+
+    def search(self, query_embedding: np.ndarray, top_k: int = 10) -> List[Tuple[int, float]]:
+        query = self._prepare_query(query_embedding)
+        if len(self.matrix) == 0 or top_k <= 0:
+            return []
+        scores = self.matrix @ query
+        top = _top_k(scores, top_k)
+        return [(int(self.ids[i]), float(scores[i])) for i in top]
+
+    def search_batch(self, query_embeddings: np.ndarray, top_k: int = 10) -> List[List[Tuple[int, float]]]:
+        queries = self._prepare_queries(query_embeddings)
+        if len(self.matrix) == 0 or top_k <= 0:
+            return [[] for _ in queries]
+        # One matrix-matrix product (a single pass over the corpus) for the whole batch
+        scores = queries @ self.matrix.T
+        results = []
+        for row in scores:
+            top = _top_k(row, top_k)
+            results.append([(int(self.ids[i]), float(row[i])) for i in top])
+        return results
+
+    def stats(self) -> Dict:
+        """Index size, dimension and memory use."""
+        stats = super().stats()
+        stats['memory_bytes'] = int(self.matrix.nbytes + self.ids.nbytes)
+        return stats
+
+    def _arrays(self) -> Dict[str, np.ndarray]:
+        return {'matrix': self.matrix, 'ids': self.ids}
+
+    @classmethod
+    def _load(cls, header: Dict, arrays, logger=None) -> 'ExactVectorIndex':
+        # Saved rows are already normalized; normalizing them again would perturb the scores
+        return cls(arrays['matrix'], arrays['ids'], copy=False, normalized=True, logger=logger)
+
+
+def _assign(matrix: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+    """Index of the most similar centroid for every row."""
+    assignment = np.empty(len(matrix), dtype=np.int64)
+    for start in range(0, len(matrix), ASSIGN_BATCH):
+        block = matrix[start:start + ASSIGN_BATCH]
+        assignment[start:start + len(block)] = np.argmax(block @ centroids.T, axis=1)
+    return assignment
+
+
+def spherical_kmeans(data: np.ndarray, n_clusters: int, iterations: int = 20,
+                     seed: int = 0) -> np.ndarray:
+    """
+    k-means on unit vectors with cosine similarity.
+
+    Args:
+        data: Row-normalized float32 matrix
+        n_clusters: Number of centroids
+        iterations: Lloyd iterations
+        seed: Random seed for initialization and reseeding empty clusters
+
+    Returns:
+        Row-normalized centroids of shape (n_clusters, dim)
+    """
+    rng = np.random.default_rng(seed)
+    n_clusters = max(1, min(n_clusters, len(data)))
+    centroids = data[rng.choice(len(data), n_clusters, replace=False)].copy()
+
+    for _ in range(iterations):
+        assignment = _assign(data, centroids)
+        order = np.argsort(assignment, kind='stable')
+        ordered = assignment[order]
+        starts = np.flatnonzero(np.r_[True, ordered[1:] != ordered[:-1]])
+
+        sums = np.zeros_like(centroids)
+        sums[ordered[starts]] = np.add.reduceat(data[order], starts, axis=0)
+        empty = np.bincount(assignment, minlength=n_clusters) == 0
+        if empty.any():
+            # Reseed empty clusters with random points
+            sums[empty] = data[rng.choice(len(data), int(empty.sum()), replace=False)]
+
+        new_centroids = _normalized(sums, copy=False)
+        if np.allclose(new_centroids, centroids, atol=1e-6):
+            centroids = new_centroids
+            break
+        centroids = new_centroids
+    return centroids
+
+
+class IVFVectorIndex(ExactVectorIndex):
+    """
+    Inverted file index: vectors are grouped by their nearest k-means centroid
+    and a query scans only the n_probe lists whose centroids are closest.
+
+    Vectors are stored list by list, so every probed list is one contiguous
+    block of the matrix. Raising n_probe raises recall and latency;
+    n_probe >= n_lists is exact search.
+    """
+
+    kind = 'ivf'
+
+    def __init__(self, embeddings: np.ndarray, ids: Optional[np.ndarray] = None,
+                 n_lists: Optional[int] = None, n_probe: int = 8,
+                 train_size: Optional[int] = None, iterations: int = 20, seed: int = 0,
+                 copy: bool = True, normalized: bool = False, logger=None):
+        """
+        Build IVF index.
+
+        Args:
+            embeddings: Array of shape (n, dim)
+            ids: Chunk position of each row (defaults to 0..n-1)
+            n_lists: Number of k-means lists (default: about 4 * sqrt(n))
+            n_probe: Lists scanned per query (recall/latency trade-off)
+            train_size: Vectors sampled to train the centroids (default: 64 per list)
+            iterations: k-means iterations
+            seed: Random seed
+            copy: Copy the embeddings; if False a contiguous float32 array is normalized in place
+            normalized: Rows are already unit length
+            logger: Optional logger instance
+        """
+        super().__init__(embeddings, ids, copy=copy, normalized=normalized, logger=logger)
+        self.n_probe = n_probe
+        self.centroids = np.zeros((0, self.dim), dtype=np.float32)
+        self.offsets = np.zeros(1, dtype=np.int64)
+        if len(self.matrix) == 0:
+            return
+
+        n = len(self.matrix)
+        n_lists = n_lists or max(1, int(4 * np.sqrt(n)))
+        n_lists = min(n_lists, n)
+        rng = np.random.default_rng(seed)
+        train_size = min(n, train_size or 64 * n_lists)
+        sample = self.matrix if train_size >= n else self.matrix[np.sort(rng.choice(n, train_size, replace=False))]
+        self.centroids = spherical_kmeans(sample, n_lists, iterations, seed)
+        self._group(_assign(self.matrix, self.centroids))
+
+    def _group(self, assignment: np.ndarray):
+        """Reorder vectors list by list and record where each list starts."""
+        order = np.argsort(assignment, kind='stable')
+        self.matrix = np.ascontiguousarray(self.matrix[order])
+        self.ids = self.ids[order]
+        counts = np.bincount(assignment, minlength=len(self.centroids))
+        self.offsets = np.concatenate([[0], np.cumsum(counts)]).astype(np.int64)
+
+    @property
+    def n_lists(self) -> int:
+        return len(self.centroids)
+
+    def search(self, query_embedding: np.ndarray, top_k: int = 10,
+               n_probe: Optional[int] = None) -> List[Tuple[int, float]]:
+        """
+        Approximate top-k chunks by cosine similarity.
+
+        Args:
+            query_embedding: Query vector of the index dimension
+            top_k: Number of results
+            n_probe: Lists to scan (default: the index's n_probe)
+
+        Returns:
+            (chunk position, score) pairs, best first
+        """
+        query = self._prepare_query(query_embedding)
+        if len(self.matrix) == 0 or top_k <= 0:
+            return []
+
+        if n_probe is None:
+            n_probe = self.n_probe
+        n_probe = min(n_probe, self.n_lists)
+        if n_probe <= 0:
+            return []
+        if n_probe >= self.n_lists:
+            return super().search(query, top_k)
+
+        probed = _top_k(self.centroids @ query, n_probe)
+        rows = np.concatenate([np.arange(self.offsets[l], self.offsets[l + 1]) for l in probed])
+        if len(rows) == 0:
+            return []
+        scores = self.matrix[rows] @ query
+        top = _top_k(scores, top_k)
+        return [(int(self.ids[rows[i]]), float(scores[i])) for i in top]
+
+    def search_batch(self, query_embeddings: np.ndarray, top_k: int = 10) -> List[List[Tuple[int, float]]]:
+        if self.n_probe >= self.n_lists:
+            return super().search_batch(query_embeddings, top_k)
+        # Queries probe different lists: searched one at a time
+        return VectorIndex.search_batch(self, query_embeddings, top_k)
+
+    def params(self) -> Dict:
+        return {'n_lists': self.n_lists, 'n_probe': self.n_probe}
+
+    def stats(self) -> Dict:
+        stats = super().stats()
+        stats['memory_bytes'] += int(self.centroids.nbytes + self.offsets.nbytes)
+        sizes = np.diff(self.offsets)
+        stats['list_size_max'] = int(sizes.max()) if len(sizes) else 0
+        return stats
+
+    def _arrays(self) -> Dict[str, np.ndarray]:
+        return {'matrix': self.matrix, 'ids': self.ids, 'centroids': self.centroids, 'offsets': self.offsets}
+
+    @classmethod
+    def _load(cls, header: Dict, arrays, logger=None) -> 'IVFVectorIndex':
+        index = cls.__new__(cls)
+        ExactVectorIndex.__init__(index, arrays['matrix'], arrays['ids'], copy=False, normalized=True, logger=logger)
+        index.centroids = np.ascontiguousarray(arrays['centroids'], dtype=np.float32)
+        index.offsets = np.asarray(arrays['offsets'], dtype=np.int64)
+        index.n_probe = header['params'].get('n_probe', 8)
+        return index
+
+
+class HNSWVectorIndex(VectorIndex):
+    """
+    Hierarchical navigable small world graph index (requires hnswlib).
+
+    Vectors are held by hnswlib only. Raising ef_search raises recall and
+    latency; M and ef_construction set graph quality at build time.
+    """
+
+    kind = 'hnsw'
+
+    def __init__(self, embeddings: np.ndarray, ids: Optional[np.ndarray] = None,
+                 M: int = 16, ef_construction: int = 200, ef_search: int = 64,
+                 threads: int = -1, normalized: bool = False, logger=None):
+        """
+        Build HNSW index.
+
+        Args:
+            embeddings: Array of shape (n, dim)
+            ids: Chunk position of each row (defaults to 0..n-1)
+            M: Graph out-degree
+            ef_construction: Candidate list size while building
+            ef_search: Candidate list size while searching (recall/latency trade-off)
+            threads: Build threads (-1: all cores)
+            normalized: Rows are already unit length
+            logger: Optional logger instance
+        """
+        if hnswlib is None:
+            raise ImportError("hnswlib is required for HNSWVectorIndex. Install with: pip install hnswlib")
+        matrix = _normalized(embeddings, normalized=normalized)
+        super().__init__(matrix.shape[1], logger)
+        self.M = M
+        self.ef_construction = ef_construction
+        self.ids = np.arange(len(matrix), dtype=np.int64) if ids is None else np.asarray(ids, dtype=np.int64)
+        self.index = hnswlib.Index(space='ip', dim=max(1, self.dim))
+        self.index.init_index(max_elements=max(1, len(matrix)), ef_construction=ef_construction, M=M)
+        if len(matrix):
+            self.index.add_items(matrix, np.arange(len(matrix)), num_threads=threads)
+        self.ef_search = ef_search
+
+    @property
+    def ef_search(self) -> int:
+        return self._ef_search
+
+    @ef_search.setter
+    def ef_search(self, value: int):
+        self._ef_search = value
+        self.index.set_ef(value)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def search(self, query_embedding: np.ndarray, top_k: int = 10) -> List[Tuple[int, float]]:
+        query = self._prepare_query(query_embedding)
+        if len(self) == 0 or top_k <= 0:
+            return []
+        k = min(top_k, len(self))
+        if self._ef_search < k:
+            self.index.set_ef(k)
+        labels, distances = self.index.knn_query(query, k=k)
+        if self._ef_search < k:
+            self.index.set_ef(self._ef_search)
+        # Inner-product space: distance = 1 - similarity
+        return [(int(self.ids[label]), float(1.0 - distance)) for label, distance in zip(labels[0], distances[0])]
+
+    def search_batch(self, query_embeddings: np.ndarray, top_k: int = 10) -> List[List[Tuple[int, float]]]:
+        queries = self._prepare_queries(query_embeddings)
+        if len(self) == 0 or top_k <= 0:
+            return [[] for _ in queries]
+        k = min(top_k, len(self))
+        if self._ef_search < k:
+            self.index.set_ef(k)
+        labels, distances = self.index.knn_query(queries, k=k)
+        if self._ef_search < k:
+            self.index.set_ef(self._ef_search)
+        return [
+            [(int(self.ids[label]), float(1.0 - distance)) for label, distance in zip(row_labels, row_distances)]
+            for row_labels, row_distances in zip(labels, distances)
+        ]
+
+    def params(self) -> Dict:
+        return {'M': self.M, 'ef_construction': self.ef_construction, 'ef_search': self._ef_search}
+
+    def _arrays(self) -> Dict[str, np.ndarray]:
+        return {'ids': self.ids}
+
+    def save(self, path: str):
+        super().save(path)
+        self.index.save_index(f"{path}.hnsw")
+
+    @classmethod
+    def _load(cls, header: Dict, arrays, logger=None, path: Optional[str] = None) -> 'HNSWVectorIndex':
+        if hnswlib is None:
+            raise ImportError("hnswlib is required to load an HNSW index. Install with: pip install hnswlib")
+        params = header['params']
+        index = cls.__new__(cls)
+        VectorIndex.__init__(index, header['dim'], logger)
+        index.M = params['M']
+        index.ef_construction = params['ef_construction']
+        index.ids = np.asarray(arrays['ids'], dtype=np.int64)
+        index.index = hnswlib.Index(space='ip', dim=max(1, index.dim))
+        index.index.load_index(f"{path}.hnsw", max_elements=max(1, len(index.ids)))
+        index.ef_search = params['ef_search']
+        return index
+
+
+INDEX_TYPES = {cls.kind: cls for cls in (ExactVectorIndex, IVFVectorIndex, HNSWVectorIndex)}
+
+
+def load_vector_index(path: str, logger=None) -> VectorIndex:
+    """
+    Load an index written by VectorIndex.save().
+
+    Args:
+        path: Index file
+        logger: Optional logger instance
+
+    Returns:
+        Index of the saved type
+    """
+    with np.load(path, allow_pickle=False) as arrays:
+        header = json.loads(str(arrays['header']))
+        kind = header['kind']
+        if kind not in INDEX_TYPES:
+            raise ValueError(f"Unknown vector index type: {kind}")
+        data = {name: arrays[name] for name in arrays.files if name != 'header'}
+    if kind == HNSWVectorIndex.kind:
+        index = HNSWVectorIndex._load(header, data, logger=logger, path=str(path))
+    else:
+        index = INDEX_TYPES[kind]._load(header, data, logger=logger)
+    index.meta = header.get('meta', {})
+    return index
+
+
+def build_vector_index(chunks: List[Dict], kind: str = 'auto',
+                       exact_threshold: int = EXACT_THRESHOLD,
+                       logger=None, embeddings: Optional[np.ndarray] = None,
+                       normalized: bool = False, **params) -> VectorIndex:
+    """
+    Build the index for a chunk corpus.
+
+    Args:
+        chunks: Chunk dictionaries with an 'embedding' field (ignored if embeddings is given)
+        kind: 'exact', 'ivf', 'hnsw', or 'auto' (exact below exact_threshold
+            vectors, otherwise hnsw if hnswlib is installed, else ivf)
+        exact_threshold: Corpus size from which 'auto' builds an approximate index
+        logger: Optional logger instance
+        embeddings: Embedding matrix with one row per chunk, e.g. an
+            EmbeddingStore's memory-mapped matrix, used instead of the chunks' embeddings
+        normalized: The embeddings' rows are already unit length
+        **params: Index parameters (IVF: n_lists, n_probe, train_size;
+            HNSW: M, ef_construction, ef_search)
+
+    Returns:
+        Vector index over the embedded chunks
+    """
+    logger = logger or get_logger(__name__)
+    if kind not in ('auto',) + tuple(INDEX_TYPES):
+        raise ValueError(f"Unknown vector index type: {kind}")
+
+    if embeddings is not None:
+        # Never normalize the caller's array in place
+        matrix, ids = (embeddings if normalized else _normalized(embeddings)), None
+        normalized = True
+    else:
+        matrix, ids = _embedded_chunks(chunks, logger)
+        normalized = False
+    if kind == 'auto':
+        if len(matrix) < exact_threshold:
+            kind = 'exact'
+        else:
+            kind = 'hnsw' if hnswlib is not None else 'ivf'
+
+    if kind == 'exact':
+        return ExactVectorIndex(matrix, ids, copy=False, normalized=normalized, logger=logger)
+    if kind == 'ivf':
+        return IVFVectorIndex(matrix, ids, copy=False, normalized=normalized, logger=logger, **params)
+    return HNSWVectorIndex(matrix, ids, normalized=normalized, logger=logger, **params)
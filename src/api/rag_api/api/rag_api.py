@@ -7,19 +7,27 @@ Falls back to Hugging Face or Ollama if Groq is unavailable.
 
 import os
 import json
+import asyncio
 import logging
+import threading
 import numpy as np
 from pathlib import Path
-from typing import List, Dict, Optional
-from fastapi import FastAPI, HTTPException
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, Callable, List, Dict, Optional, Tuple
+from fastapi import FastAPI, HTTPException, Header, Body, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, FileResponse
+from fastapi.responses import JSONResponse, FileResponse, Response, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from contextlib import asynccontextmanager
 from pydantic import BaseModel
 import time
 import requests
 
+try:
+    import httpx  # Installed with openai; without it the async path runs provider calls in threads
+except ImportError:
+    httpx = None
+
 # Set up logger
 logger = logging.getLogger(__name__)
 
@@ -27,22 +35,46 @@ logger = logging.getLogger(__name__)
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "src"))
 sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
-from core.utils import load_groq_api_key
+from core.utils import (
+    load_groq_api_key, get_groq_base_url, is_admin_token, env_int, env_float, Provider, ProviderRouter,
+    get_profiler, TTLCache, BM25Index, reciprocal_rank_fusion, MicroBatcher
+)
+from core.utils.metrics import CONTENT_TYPE as METRICS_CONTENT_TYPE, asgi_metrics_middleware, render_metrics, record_cache
+from core.utils.profiling import asgi_profiling_middleware
 
 # Import analysis modules
 try:
-    from rag_api.analysis import EmbeddingSearch, EmbeddingAnalyzer
+    from rag_api.analysis import (
+        EmbeddingSearch, EmbeddingAnalyzer, EmbeddingStore, SemanticAnswerCache,
+        build_vector_index, load_vector_index, is_embedding_store
+    )
     ANALYSIS_AVAILABLE = True
 except ImportError:
     ANALYSIS_AVAILABLE = False
 
 
+# vector: embedding similarity; keyword: BM25; hybrid: both, fused by reciprocal rank
+SEARCH_MODES = ("vector", "keyword", "hybrid")
+
+
 class QueryRequest(BaseModel):
     query: str
     top_k: int = 5
     min_score: float = 0.0
     llm_model: str = "groq"  # Default to Groq
     system_prompt: Optional[str] = None  # Optional custom system prompt
+    search_mode: Optional[str] = None  # vector, keyword or hybrid (default: RAG_SEARCH_MODE)
+
+
+class BatchSearchRequest(BaseModel):
+    queries: List[str]
+    top_k: int = 5
+    min_score: float = 0.0
+    search_mode: Optional[str] = None  # vector, keyword or hybrid (default: RAG_SEARCH_MODE)
+
+
+# Most queries accepted by one /search/batch request
+MAX_BATCH_QUERIES = 256
 
 
 class QueryResponse(BaseModel):
@@ -52,6 +84,7 @@ class QueryResponse(BaseModel):
     processing_time: float
     llm_model: str
     llm_mode: str = "ollama"
+    cached: bool = False
 
 
 class RAGEngine:
@@ -264,7 +297,7 @@ Awaiting operator input."""
         Initialize RAG engine.
 
         Args:
-            embeddings_dir: Directory containing pre-computed embedding JSON files
+            embeddings_dir: Directory containing pre-computed embedding JSON files or an embedding store
             ollama_url: Ollama API URL
             ollama_model: Ollama model name to use (auto-detects if None)
             embedding_model: Sentence transformer model for query embeddings
@@ -286,6 +319,55 @@ Awaiting operator input."""
         self.huggingface_available = False
         self.embedding_search = None
         self.embedding_analyzer = None
+        self.provider_router = None
+        self.groq_client = None
+        self.groq_async_client = None
+        self.huggingface_key = None
+        # Keep-alive connection pools per provider (requests sessions for threads, httpx clients for
+        # the event loop), created on first use so connections are reused across queries
+        self.http_pool_size = max(1, env_int("RAG_HTTP_POOL_SIZE", 16))
+        self._http_sessions: Dict[str, requests.Session] = {}
+        self._async_http_clients: Dict[str, "httpx.AsyncClient"] = {}
+        # Provider reachability, probed at most once per RAG_HEALTH_TTL seconds (never per query)
+        self.health_cache = TTLCache("rag_provider_health", max_entries=16, ttl=env_float("RAG_HEALTH_TTL", 60.0))
+        self._init_lock = threading.Lock()
+        self.vector_index = None
+        self._indexed_corpus = None  # (id, length) of the chunk list the index was built from
+        self.embedding_store = None  # Memory-mapped EmbeddingStore the chunks came from, if any
+        self.keyword_index = None
+        self._keyword_corpus = None  # (id, length) of the chunk list the keyword index was built from
+        self.search_mode = os.getenv("RAG_SEARCH_MODE", "vector")
+        if self.search_mode not in SEARCH_MODES:
+            logger.warning(f"Unknown RAG_SEARCH_MODE {self.search_mode!r} - using vector search")
+            self.search_mode = "vector"
+
+        # Query embeddings by normalized query text, and answers of semantically equivalent queries
+        self.query_embedding_cache = TTLCache(
+            "rag_query_embedding",
+            max_entries=env_int("RAG_QUERY_CACHE_SIZE", 1024),
+            ttl=env_float("RAG_QUERY_CACHE_TTL", 3600.0)
+        )
+        self.answer_cache = SemanticAnswerCache(
+            threshold=env_float("RAG_ANSWER_CACHE_THRESHOLD", 0.95),
+            max_entries=env_int("RAG_ANSWER_CACHE_SIZE", 256),
+            ttl=env_float("RAG_ANSWER_CACHE_TTL", 600.0),
+            on_lookup=lambda hit: record_cache("rag_answer", hit)
+        ) if ANALYSIS_AVAILABLE else None
+
+        # Async handlers run embedding and search in a bounded thread pool, and at most
+        # RAG_MAX_CONCURRENT_QUERIES queries at once (the rest wait for a slot)
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, env_int("RAG_SEARCH_WORKERS", 16)), thread_name_prefix="rag-search"
+        )
+        self.max_concurrent_queries = max(1, env_int("RAG_MAX_CONCURRENT_QUERIES", 32))
+
+        # Concurrent queries arriving within RAG_BATCH_MAX_WAIT_MS are encoded together and
+        # searched with one matrix-matrix product (RAG_BATCH_MAX_SIZE of 1 disables batching)
+        self.batch_max_size = env_int("RAG_BATCH_MAX_SIZE", 32)
+        self.batch_max_wait = env_float("RAG_BATCH_MAX_WAIT_MS", 5.0) / 1000.0
+        self.search_batcher = None
+        self._query_slots = None  # asyncio.Semaphore, created on the event loop
+        self.queries_in_flight = 0
 
         # Check if we're in testing mode (from environment variable)
         testing_mode = os.getenv('TESTING', 'false').lower() == 'true'
@@ -306,50 +388,70 @@ Awaiting operator input."""
         if self._initialized:
             return
 
-        logger.info("Initializing heavy RAG components...")
+        with self._init_lock:  # Concurrent first requests initialize once
+            if self._initialized:
+                return
+
+            logger.info("Initializing heavy RAG components...")
+
+            # Initialize analysis components
+            if ANALYSIS_AVAILABLE:
+                try:
+                    self.embedding_search = EmbeddingSearch(
+                        model_name=self.embedding_model_name, query_cache=self.query_embedding_cache
+                    )
+                    self.embedding_analyzer = EmbeddingAnalyzer()
+                    if self.batch_max_size > 1:
+                        self.embedding_search.query_batcher = MicroBatcher(
+                            lambda queries: list(self.embedding_search.encode_queries(queries)),
+                            max_batch=self.batch_max_size, max_wait=self.batch_max_wait, name="rag_query_embedding"
+                        )
+                        self.search_batcher = MicroBatcher(
+                            self._batched_vector_search,
+                            max_batch=self.batch_max_size, max_wait=self.batch_max_wait, name="rag_vector_search"
+                        )
+                    logger.info("Analysis modules loaded")
+                except Exception as e:
+                    logger.warning(f"Analysis modules not available: {e}")
+                    logger.info("Continuing without advanced analysis features")
 
-        # Initialize analysis components
-        if ANALYSIS_AVAILABLE:
+            # Check cloud API availability
+            self.groq_available = False
+            self.huggingface_available = False
+            self._check_cloud_apis()
+
+            # Check Ollama availability (fallback)
             try:
-                self.embedding_search = EmbeddingSearch(model_name=self.embedding_model_name)
-                self.embedding_analyzer = EmbeddingAnalyzer()
-                logger.info("Analysis modules loaded")
-            except Exception as e:
-                logger.warning(f"Analysis modules not available: {e}")
-                logger.info("Continuing without advanced analysis features")
+                self._check_ollama()
+            except RuntimeError as e:
+                logger.warning(f"Ollama connection failed: {e}")
+                logger.info("Continuing without Ollama (will use other available providers)")
 
-        # Check cloud API availability
-        self.groq_available = False
-        self.huggingface_available = False
-        self._check_cloud_apis()
+            # Determine default LLM provider
+            if self.groq_available:
+                self.default_llm = "groq"
+                logger.info("Groq API available (recommended - fast & free)")
+            elif self.huggingface_available:
+                self.default_llm = "huggingface"
+                logger.info("Hugging Face API available")
+            elif self.ollama_available:
+                self.default_llm = "ollama"
+                logger.info("Ollama available (local, may be slower)")
+            else:
+                logger.warning("No LLM provider available during initialization - will retry on first request")
 
-        # Check Ollama availability (fallback)
-        try:
-            self._check_ollama()
-        except RuntimeError as e:
-            logger.warning(f"Ollama connection failed: {e}")
-            logger.info("Continuing without Ollama (will use other available providers)")
-
-        # Determine default LLM provider
-        if self.groq_available:
-            self.default_llm = "groq"
-            logger.info("Groq API available (recommended - fast & free)")
-        elif self.huggingface_available:
-            self.default_llm = "huggingface"
-            logger.info("Hugging Face API available")
-        elif self.ollama_available:
-            self.default_llm = "ollama"
-            logger.info("Ollama available (local, may be slower)")
-        else:
-            logger.warning("No LLM provider available during initialization - will retry on first request")
+            self._build_provider_router()
 
-        # Load pre-computed embeddings
-        logger.info("Loading pre-computed embeddings...")
-        self.chunks = self._load_all_chunks()
-        logger.info(f"Loaded {len(self.chunks)} chunks from {len(self.chunks_by_pdf)} PDFs")
+            # Load pre-computed embeddings
+            logger.info("Loading pre-computed embeddings...")
+            self.chunks = self._load_all_chunks()
+            logger.info(f"Loaded {len(self.chunks)} chunks from {len(self.chunks_by_pdf)} PDFs")
+            self._get_vector_index()
+            if self.search_mode != "vector" or self.embedding_search is None:
+                self._get_keyword_index()
 
-        self._initialized = True
-        logger.info("Heavy RAG components initialization complete")
+            self._initialized = True
+            logger.info("Heavy RAG components initialization complete")
 
     def _check_ollama(self):
         """Check if Ollama is available and get available models."""
@@ -358,7 +460,9 @@ Awaiting operator input."""
             return any(token in name for token in ["embedding", "embed"])
 
         try:
-            response = requests.get(f"{self.ollama_url}/api/tags", timeout=5)
+            response = self._http_session("ollama").get(
+                f"{self.ollama_url}/api/tags", timeout=(self.HTTP_CONNECT_TIMEOUT, 5)
+            )
             if response.status_code == 200:
                 models = response.json().get('models', [])
                 if models:
@@ -399,21 +503,30 @@ Awaiting operator input."""
             raise RuntimeError(f"Error connecting to Ollama: {e}")
     
     def _check_cloud_apis(self):
-        """Check availability of cloud APIs (Groq, Hugging Face)."""
+        """
+        Set up cloud API clients (Groq, Hugging Face) for the configured keys.
+
+        No requests are made here: reachability is probed by provider_health(), and a
+        failing provider is skipped by the router's circuit breaker.
+        """
         # Check Groq
         groq_key = os.getenv("GROQ_API_KEY")
         if groq_key:
             try:
-                from openai import OpenAI
-                self.groq_client = OpenAI(
-                    api_key=groq_key,
-                    base_url="https://api.groq.com/openai/v1"
-                )
-                # Test connection
-                self.groq_client.models.list()
+                from openai import OpenAI, AsyncOpenAI
+                pooling = {}
+                if httpx is not None:
+                    pooling = {
+                        "timeout": httpx.Timeout(30.0, connect=self.HTTP_CONNECT_TIMEOUT),
+                        "http_client": httpx.Client(limits=self._http_limits())
+                    }
+                self.groq_client = OpenAI(api_key=groq_key, base_url=get_groq_base_url(), **pooling)
+                if httpx is not None:
+                    pooling["http_client"] = httpx.AsyncClient(limits=self._http_limits())
+                self.groq_async_client = AsyncOpenAI(api_key=groq_key, base_url=get_groq_base_url(), **pooling)
                 self.groq_available = True
             except Exception as e:
-                logger.warning(f"Groq API key found but connection failed: {e}")
+                logger.warning(f"Groq API key found but client setup failed: {e}")
                 self.groq_available = False
         else:
             self.groq_available = False
@@ -421,27 +534,86 @@ Awaiting operator input."""
         # Check Hugging Face
         hf_key = os.getenv("HUGGINGFACE_API_KEY")
         if hf_key:
-            try:
-                self.huggingface_key = hf_key
-                # Test with a simple request
-                test_response = requests.get(
-                    "https://api-inference.huggingface.co/models/meta-llama/Llama-2-7b-chat-hf",
-                    headers={"Authorization": f"Bearer {hf_key}"},
-                    timeout=5
-                )
-                if test_response.status_code in [200, 503]:  # 503 means model loading, but API works
-                    self.huggingface_available = True
-                else:
-                    self.huggingface_available = False
-            except Exception:
-                self.huggingface_available = False
+            self.huggingface_key = hf_key
+            self.huggingface_available = True
         else:
             self.huggingface_available = False
+
+    # Seconds to establish a provider connection; read timeouts are set per request
+    HTTP_CONNECT_TIMEOUT = 5.0
+    # Seconds an idle pooled connection is kept open
+    HTTP_KEEPALIVE_SECONDS = 60.0
+
+    def _http_limits(self) -> "httpx.Limits":
+        return httpx.Limits(
+            max_connections=self.http_pool_size,
+            max_keepalive_connections=self.http_pool_size,
+            keepalive_expiry=self.HTTP_KEEPALIVE_SECONDS
+        )
+
+    def _http_session(self, provider: str) -> requests.Session:
+        """Keep-alive requests session for a provider, shared by the threads calling it."""
+        session = self._http_sessions.get(provider)
+        if session is None:
+            session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=self.http_pool_size)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            session = self._http_sessions.setdefault(provider, session)
+        return session
+
+    def _async_http(self, provider: str) -> "httpx.AsyncClient":
+        """Keep-alive async HTTP client for a provider."""
+        client = self._async_http_clients.get(provider)
+        if client is None:
+            client = httpx.AsyncClient(
+                limits=self._http_limits(),
+                timeout=httpx.Timeout(60.0, connect=self.HTTP_CONNECT_TIMEOUT)
+            )
+            self._async_http_clients[provider] = client
+        return client
     
+    def _store_path(self) -> Optional[Path]:
+        """
+        Embedding store to load instead of the JSON files, if one exists.
+
+        RAG_EMBEDDING_STORE names it explicitly; otherwise the embeddings directory
+        itself or a sibling 'store' directory (the vectorizer's default) is used.
+        """
+        if not ANALYSIS_AVAILABLE:
+            return None
+        candidates = [Path(p) for p in [os.getenv("RAG_EMBEDDING_STORE")] if p]
+        candidates += [self.embeddings_dir, self.embeddings_dir.parent / "store"]
+        for candidate in candidates:
+            if is_embedding_store(str(candidate)):
+                return candidate
+        return None
+
+    def _load_store_chunks(self, store_path: Path) -> List[Dict]:
+        """
+        Map an embedding store.
+
+        The returned chunk list and chunks_by_pdf are lazy views: a chunk's text and
+        metadata are decoded only when it is accessed, e.g. for a search hit.
+        """
+        started = time.time()
+        self.embedding_store = EmbeddingStore(str(store_path))
+        self.chunks_by_pdf = self.embedding_store.chunks_by_pdf()
+        logger.info(f"Mapped embedding store {store_path} in {time.time() - started:.2f}s")
+        return self.embedding_store.lazy_chunks()
+
     def _load_all_chunks(self) -> List[Dict]:
-        """Load all pre-computed vectorized chunks from JSON files."""
+        """Load all pre-computed vectorized chunks from the embedding store or JSON files."""
+        store_path = self._store_path()
+        if store_path is not None:
+            try:
+                return self._load_store_chunks(store_path)
+            except (ValueError, OSError) as e:
+                logger.warning(f"Failed to open embedding store {store_path}: {e} - loading JSON files")
+
         chunks = []
         self.chunks_by_pdf = {}
+        self.embedding_store = None
         
         if not self.embeddings_dir.exists():
             raise ValueError(
@@ -482,6 +654,118 @@ Awaiting operator input."""
         
         return chunks
     
+    def _get_vector_index(self):
+        """
+        Resident vector index, rebuilt when the chunk list changes.
+
+        RAG_VECTOR_INDEX selects exact, ivf, hnsw or auto (exact for small corpora);
+        RAG_VECTOR_INDEX_FILE keeps the built index on disk across restarts.
+        """
+        if not ANALYSIS_AVAILABLE:
+            return None
+        corpus = (id(self.chunks), len(self.chunks))
+        if self.vector_index is not None and self._indexed_corpus == corpus:
+            return self.vector_index
+
+        started = time.time()
+        index_file = os.getenv("RAG_VECTOR_INDEX_FILE")
+        index = None
+        if index_file and Path(index_file).exists():
+            try:
+                index = load_vector_index(index_file)
+                if index.meta.get("corpus_chunks") != len(self.chunks):
+                    logger.info(f"Vector index {index_file} was built for another corpus - rebuilding")
+                    index = None
+            except Exception as e:
+                logger.warning(f"Failed to load vector index {index_file}: {e}")
+                index = None
+        if index is None:
+            kind = os.getenv("RAG_VECTOR_INDEX", "auto")
+            if self.embedding_store is not None:
+                # Index the store's matrix (float32 stores are searched in place, no copy)
+                index = build_vector_index(
+                    self.chunks, kind=kind, embeddings=self.embedding_store.embeddings,
+                    normalized=self.embedding_store.normalized
+                )
+            else:
+                index = build_vector_index(self.chunks, kind=kind)
+            index.meta["corpus_chunks"] = len(self.chunks)
+            if index_file:
+                try:
+                    index.save(index_file)
+                except OSError as e:
+                    logger.warning(f"Failed to save vector index {index_file}: {e}")
+
+        self.vector_index = index
+        self._indexed_corpus = corpus
+        stats = index.stats()
+        logger.info(
+            f"Vector index ready: {stats['type']}, {stats['vectors']} x {stats['dim']} "
+            f"in {time.time() - started:.2f}s"
+        )
+        return self.vector_index
+
+    def _keyword_index_file(self) -> Path:
+        """
+        Where the keyword index is persisted: RAG_KEYWORD_INDEX_FILE, else next to the embeddings
+        (inside the embedding store, so rewriting the store discards it).
+        """
+        index_file = os.getenv("RAG_KEYWORD_INDEX_FILE")
+        if index_file:
+            return Path(index_file)
+        if self.embedding_store is not None:
+            return self.embedding_store.path / "bm25.json"
+        return self.embeddings_dir.parent / "bm25_index.json"
+
+    def _get_keyword_index(self) -> BM25Index:
+        """BM25 index over the chunk texts, loaded from disk or built once and saved."""
+        corpus = (id(self.chunks), len(self.chunks))
+        if self.keyword_index is not None and self._keyword_corpus == corpus:
+            return self.keyword_index
+
+        started = time.time()
+        index_file = self._keyword_index_file()
+        corpus_meta = {
+            "corpus_chunks": len(self.chunks),
+            "corpus_created_at": self.embedding_store.manifest.get("created_at") if self.embedding_store else None
+        }
+        index = None
+        if index_file.exists():
+            try:
+                index = BM25Index.load(str(index_file))
+                if index.meta != corpus_meta:
+                    logger.info(f"Keyword index {index_file} was built for another corpus - rebuilding")
+                    index = None
+            except (OSError, ValueError, KeyError) as e:
+                logger.warning(f"Failed to load keyword index {index_file}: {e}")
+                index = None
+        if index is None:
+            index = BM25Index.build(chunk.get('text', '') for chunk in self.chunks)
+            index.meta = corpus_meta
+            try:
+                index.save(str(index_file))
+            except OSError as e:
+                logger.warning(f"Failed to save keyword index {index_file}: {e}")
+
+        self.keyword_index = index
+        self._keyword_corpus = corpus
+        stats = index.stats()
+        logger.info(
+            f"Keyword index ready: {stats['documents']} chunks, {stats['terms']} terms "
+            f"in {time.time() - started:.2f}s"
+        )
+        return self.keyword_index
+
+    def reload_chunks(self):
+        """Reload the embedding store or files and rebuild the vector and keyword indexes."""
+        self.chunks = self._load_all_chunks()
+        if self.answer_cache is not None:
+            self.answer_cache.clear()  # Cached answers cite the old corpus
+        self._get_vector_index()
+        if self.keyword_index is not None:
+            self._get_keyword_index()
+        logger.info(f"Reloaded {len(self.chunks)} chunks from {len(self.chunks_by_pdf)} PDFs")
+
     def _cosine_similarity(self, vec1: np.ndarray, vec2: np.ndarray) -> float:
         """Calculate cosine similarity between two vectors."""
         return np.dot(vec1, vec2) / (np.linalg.norm(vec1) * np.linalg.norm(vec2))
@@ -499,90 +783,148 @@ Awaiting operator input."""
         # For query embedding, we can use a simple approach or keep existing method
         pass
     
-    def search(self, query: str, top_k: int = 5, min_score: float = 0.0) -> List[Dict]:
+    # Candidates taken from each ranking per requested result in hybrid search
+    HYBRID_CANDIDATES = 4
+
+    @staticmethod
+    def _format_result(chunk: Dict, score: float) -> Dict:
+        return {
+            'text': chunk['text'],
+            'score': float(score),
+            'metadata': chunk.get('metadata', {}),
+            'pdf_filename': chunk.get('pdf_filename', 'Unknown'),
+            'chunk_index': chunk.get('chunk_index', 0)
+        }
+
+    def search(self, query: str, top_k: int = 5, min_score: float = 0.0,
+               search_mode: Optional[str] = None) -> List[Dict]:
         """
-        Search for relevant chunks using semantic similarity with embeddings.
+        Search for relevant chunks.
 
         Args:
             query: Search query
             top_k: Number of results to return
-            min_score: Minimum similarity score threshold
+            min_score: Minimum score threshold (cosine similarity for vector and hybrid
+                search, BM25 score for keyword search)
+            search_mode: "vector" (embedding similarity), "keyword" (BM25) or "hybrid"
+                (both, fused by reciprocal rank; 'score' is the fused score and
+                'vector_score' / 'keyword_score' the inputs); default RAG_SEARCH_MODE
 
         Returns:
             List of relevant chunks with scores and metadata
+
+        Raises:
+            ValueError: For an unknown search mode
         """
+        search_mode = self._resolve_search_mode(search_mode)
+
         # Ensure heavy components are initialized
         if not self._initialized:
             self._initialize_heavy_components()
 
+        if search_mode == "keyword":
+            return self._text_based_search(query, top_k, min_score)
+
         if self.embedding_search is None:
-            # Fallback to text-based search if analysis modules not available
-            logger.warning("Embedding search not available, falling back to text matching")
+            # Fallback to keyword search if analysis modules not available
+            logger.warning("Embedding search not available, falling back to keyword search")
             return self._text_based_search(query, top_k, min_score)
 
+        depth = self._vector_depth(top_k, search_mode)
         try:
-            # Use proper embedding-based search
-            results = self.embedding_search.search_by_text(
-                query, self.chunks, top_k=top_k, min_score=min_score
-            )
-
-            # Convert to expected format
-            formatted_results = []
-            for result in results:
-                formatted_results.append({
-                    'text': result['text'],
-                    'score': result['score'],
-                    'metadata': result.get('metadata', {}),
-                    'pdf_filename': result.get('pdf_filename', 'Unknown'),
-                    'chunk_index': result.get('chunk_index', 0)
-                })
-
-            return formatted_results
-
+            # Use proper embedding-based search (batched with concurrent queries)
+            embedding = self.embedding_search.generate_query_embedding(query)
+            if self.search_batcher is not None:
+                hits = self.search_batcher((embedding, depth))
+            else:
+                hits = self._get_vector_index().search(embedding, depth)
         except Exception as e:
             logger.warning(f"Embedding search failed: {e}")
-            logger.info("Falling back to text-based search")
+            logger.info("Falling back to keyword search")
             return self._text_based_search(query, top_k, min_score)
 
+        return self._rank(query, hits, top_k, min_score, search_mode)
+
+    def search_batch(self, queries: List[str], top_k: int = 5, min_score: float = 0.0,
+                     search_mode: Optional[str] = None) -> List[List[Dict]]:
+        """
+        Search for several queries at once: one encoding batch and one pass over the index.
+
+        Args:
+            queries: Search queries
+            top_k: Number of results per query
+            min_score: Minimum score threshold (see search())
+            search_mode: "vector", "keyword" or "hybrid" (default RAG_SEARCH_MODE)
+
+        Returns:
+            One list of results per query, as returned by search()
+
+        Raises:
+            ValueError: For an unknown search mode
+        """
+        search_mode = self._resolve_search_mode(search_mode)
+        if not self._initialized:
+            self._initialize_heavy_components()
+
+        if search_mode != "keyword" and self.embedding_search is not None:
+            depth = self._vector_depth(top_k, search_mode)
+            try:
+                embeddings = self.embedding_search.generate_query_embeddings(queries)
+                all_hits = self._get_vector_index().search_batch(embeddings, depth)
+                return [self._rank(query, hits, top_k, min_score, search_mode)
+                        for query, hits in zip(queries, all_hits)]
+            except Exception as e:
+                logger.warning(f"Batch embedding search failed: {e}")
+                logger.info("Falling back to keyword search")
+        return [self._text_based_search(query, top_k, min_score) for query in queries]
+
+    def _resolve_search_mode(self, search_mode: Optional[str]) -> str:
+        search_mode = search_mode or self.search_mode
+        if search_mode not in SEARCH_MODES:
+            raise ValueError(f"Unknown search mode: {search_mode} (use one of {', '.join(SEARCH_MODES)})")
+        return search_mode
+
+    def _vector_depth(self, top_k: int, search_mode: str) -> int:
+        """Vector candidates needed for top_k results."""
+        return max(top_k * self.HYBRID_CANDIDATES, 20) if search_mode == "hybrid" else top_k
+
+    def _batched_vector_search(self, items: List[tuple]) -> List[List[tuple]]:
+        """Search-batcher function: one index pass for (query embedding, depth) items."""
+        depth = max(item_depth for _, item_depth in items)
+        all_hits = self._get_vector_index().search_batch(np.stack([embedding for embedding, _ in items]), depth)
+        return [hits[:item_depth] for hits, (_, item_depth) in zip(all_hits, items)]
+
+    def _rank(self, query: str, hits: List[tuple], top_k: int, min_score: float, search_mode: str) -> List[Dict]:
+        """Results from vector hits: as they are, or fused with keyword hits in hybrid mode."""
+        vector_hits = [(position, score) for position, score in hits if score >= min_score]
+        if search_mode == "vector":
+            return [self._format_result(self.chunks[position], score) for position, score in vector_hits[:top_k]]
+
+        keyword_hits = self._get_keyword_index().search(query, self._vector_depth(top_k, search_mode))
+        vector_scores = dict(vector_hits)
+        keyword_scores = dict(keyword_hits)
+        formatted_results = []
+        for position, score in reciprocal_rank_fusion([vector_hits, keyword_hits])[:top_k]:
+            result = self._format_result(self.chunks[position], score)
+            result['vector_score'] = vector_scores.get(position)
+            result['keyword_score'] = keyword_scores.get(position)
+            formatted_results.append(result)
+        return formatted_results
+
     def _text_based_search(self, query: str, top_k: int = 5, min_score: float = 0.0) -> List[Dict]:
         """
-        Fallback text-based search method.
+        Keyword search: BM25 over the inverted index (no embeddings needed).
 
         Args:
             query: Search query
             top_k: Number of results to return
-            min_score: Minimum similarity score threshold
+            min_score: Minimum BM25 score
 
         Returns:
             List of relevant chunks with scores
         """
-        # Simple text-based search (keyword matching)
-        query_lower = query.lower()
-        query_words = set(query_lower.split())
-
-        results = []
-        for chunk in self.chunks:
-            chunk_text_lower = chunk['text'].lower()
-            chunk_words = set(chunk_text_lower.split())
-
-            # Calculate simple word overlap score
-            if query_words:
-                overlap = len(query_words & chunk_words) / len(query_words)
-            else:
-                overlap = 0.0
-
-            if overlap >= min_score:
-                results.append({
-                    'text': chunk['text'],
-                    'score': float(overlap),
-                    'metadata': chunk.get('metadata', {}),
-                    'pdf_filename': chunk.get('pdf_filename', 'Unknown'),
-                    'chunk_index': chunk.get('chunk_index', 0)
-                })
-
-        # Sort by score and return top_k
-        results.sort(key=lambda x: x['score'], reverse=True)
-        return results[:top_k]
+        hits = self._get_keyword_index().search(query, top_k)
+        return [self._format_result(self.chunks[position], score) for position, score in hits if score >= min_score]
 
     def get_embedding_statistics(self) -> Dict:
         """
@@ -624,17 +966,9 @@ Awaiting operator input."""
         except Exception as e:
             return {'error': f'Failed to generate validation report: {e}'}
 
-    def _generate_with_ollama(self, query: str, context: str, system_prompt: Optional[str] = None) -> str:
-        """
-        Generate answer using Ollama LLM.
-        
-        Args:
-            query: User query
-            context: Context from retrieved chunks
-        
-        Returns:
-            Generated answer
-        """
+    def _ollama_request(self, query: str, context: str, system_prompt: Optional[str] = None,
+                        model: Optional[str] = None) -> Dict:
+        """Body of an Ollama /api/generate request (model defaults to the engine's Ollama model)."""
         system_prompt_to_use = system_prompt if system_prompt else self.SYSTEM_PROMPT
         
         prompt = f"""{system_prompt_to_use}
@@ -650,34 +984,49 @@ Provide a comprehensive, coherent answer that synthesizes the information from t
 
 Answer:"""
         
+        # Limit prompt length to avoid issues (reduced for faster processing)
+        max_prompt_length = 3000  # Characters (reduced from 4000)
+        if len(prompt) > max_prompt_length:
+            # Truncate context if needed, keep system prompt and query
+            system_and_query = f"{system_prompt_to_use}\n\nUser Question: {query}\n\nAnswer:"
+            available_for_context = max_prompt_length - len(system_and_query) - 200
+            if available_for_context > 0 and len(context) > available_for_context:
+                context = context[:available_for_context] + "\n\n[Context truncated...]"
+            prompt = f"{system_prompt_to_use}\n\nContext:\n{context}\n\nUser Question: {query}\n\nProvide a concise answer:\n\nAnswer:"
+
+        # Check if this is an evaluation query (has system prompt with "PoD Reviewer")
+        is_evaluation = system_prompt and "PoD Reviewer" in system_prompt
+        num_predict = 2000 if is_evaluation else 300  # More tokens for evaluation queries
+
+        return {
+            "model": model or self.ollama_model,
+            "prompt": prompt,
+            "stream": False,
+            "options": {
+                "temperature": 0.7,
+                "top_p": 0.9,
+                "num_predict": num_predict,
+            }
+        }
+
+    def _generate_with_ollama(self, query: str, context: str, system_prompt: Optional[str] = None,
+                              model: Optional[str] = None) -> str:
+        """
+        Generate answer using Ollama LLM.
+        
+        Args:
+            query: User query
+            context: Context from retrieved chunks
+            model: Ollama model for this request (default: the engine's Ollama model)
+        
+        Returns:
+            Generated answer
+        """
         try:
-            # Limit prompt length to avoid issues (reduced for faster processing)
-            max_prompt_length = 3000  # Characters (reduced from 4000)
-            if len(prompt) > max_prompt_length:
-                # Truncate context if needed, keep system prompt and query
-                system_and_query = f"{system_prompt_to_use}\n\nUser Question: {query}\n\nAnswer:"
-                available_for_context = max_prompt_length - len(system_and_query) - 200
-                if available_for_context > 0 and len(context) > available_for_context:
-                    context = context[:available_for_context] + "\n\n[Context truncated...]"
-                prompt = f"{system_prompt_to_use}\n\nContext:\n{context}\n\nUser Question: {query}\n\nProvide a concise answer:\n\nAnswer:"
-            
-            # Check if this is an evaluation query (has system prompt with "PoD Reviewer")
-            is_evaluation = system_prompt and "PoD Reviewer" in system_prompt
-            num_predict = 2000 if is_evaluation else 300  # More tokens for evaluation queries
-            
-            response = requests.post(
+            response = self._http_session("ollama").post(
                 f"{self.ollama_url}/api/generate",
-                json={
-                    "model": self.ollama_model,
-                    "prompt": prompt,
-                    "stream": False,
-                    "options": {
-                        "temperature": 0.7,
-                        "top_p": 0.9,
-                        "num_predict": num_predict,
-                    }
-                },
-                timeout=120  # 120 second timeout for longer prompts
+                json=self._ollama_request(query, context, system_prompt, model),
+                timeout=(self.HTTP_CONNECT_TIMEOUT, 120)  # 120 second timeout for longer prompts
             )
             
             if response.status_code == 200:
@@ -689,7 +1038,74 @@ Answer:"""
             raise Exception("Ollama request timed out. The model may be too slow or the context too large.")
         except Exception as e:
             raise Exception(f"Error calling Ollama: {e}")
-    
+
+    async def _agenerate_with_ollama(self, query: str, context: str, system_prompt: Optional[str] = None,
+                                     model: Optional[str] = None) -> str:
+        """Async _generate_with_ollama() on the shared HTTP client."""
+        try:
+            response = await self._async_http("ollama").post(
+                f"{self.ollama_url}/api/generate",
+                json=self._ollama_request(query, context, system_prompt, model),
+                timeout=120
+            )
+            if response.status_code == 200:
+                return response.json().get('response', '').strip()
+            raise Exception(f"Ollama API error: {response.status_code} - {response.text}")
+        except httpx.TimeoutException:
+            raise Exception("Ollama request timed out. The model may be too slow or the context too large.")
+        except Exception as e:
+            raise Exception(f"Error calling Ollama: {e}")
+
+    async def _astream_with_ollama(self, query: str, context: str, system_prompt: Optional[str] = None,
+                                   model: Optional[str] = None) -> AsyncIterator[str]:
+        """Stream an Ollama answer token by token."""
+        body = dict(self._ollama_request(query, context, system_prompt, model), stream=True)
+        async with self._async_http("ollama").stream("POST", f"{self.ollama_url}/api/generate", json=body, timeout=120) as response:
+            if response.status_code != 200:
+                await response.aread()
+                raise Exception(f"Ollama API error: {response.status_code} - {response.text}")
+            async for line in response.aiter_lines():
+                if not line.strip():
+                    continue
+                data = json.loads(line)
+                if data.get('error'):
+                    raise Exception(f"Ollama API error: {data['error']}")
+                if data.get('response'):
+                    yield data['response']
+                if data.get('done'):
+                    break
+
+    def _groq_request(self, query: str, context: str, system_prompt: Optional[str] = None) -> Dict:
+        """Arguments of a Groq chat completion request."""
+        # Limit context length
+        max_context_length = 2000
+        if len(context) > max_context_length:
+            context = context[:max_context_length] + "\n\n[Context truncated...]"
+
+        system_prompt_to_use = system_prompt if system_prompt else self.SYSTEM_PROMPT
+
+        messages = [
+            {"role": "system", "content": system_prompt_to_use},
+            {"role": "user", "content": f"""Context from Syntheverse knowledge base:
+{context}
+
+User Question: {query}
+
+Answer (synthesize from context using Gina × Leo × Pru framework):"""}
+        ]
+
+        # Check if this is an evaluation query (has system prompt with "PoD Reviewer")
+        is_evaluation = system_prompt_to_use and "PoD Reviewer" in system_prompt_to_use
+        max_tokens = 2000 if is_evaluation else 500  # More tokens for evaluation queries
+
+        return {
+            "model": "llama-3.1-8b-instant",  # Fast model
+            "messages": messages,
+            "temperature": 0.7,
+            "max_tokens": max_tokens,
+            "timeout": 30
+        }
+
     def _generate_with_groq(self, query: str, context: str, system_prompt: Optional[str] = None) -> str:
         """
         Generate answer using Groq API (fast cloud LLM).
@@ -702,39 +1118,72 @@ Answer:"""
             Generated answer
         """
         try:
-            # Limit context length
-            max_context_length = 2000
-            if len(context) > max_context_length:
-                context = context[:max_context_length] + "\n\n[Context truncated...]"
-            
-            system_prompt_to_use = system_prompt if system_prompt else self.SYSTEM_PROMPT
-            
-            messages = [
-                {"role": "system", "content": system_prompt_to_use},
-                {"role": "user", "content": f"""Context from Syntheverse knowledge base:
-{context}
-
-User Question: {query}
+            response = self.groq_client.chat.completions.create(**self._groq_request(query, context, system_prompt))
+            return response.choices[0].message.content.strip()
+        except Exception as e:
+            raise Exception(f"Error calling Groq API: {e}")
 
-Answer (synthesize from context using Gina × Leo × Pru framework):"""}
-            ]
-            
-            # Check if this is an evaluation query (has system prompt with "PoD Reviewer")
-            is_evaluation = system_prompt_to_use and "PoD Reviewer" in system_prompt_to_use
-            max_tokens = 2000 if is_evaluation else 500  # More tokens for evaluation queries
-            
-            response = self.groq_client.chat.completions.create(
-                model="llama-3.1-8b-instant",  # Fast model
-                messages=messages,
-                temperature=0.7,
-                max_tokens=max_tokens,
-                timeout=30
+    async def _agenerate_with_groq(self, query: str, context: str, system_prompt: Optional[str] = None) -> str:
+        """Async _generate_with_groq()."""
+        try:
+            response = await self.groq_async_client.chat.completions.create(
+                **self._groq_request(query, context, system_prompt)
             )
-            
             return response.choices[0].message.content.strip()
         except Exception as e:
             raise Exception(f"Error calling Groq API: {e}")
-    
+
+    async def _astream_with_groq(self, query: str, context: str,
+                                 system_prompt: Optional[str] = None) -> AsyncIterator[str]:
+        """Stream a Groq answer token by token."""
+        stream = await self.groq_async_client.chat.completions.create(
+            **self._groq_request(query, context, system_prompt), stream=True
+        )
+        async for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+
+    # Fast, free Hugging Face model used for generation
+    HUGGINGFACE_URL = "https://api-inference.huggingface.co"
+    HUGGINGFACE_MODEL = "mistralai/Mistral-7B-Instruct-v0.2"
+
+    def _huggingface_request(self, query: str, context: str, system_prompt: Optional[str] = None) -> Dict:
+        """Body of a Hugging Face Inference API request."""
+        # Limit context length
+        max_context_length = 1500
+        if len(context) > max_context_length:
+            context = context[:max_context_length] + "\n\n[Context truncated...]"
+
+        system_prompt_to_use = system_prompt if system_prompt else self.SYSTEM_PROMPT
+
+        prompt = f"""{system_prompt_to_use}
+
+Context from Syntheverse knowledge base:
+{context}
+
+User Question: {query}
+
+Answer (synthesize from context using Gina × Leo × Pru framework):"""
+
+        return {
+            "inputs": prompt,
+            "parameters": {
+                "max_new_tokens": 300,
+                "temperature": 0.7,
+                "return_full_text": False
+            }
+        }
+
+    @staticmethod
+    def _huggingface_answer(result) -> str:
+        """Generated text of a Hugging Face Inference API response."""
+        if isinstance(result, list) and len(result) > 0:
+            return result[0].get('generated_text', '').strip()
+        elif isinstance(result, dict):
+            return result.get('generated_text', '').strip()
+        else:
+            return str(result).strip()
+
     def _generate_with_huggingface(self, query: str, context: str, system_prompt: Optional[str] = None) -> str:
         """
         Generate answer using Hugging Face Inference API.
@@ -747,52 +1196,86 @@ Answer (synthesize from context using Gina × Leo × Pru framework):"""}
             Generated answer
         """
         try:
-            # Limit context length
-            max_context_length = 1500
-            if len(context) > max_context_length:
-                context = context[:max_context_length] + "\n\n[Context truncated...]"
-            
-            system_prompt_to_use = system_prompt if system_prompt else self.SYSTEM_PROMPT
-            
-            prompt = f"""{system_prompt_to_use}
-
-Context from Syntheverse knowledge base:
-{context}
-
-User Question: {query}
-
-Answer (synthesize from context using Gina × Leo × Pru framework):"""
-            
-            # Use a fast, free model
-            model = "mistralai/Mistral-7B-Instruct-v0.2"
-            
-            response = requests.post(
-                f"https://api-inference.huggingface.co/models/{model}",
+            response = self._http_session("huggingface").post(
+                f"{self.HUGGINGFACE_URL}/models/{self.HUGGINGFACE_MODEL}",
                 headers={"Authorization": f"Bearer {self.huggingface_key}"},
-                json={
-                    "inputs": prompt,
-                    "parameters": {
-                        "max_new_tokens": 300,
-                        "temperature": 0.7,
-                        "return_full_text": False
-                    }
-                },
-                timeout=60
+                json=self._huggingface_request(query, context, system_prompt),
+                timeout=(self.HTTP_CONNECT_TIMEOUT, 60)
             )
             
             if response.status_code == 200:
-                result = response.json()
-                if isinstance(result, list) and len(result) > 0:
-                    return result[0].get('generated_text', '').strip()
-                elif isinstance(result, dict):
-                    return result.get('generated_text', '').strip()
-                else:
-                    return str(result).strip()
+                return self._huggingface_answer(response.json())
             else:
                 raise Exception(f"Hugging Face API error: {response.status_code} - {response.text}")
         except Exception as e:
             raise Exception(f"Error calling Hugging Face API: {e}")
+
+    async def _agenerate_with_huggingface(self, query: str, context: str, system_prompt: Optional[str] = None) -> str:
+        """Async _generate_with_huggingface() on the shared HTTP client."""
+        try:
+            response = await self._async_http("huggingface").post(
+                f"{self.HUGGINGFACE_URL}/models/{self.HUGGINGFACE_MODEL}",
+                headers={"Authorization": f"Bearer {self.huggingface_key}"},
+                json=self._huggingface_request(query, context, system_prompt),
+                timeout=60
+            )
+            if response.status_code == 200:
+                return self._huggingface_answer(response.json())
+            raise Exception(f"Hugging Face API error: {response.status_code} - {response.text}")
+        except Exception as e:
+            raise Exception(f"Error calling Hugging Face API: {e}")
+
     
+    # Hedge delays used until a provider has enough latency samples for its p95
+    PROVIDER_HEDGE_AFTER = {"groq": 5.0, "huggingface": 15.0, "ollama": 30.0}
+
+    def _build_provider_router(self):
+        """Build the provider router from the currently available LLM providers."""
+        generators = {
+            "groq": (self.groq_available, self._generate_with_groq),
+            "huggingface": (self.huggingface_available, self._generate_with_huggingface),
+            "ollama": (self.ollama_available, self._generate_with_ollama),
+        }
+        # Async generators for the async path (without them, calls run in the router's threads)
+        async_generators = {
+            "groq": self._agenerate_with_groq if self.groq_async_client is not None else None,
+            "huggingface": self._agenerate_with_huggingface if httpx is not None else None,
+            "ollama": self._agenerate_with_ollama if httpx is not None else None,
+        }
+        # Token streams for /query/stream (other providers send the whole answer at once)
+        stream_generators = {
+            "groq": self._astream_with_groq if self.groq_async_client is not None else None,
+            "ollama": self._astream_with_ollama if httpx is not None else None,
+        }
+        # Default provider first, then the rest in the usual fallback order
+        order = [self.default_llm] + [name for name in ("groq", "huggingface", "ollama") if name != self.default_llm]
+
+        # Ollama also takes the request's model ("ollama:<model>"), so concurrent
+        # requests for different models never share engine state
+        def options(name: str, request: Dict) -> Dict:
+            return {"model": request.get("ollama_model")} if name == "ollama" else {}
+
+        router = ProviderRouter()
+        for name in order:
+            available, generate = generators.get(name, (False, None))
+            agenerate = async_generators.get(name)
+            stream = stream_generators.get(name)
+            if available:
+                router.add_provider(Provider(
+                    name,
+                    lambda request, cancel_event, generate=generate, name=name: generate(
+                        request["query"], request["context"], request["system_prompt"], **options(name, request)
+                    ),
+                    hedge_after=self.PROVIDER_HEDGE_AFTER[name],
+                    async_call=(lambda request, agenerate=agenerate, name=name: agenerate(
+                        request["query"], request["context"], request["system_prompt"], **options(name, request)
+                    )) if agenerate is not None else None,
+                    stream_call=(lambda request, stream=stream, name=name: stream(
+                        request["query"], request["context"], request["system_prompt"], **options(name, request)
+                    )) if stream is not None else None
+                ))
+        self.provider_router = router
+
     def generate_answer(self, query: str, relevant_chunks: List[Dict], llm_model: str = None, system_prompt: Optional[str] = None) -> str:
         """
         Generate synthesized answer from relevant chunks using specified LLM.
@@ -800,14 +1283,40 @@ Answer (synthesize from context using Gina × Leo × Pru framework):"""
         Args:
             query: Original query
             relevant_chunks: List of relevant chunks with scores
-            llm_model: LLM to use ("groq", "huggingface", "ollama", or None for auto)
+            llm_model: LLM to use first ("groq", "huggingface", "ollama", "ollama:<model>", or None for auto);
+                other available providers take over on failure or when it exceeds its p95 latency
         
         Returns:
             Synthesized answer as a coherent narrative
         """
         if not relevant_chunks:
-            return "I couldn't find specific information matching your query in the knowledge base. You might want to try rephrasing your question or exploring related topics. Would you like to enter the sandbox for deeper exploration?"
-        
+            return self.NO_RESULTS_ANSWER
+
+        # Selected LLM goes first; slow or failing requests are hedged to the next provider
+        request, provider = self._provider_request(query, relevant_chunks, llm_model, system_prompt)
+        return self._get_provider_router().call(request, preferred=provider)
+
+    async def agenerate_answer(self, query: str, relevant_chunks: List[Dict], llm_model: str = None,
+                               system_prompt: Optional[str] = None) -> str:
+        """Async generate_answer(): provider calls do not block the event loop."""
+        if not relevant_chunks:
+            return self.NO_RESULTS_ANSWER
+        request, provider = self._provider_request(query, relevant_chunks, llm_model, system_prompt)
+        return await self._get_provider_router().acall(request, preferred=provider)
+
+    def _provider_request(self, query: str, relevant_chunks: List[Dict], llm_model: Optional[str],
+                          system_prompt: Optional[str]) -> Tuple[Dict, str]:
+        """Provider router request and preferred provider; "ollama:<model>" picks the Ollama model per request."""
+        provider, _, ollama_model = (llm_model or self.default_llm).partition(":")
+        request = {"query": query, "context": self._answer_context(relevant_chunks), "system_prompt": system_prompt,
+                   "ollama_model": ollama_model or None}
+        return request, provider
+
+    NO_RESULTS_ANSWER = "I couldn't find specific information matching your query in the knowledge base. You might want to try rephrasing your question or exploring related topics. Would you like to enter the sandbox for deeper exploration?"
+
+    @staticmethod
+    def _answer_context(relevant_chunks: List[Dict]) -> str:
+        """LLM context from the top search results."""
         # Use top 3 chunks for faster processing
         top_chunks = relevant_chunks[:3]
         
@@ -819,77 +1328,323 @@ Answer (synthesize from context using Gina × Leo × Pru framework):"""
             if len(chunk_text) > 400:
                 chunk_text = chunk_text[:400] + "..."
             context_parts.append(f"[Source {i}: {chunk.get('pdf_filename', 'Unknown')}]\n{chunk_text}\n")
-        context = "\n\n".join(context_parts)
-        
-        # Determine which LLM to use
-        if llm_model is None:
-            llm_model = self.default_llm
-        
-        # Generate with selected LLM (pass system_prompt)
-        if llm_model == "groq" and self.groq_available:
-            return self._generate_with_groq(query, context, system_prompt)
-        elif llm_model == "huggingface" and self.huggingface_available:
-            return self._generate_with_huggingface(query, context, system_prompt)
-        elif llm_model == "ollama" and self.ollama_available:
-            # If Ollama generation fails (e.g. embedding-only model, runtime error),
-            # fall back to an available cloud provider rather than failing the whole request.
-            try:
-                return self._generate_with_ollama(query, context, system_prompt)
-            except Exception as e:
-                err = str(e)
-                if self.groq_available:
-                    logger.warning(f"Ollama generation failed ({err}); falling back to Groq")
-                    return self._generate_with_groq(query, context, system_prompt)
-                if self.huggingface_available:
-                    logger.warning(f"Ollama generation failed ({err}); falling back to Hugging Face")
-                    return self._generate_with_huggingface(query, context, system_prompt)
-                raise
-        else:
-            # Fallback: try available providers in order
-            if self.groq_available:
-                return self._generate_with_groq(query, context, system_prompt)
-            elif self.huggingface_available:
-                return self._generate_with_huggingface(query, context, system_prompt)
-            elif self.ollama_available:
-                return self._generate_with_ollama(query, context, system_prompt)
-            else:
-                raise RuntimeError("No LLM provider available")
-    
-    def query(self, query: str, top_k: int = 5, min_score: float = 0.0, llm_model: str = None, system_prompt: Optional[str] = None) -> Dict:
+        return "\n\n".join(context_parts)
+
+    def _get_provider_router(self) -> ProviderRouter:
+        if self.provider_router is None or not self.provider_router.providers:
+            self._build_provider_router()
+        if not self.provider_router.providers:
+            raise RuntimeError("No LLM provider available")
+        return self.provider_router
+
+    def query(self, query: str, top_k: int = 5, min_score: float = 0.0, llm_model: str = None,
+              system_prompt: Optional[str] = None, search_mode: Optional[str] = None) -> Dict:
         """
         Complete RAG query: search + generate answer with Ollama.
 
+        Answers are reused for queries within RAG_ANSWER_CACHE_THRESHOLD cosine
+        similarity of an earlier query asked with the same LLM, top_k, min_score,
+        system prompt and search mode.
+
         Args:
             query: User query
             top_k: Number of chunks to retrieve
             min_score: Minimum similarity score
+            search_mode: "vector", "keyword" or "hybrid" retrieval (default RAG_SEARCH_MODE)
 
         Returns:
-            Dictionary with answer, sources, and metadata
+            Dictionary with answer, sources, and metadata ('cached' is True for a reused answer)
         """
         # Ensure heavy components are initialized
         if not self._initialized:
             self._initialize_heavy_components()
 
         start_time = time.time()
-        
+        if llm_model is None:
+            llm_model = self.default_llm
+
+        # Semantic answer cache (the query embedding is cached for the search below)
+        search_mode = search_mode or self.search_mode
+        scope = (llm_model, top_k, min_score, system_prompt or "", search_mode)
+        query_embedding, cached = self._lookup_answer(query, scope)
+        if cached is not None:
+            return self._cached_result(cached, query, start_time)
+
         # Search for relevant chunks
-        relevant_chunks = self.search(query, top_k=top_k, min_score=min_score)
+        relevant_chunks = self.search(query, top_k=top_k, min_score=min_score, search_mode=search_mode)
         
         # Generate answer with selected LLM
-        if llm_model is None:
-            llm_model = self.default_llm
         answer = self.generate_answer(query, relevant_chunks, llm_model=llm_model, system_prompt=system_prompt)
-        
-        processing_time = time.time() - start_time
-        
-        return {
+
+        return self._query_result(query, answer, relevant_chunks, llm_model, start_time, query_embedding, scope)
+
+    async def aquery(self, query: str, top_k: int = 5, min_score: float = 0.0, llm_model: str = None,
+                     system_prompt: Optional[str] = None, search_mode: Optional[str] = None) -> Dict:
+        """
+        Async query(): embedding and search run in the engine's thread pool and LLM calls
+        on async clients, so other requests proceed while this one waits. At most
+        RAG_MAX_CONCURRENT_QUERIES queries run at once; the rest wait for a slot.
+        """
+        async with self._concurrency_slot():
+            if not self._initialized:
+                await self.run_blocking(self._initialize_heavy_components)
+
+            start_time = time.time()
+            if llm_model is None:
+                llm_model = self.default_llm
+
+            search_mode = search_mode or self.search_mode
+            scope = (llm_model, top_k, min_score, system_prompt or "", search_mode)
+            query_embedding, cached = await self.run_blocking(self._lookup_answer, query, scope)
+            if cached is not None:
+                return self._cached_result(cached, query, start_time)
+
+            relevant_chunks = await self.run_blocking(self.search, query, top_k, min_score, search_mode)
+            answer = await self.agenerate_answer(query, relevant_chunks, llm_model=llm_model, system_prompt=system_prompt)
+
+            return self._query_result(query, answer, relevant_chunks, llm_model, start_time, query_embedding, scope)
+
+    async def astream_query(self, query: str, top_k: int = 5, min_score: float = 0.0, llm_model: str = None,
+                            system_prompt: Optional[str] = None,
+                            search_mode: Optional[str] = None) -> AsyncIterator[Dict]:
+        """
+        Streaming aquery(): sources as soon as retrieval finishes, then the answer as it is generated.
+
+        Yields events:
+            {"type": "sources", "query", "sources", "num_sources", "retrieval_time"}
+            {"type": "token", "text"} - answer text chunks, in order
+            {"type": "done", "processing_time", "llm_model", "cached"}
+
+        Raises:
+            ProviderError: If no provider produced an answer (after the sources were sent)
+        """
+        async with self._concurrency_slot():
+            if not self._initialized:
+                await self.run_blocking(self._initialize_heavy_components)
+
+            start_time = time.time()
+            if llm_model is None:
+                llm_model = self.default_llm
+
+            search_mode = search_mode or self.search_mode
+            scope = (llm_model, top_k, min_score, system_prompt or "", search_mode)
+            query_embedding, cached = await self.run_blocking(self._lookup_answer, query, scope)
+            if cached is not None:
+                yield self._sources_event(query, cached['sources'], start_time)
+                yield {"type": "token", "text": cached['answer']}
+                yield {"type": "done", "processing_time": time.time() - start_time,
+                       "llm_model": cached['llm_model'], "cached": True}
+                return
+
+            relevant_chunks = await self.run_blocking(self.search, query, top_k, min_score, search_mode)
+            yield self._sources_event(query, relevant_chunks, start_time)
+
+            parts = []
+            if not relevant_chunks:
+                parts.append(self.NO_RESULTS_ANSWER)
+                yield {"type": "token", "text": self.NO_RESULTS_ANSWER}
+            else:
+                request, provider = self._provider_request(query, relevant_chunks, llm_model, system_prompt)
+                async for text in self._get_provider_router().astream(request, preferred=provider):
+                    parts.append(text)
+                    yield {"type": "token", "text": text}
+
+            result = self._query_result(query, "".join(parts).strip(), relevant_chunks, llm_model,
+                                        start_time, query_embedding, scope)
+            yield {"type": "done", "processing_time": result['processing_time'],
+                   "llm_model": result['llm_model'], "cached": False}
+
+    @staticmethod
+    def _sources_event(query: str, sources: List[Dict], start_time: float) -> Dict:
+        return {"type": "sources", "query": query, "sources": list(sources), "num_sources": len(sources),
+                "retrieval_time": time.time() - start_time}
+
+    async def asearch(self, query: str, top_k: int = 5, min_score: float = 0.0,
+                      search_mode: Optional[str] = None) -> List[Dict]:
+        """Async search(), run in the engine's thread pool under the concurrency limit."""
+        async with self._concurrency_slot():
+            return await self.run_blocking(self.search, query, top_k, min_score, search_mode)
+
+    async def asearch_batch(self, queries: List[str], top_k: int = 5, min_score: float = 0.0,
+                            search_mode: Optional[str] = None) -> List[List[Dict]]:
+        """Async search_batch(), run in the engine's thread pool under the concurrency limit."""
+        async with self._concurrency_slot():
+            return await self.run_blocking(self.search_batch, queries, top_k, min_score, search_mode)
+
+    async def run_blocking(self, func: Callable, *args):
+        """Run a blocking (CPU-bound or synchronous I/O) call in the engine's bounded thread pool."""
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+
+    @asynccontextmanager
+    async def _concurrency_slot(self):
+        if self._query_slots is None:
+            self._query_slots = asyncio.Semaphore(self.max_concurrent_queries)
+        async with self._query_slots:
+            self.queries_in_flight += 1
+            try:
+                yield
+            finally:
+                self.queries_in_flight -= 1
+
+    def _lookup_answer(self, query: str, scope: tuple):
+        """Query embedding for the answer cache, and the cached answer for it (None if absent)."""
+        if self.answer_cache is None or self.embedding_search is None:
+            return None, None
+        try:
+            query_embedding = self.embedding_search.generate_query_embedding(query)
+        except (ValueError, RuntimeError) as e:
+            logger.warning(f"Answer cache skipped: {e}")
+            return None, None
+        return query_embedding, self.answer_cache.lookup(query_embedding, scope)
+
+    @staticmethod
+    def _cached_result(cached: Dict, query: str, start_time: float) -> Dict:
+        return dict(cached, sources=list(cached['sources']), query=query,
+                    processing_time=time.time() - start_time, cached=True)
+
+    def _query_result(self, query: str, answer: str, relevant_chunks: List[Dict], llm_model: str,
+                      start_time: float, query_embedding, scope: tuple) -> Dict:
+        """Query response, stored in the answer cache when the query was embedded."""
+        result = {
             'answer': answer,
             'sources': relevant_chunks,
             'query': query,
-            'processing_time': processing_time,
+            'processing_time': time.time() - start_time,
             'num_sources': len(relevant_chunks),
-            'llm_model': llm_model or self.default_llm
+            'llm_model': llm_model or self.default_llm,
+            'cached': False
+        }
+        if query_embedding is not None:
+            self.answer_cache.store(query_embedding, scope, dict(result))
+        return result
+
+    async def _fetch_ollama_models(self) -> List[str]:
+        if httpx is not None:
+            response = await self._async_http("ollama").get(f"{self.ollama_url}/api/tags", timeout=5)
+        else:
+            response = await self.run_blocking(
+                lambda: self._http_session("ollama").get(f"{self.ollama_url}/api/tags", timeout=(self.HTTP_CONNECT_TIMEOUT, 5))
+            )
+        if response.status_code != 200:
+            raise RuntimeError(f"Ollama API returned error: {response.status_code}")
+        models = [m['name'] for m in response.json().get('models', [])]
+        self.health_cache.put("ollama_models", models)
+        return models
+
+    async def list_ollama_models(self) -> List[str]:
+        """
+        Names of the models installed in Ollama ([] if it is unreachable).
+
+        A successful listing is cached for RAG_HEALTH_TTL; failures are not, so the
+        models reappear as soon as Ollama is back.
+        """
+        models = self.health_cache.get("ollama_models")
+        if models is None:
+            try:
+                models = await self._fetch_ollama_models()
+            except Exception:
+                models = []
+        return models
+
+    # Seconds a single health probe may take
+    HEALTH_PROBE_TIMEOUT = 5.0
+
+    async def provider_health(self) -> Dict[str, Dict]:
+        """
+        Reachability of the configured LLM providers.
+
+        Each provider is probed at most once per RAG_HEALTH_TTL seconds (stale ones
+        concurrently); other calls return the cached status.
+
+        Returns:
+            Provider name -> {"healthy", "latency_seconds", "error" (if unhealthy)}
+        """
+        probes = {"ollama": self._probe_ollama}
+        if self.groq_async_client is not None:
+            probes["groq"] = self._probe_groq
+        if self.huggingface_key:
+            probes["huggingface"] = self._probe_huggingface
+
+        statuses = {name: self.health_cache.get(f"health:{name}") for name in probes}
+        stale = [name for name, status in statuses.items() if status is None]
+        if stale:
+            results = await asyncio.gather(*(self._probe(probes[name]) for name in stale))
+            for name, status in zip(stale, results):
+                self.health_cache.put(f"health:{name}", status)
+                statuses[name] = status
+        return statuses
+
+    async def _probe(self, probe: Callable) -> Dict:
+        started = time.monotonic()
+        try:
+            await asyncio.wait_for(probe(), timeout=self.HEALTH_PROBE_TIMEOUT)
+            status = {"healthy": True}
+        except Exception as e:
+            status = {"healthy": False, "error": str(e) or type(e).__name__}
+        status["latency_seconds"] = round(time.monotonic() - started, 3)
+        return status
+
+    async def _probe_groq(self):
+        await self.groq_async_client.models.list()
+
+    async def _probe_ollama(self):
+        await self._fetch_ollama_models()
+
+    async def _probe_huggingface(self):
+        url = f"{self.HUGGINGFACE_URL}/models/{self.HUGGINGFACE_MODEL}"
+        headers = {"Authorization": f"Bearer {self.huggingface_key}"}
+        if httpx is not None:
+            response = await self._async_http("huggingface").get(url, headers=headers)
+        else:
+            response = await self.run_blocking(
+                lambda: self._http_session("huggingface").get(url, headers=headers, timeout=(self.HTTP_CONNECT_TIMEOUT, 5))
+            )
+        if response.status_code not in (200, 503):  # 503 means model loading, but API works
+            raise RuntimeError(f"Hugging Face API returned error: {response.status_code}")
+
+    async def warm_up(self):
+        """
+        Initialize in the background and open the provider connection pools, so the
+        first query pays for neither.
+        """
+        try:
+            await self.run_blocking(self._initialize_heavy_components)
+            await self.provider_health()
+            logger.info("RAG engine warmed up")
+        except Exception as e:
+            logger.warning(f"RAG engine warm-up failed: {e}")
+
+    async def aclose(self):
+        """Close the HTTP clients and sessions, the batchers and the thread pool."""
+        for client in self._async_http_clients.values():
+            await client.aclose()
+        self._async_http_clients.clear()
+        for session in self._http_sessions.values():
+            session.close()
+        self._http_sessions.clear()
+        if self.groq_async_client is not None:
+            await self.groq_async_client.close()
+        if self.groq_client is not None:
+            self.groq_client.close()
+        for batcher in self._batchers():
+            batcher.close(timeout=1.0)
+        self._executor.shutdown(wait=False)
+
+    def _batchers(self) -> List[MicroBatcher]:
+        batchers = [self.search_batcher]
+        if self.embedding_search is not None:
+            batchers.append(self.embedding_search.query_batcher)
+        return [batcher for batcher in batchers if batcher is not None]
+
+    def batch_stats(self) -> Dict:
+        """Batch counts and sizes of the query embedding and vector search batchers."""
+        return {batcher.name: batcher.stats() for batcher in self._batchers()}
+
+    def cache_stats(self) -> Dict:
+        """Hit rates and sizes of the query embedding and answer caches."""
+        return {
+            'query_embedding': self.query_embedding_cache.stats(),
+            'answer': self.answer_cache.stats() if self.answer_cache is not None else None
         }
 
 
@@ -915,10 +1670,18 @@ async def lifespan(app: FastAPI):
         # Allow server to start without RAG functionality
         rag_engine = None
 
+    # Load embeddings and connect to providers in the background instead of on the first query
+    warm_up = None
+    if rag_engine is not None and os.getenv('TESTING', 'false').lower() != 'true':
+        warm_up = asyncio.create_task(rag_engine.warm_up())
+
     yield
 
-    # Shutdown cleanup (if needed)
-    pass
+    # Shutdown cleanup
+    if warm_up is not None:
+        warm_up.cancel()
+    if rag_engine is not None:
+        await rag_engine.aclose()
 
 # Initialize FastAPI app
 app = FastAPI(
@@ -937,6 +1700,16 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Request latency and in-flight metrics (scraped at /metrics)
+app.middleware("http")(asgi_metrics_middleware("rag-api"))
+
+# On-demand profiling (/admin/profile, or SIGUSR2 to toggle a 30s sampling session)
+profiler = get_profiler(
+    os.getenv("SYNTHEVERSE_PROFILE_DIR") or str(Path(__file__).parent.parent.parent.parent / "test_outputs" / "profiles")
+)
+app.middleware("http")(asgi_profiling_middleware(profiler))
+profiler.install_signal_handler()
+
 # Serve static files (UI)
 static_dir = Path(__file__).parent / "static"
 static_dir.mkdir(exist_ok=True)
@@ -961,6 +1734,7 @@ async def root():
         "llm": "Ollama (required)",
         "endpoints": {
             "/query": "POST - Query the RAG system",
+            "/query/stream": "POST - Query with streamed sources and answer tokens",
             "/health": "GET - Health check",
             "/stats": "GET - System statistics",
             "/ui": "GET - Web UI"
@@ -993,10 +1767,39 @@ async def health():
             "ollama": "available" if rag_engine.ollama_available else "unavailable"
         },
         "default_llm": rag_engine.default_llm,
-        "ollama_model": rag_engine.ollama_model if rag_engine.ollama_available else None
+        "ollama_model": rag_engine.ollama_model if rag_engine.ollama_available else None,
+        "provider_latency": rag_engine.provider_router.stats() if rag_engine.provider_router else {},
+        "provider_health": await rag_engine.provider_health()
     }
 
 
+@app.get("/metrics")
+async def metrics():
+    """Prometheus metrics."""
+    return Response(render_metrics(), media_type=METRICS_CONTENT_TYPE)
+
+
+@app.get("/admin/profile")
+async def get_profile(x_admin_token: Optional[str] = Header(None)):
+    """Profiler status and the files of the last profiling session."""
+    if not is_admin_token(x_admin_token):
+        raise HTTPException(status_code=403, detail="Admin token required")
+    return profiler.status()
+
+
+@app.post("/admin/profile")
+async def set_profile(payload: Optional[dict] = Body(None), x_admin_token: Optional[str] = Header(None)):
+    """Start ({"action": "start", "mode", "seconds", "requests"}) or stop ({"action": "stop"}) profiling."""
+    if not is_admin_token(x_admin_token):
+        raise HTTPException(status_code=403, detail="Admin token required")
+    try:
+        return profiler.command(payload or {})
+    except RuntimeError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    except (TypeError, ValueError) as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
 @app.get("/stats")
 async def stats():
     """Get system statistics."""
@@ -1008,7 +1811,13 @@ async def stats():
         "total_pdfs": len(rag_engine.chunks_by_pdf),
         "ollama_model": rag_engine.ollama_model,
         "ollama_url": rag_engine.ollama_url,
-        "pdfs": list(rag_engine.chunks_by_pdf.keys())[:10]  # First 10
+        "pdfs": list(rag_engine.chunks_by_pdf.keys())[:10],  # First 10
+        "caches": rag_engine.cache_stats(),
+        "batching": rag_engine.batch_stats(),
+        "concurrency": {
+            "queries_in_flight": rag_engine.queries_in_flight,
+            "max_concurrent_queries": rag_engine.max_concurrent_queries
+        }
     }
 
 
@@ -1039,14 +1848,7 @@ async def get_llm_models():
         })
     
     # Add Ollama models (fallback)
-    ollama_models = []
-    try:
-        response = requests.get(f"{rag_engine.ollama_url}/api/tags", timeout=5)
-        if response.status_code == 200:
-            models = response.json().get('models', [])
-            ollama_models = [m['name'] for m in models]
-    except:
-        pass
+    ollama_models = await rag_engine.list_ollama_models()
     
     for model_name in ollama_models:
         models_list.append({
@@ -1075,24 +1877,22 @@ async def query(request: QueryRequest):
     """
     if rag_engine is None:
         raise HTTPException(status_code=503, detail="RAG engine not initialized")
-    
-    # Update model if specified
-    if request.llm_model.startswith("ollama:"):
-        model_name = request.llm_model.split(":", 1)[1]
-        rag_engine.ollama_model = model_name
+    if request.search_mode is not None and request.search_mode not in SEARCH_MODES:
+        raise HTTPException(status_code=400, detail=f"search_mode must be one of {', '.join(SEARCH_MODES)}")
     
     try:
-        # Determine LLM model to use
+        # Determine LLM model to use ("ollama:<model>" selects the Ollama model for this request only)
         llm_model = request.llm_model
         if llm_model == "auto" or llm_model is None:
             llm_model = None  # Let RAG engine decide
         
-        result = rag_engine.query(
+        result = await rag_engine.aquery(
             query=request.query,
             top_k=request.top_k,
             min_score=request.min_score,
             llm_model=llm_model,
-            system_prompt=getattr(request, 'system_prompt', None)
+            system_prompt=getattr(request, 'system_prompt', None),
+            search_mode=request.search_mode
         )
         
         # Add LLM model info to response
@@ -1105,6 +1905,55 @@ async def query(request: QueryRequest):
         raise HTTPException(status_code=500, detail=f"Error processing query: {str(e)}")
 
 
+@app.post("/query/stream")
+async def query_stream(request: QueryRequest, http_request: Request):
+    """
+    Streaming /query: a "sources" event once retrieval finishes, "token" events with the
+    answer text as the LLM generates it, then "done" (or "error").
+
+    Events are newline-delimited JSON (application/x-ndjson), or server-sent events
+    when the client accepts text/event-stream.
+
+    Args:
+        request: Query request with query text and parameters
+
+    Returns:
+        Streaming response of query events
+    """
+    if rag_engine is None:
+        raise HTTPException(status_code=503, detail="RAG engine not initialized")
+    if request.search_mode is not None and request.search_mode not in SEARCH_MODES:
+        raise HTTPException(status_code=400, detail=f"search_mode must be one of {', '.join(SEARCH_MODES)}")
+
+    llm_model = None if request.llm_model == "auto" else request.llm_model
+
+    sse = "text/event-stream" in http_request.headers.get("accept", "")
+
+    def encode(event: Dict) -> str:
+        data = json.dumps(event, default=str)
+        return f"event: {event['type']}\ndata: {data}\n\n" if sse else data + "\n"
+
+    async def events():
+        try:
+            async for event in rag_engine.astream_query(
+                query=request.query,
+                top_k=request.top_k,
+                min_score=request.min_score,
+                llm_model=llm_model,
+                system_prompt=request.system_prompt,
+                search_mode=request.search_mode
+            ):
+                yield encode(event)
+        except Exception as e:
+            yield encode({"type": "error", "detail": f"Error processing query: {str(e)}"})
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream" if sse else "application/x-ndjson",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
 @app.post("/search")
 async def search(request: QueryRequest):
     """
@@ -1118,12 +1967,15 @@ async def search(request: QueryRequest):
     """
     if rag_engine is None:
         raise HTTPException(status_code=503, detail="RAG engine not initialized")
+    if request.search_mode is not None and request.search_mode not in SEARCH_MODES:
+        raise HTTPException(status_code=400, detail=f"search_mode must be one of {', '.join(SEARCH_MODES)}")
     
     try:
-        results = rag_engine.search(
+        results = await rag_engine.asearch(
             query=request.query,
             top_k=request.top_k,
-            min_score=request.min_score
+            min_score=request.min_score,
+            search_mode=request.search_mode
         )
         
         return {
@@ -1136,6 +1988,48 @@ async def search(request: QueryRequest):
         raise HTTPException(status_code=500, detail=f"Error searching: {str(e)}")
 
 
+@app.post("/search/batch")
+async def search_batch(request: BatchSearchRequest):
+    """
+    Search for several queries at once (encoded together, one pass over the index).
+
+    Args:
+        request: Queries and search parameters
+
+    Returns:
+        Results per query, in request order
+    """
+    if rag_engine is None:
+        raise HTTPException(status_code=503, detail="RAG engine not initialized")
+    if not request.queries or len(request.queries) > MAX_BATCH_QUERIES:
+        raise HTTPException(status_code=400, detail=f"queries must hold 1 to {MAX_BATCH_QUERIES} queries")
+    if any(not query.strip() for query in request.queries):
+        raise HTTPException(status_code=400, detail="queries must not be empty")
+    if request.search_mode is not None and request.search_mode not in SEARCH_MODES:
+        raise HTTPException(status_code=400, detail=f"search_mode must be one of {', '.join(SEARCH_MODES)}")
+
+    try:
+        start_time = time.time()
+        results = await rag_engine.asearch_batch(
+            queries=request.queries,
+            top_k=request.top_k,
+            min_score=request.min_score,
+            search_mode=request.search_mode
+        )
+
+        return {
+            "results": [
+                {"query": query, "results": query_results, "count": len(query_results)}
+                for query, query_results in zip(request.queries, results)
+            ],
+            "count": len(results),
+            "processing_time": time.time() - start_time
+        }
+
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error searching: {str(e)}")
+
+
 @app.get("/embedding-statistics")
 async def get_embedding_statistics():
     """
@@ -1148,7 +2042,7 @@ async def get_embedding_statistics():
         raise HTTPException(status_code=503, detail="RAG engine not initialized")
 
     try:
-        stats = rag_engine.get_embedding_statistics()
+        stats = await rag_engine.run_blocking(rag_engine.get_embedding_statistics)
         return stats
 
     except Exception as e:
@@ -1167,7 +2061,7 @@ async def get_embedding_validation():
         raise HTTPException(status_code=503, detail="RAG engine not initialized")
 
     try:
-        report = rag_engine.get_embedding_validation_report()
+        report = await rag_engine.run_blocking(rag_engine.get_embedding_validation_report)
         return report
 
     except Exception as e:
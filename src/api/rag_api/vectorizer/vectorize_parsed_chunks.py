@@ -1,6 +1,7 @@
 """
 Vectorize Parsed PDF Chunks (Simple File-Based Version)
-Reads parsed JSON files, creates embeddings using local models, and saves to JSON files.
+Reads parsed JSON files, creates embeddings using local models, and saves them to a
+memory-mapped embedding store (per-PDF JSON files are available as an export).
 No ChromaDB required - works with any SQLite version.
 """
 
@@ -21,15 +22,23 @@ try:
 except ImportError:
     ANALYSIS_AVAILABLE = False
 
+try:
+    from analysis.embedding_store import EmbeddingStore, is_embedding_store
+    STORE_AVAILABLE = True
+except ImportError:
+    STORE_AVAILABLE = False
+
 
 def vectorize_parsed_chunks(parsed_dir: str = "./parsed",
                            output_dir: str = "./vectorized",
                            embedding_model: str = "all-MiniLM-L6-v2",
                            batch_size: int = 100,
                            validate_embeddings: bool = True,
-                           generate_statistics: bool = True):
+                           generate_statistics: bool = True,
+                           export_json: bool = False,
+                           dtype: str = "float32"):
     """
-    Vectorize all parsed PDF chunks and save embeddings to JSON files.
+    Vectorize all parsed PDF chunks and save embeddings to the embedding store.
 
     Args:
         parsed_dir: Directory containing parsed JSON files
@@ -38,6 +47,8 @@ def vectorize_parsed_chunks(parsed_dir: str = "./parsed",
         batch_size: Batch size for embedding generation
         validate_embeddings: Whether to validate generated embeddings
         generate_statistics: Whether to generate embedding statistics
+        export_json: Also write per-PDF embedding JSON files (always done if the store is unavailable)
+        dtype: Embedding dtype in the store ('float32' or 'float16')
     """
     parsed_path = Path(parsed_dir)
     output_path = Path(output_dir)
@@ -51,13 +62,17 @@ def vectorize_parsed_chunks(parsed_dir: str = "./parsed",
     embeddings_path.mkdir(parents=True, exist_ok=True)
     metadata_path = output_path / "metadata"
     metadata_path.mkdir(parents=True, exist_ok=True)
+    store_path = output_path / "store"
+    write_json = export_json or not STORE_AVAILABLE
     
     print("=" * 80)
     print("Vectorization Pipeline - Parsed Chunks to Embeddings (File-Based)")
     print("=" * 80)
     print(f"📁 Parsed directory: {parsed_path.absolute()}")
     print(f"📁 Output directory: {output_path.absolute()}")
-    print(f"📁 Embeddings directory: {embeddings_path.absolute()}")
+    print(f"📁 Embedding store: {store_path.absolute()}")
+    if write_json:
+        print(f"📁 Embeddings directory: {embeddings_path.absolute()}")
     print(f"🤖 Using LOCAL embeddings (no API calls, free!): {embedding_model}")
     print()
     
@@ -89,8 +104,16 @@ def vectorize_parsed_chunks(parsed_dir: str = "./parsed",
     print(f"📚 Found {len(json_files)} parsed PDF file(s)")
     print()
     
-    # Check for already processed files
+    # Check for already processed files (in the store, or as JSON from earlier runs)
     processed_files = set()
+    store = None
+    store_chunk_counts = {}
+    if STORE_AVAILABLE and is_embedding_store(str(store_path)):
+        store = EmbeddingStore(str(store_path))
+        for pdf_position in store.pdf_index:
+            pdf_name = store.pdfs[int(pdf_position)]
+            store_chunk_counts[pdf_name] = store_chunk_counts.get(pdf_name, 0) + 1
+        processed_files.update(store.pdfs)
     if embeddings_path.exists():
         for emb_file in embeddings_path.glob("*.json"):
             processed_files.add(emb_file.stem)
@@ -107,6 +130,7 @@ def vectorize_parsed_chunks(parsed_dir: str = "./parsed",
     total_skipped = 0
     total_chunks = 0
     processing_stats = []
+    new_chunks = []  # Vectorized chunks of this run, added to the store at the end
     
     for i, json_file in enumerate(json_files, 1):
         pdf_filename = json_file.stem + ".pdf"
@@ -116,7 +140,10 @@ def vectorize_parsed_chunks(parsed_dir: str = "./parsed",
         if json_file.stem in processed_files:
             print(f"[{i}/{len(json_files)}] ⊘ Skipping (already vectorized): {pdf_filename}", flush=True)
             total_skipped += 1
-            # Count chunks from existing file
+            # Count chunks from the store or existing file
+            if json_file.stem in store_chunk_counts:
+                total_chunks += store_chunk_counts[json_file.stem]
+                continue
             try:
                 with open(output_file, 'r', encoding='utf-8') as f:
                     existing_data = json.load(f)
@@ -164,8 +191,11 @@ def vectorize_parsed_chunks(parsed_dir: str = "./parsed",
                 vectorized_chunks.append(vectorized_chunk)
             
             # Save vectorized chunks
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(vectorized_chunks, f, indent=2, ensure_ascii=False)
+            if write_json:
+                with open(output_file, 'w', encoding='utf-8') as f:
+                    json.dump(vectorized_chunks, f, indent=2, ensure_ascii=False)
+            for vectorized_chunk in vectorized_chunks:
+                new_chunks.append(dict(vectorized_chunk, pdf_filename=json_file.stem))
             
             total_chunks += len(vectorized_chunks)
             total_processed += 1
@@ -195,6 +225,27 @@ def vectorize_parsed_chunks(parsed_dir: str = "./parsed",
             })
             continue
     
+    # Write the embedding store: previous contents, JSON-only PDFs from earlier runs, and this run's chunks
+    if STORE_AVAILABLE and (new_chunks or store is None):
+        stored_pdfs = set(store.pdfs) if store is not None else set()
+        stored_pdfs.update(chunk['pdf_filename'] for chunk in new_chunks)
+        store_chunks = store.chunks() if store is not None else []
+        for emb_file in sorted(embeddings_path.glob("*.json")):
+            if emb_file.stem in stored_pdfs:
+                continue
+            try:
+                with open(emb_file, 'r', encoding='utf-8') as f:
+                    for chunk in json.load(f):
+                        store_chunks.append(dict(chunk, pdf_filename=emb_file.stem))
+            except Exception as e:
+                print(f"⚠️  Warning: Could not add {emb_file} to the embedding store: {e}")
+        if store_chunks or new_chunks:
+            print()
+            print("💾 Writing embedding store...", flush=True)
+            store = EmbeddingStore.write(str(store_path), store_chunks + new_chunks,
+                                         dtype=dtype, embedding_model=embedding_model)
+            print(f"  ✓ {len(store)} chunks from {len(store.pdfs)} PDFs ({dtype})")
+
     # Save processing metadata
     metadata_file = metadata_path / "vectorization_metadata.json"
     with open(metadata_file, 'w', encoding='utf-8') as f:
@@ -218,7 +269,9 @@ def vectorize_parsed_chunks(parsed_dir: str = "./parsed",
         try:
             # Load all generated embeddings for analysis
             all_embeddings_data = []
-            for json_file in embeddings_path.glob("*.json"):
+            if store is not None:
+                all_embeddings_data = store.chunks()
+            for json_file in ([] if store is not None else embeddings_path.glob("*.json")):
                 try:
                     with open(json_file, 'r', encoding='utf-8') as f:
                         chunks = json.load(f)
@@ -280,12 +333,16 @@ def vectorize_parsed_chunks(parsed_dir: str = "./parsed",
     print(f"Embedding model: {embedding_model}")
     if processing_stats and processing_stats[0].get('embedding_dim', 0) > 0:
         print(f"Embedding dimension: {processing_stats[0]['embedding_dim']}")
-    print(f"Embeddings saved to: {embeddings_path}")
+    if store is not None:
+        print(f"Embedding store: {store_path}")
+    if write_json:
+        print(f"Embeddings saved to: {embeddings_path}")
     print(f"Metadata saved to: {metadata_file}")
     print("=" * 80)
     
     print()
-    print("✅ Vectorization complete! Embeddings saved as JSON files.")
+    print("✅ Vectorization complete! Embeddings saved to the embedding store." if store is not None
+          else "✅ Vectorization complete! Embeddings saved as JSON files.")
 
 
 if __name__ == "__main__":
@@ -325,6 +382,17 @@ if __name__ == "__main__":
         default=True,
         help="Generate embedding statistics after creation (default: True)"
     )
+    parser.add_argument(
+        '--export-json',
+        action='store_true',
+        help="Also write per-PDF embedding JSON files next to the embedding store"
+    )
+    parser.add_argument(
+        '--dtype',
+        choices=['float32', 'float16'],
+        default='float32',
+        help="Embedding dtype in the store (default: float32; float16 halves its size)"
+    )
     
     args = parser.parse_args()
     
@@ -334,6 +402,8 @@ if __name__ == "__main__":
         embedding_model=args.embedding_model,
         batch_size=args.batch_size,
         validate_embeddings=args.validate_embeddings,
-        generate_statistics=args.generate_statistics
+        generate_statistics=args.generate_statistics,
+        export_json=args.export_json,
+        dtype=args.dtype
     )
 
@@ -0,0 +1,288 @@
+"""
+Certificate PDF Cache
+Rendered PoC certificates kept on disk, keyed by their inputs.
+
+A certificate only changes when its contribution is re-evaluated, so the PDF
+is rendered once per (submission, allocation) input set and served as a
+static file afterwards. Rendering runs on a small background pool: it is
+queued as soon as a contribution turns qualified, and a download that races
+the background render waits for it instead of rendering twice. When a
+contribution's inputs change its old certificate is evicted, and the cache
+is capped at max_entries files (least recently served go first).
+"""
+
+import re
+import json
+import shutil
+import hashlib
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple
+
+from core.utils.metrics import record_cache
+
+logger = logging.getLogger(__name__)
+
+# Bump when the certificate layout changes so existing PDFs are re-rendered
+CERTIFICATE_VERSION = 1
+
+
+class CertificateError(ValueError):
+    """Contribution cannot be certified (not qualified or no allocation)."""
+
+
+def certificate_inputs(contribution: Dict) -> Tuple[Dict, Dict]:
+    """
+    Certificate inputs of an archived contribution.
+
+    Args:
+        contribution: Archive contribution
+
+    Returns:
+        (submission_data, allocation_data) for the PDF generator
+
+    Raises:
+        CertificateError: If the contribution is not qualified or has no allocations
+    """
+    if contribution.get("status") != "qualified":
+        raise CertificateError("Contribution is not qualified for certification")
+
+    evaluation_data = contribution.get("metadata", {})
+    allocations = evaluation_data.get("allocations", [])
+    if not allocations:
+        raise CertificateError("No allocations found for this contribution")
+
+    # Use the first allocation (primary metal)
+    allocation = allocations[0]["allocation"]
+    submission_data = {
+        "submission_hash": contribution.get("submission_hash"),
+        "title": contribution.get("title", "Unknown"),
+        "contributor": contribution.get("contributor", "Unknown"),
+        "category": contribution.get("category", "general"),
+        "status": contribution.get("status", "unknown"),
+        "timestamp": contribution.get("created_at", "Unknown"),
+    }
+    allocation_data = {
+        "epoch": allocation.get("epoch", "unknown"),
+        "tier": allocation.get("tier", "unknown"),
+        "pod_score": evaluation_data.get("pod_score", 0),
+        "reward": allocation.get("reward", 0),
+    }
+    return submission_data, allocation_data
+
+
+def certificate_key(submission_data: Dict, allocation_data: Dict) -> str:
+    """Content hash of the certificate inputs."""
+    payload = json.dumps(
+        {"version": CERTIFICATE_VERSION, "submission": submission_data, "allocation": allocation_data},
+        sort_keys=True, default=str
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _file_prefix(submission_hash: str) -> str:
+    return re.sub(r"[^A-Za-z0-9_]", "_", submission_hash or "unknown")
+
+
+class CertificateCache:
+    """On-disk certificate PDFs with background rendering and eviction."""
+
+    def __init__(
+        self,
+        cache_dir: str,
+        renderer: Callable[[Dict, Dict], str],
+        max_entries: int = 1000,
+        workers: int = 1
+    ):
+        """
+        Initialize certificate cache.
+
+        Args:
+            cache_dir: Directory the cached PDFs are kept in
+            renderer: Renders a certificate and returns the PDF path
+                (e.g. PODPDFGenerator.generate_certificate_pdf); the file is moved into the cache
+            max_entries: Maximum number of cached certificates
+            workers: Background render threads
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.renderer = renderer
+        self.max_entries = max_entries
+        self._executor = ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="certificate-render")
+        self._lock = threading.Lock()
+        self._pending: Dict[str, Future] = {}
+        # submission prefix -> cached file name (one current certificate per submission)
+        self._entries: Dict[str, str] = {}
+        self.hits = 0
+        self.misses = 0
+        self.renders = 0
+        self.render_errors = 0
+        self.evictions = 0
+
+        for path in self.cache_dir.glob("*.pdf"):
+            prefix = path.stem.rsplit("-", 1)[0]
+            stale = self._entries.get(prefix)
+            if stale is not None:
+                # Two files for one submission (interrupted eviction): keep the newer one
+                older, newer = sorted((self.cache_dir / stale, path), key=lambda p: p.stat().st_mtime)
+                older.unlink(missing_ok=True)
+                path = newer
+            self._entries[prefix] = path.name
+        for path in self.cache_dir.glob("*.tmp"):
+            path.unlink(missing_ok=True)
+
+    def path_for(self, submission_data: Dict, allocation_data: Dict) -> Path:
+        """Cache file of a certificate (whether or not it is rendered yet)."""
+        key = certificate_key(submission_data, allocation_data)
+        return self.cache_dir / f"{_file_prefix(submission_data.get('submission_hash'))}-{key[:24]}.pdf"
+
+    def lookup(self, submission_data: Dict, allocation_data: Dict) -> Optional[Path]:
+        """Cached certificate, or None if it is not rendered yet."""
+        path = self.path_for(submission_data, allocation_data)
+        return path if path.exists() else None
+
+    def get(self, submission_data: Dict, allocation_data: Dict, timeout: Optional[float] = None) -> Path:
+        """
+        Cached certificate, rendering it first on a miss.
+
+        Args:
+            submission_data: Submission fields of the certificate
+            allocation_data: Allocation fields of the certificate
+            timeout: Seconds to wait for the render (None waits indefinitely)
+
+        Returns:
+            Path of the certificate PDF
+        """
+        path = self.lookup(submission_data, allocation_data)
+        if path is not None:
+            with self._lock:
+                self.hits += 1
+            record_cache("certificate", True)
+            try:
+                # mtime marks recent use for eviction
+                path.touch()
+            except OSError:
+                pass
+            return path
+
+        with self._lock:
+            self.misses += 1
+        record_cache("certificate", False)
+        return self.schedule(submission_data, allocation_data).result(timeout)
+
+    def schedule(self, submission_data: Dict, allocation_data: Dict) -> Future:
+        """
+        Render a certificate in the background unless it is cached or already queued.
+
+        Returns:
+            Future resolving to the certificate path
+        """
+        path = self.path_for(submission_data, allocation_data)
+        with self._lock:
+            pending = self._pending.get(path.name)
+            if pending is not None:
+                return pending
+            if path.exists():
+                done: Future = Future()
+                done.set_result(path)
+                return done
+            future = self._executor.submit(self._render, submission_data, allocation_data, path)
+            self._pending[path.name] = future
+        return future
+
+    def schedule_contribution(self, contribution: Dict) -> Optional[Future]:
+        """
+        Queue the certificate of a qualified contribution; evict it otherwise.
+
+        Returns:
+            Render future, or None if the contribution cannot be certified
+        """
+        try:
+            submission_data, allocation_data = certificate_inputs(contribution)
+        except CertificateError:
+            self.invalidate(contribution.get("submission_hash"))
+            return None
+        return self.schedule(submission_data, allocation_data)
+
+    def _render(self, submission_data: Dict, allocation_data: Dict, path: Path) -> Path:
+        try:
+            rendered = Path(self.renderer(submission_data, allocation_data))
+            tmp = path.with_suffix(".tmp")
+            shutil.move(str(rendered), str(tmp))
+            tmp.replace(path)
+        except Exception:
+            with self._lock:
+                self.render_errors += 1
+            raise
+        finally:
+            with self._lock:
+                self._pending.pop(path.name, None)
+
+        prefix = _file_prefix(submission_data.get("submission_hash"))
+        with self._lock:
+            self.renders += 1
+            stale = self._entries.get(prefix)
+            self._entries[prefix] = path.name
+        if stale and stale != path.name:
+            self._remove(stale)
+        self._enforce_limit()
+        logger.debug(f"Rendered certificate {path.name}")
+        return path
+
+    def _remove(self, name: str):
+        try:
+            (self.cache_dir / name).unlink()
+            with self._lock:
+                self.evictions += 1
+        except FileNotFoundError:
+            pass
+
+    def _enforce_limit(self):
+        with self._lock:
+            excess = len(self._entries) - self.max_entries
+            if excess <= 0:
+                return
+            by_age = sorted(
+                self._entries.items(),
+                key=lambda item: (self.cache_dir / item[1]).stat().st_mtime if (self.cache_dir / item[1]).exists() else 0
+            )
+            evicted = [name for _, name in by_age[:excess]]
+            for prefix, _ in by_age[:excess]:
+                del self._entries[prefix]
+        for name in evicted:
+            self._remove(name)
+
+    def invalidate(self, submission_hash: Optional[str]):
+        """Evict the certificate of a submission (e.g. no longer qualified or deleted)."""
+        with self._lock:
+            name = self._entries.pop(_file_prefix(submission_hash), None)
+        if name:
+            self._remove(name)
+
+    def clear(self):
+        """Evict every cached certificate."""
+        with self._lock:
+            names = list(self._entries.values())
+            self._entries.clear()
+        for name in names:
+            self._remove(name)
+
+    def stats(self) -> Dict:
+        """Cache size and hit/miss/render counters."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "pending": len(self._pending),
+                "hits": self.hits,
+                "misses": self.misses,
+                "renders": self.renders,
+                "render_errors": self.render_errors,
+                "evictions": self.evictions,
+            }
+
+    def shutdown(self, wait: bool = True):
+        """Stop the render pool."""
+        self._executor.shutdown(wait=wait)
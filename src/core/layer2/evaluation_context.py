@@ -0,0 +1,294 @@
+"""
+Evaluation Prompt Context
+Relevance-ranked, token-budgeted archive context for PoC evaluation prompts.
+
+The archive-first rule means every evaluation is compared against the whole
+archive, but the LLM only needs to see the archived contributions that are
+actually close to the one being evaluated. This module keeps a lightweight
+TF-IDF similarity index over the archive and packs the k most similar entries
+into a fixed token budget measured with a local token counter.
+"""
+
+import math
+import re
+import logging
+import threading
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Terms used for similarity (lowercased words of 3+ characters)
+_TERM_PATTERN = re.compile(r"[a-z0-9][a-z0-9_\-]{2,}")
+
+# Approximate BPE tokenization: words, numbers and individual symbols
+_TOKEN_PATTERN = re.compile(r"[A-Za-z]+|\d+|[^\sA-Za-z\d]")
+
+# Very common English words that carry no topical signal
+_STOP_WORDS = frozenset({
+    "the", "and", "for", "that", "this", "with", "are", "from", "was", "were",
+    "which", "have", "has", "not", "but", "can", "its", "their", "these",
+    "those", "into", "than", "then", "also", "such", "our", "more", "may",
+    "been", "being", "all", "any", "each", "other", "will", "would", "should",
+    "there", "here", "when", "where", "what", "who", "how", "one", "two",
+})
+
+# Only the first part of each contribution is indexed to bound indexing cost
+MAX_INDEXED_CHARS = 20000
+
+# Cap on distinct query terms used for scoring (highest-frequency terms win)
+MAX_QUERY_TERMS = 256
+
+_tiktoken_encoding = None
+_tiktoken_checked = False
+
+
+def count_tokens(text: str) -> int:
+    """
+    Count tokens in text locally (no API call).
+
+    Uses tiktoken's cl100k_base encoding when it is installed, otherwise an
+    approximation that splits words, numbers and symbols and charges long
+    words roughly one token per four characters.
+
+    Args:
+        text: Text to measure
+
+    Returns:
+        Token count
+    """
+    global _tiktoken_encoding, _tiktoken_checked
+
+    if not text:
+        return 0
+
+    if not _tiktoken_checked:
+        _tiktoken_checked = True
+        try:
+            import tiktoken
+            _tiktoken_encoding = tiktoken.get_encoding("cl100k_base")
+        except Exception:
+            _tiktoken_encoding = None
+
+    if _tiktoken_encoding is not None:
+        return len(_tiktoken_encoding.encode(text, disallowed_special=()))
+
+    tokens = 0
+    for match in _TOKEN_PATTERN.finditer(text):
+        piece = match.group(0)
+        tokens += max(1, math.ceil(len(piece) / 4)) if piece.isalpha() else max(1, math.ceil(len(piece) / 3))
+    return tokens
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """
+    Truncate text so that it fits within a token budget.
+
+    Args:
+        text: Text to truncate
+        max_tokens: Maximum number of tokens
+
+    Returns:
+        Text prefix within the budget (unchanged if it already fits)
+    """
+    if max_tokens <= 0:
+        return ""
+    # No token is longer than a handful of characters, so never scan more than needed
+    text = text[:max_tokens * 8]
+    if count_tokens(text) <= max_tokens:
+        return text
+
+    # Binary search on character length; token count is monotonic in prefix length
+    low, high = 0, len(text)
+    while low < high:
+        mid = (low + high + 1) // 2
+        if count_tokens(text[:mid]) <= max_tokens:
+            low = mid
+        else:
+            high = mid - 1
+    return text[:low]
+
+
+def _extract_terms(text: str) -> Counter:
+    """Extract topical term frequencies from text."""
+    terms = _TERM_PATTERN.findall(text[:MAX_INDEXED_CHARS].lower())
+    return Counter(t for t in terms if t not in _STOP_WORDS)
+
+
+def _unit_weights(term_counts: Counter) -> Dict[str, float]:
+    """Sublinear TF weights normalized to unit length."""
+    weights = {term: 1.0 + math.log(count) for term, count in term_counts.items()}
+    norm = math.sqrt(sum(w * w for w in weights.values()))
+    if norm == 0:
+        return {}
+    return {term: w / norm for term, w in weights.items()}
+
+
+class ArchiveSimilarityIndex:
+    """
+    Incremental TF-IDF similarity index over archived contributions.
+
+    Documents are indexed once (title + leading content) into an inverted
+    index; queries only touch postings of the terms they share with the
+    archive, so cost grows with vocabulary overlap rather than archive size.
+    """
+
+    def __init__(self):
+        """Initialize an empty index."""
+        self._postings: Dict[str, Dict[str, float]] = {}  # term -> {submission_hash: weight}
+        self._doc_terms: Dict[str, List[str]] = {}        # submission_hash -> indexed terms
+        self._doc_content_hash: Dict[str, Optional[str]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._doc_terms)
+
+    def __contains__(self, submission_hash: str) -> bool:
+        return submission_hash in self._doc_terms
+
+    def add(self, submission_hash: str, title: str, text: str, content_hash: Optional[str] = None):
+        """
+        Index (or re-index) a contribution.
+
+        Args:
+            submission_hash: Submission identifier
+            title: Contribution title (weighted like body text)
+            text: Contribution text content
+            content_hash: Content hash, used to detect changed content on sync
+        """
+        weights = _unit_weights(_extract_terms(f"{title or ''}\n{text or ''}"))
+        with self._lock:
+            self._remove_locked(submission_hash)
+            for term, weight in weights.items():
+                self._postings.setdefault(term, {})[submission_hash] = weight
+            self._doc_terms[submission_hash] = list(weights)
+            self._doc_content_hash[submission_hash] = content_hash
+
+    def remove(self, submission_hash: str):
+        """Remove a contribution from the index."""
+        with self._lock:
+            self._remove_locked(submission_hash)
+
+    def _remove_locked(self, submission_hash: str):
+        for term in self._doc_terms.pop(submission_hash, []):
+            docs = self._postings.get(term)
+            if docs is not None:
+                docs.pop(submission_hash, None)
+                if not docs:
+                    del self._postings[term]
+        self._doc_content_hash.pop(submission_hash, None)
+
+    def sync(self, contributions: List[Dict]) -> int:
+        """
+        Bring the index in line with the archive.
+        Only new or changed contributions are (re)indexed.
+
+        Args:
+            contributions: All archive contribution records
+
+        Returns:
+            Number of contributions indexed by this call
+        """
+        live = set()
+        indexed = 0
+        for contrib in contributions:
+            submission_hash = contrib["submission_hash"]
+            live.add(submission_hash)
+            content_hash = contrib.get("content_hash")
+            if submission_hash in self._doc_terms and self._doc_content_hash.get(submission_hash) == content_hash:
+                continue
+            self.add(submission_hash, contrib.get("title", ""), contrib.get("text_content", ""), content_hash)
+            indexed += 1
+
+        for stale in [h for h in self._doc_terms if h not in live]:
+            self.remove(stale)
+
+        return indexed
+
+    def most_similar(self, text: str, k: int = 20, exclude: Optional[str] = None) -> List[Tuple[str, float]]:
+        """
+        Find the archived contributions most similar to text.
+
+        Args:
+            text: Query text (title + content of the contribution being evaluated)
+            k: Maximum number of results
+            exclude: Submission hash to leave out (usually the query itself)
+
+        Returns:
+            List of (submission_hash, score) sorted by descending score
+        """
+        query_counts = _extract_terms(text)
+        if not query_counts or k <= 0:
+            return []
+        if len(query_counts) > MAX_QUERY_TERMS:
+            query_counts = Counter(dict(query_counts.most_common(MAX_QUERY_TERMS)))
+        query_weights = _unit_weights(query_counts)
+
+        scores: Dict[str, float] = {}
+        with self._lock:
+            total_docs = len(self._doc_terms)
+            for term, q_weight in query_weights.items():
+                docs = self._postings.get(term)
+                if not docs:
+                    continue
+                idf = math.log(1.0 + total_docs / len(docs))
+                factor = q_weight * idf
+                for submission_hash, d_weight in docs.items():
+                    scores[submission_hash] = scores.get(submission_hash, 0.0) + factor * d_weight
+
+        scores.pop(exclude, None)
+        ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)
+        return ranked[:k]
+
+
+def build_archive_context(
+    contribution: Dict,
+    archive_lookup: Dict[str, Dict],
+    index: ArchiveSimilarityIndex,
+    k: int = 20,
+    token_budget: int = 1500
+) -> Tuple[str, Dict]:
+    """
+    Build the archive section of an evaluation prompt.
+
+    Picks the k archived contributions most similar to the contribution and
+    packs one line per entry, most similar first, until the token budget is
+    exhausted.
+
+    Args:
+        contribution: Contribution being evaluated
+        archive_lookup: submission_hash -> contribution record
+        index: Similarity index over the archive
+        k: Maximum number of archive entries to consider
+        token_budget: Maximum tokens for the archive context lines
+
+    Returns:
+        Tuple of (context text, stats dict)
+    """
+    query_text = f"{contribution.get('title', '')}\n{contribution.get('text_content', '')}"
+    candidates = index.most_similar(query_text, k=k, exclude=contribution["submission_hash"])
+
+    lines = []
+    used_tokens = 0
+    for submission_hash, score in candidates:
+        arch_contrib = archive_lookup.get(submission_hash)
+        if not arch_contrib:
+            continue
+        metals = ",".join(arch_contrib.get("metals", []))
+        line = (
+            f"- {arch_contrib['title']} ({submission_hash[:16]}...) "
+            f"[{metals}] - {arch_contrib['status']} (similarity {score:.2f})"
+        )
+        line_tokens = count_tokens(line) + 1  # +1 for the newline
+        if used_tokens + line_tokens > token_budget:
+            break
+        lines.append(line)
+        used_tokens += line_tokens
+
+    stats = {
+        "archive_candidates": len(candidates),
+        "archive_entries": len(lines),
+        "archive_tokens": used_tokens,
+        "archive_token_budget": token_budget,
+    }
+    return "\n".join(lines), stats
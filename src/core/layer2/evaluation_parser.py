@@ -0,0 +1,370 @@
+"""
+Evaluation Output Parser
+Shared single-pass parser for LLM evaluation responses (PoC and PoD).
+
+The response is tokenized once with one precompiled pattern that finds code
+fences, JSON object starts, labelled scores (coherence/Φ, density/ρ,
+redundancy, PoD score, tier, epoch, status, metals) and approved/rejected
+verdicts. Every quantifier in the pattern is bounded and input is capped at
+MAX_PARSE_CHARS, so worst-case time is linear in the (capped) input length
+no matter how long or adversarial the response is. JSON is decoded with
+json.JSONDecoder.raw_decode at a bounded number of candidate positions.
+"""
+
+import re
+import copy
+import json
+import logging
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Responses longer than this are truncated before parsing
+MAX_PARSE_CHARS = 200000
+
+# Maximum number of JSON decode attempts per response
+MAX_JSON_CANDIDATES = 32
+
+# Canonical field per label alias, and alias priority (lower wins, like the
+# order of the original pattern fallbacks)
+_LABEL_FIELDS = {
+    "coherence": ("coherence", 0), "Φ": ("coherence", 1), "phi": ("coherence", 2),
+    "density": ("density", 0), "ρ": ("density", 1), "rho": ("density", 2),
+    "redundancy": ("redundancy", 0), "R": ("redundancy", 1),
+    "pod_score": ("pod_score", 0), "S": ("pod_score", 1),
+    "tier": ("tier", 0), "classified as": ("tier", 1),
+    "epoch": ("epoch", 0), "qualified for": ("epoch", 1),
+    "status": ("status", 0),
+}
+
+_TOKEN_PATTERN = re.compile(
+    r"""
+      (?P<fence>```[a-z]{0,10})
+    | (?P<json_start>\{(?=\s{0,20}"))
+    | (?P<metals_label>\bmetals?\b)"?[\s:=|*]{1,10}(?P<metals_value>\[?[\sa-z",'+&]{1,80}\]?)
+    | (?P<label>
+          \bcoherence\b | Φ | \bphi\b
+        | \bdensity\b | ρ | \brho\b
+        | \bredundancy\b | (?-i:\bR\b)
+        | \bpod[_\ ]?score\b | (?-i:\bS\b)
+        | \btier\b | \bclassif(?:ied)?\s{1,3}as\b
+        | \bepoch\b | \bqualif(?:ied)?\s{1,3}for\b
+        | \bstatus\b
+      )
+      "?[\ \t]{0,3}(?:\([^)\n]{0,60}\)[\ \t]{0,3})?
+      [\s:=|*"]{1,10}
+      (?P<value>\d{1,12}(?:\.\d{1,12})?|[a-z_]{2,30})
+    | (?P<verdict>\b(?:approved|rejected)\b)
+    """,
+    re.IGNORECASE | re.VERBOSE,
+)
+
+_METAL_NAMES = ("gold", "silver", "copper")
+_METAL_PATTERN = re.compile(r"\b(gold|silver|copper)\b", re.IGNORECASE)
+
+
+class EvaluationScan:
+    """Result of scanning one evaluation response."""
+
+    __slots__ = ("json_data", "fields", "metals", "verdict", "truncated")
+
+    def __init__(self):
+        self.json_data: Optional[Dict] = None
+        # field -> (alias priority, position, raw value) of the best labelled value
+        self.fields: Dict[str, Tuple[int, int, str]] = {}
+        self.metals: List[str] = []
+        self.verdict: Optional[str] = None
+        self.truncated = False
+
+    def field(self, name: str) -> Optional[str]:
+        """Raw labelled value of a field from the markdown text, if any."""
+        entry = self.fields.get(name)
+        return entry[2] if entry else None
+
+
+def _canonical_label(label: str) -> Tuple[str, int]:
+    text = label.strip()
+    if text in ("Φ", "ρ", "R", "S"):
+        return _LABEL_FIELDS[text]
+    lowered = re.sub(r"\s+", " ", text.lower())
+    if lowered.startswith("pod"):
+        return _LABEL_FIELDS["pod_score"]
+    if lowered.startswith("classif"):
+        return _LABEL_FIELDS["classified as"]
+    if lowered.startswith("qualif"):
+        return _LABEL_FIELDS["qualified for"]
+    return _LABEL_FIELDS[lowered]
+
+
+def _decode_object(text: str, start: int, end: Optional[int] = None) -> Optional[Dict]:
+    """Decode a JSON object starting at text[start] (optionally within text[:end])."""
+    try:
+        data, _ = json.JSONDecoder().raw_decode(text if end is None else text[:end], start)
+    except (ValueError, RecursionError):
+        # Invalid or pathologically nested JSON
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def _valid_field_value(field: str, value: str) -> bool:
+    """Scores need numbers (coherence/density: 3-5 digits); tier/epoch/status need words."""
+    if field in ("coherence", "density"):
+        return _score(value) is not None
+    if field in ("redundancy", "pod_score"):
+        return value[0].isdigit()
+    return value[0].isalpha()
+
+
+@lru_cache(maxsize=16)
+def scan_evaluation_output(text: str) -> EvaluationScan:
+    """
+    Tokenize an evaluation response in a single pass.
+
+    Results are cached per text, so the JSON and markdown parsers can be
+    applied to the same response without scanning it twice.
+
+    Args:
+        text: Raw LLM response
+
+    Returns:
+        EvaluationScan with the JSON object (if any) and labelled markdown values
+    """
+    scan = EvaluationScan()
+    if not text:
+        return scan
+    if len(text) > MAX_PARSE_CHARS:
+        text = text[:MAX_PARSE_CHARS]
+        scan.truncated = True
+
+    fences: List[Tuple[int, int, str]] = []  # (start, content start, info string)
+    json_starts: List[int] = []
+
+    for match in _TOKEN_PATTERN.finditer(text):
+        kind = match.lastgroup
+        if kind == "fence":
+            fences.append((match.start(), match.end(), match.group("fence")[3:].lower()))
+        elif kind == "json_start":
+            if len(json_starts) < MAX_JSON_CANDIDATES:
+                json_starts.append(match.start())
+        elif kind == "metals_value":
+            if not scan.metals:
+                scan.metals = normalize_metals(_METAL_PATTERN.findall(match.group("metals_value")))
+        elif kind == "value":
+            field, priority = _canonical_label(match.group("label"))
+            if not _valid_field_value(field, match.group("value")):
+                continue
+            current = scan.fields.get(field)
+            if current is None or priority < current[0]:
+                scan.fields[field] = (priority, match.start(), match.group("value"))
+        elif kind == "verdict":
+            if scan.verdict is None:
+                scan.verdict = match.group("verdict").lower()
+
+    scan.json_data = _select_json(text, fences, json_starts)
+    return scan
+
+
+def _select_json(text: str, fences: List[Tuple[int, int, str]], json_starts: List[int]) -> Optional[Dict]:
+    """
+    Pick the evaluation JSON object.
+
+    Preference: a ```json block, then any fenced block mentioning "coherence",
+    then the first decodable object in the text.
+    """
+    # Pair up fences into blocks (opening fence, closing fence)
+    blocks = []
+    for opening, closing in zip(fences[0::2], fences[1::2]):
+        blocks.append((opening[1], closing[0], opening[2]))
+
+    attempts = 0
+    for wanted in ("json", None):
+        for content_start, content_end, info in blocks:
+            if attempts >= MAX_JSON_CANDIDATES:
+                break
+            if wanted == "json" and info != "json":
+                continue
+            if wanted is None and (info == "json" or '"coherence"' not in text[content_start:content_end]):
+                continue
+            brace = text.find("{", content_start, content_end)
+            if brace == -1:
+                continue
+            attempts += 1
+            data = _decode_object(text, brace, content_end)
+            if data is not None:
+                return data
+
+    for start in json_starts:
+        if attempts >= MAX_JSON_CANDIDATES:
+            break
+        attempts += 1
+        data = _decode_object(text, start)
+        if data is not None:
+            return data
+    return None
+
+
+def normalize_metals(raw) -> List[str]:
+    """
+    Normalize a metals value to lowercase metal names in order, without duplicates.
+
+    Args:
+        raw: List of strings (e.g. ["Gold", "silver"]) or a single string
+
+    Returns:
+        List of "gold", "silver" and/or "copper"
+    """
+    if isinstance(raw, str):
+        raw = [raw]
+    if not isinstance(raw, (list, tuple)):
+        return []
+    metals = []
+    for item in raw:
+        lowered = str(item).lower()
+        for name in _METAL_NAMES:
+            if name in lowered and name not in metals:
+                metals.append(name)
+    return metals
+
+
+def extract_evaluation_json(text: str) -> Optional[Dict]:
+    """
+    Get the JSON object of an evaluation response.
+
+    Args:
+        text: Raw LLM response
+
+    Returns:
+        Decoded JSON object (the caller's own copy), or None if the response has none
+    """
+    # Scans are cached and shared: never hand out the cached dict itself
+    return copy.deepcopy(scan_evaluation_output(text or "").json_data)
+
+
+def _epoch_from_density(density: float) -> str:
+    if density >= 8000:
+        return "founder"
+    if density >= 6000:
+        return "pioneer"
+    if density >= 4000:
+        return "community"
+    return "ecosystem"
+
+
+def parse_pod_evaluation_json(text: str) -> Optional[Dict]:
+    """
+    Parse a PoD evaluation from the JSON block of a response.
+
+    Args:
+        text: Raw LLM response (markdown report followed by a JSON block)
+
+    Returns:
+        Evaluation dict, or None if there is no JSON with coherence and density
+    """
+    data = extract_evaluation_json(text)
+    if data is None:
+        return None
+
+    coherence = data.get("coherence")
+    density = data.get("density")
+    if coherence is None or density is None:
+        logger.debug(f"Evaluation JSON missing required fields. Got: {list(data.keys())}")
+        return None
+
+    try:
+        return {
+            "coherence": float(coherence),
+            "density": float(density),
+            "redundancy": float(data.get("redundancy", 0.0)),
+            "epoch_weight": float(data.get("epoch_weight", 1.0)),
+            "pod_score": float(data.get("pod_score", 0.0)),
+            "tier": data.get("tier", "gold"),
+            "epoch": data.get("epoch"),
+            "tier_justification": data.get("tier_justification", ""),
+            "redundancy_analysis": data.get("redundancy_analysis", ""),
+            "epoch_justification": data.get("epoch_justification", ""),
+            "retroactive_mining": data.get("retroactive_mining"),
+            "reasoning": data.get("reasoning", ""),
+            "status": data.get("status", "approved"),
+            "rejection_reason": data.get("rejection_reason")
+        }
+    except (TypeError, ValueError) as e:
+        logger.debug(f"Evaluation JSON has non-numeric scores: {e}")
+        return None
+
+
+def _score(value: Optional[str]) -> Optional[int]:
+    """Labelled coherence/density value (3-5 integer digits, as in the report format)."""
+    if value is None:
+        return None
+    digits = value.split(".", 1)[0]
+    if not digits.isdigit() or not 3 <= len(digits) <= 5:
+        return None
+    return max(0, min(10000, int(digits)))
+
+
+def _number(value: Optional[str]) -> Optional[float]:
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+def parse_pod_evaluation_markdown(text: str) -> Optional[Dict]:
+    """
+    Parse a PoD evaluation from labelled scores in markdown text.
+    Fallback for responses without usable JSON.
+
+    Args:
+        text: Raw LLM response
+
+    Returns:
+        Evaluation dict, or None if coherence and density cannot be found
+    """
+    if not text or not text.strip():
+        return None
+    scan = scan_evaluation_output(text)
+
+    coherence_val = _score(scan.field("coherence"))
+    density_val = _score(scan.field("density"))
+    if coherence_val is None or density_val is None:
+        return None
+
+    redundancy_val = _number(scan.field("redundancy"))
+    if redundancy_val is None:
+        redundancy_val = 0.1
+    if redundancy_val > 1.0:
+        redundancy_val = redundancy_val / 100.0  # Normalize if given as percentage
+
+    pod_score_val = _number(scan.field("pod_score")) or 0.0
+    if pod_score_val == 0:
+        # Calculate from other values
+        pod_score_val = (coherence_val / 10000) * (density_val / 10000) * (1 - redundancy_val) * 1.0 * 10000
+
+    tier_str = (scan.field("tier") or "copper").lower()
+    if tier_str not in _METAL_NAMES:
+        # Infer from scores
+        tier_str = "gold" if density_val >= 8000 else "silver" if density_val >= 6000 else "copper"
+
+    epoch_raw = scan.field("epoch")
+    epoch_str = epoch_raw.lower() if epoch_raw else _epoch_from_density(density_val)
+
+    status_str = scan.verdict or ("approved" if density_val >= 4000 else "rejected")
+
+    return {
+        "coherence": coherence_val,
+        "density": density_val,
+        "redundancy": redundancy_val,
+        "epoch_weight": 1.0,
+        "pod_score": pod_score_val,
+        "tier": tier_str,
+        "epoch": epoch_str,
+        "tier_justification": "Extracted from markdown evaluation",
+        "redundancy_analysis": f"Redundancy: {redundancy_val:.3f}",
+        "epoch_justification": f"Density {density_val} qualifies for {epoch_str} epoch",
+        "reasoning": text[:1000],
+        "status": status_str,
+        "rejection_reason": None if status_str == "approved" else "Density below threshold"
+    }
@@ -0,0 +1,332 @@
+"""
+Evaluation Scheduler
+Priority classes and weighted fair queuing in front of the evaluation workers.
+
+Queued evaluations are grouped into priority classes (admin re-evaluations,
+founder-epoch candidates, standard submissions). A free worker takes work
+from the highest class that is below its concurrency cap. Within a class,
+contributors (keyed like PoCArchive's by_contributor index) share the
+workers by weighted fair queuing: each job gets a virtual finish tag of
+max(class virtual time, contributor's last finish tag) + 1/weight, and jobs
+run in tag order. A contributor who bulk-submits 500 papers therefore gets
+one slot in turn with everyone else instead of a 500-deep head start.
+"""
+
+import time
+import heapq
+import logging
+import threading
+from enum import Enum
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class PriorityClass(Enum):
+    """Evaluation priority classes, highest first."""
+    ADMIN = "admin"          # Re-evaluations requested by administrators
+    FOUNDER = "founder"      # Founder-epoch candidates
+    STANDARD = "standard"    # Regular submissions
+
+
+CLASS_ORDER = [PriorityClass.ADMIN, PriorityClass.FOUNDER, PriorityClass.STANDARD]
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+
+
+class EvaluationTicket:
+    """Handle for a scheduled evaluation."""
+
+    def __init__(
+        self,
+        submission_hash: str,
+        contributor: str,
+        priority: PriorityClass,
+        weight: float,
+        kwargs: Dict[str, Any]
+    ):
+        self.submission_hash = submission_hash
+        self.contributor = contributor
+        self.priority = priority
+        self.weight = weight
+        self.kwargs = kwargs
+        self.state = QUEUED
+        self.start_tag = 0.0
+        self.finish_tag = 0.0
+        self.seq = 0
+        self.enqueued_at = time.time()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.result: Optional[Dict] = None
+        self.error: Optional[BaseException] = None
+        self._done = threading.Event()
+
+    def __lt__(self, other: "EvaluationTicket") -> bool:
+        return (self.finish_tag, self.seq) < (other.finish_tag, other.seq)
+
+    @classmethod
+    def resolved(cls, submission_hash: str, contributor: str, result: Dict) -> "EvaluationTicket":
+        """Ticket for an evaluation that already finished (nothing is queued)."""
+        ticket = cls(submission_hash, contributor, PriorityClass.STANDARD, 1.0, {})
+        ticket.state = DONE
+        ticket.result = result
+        ticket.started_at = ticket.finished_at = ticket.enqueued_at
+        ticket._done.set()
+        return ticket
+
+    def done(self) -> bool:
+        """Whether the evaluation has finished."""
+        return self._done.is_set()
+
+    def wait(self, timeout: Optional[float] = None) -> Dict:
+        """
+        Wait for the evaluation result.
+
+        Args:
+            timeout: Seconds to wait (None waits indefinitely)
+
+        Returns:
+            Evaluation result
+
+        Raises:
+            TimeoutError: If the evaluation did not finish in time
+            Exception: Whatever the evaluation raised
+        """
+        if not self._done.wait(timeout):
+            raise TimeoutError(f"Evaluation of {self.submission_hash} still {self.state}")
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+class EvaluationScheduler:
+    """
+    Priority and fair-share scheduler running evaluations on worker threads.
+
+    Worker threads start with the first submission.
+    """
+
+    def __init__(
+        self,
+        run: Callable[..., Dict],
+        workers: int = 4,
+        class_caps: Optional[Dict[PriorityClass, int]] = None,
+        initial_service_time: float = 30.0
+    ):
+        """
+        Initialize scheduler.
+
+        Args:
+            run: Called as run(submission_hash, **kwargs) to perform an evaluation
+            workers: Number of evaluation worker threads
+            class_caps: Maximum concurrent evaluations per class (default: standard
+                work leaves one worker free for admin and founder evaluations)
+            initial_service_time: Seconds per evaluation assumed before any have completed
+        """
+        self.run = run
+        self.workers = max(1, workers)
+        self.class_caps = {
+            PriorityClass.ADMIN: self.workers,
+            PriorityClass.FOUNDER: self.workers,
+            PriorityClass.STANDARD: max(1, self.workers - 1),
+        }
+        if class_caps:
+            self.class_caps.update(class_caps)
+
+        self._lock = threading.Condition()
+        self._queues: Dict[PriorityClass, List[EvaluationTicket]] = {cls: [] for cls in CLASS_ORDER}
+        self._virtual_time = {cls: 0.0 for cls in CLASS_ORDER}
+        self._last_finish: Dict[tuple, float] = {}
+        self._running = {cls: 0 for cls in CLASS_ORDER}
+        self._tickets: Dict[str, EvaluationTicket] = {}
+        self._seq = 0
+        self._threads: List[threading.Thread] = []
+        self._shutdown = False
+
+        self.avg_service_time = initial_service_time
+        self.completed = 0
+        self.coalesced = 0
+
+    def submit(
+        self,
+        submission_hash: str,
+        contributor: str,
+        priority: PriorityClass = PriorityClass.STANDARD,
+        weight: float = 1.0,
+        **kwargs
+    ) -> EvaluationTicket:
+        """
+        Queue an evaluation.
+
+        A submission that is already queued or running is not queued twice;
+        its existing ticket is returned (moved up if the new priority is higher).
+
+        Args:
+            submission_hash: Submission to evaluate
+            contributor: Contributor the submission belongs to (fair-share key)
+            priority: Priority class
+            weight: Contributor share within the class (higher gets more turns)
+            **kwargs: Passed to the run function
+
+        Returns:
+            EvaluationTicket
+        """
+        with self._lock:
+            if self._shutdown:
+                raise RuntimeError("Evaluation scheduler is shut down")
+
+            existing = self._tickets.get(submission_hash)
+            if existing is not None:
+                self.coalesced += 1
+                if existing.state == QUEUED and CLASS_ORDER.index(priority) < CLASS_ORDER.index(existing.priority):
+                    self._queues[existing.priority].remove(existing)
+                    heapq.heapify(self._queues[existing.priority])
+                    existing.priority = priority
+                    self._enqueue(existing)
+                    self._lock.notify()
+                return existing
+
+            ticket = EvaluationTicket(submission_hash, contributor or "", priority, max(weight, 1e-6), kwargs)
+            self._tickets[submission_hash] = ticket
+            self._enqueue(ticket)
+            self._ensure_workers()
+            self._lock.notify()
+            return ticket
+
+    def _enqueue(self, ticket: EvaluationTicket):
+        """Assign fair-queuing tags and push onto the class queue (lock held)."""
+        key = (ticket.priority, ticket.contributor)
+        ticket.start_tag = max(self._virtual_time[ticket.priority], self._last_finish.get(key, 0.0))
+        ticket.finish_tag = ticket.start_tag + 1.0 / ticket.weight
+        self._last_finish[key] = ticket.finish_tag
+        self._seq += 1
+        ticket.seq = self._seq
+        heapq.heappush(self._queues[ticket.priority], ticket)
+
+    def _next_ticket(self) -> Optional[EvaluationTicket]:
+        """Pop the next runnable ticket, honouring class order and caps (lock held)."""
+        for cls in CLASS_ORDER:
+            if self._queues[cls] and self._running[cls] < self.class_caps[cls]:
+                ticket = heapq.heappop(self._queues[cls])
+                self._virtual_time[cls] = max(self._virtual_time[cls], ticket.start_tag)
+                self._running[cls] += 1
+                ticket.state = RUNNING
+                ticket.started_at = time.time()
+                return ticket
+        return None
+
+    def _ensure_workers(self):
+        """Start worker threads on first use (lock held)."""
+        while len(self._threads) < self.workers:
+            thread = threading.Thread(
+                target=self._worker,
+                name=f"evaluation-worker-{len(self._threads)}",
+                daemon=True
+            )
+            self._threads.append(thread)
+            thread.start()
+
+    def _worker(self):
+        while True:
+            with self._lock:
+                ticket = self._next_ticket()
+                while ticket is None:
+                    if self._shutdown:
+                        return
+                    self._lock.wait()
+                    ticket = self._next_ticket()
+
+            try:
+                ticket.result = self.run(ticket.submission_hash, **ticket.kwargs)
+            except Exception as e:
+                logger.error(f"Scheduled evaluation of {ticket.submission_hash} failed: {e}")
+                ticket.error = e
+            finally:
+                ticket.finished_at = time.time()
+                with self._lock:
+                    self._running[ticket.priority] -= 1
+                    ticket.state = DONE
+                    if self._tickets.get(ticket.submission_hash) is ticket:
+                        del self._tickets[ticket.submission_hash]
+                    duration = ticket.finished_at - ticket.started_at
+                    self.completed += 1
+                    self.avg_service_time = 0.8 * self.avg_service_time + 0.2 * duration
+                    self._lock.notify_all()
+                ticket._done.set()
+
+    def is_scheduled(self, submission_hash: str) -> bool:
+        """Whether an evaluation of the submission is queued or running."""
+        with self._lock:
+            return submission_hash in self._tickets
+
+    def position(self, submission_hash: str) -> Optional[Dict]:
+        """
+        Estimate where a submission is in the queue.
+
+        Args:
+            submission_hash: Submission identifier
+
+        Returns:
+            Queue state, position (1 = next to run), evaluations ahead and an
+            estimated wait in seconds; None if the submission is not scheduled
+        """
+        with self._lock:
+            ticket = self._tickets.get(submission_hash)
+            if ticket is None:
+                return None
+
+            info = {
+                "state": ticket.state,
+                "priority": ticket.priority.value,
+                "enqueued_at": ticket.enqueued_at,
+            }
+            if ticket.state == RUNNING:
+                info.update({"position": 0, "ahead": 0, "estimated_wait_seconds": 0.0})
+                return info
+
+            ahead = 0
+            for cls in CLASS_ORDER:
+                if cls == ticket.priority:
+                    ahead += sum(1 for other in self._queues[cls] if other < ticket)
+                    break
+                ahead += len(self._queues[cls])
+
+            # Jobs ahead drain across all workers; the running ones finish first
+            running = sum(self._running.values())
+            waves = (ahead + running) / self.workers
+            info.update({
+                "position": ahead + 1,
+                "ahead": ahead,
+                "estimated_wait_seconds": round(waves * self.avg_service_time, 1),
+            })
+            return info
+
+    def stats(self) -> Dict:
+        """Queue depth and running count per class."""
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "completed": self.completed,
+                "coalesced": self.coalesced,
+                "avg_service_time": round(self.avg_service_time, 3),
+                "classes": {
+                    cls.value: {
+                        "queued": len(self._queues[cls]),
+                        "running": self._running[cls],
+                        "cap": self.class_caps[cls],
+                    }
+                    for cls in CLASS_ORDER
+                },
+            }
+
+    def shutdown(self, wait: bool = True):
+        """Stop the workers once the queued evaluations have run."""
+        with self._lock:
+            self._shutdown = True
+            self._lock.notify_all()
+            threads = list(self._threads)
+        if wait:
+            for thread in threads:
+                thread.join()
@@ -0,0 +1,183 @@
+"""
+Evaluation Trace Record/Replay
+Capture PoC evaluation traffic as a replayable JSONL trace and replay it without the LLM.
+
+A trace record holds the contribution inputs, the evaluation prompt, the raw
+LLM response and per-stage timings. Replaying a trace runs the real pipeline
+(archive writes, redundancy checks, parsing, allocation) against the recorded
+responses, either at full speed or at the recorded LLM pace, so the non-LLM
+overhead can be measured on its own.
+"""
+
+import json
+import time
+import hashlib
+import logging
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+TRACE_VERSION = 1
+
+PACE_FAST = "fast"
+PACE_RECORDED = "recorded"
+
+
+def prompt_fingerprint(prompt: str) -> str:
+    """SHA-256 of an evaluation prompt, used to match replayed prompts to recorded responses."""
+    return hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+
+
+class EvaluationTraceRecorder:
+    """Append-only JSONL recorder for evaluation traffic (thread-safe)."""
+
+    def __init__(self, trace_file: str):
+        """
+        Initialize recorder.
+
+        Args:
+            trace_file: Path of the JSONL trace (appended to if it exists)
+        """
+        self.trace_file = Path(trace_file)
+        self.trace_file.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+
+    def record(
+        self,
+        contribution: Dict,
+        prompt: str,
+        response: Optional[str],
+        timings: Dict[str, float],
+        success: bool,
+        error: Optional[str] = None
+    ):
+        """
+        Append one evaluation to the trace.
+
+        Args:
+            contribution: Archive contribution record that was evaluated
+            prompt: Evaluation prompt sent to the LLM
+            response: Raw LLM response (None if the call failed)
+            timings: Stage durations in seconds (prepare, llm, post, total)
+            success: Whether the evaluation completed
+            error: Error message for failed evaluations
+        """
+        entry = {
+            "version": TRACE_VERSION,
+            "recorded_at": datetime.now().isoformat(),
+            "submission_hash": contribution["submission_hash"],
+            "title": contribution.get("title", ""),
+            "contributor": contribution.get("contributor", ""),
+            "category": contribution.get("category"),
+            "text_content": contribution.get("text_content", ""),
+            "prompt_sha256": prompt_fingerprint(prompt),
+            "prompt": prompt,
+            "response": response,
+            "timings": {stage: round(seconds, 6) for stage, seconds in timings.items()},
+            "success": success,
+        }
+        if error:
+            entry["error"] = error
+
+        line = json.dumps(entry, ensure_ascii=False)
+        try:
+            with self._lock:
+                with open(self.trace_file, "a", encoding="utf-8") as f:
+                    f.write(line + "\n")
+        except OSError as e:
+            # Recording must never break an evaluation
+            logger.warning(f"Could not write evaluation trace to {self.trace_file}: {e}")
+
+
+def iter_trace(trace_file: str) -> Iterator[Dict]:
+    """
+    Iterate over the records of a trace file, skipping malformed lines.
+
+    Args:
+        trace_file: Path of the JSONL trace
+
+    Yields:
+        Trace records in recorded order
+    """
+    with open(trace_file, "r", encoding="utf-8") as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                logger.warning(f"Skipping malformed trace line {line_number} in {trace_file}")
+
+
+def load_trace(trace_file: str, include_failed: bool = False) -> List[Dict]:
+    """
+    Load trace records that can be replayed.
+
+    Args:
+        trace_file: Path of the JSONL trace
+        include_failed: Also return records without an LLM response
+
+    Returns:
+        List of trace records
+    """
+    return [r for r in iter_trace(trace_file) if include_failed or r.get("response") is not None]
+
+
+class ReplayResponder:
+    """
+    Stand-in for the LLM call that answers with recorded responses.
+
+    Prompts are matched by fingerprint first. When a prompt differs from the
+    recorded one (e.g. the archive context changed), the response of the
+    record set with expect() is used and the mismatch is counted.
+    """
+
+    def __init__(self, records: List[Dict], pace: str = PACE_FAST):
+        """
+        Initialize responder.
+
+        Args:
+            records: Trace records to answer from
+            pace: PACE_FAST (answer immediately) or PACE_RECORDED (sleep for the recorded LLM time)
+        """
+        if pace not in (PACE_FAST, PACE_RECORDED):
+            raise ValueError(f"Unknown replay pace: {pace}")
+        self.pace = pace
+        self._by_prompt = {r["prompt_sha256"]: r for r in records if r.get("response") is not None}
+        self._expected: Optional[Dict] = None
+        self.prompt_matches = 0
+        self.prompt_mismatches = 0
+
+    def expect(self, record: Optional[Dict]):
+        """Set the record whose response is used when the prompt does not match exactly."""
+        self._expected = record
+
+    def __call__(self, prompt: str) -> str:
+        """
+        Answer an evaluation prompt with a recorded response.
+
+        Args:
+            prompt: Evaluation prompt
+
+        Returns:
+            Recorded raw LLM response
+
+        Raises:
+            KeyError: If no recorded response applies
+        """
+        record = self._by_prompt.get(prompt_fingerprint(prompt))
+        if record is not None:
+            self.prompt_matches += 1
+        elif self._expected is not None and self._expected.get("response") is not None:
+            record = self._expected
+            self.prompt_mismatches += 1
+        else:
+            raise KeyError("No recorded response for this evaluation prompt")
+
+        if self.pace == PACE_RECORDED:
+            time.sleep(record.get("timings", {}).get("llm", 0.0))
+        return record["response"]
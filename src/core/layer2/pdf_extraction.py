@@ -0,0 +1,381 @@
+"""
+PDF Text Extraction Service
+Parallel, cached PDF text extraction shared by the PoC and PoD servers.
+
+Pages are extracted in ranges on a process pool, so CPU-heavy parsing of a
+large upload does not hold the API worker's GIL, and each document has an
+overall timeout. A timed-out document retires its pool: new documents go to a
+fresh pool and the old one is terminated once the documents still running on
+it have finished, so a stuck upload never fails its neighbours. Extracted pages are
+cached on disk by the file's SHA-256 (one JSON string per line), so a
+resubmitted or re-evaluated PDF is never parsed twice, and text is yielded
+page by page instead of being concatenated in memory.
+"""
+
+import io
+import os
+import json
+import time
+import hashlib
+import logging
+import threading
+import multiprocessing
+from multiprocessing import context as mp_context, spawn as mp_spawn, util as mp_util
+from pathlib import Path
+from typing import Callable, Iterator, List, Optional
+
+try:
+    from multiprocessing import popen_spawn_posix
+except ImportError:  # Windows
+    popen_spawn_posix = None
+
+from core.utils.metrics import record_cache
+
+logger = logging.getLogger(__name__)
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+class PDFExtractionError(Exception):
+    """Raised when a PDF cannot be extracted or extraction times out."""
+
+
+def file_sha256(path: str) -> str:
+    """SHA-256 of a file, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def count_pdf_pages(pdf_path: str) -> int:
+    """Number of pages in a PDF (PyPDF2, falling back to pdfplumber)."""
+    try:
+        import PyPDF2
+        return len(PyPDF2.PdfReader(pdf_path).pages)
+    except Exception as pypdf_error:
+        try:
+            import pdfplumber
+        except ImportError:
+            raise PDFExtractionError(f"Cannot read PDF: {pypdf_error}")
+        with pdfplumber.open(pdf_path) as pdf:
+            return len(pdf.pages)
+
+
+def extract_pdf_pages(pdf_path: str, start: int, stop: int) -> List[str]:
+    """
+    Extract the text of pages [start, stop) of a PDF.
+
+    Runs in pool workers, so it opens the document itself. Falls back to
+    pdfplumber when PyPDF2 is missing or fails on the document.
+    """
+    try:
+        import PyPDF2
+        reader = PyPDF2.PdfReader(pdf_path)
+        return [reader.pages[i].extract_text() or "" for i in range(start, stop)]
+    except Exception as pypdf_error:
+        try:
+            import pdfplumber
+        except ImportError:
+            raise PDFExtractionError(f"Cannot extract PDF text: {pypdf_error}")
+        with pdfplumber.open(pdf_path) as pdf:
+            return [pdf.pages[i].extract_text() or "" for i in range(start, stop)]
+
+
+def _worker_preparation_data(name: str) -> dict:
+    """Spawn preparation data without the parent's __main__, so workers do not run the entry script."""
+    data = mp_spawn.get_preparation_data(name)
+    data.pop("init_main_from_name", None)
+    data.pop("init_main_from_path", None)
+    return data
+
+
+if popen_spawn_posix is not None:
+    class _WorkerPopen(popen_spawn_posix.Popen):
+        """
+        Spawn launcher for extraction workers.
+
+        Plain spawn workers re-run the entry script as __mp_main__ before starting,
+        so a server that builds its services at module level (app.py's PoCServer)
+        would build them again in every worker. Extraction workers only need the
+        modules of their page functions, which unpickling the tasks imports.
+        Same as popen_spawn_posix.Popen._launch apart from the preparation data.
+        """
+
+        def _launch(self, process_obj):
+            from multiprocessing import resource_tracker
+            tracker_fd = resource_tracker.getfd()
+            self._fds.append(tracker_fd)
+            prep_data = _worker_preparation_data(process_obj._name)
+            fp = io.BytesIO()
+            mp_context.set_spawning_popen(self)
+            try:
+                mp_context.reduction.dump(prep_data, fp)
+                mp_context.reduction.dump(process_obj, fp)
+            finally:
+                mp_context.set_spawning_popen(None)
+
+            parent_r = child_w = child_r = parent_w = None
+            try:
+                parent_r, child_w = os.pipe()
+                child_r, parent_w = os.pipe()
+                cmd = mp_spawn.get_command_line(tracker_fd=tracker_fd, pipe_handle=child_r)
+                self._fds.extend([child_r, child_w])
+                self.pid = mp_util.spawnv_passfds(mp_spawn.get_executable(), cmd, self._fds)
+                self.sentinel = parent_r
+                with open(parent_w, "wb", closefd=False) as f:
+                    f.write(fp.getbuffer())
+            finally:
+                self.finalizer = mp_util.Finalize(
+                    self, mp_util.close_fds, [fd for fd in (parent_r, parent_w) if fd is not None]
+                )
+                for fd in (child_r, child_w):
+                    if fd is not None:
+                        os.close(fd)
+
+    class _WorkerProcess(mp_context.SpawnProcess):
+        @staticmethod
+        def _Popen(process_obj):
+            return _WorkerPopen(process_obj)
+
+    class _WorkerContext(mp_context.SpawnContext):
+        Process = _WorkerProcess
+
+    _worker_context = _WorkerContext()
+else:
+    # No entry-script-free launcher on Windows: workers import the entry script there
+    _worker_context = multiprocessing.get_context("spawn")
+
+
+class PDFExtractionService:
+    """
+    Extract PDF text on a process pool with a per-document timeout and a SHA-256 keyed disk cache.
+
+    Thread-safe: API worker threads share one service and one pool. Workers are
+    spawned rather than forked, since the service runs inside threaded servers,
+    and do not re-run the entry script (page functions must live in importable
+    modules, not in __main__).
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        max_workers: Optional[int] = None,
+        timeout: float = 120.0,
+        pages_per_task: int = 8,
+        page_counter: Callable[[str], int] = count_pdf_pages,
+        page_extractor: Callable[[str, int, int], List[str]] = extract_pdf_pages
+    ):
+        """
+        Initialize extraction service.
+
+        Args:
+            cache_dir: Directory for cached page text (None disables the cache)
+            max_workers: Worker processes (default: CPU count, capped at 4); 0 extracts inline
+            timeout: Seconds allowed per document before its pool is retired
+            pages_per_task: Pages extracted per worker task
+            page_counter: Picklable function returning a document's page count
+            page_extractor: Picklable function returning the texts of a page range
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        if self.cache_dir:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_workers = min(4, os.cpu_count() or 1) if max_workers is None else max_workers
+        self.timeout = timeout
+        self.pages_per_task = max(1, pages_per_task)
+        self.page_counter = page_counter
+        self.page_extractor = page_extractor
+
+        self._pool = None
+        # Documents extracting on each pool, and pools retired after a timeout
+        self._pool_users = {}
+        self._retired = set()
+        self._pool_lock = threading.Lock()
+        self.stats = {"extracted": 0, "cache_hits": 0, "timeouts": 0, "pages": 0}
+
+    def _count(self, stat: str, amount: int = 1):
+        with self._pool_lock:
+            self.stats[stat] += amount
+
+    def _acquire_pool(self):
+        """Pool for one document, created on first use; None means extract inline."""
+        if self.max_workers <= 0:
+            return None
+        with self._pool_lock:
+            if self._pool is None:
+                try:
+                    self._pool = _worker_context.Pool(self.max_workers)
+                except (OSError, NotImplementedError) as e:
+                    logger.warning(f"Process pool unavailable, extracting PDFs inline: {e}")
+                    self.max_workers = 0
+                    return None
+            self._pool_users[self._pool] = self._pool_users.get(self._pool, 0) + 1
+            return self._pool
+
+    def _release_pool(self, pool, timed_out: bool = False):
+        """
+        Finish a document on pool.
+
+        A timed-out document retires the pool, whose workers may be stuck on it;
+        a retired pool is terminated when its last document finishes.
+        """
+        with self._pool_lock:
+            if timed_out:
+                self.stats["timeouts"] += 1
+                if self._pool is pool:
+                    self._pool = None
+                self._retired.add(pool)
+            self._pool_users[pool] -= 1
+            finished = pool in self._retired and self._pool_users[pool] == 0
+            if finished:
+                del self._pool_users[pool]
+                self._retired.discard(pool)
+        if finished:
+            pool.terminate()
+
+    def close(self):
+        """Terminate the worker pools."""
+        with self._pool_lock:
+            pools = set(self._pool_users) | self._retired
+            if self._pool is not None:
+                pools.add(self._pool)
+            self._pool = None
+            self._pool_users.clear()
+            self._retired.clear()
+        for pool in pools:
+            pool.terminate()
+            pool.join()
+
+    def _cache_path(self, digest: str) -> Optional[Path]:
+        return self.cache_dir / f"{digest}.jsonl" if self.cache_dir else None
+
+    def iter_pages(self, pdf_path: str, digest: Optional[str] = None) -> Iterator[str]:
+        """
+        Yield the text of each page in order.
+
+        Args:
+            pdf_path: Path to PDF file
+            digest: SHA-256 of the file if already known (e.g. computed while uploading)
+
+        Yields:
+            Page texts
+
+        Raises:
+            PDFExtractionError: If the document cannot be read or times out
+        """
+        cache_path = self._cache_path(digest or file_sha256(pdf_path))
+        cached = cache_path is not None and cache_path.exists()
+        if cache_path is not None:
+            record_cache("pdf_text", cached)
+        if cached:
+            self._count("cache_hits")
+            with open(cache_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    yield json.loads(line)
+            return
+
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.{threading.get_ident()}.tmp") \
+            if cache_path else None
+        cache_file = open(tmp_path, "w", encoding="utf-8") if tmp_path else None
+        completed = False
+        try:
+            for page in self._extract_pages(pdf_path):
+                if cache_file:
+                    cache_file.write(json.dumps(page, ensure_ascii=False) + "\n")
+                yield page
+            completed = True
+        finally:
+            if cache_file:
+                cache_file.close()
+                if completed:
+                    os.replace(tmp_path, cache_path)
+                else:
+                    tmp_path.unlink(missing_ok=True)
+
+    def _extract_pages(self, pdf_path: str) -> Iterator[str]:
+        """Extract pages on the pool, yielding them in order as ranges finish."""
+        pool = self._acquire_pool()
+        if pool is None:
+            page_count = self.page_counter(pdf_path)
+            for start in range(0, page_count, self.pages_per_task):
+                pages = self.page_extractor(pdf_path, start, min(page_count, start + self.pages_per_task))
+                self._count("pages", len(pages))
+                yield from pages
+            self._count("extracted")
+            return
+
+        deadline = time.monotonic() + self.timeout
+        timed_out = False
+        try:
+            page_count = self._wait(pool.apply_async(self.page_counter, (pdf_path,)), deadline, pdf_path)
+            ranges = [
+                pool.apply_async(self.page_extractor, (pdf_path, start, min(page_count, start + self.pages_per_task)))
+                for start in range(0, page_count, self.pages_per_task)
+            ]
+            for pending in ranges:
+                pages = self._wait(pending, deadline, pdf_path)
+                self._count("pages", len(pages))
+                yield from pages
+        except multiprocessing.TimeoutError:
+            timed_out = True
+            raise PDFExtractionError(f"PDF extraction timed out after {self.timeout}s: {pdf_path}")
+        finally:
+            self._release_pool(pool, timed_out)
+        self._count("extracted")
+
+    @staticmethod
+    def _wait(pending, deadline: float, pdf_path: str):
+        """Wait for a pool task within the document deadline."""
+        try:
+            return pending.get(max(0.0, deadline - time.monotonic()))
+        except (PDFExtractionError, multiprocessing.TimeoutError):
+            raise
+        except Exception as e:
+            raise PDFExtractionError(f"Cannot extract PDF text from {pdf_path}: {e}")
+
+    def extract_text(self, pdf_path: str, separator: str = "\n", digest: Optional[str] = None) -> Optional[str]:
+        """
+        Extract the full text of a PDF.
+
+        Args:
+            pdf_path: Path to PDF file
+            separator: String placed between pages
+            digest: SHA-256 of the file if already known
+
+        Returns:
+            Extracted text, or None if the PDF contains no text
+
+        Raises:
+            PDFExtractionError: If the document cannot be read or times out
+        """
+        text = separator.join(self.iter_pages(pdf_path, digest))
+        return text if text.strip() else None
+
+
+_shared_services = {}
+_shared_lock = threading.Lock()
+
+
+def get_pdf_extraction_service(cache_dir: Optional[str] = None) -> PDFExtractionService:
+    """
+    Process-wide extraction service for a cache directory.
+
+    Worker count and timeout come from PDF_EXTRACTION_WORKERS and
+    PDF_EXTRACTION_TIMEOUT.
+    """
+    key = str(Path(cache_dir).resolve()) if cache_dir else None
+    with _shared_lock:
+        service = _shared_services.get(key)
+        if service is None:
+            try:
+                workers = int(os.getenv("PDF_EXTRACTION_WORKERS", ""))
+            except ValueError:
+                workers = None
+            try:
+                timeout = float(os.getenv("PDF_EXTRACTION_TIMEOUT", "120"))
+            except ValueError:
+                timeout = 120.0
+            service = PDFExtractionService(cache_dir=cache_dir, max_workers=workers, timeout=timeout)
+            _shared_services[key] = service
+        return service
@@ -11,6 +11,8 @@ from typing import Dict, List, Optional, Set
 from datetime import datetime
 from enum import Enum
 
+from core.utils.metrics import ARCHIVE_SAVE_DURATION
+
 
 class ContributionStatus(Enum):
     """Contribution lifecycle status."""
@@ -57,6 +59,7 @@ class PoCArchive:
                 MetalType.SILVER.value: [],
                 MetalType.COPPER.value: [],
             },
+            "test_submissions": [],     # submission_hashes marked or detected as test submissions
             "metadata": {
                 "total_contributions": 0,
                 "created_at": datetime.now().isoformat(),
@@ -89,9 +92,31 @@ class PoCArchive:
                             MetalType.SILVER.value: [],
                             MetalType.COPPER.value: [],
                         }
+                    if "test_submissions" not in loaded:
+                        # Archives saved before the test index existed: build it once
+                        self.archive["test_submissions"] = [
+                            submission_hash
+                            for submission_hash, contribution in self.archive["contributions"].items()
+                            if contribution.get("is_test", False) or self.is_test_submission(
+                                submission_hash, contribution.get("title", ""), contribution.get("contributor", "")
+                            )
+                        ]
             except Exception as e:
                 print(f"Warning: Failed to load archive: {e}")
 
+    @staticmethod
+    def is_test_submission(submission_hash: str, title: str, contributor: str) -> bool:
+        """Detect test/demo submissions by title, contributor and hash patterns."""
+        title = (title or "").lower()
+        contributor = (contributor or "").lower()
+        return (
+            'test' in title or 'test' in contributor or
+            'demo' in title or 'demo' in contributor or
+            submission_hash.endswith('-test-123') or
+            submission_hash.endswith('-123') or
+            'blockchain-test' in submission_hash
+        )
+
     @property
     def contributions(self):
         """Convenience property for accessing contributions."""
@@ -109,8 +134,9 @@ class PoCArchive:
             raise TypeError(f"Object of type {type(obj)} is not JSON serializable")
 
         try:
-            with open(self.archive_file, "w") as f:
-                json.dump(self.archive, f, indent=2, default=json_encoder)
+            with ARCHIVE_SAVE_DURATION.labels(archive="poc_archive").time():
+                with open(self.archive_file, "w") as f:
+                    json.dump(self.archive, f, indent=2, default=json_encoder)
         except Exception as e:
             print(f"Error saving archive: {e}")
     
@@ -181,6 +207,8 @@ class PoCArchive:
         self._update_status_index(status.value, submission_hash)
         self._update_contributor_index(contributor, submission_hash)
         self._update_metal_index(metals, submission_hash)
+        if is_test or self.is_test_submission(submission_hash, title, contributor):
+            self._update_test_index(submission_hash)
         
         # Save archive
         self.save_archive()
@@ -359,6 +387,53 @@ class PoCArchive:
         if submission_hash not in self.archive["by_contributor"][contributor]:
             self.archive["by_contributor"][contributor].append(submission_hash)
     
+    def _update_test_index(self, submission_hash: str):
+        """Update test submission index."""
+        if submission_hash not in self.archive["test_submissions"]:
+            self.archive["test_submissions"].append(submission_hash)
+    
+    def get_test_submissions(self) -> List[str]:
+        """Submission hashes of test submissions still in the archive."""
+        return list(self.archive.get("test_submissions", []))
+    
+    def remove_contribution(self, submission_hash: str) -> bool:
+        """
+        Remove a contribution and its index entries (the archive is not saved).
+        
+        Args:
+            submission_hash: Submission identifier
+        
+        Returns:
+            True if the contribution was removed
+        """
+        contribution = self.archive["contributions"].pop(submission_hash, None)
+        if submission_hash in self.archive.get("test_submissions", []):
+            self.archive["test_submissions"].remove(submission_hash)
+        if contribution is None:
+            return False
+        
+        content_hash = contribution.get("content_hash")
+        if content_hash and submission_hash in self.archive["content_hashes"].get(content_hash, []):
+            self.archive["content_hashes"][content_hash].remove(submission_hash)
+            if not self.archive["content_hashes"][content_hash]:
+                del self.archive["content_hashes"][content_hash]
+        
+        status = contribution.get("status")
+        if status and submission_hash in self.archive["by_status"].get(status, []):
+            self.archive["by_status"][status].remove(submission_hash)
+        
+        contributor = contribution.get("contributor")
+        if contributor and submission_hash in self.archive["by_contributor"].get(contributor, []):
+            self.archive["by_contributor"][contributor].remove(submission_hash)
+            if not self.archive["by_contributor"][contributor]:
+                del self.archive["by_contributor"][contributor]
+        
+        for metal in contribution.get("metals", []):
+            if submission_hash in self.archive["by_metal"].get(metal, []):
+                self.archive["by_metal"][metal].remove(submission_hash)
+        
+        return True
+    
     def _update_metal_index(self, metals: List[MetalType], submission_hash: str):
         """Update metal index."""
         for metal in metals:
@@ -4,9 +4,11 @@ Archive-first evaluation with multi-metal support and Syntheverse Sandbox Map in
 """
 
 import os
-import json
+import time
 import logging
-from typing import Dict, Optional, List, Callable
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional, List, Callable, Tuple
 from datetime import datetime
 from pathlib import Path
 
@@ -15,9 +17,19 @@ from .poc_archive import PoCArchive, ContributionStatus, MetalType
 from .sandbox_map import SandboxMap
 from .zenodo_integration import ZenodoIntegration
 from .recognition_system import RecognitionSystem
+from .evaluation_context import ArchiveSimilarityIndex, build_archive_context, count_tokens, truncate_to_tokens
+from .evaluation_trace import EvaluationTraceRecorder
+from .evaluation_parser import extract_evaluation_json, normalize_metals
+from .pdf_extraction import PDFExtractionError, PDFExtractionService, get_pdf_extraction_service
+from .evaluation_scheduler import EvaluationScheduler, EvaluationTicket, PriorityClass
+from .progress_bus import ProgressBus
 
 # Load GROQ_API_KEY using centralized utility
-from core.utils import load_groq_api_key
+from core.utils import (
+    load_groq_api_key, get_groq_base_url, env_int, ProviderRouter, ProviderError, openai_chat_provider
+)
+from core.utils.tracing import Tracer, get_tracer
+from core.utils.metrics import ARCHIVE_CONTRIBUTIONS, EVALUATION_QUEUE_DEPTH, EVALUATIONS_RUNNING, record_cache
 
 # Set up logger
 logger = logging.getLogger(__name__)
@@ -34,7 +46,11 @@ class PoCServer:
         groq_api_key: Optional[str] = None,
         output_dir: str = "test_outputs/poc_reports",
         tokenomics_state_file: str = "test_outputs/l2_tokenomics_state.json",
-        archive_file: str = "test_outputs/poc_archive.json"
+        archive_file: str = "test_outputs/poc_archive.json",
+        llm_responder: Optional[Callable[[str], str]] = None,
+        trace_file: Optional[str] = None,
+        pdf_extractor: Optional[PDFExtractionService] = None,
+        tracer: Optional[Tracer] = None
     ):
         """
         Initialize PoC server.
@@ -44,7 +60,161 @@ class PoCServer:
             output_dir: Directory for output reports
             tokenomics_state_file: Path to tokenomics state file
             archive_file: Path to PoC archive file
+            llm_responder: Optional function answering evaluation prompts in place of the
+                Groq API (e.g. evaluation_trace.ReplayResponder); Groq is not contacted
+            trace_file: Optional JSONL file to record evaluations to for later replay
+            pdf_extractor: PDF extraction service (defaults to the shared service
+                caching next to output_dir)
+            tracer: Span tracer for per-stage latency (defaults to the process-wide tracer)
         """
+        startup_started = time.perf_counter()
+        self.startup_timings: Dict[str, float] = {}
+        self._ready = threading.Event()
+        self.llm_provider_status = "unchecked"
+
+        self.tracer = tracer or get_tracer()
+        self.llm_responder = llm_responder
+        self.trace_recorder = EvaluationTraceRecorder(trace_file) if trace_file else None
+        if trace_file:
+            logger.info(f"Recording evaluation trace to {trace_file}")
+
+        if llm_responder is not None:
+            self.groq_api_key = groq_api_key
+            self.groq_client = None
+            self.llm_router = None
+            self.llm_provider_status = "injected"
+            logger.info("Using injected LLM responder - Groq API will not be contacted")
+        else:
+            self._init_llm_clients(groq_api_key)
+        self.startup_timings["llm_clients"] = time.perf_counter() - startup_started
+        
+        self.output_dir = Path(output_dir)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.pdf_extractor = pdf_extractor or get_pdf_extraction_service(
+            str(self.output_dir.parent / "pdf_text_cache")
+        )
+        
+        # Initialize components: the state files are independent, so load them concurrently
+        state_started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=4, thread_name_prefix="poc-startup") as loader:
+            tokenomics = loader.submit(TokenomicsState, state_file=tokenomics_state_file)
+            archive = loader.submit(PoCArchive, archive_file=archive_file)
+            zenodo = loader.submit(ZenodoIntegration)
+            recognition = loader.submit(RecognitionSystem)
+            self.tokenomics = tokenomics.result()
+            self.archive = archive.result()
+            self.zenodo = zenodo.result()
+            self.recognition = recognition.result()
+        self.sandbox_map = SandboxMap(self.archive)
+        self.startup_timings["state_files"] = time.perf_counter() - state_started
+
+        # Evaluation prompt context: k most similar archive entries within a token budget
+        self.archive_context_k = env_int("POC_ARCHIVE_CONTEXT_K", 20)
+        self.archive_context_token_budget = env_int("POC_ARCHIVE_CONTEXT_TOKENS", 1500)
+        self.content_token_budget = env_int("POC_CONTENT_TOKENS", 2000)
+        self.similarity_index = ArchiveSimilarityIndex()
+
+        # Evaluation progress is published in memory (streamed to clients), not saved to the archive
+        self.progress_bus = ProgressBus()
+
+        # Called with the archived contribution after each evaluation is stored (e.g. certificate pre-rendering)
+        self.evaluation_listeners: List[Callable[[Dict], None]] = []
+
+        # Evaluations run on a priority / fair-share scheduler (workers start on first use)
+        self.evaluation_scheduler = EvaluationScheduler(
+            self._run_scheduled_evaluation,
+            workers=env_int("POC_EVALUATION_WORKERS", 4)
+        )
+
+        logger.info("PoC Archive initialized")
+        logger.info("Syntheverse Sandbox Map initialized")
+
+        # Remove test submissions left from earlier runs (only the indexed ones are visited);
+        # the archive save happens in the background before the server reports ready
+        cleanup_started = time.perf_counter()
+        cleanup_result = self.cleanup_test_submissions(save=False)
+        self.startup_timings["test_cleanup"] = time.perf_counter() - cleanup_started
+        self.startup_timings["init"] = time.perf_counter() - startup_started
+        if cleanup_result.get("cleaned_count", 0) > 0:
+            logger.info(f"Cleaned up {cleanup_result['cleaned_count']} existing test submissions")
+
+        threading.Thread(
+            target=self._finish_startup,
+            args=(cleanup_result.get("cleaned_count", 0) > 0, startup_started),
+            name="poc-startup",
+            daemon=True
+        ).start()
+    
+    def _finish_startup(self, save_archive: bool, startup_started: float):
+        """Background startup stage: persist the startup cleanup, mark ready, then check the LLM provider."""
+        try:
+            if save_archive:
+                self.archive.save_archive()
+        finally:
+            self.startup_timings["ready"] = time.perf_counter() - startup_started
+            self._ready.set()
+            logger.info(f"PoC server ready after {self.startup_timings['ready']:.2f}s")
+        if self.groq_client is not None:
+            self._check_llm_provider()
+    
+    def _check_llm_provider(self):
+        """Verify the Groq API is reachable (kept off the startup path)."""
+        self.llm_provider_status = "checking"
+        try:
+            self.groq_client.models.list()
+            self.llm_provider_status = "ok"
+            logger.info("Grok API initialized successfully")
+        except Exception as e:
+            self.llm_provider_status = f"unavailable: {e}"
+            logger.warning(f"Grok API connectivity check failed: {e}")
+    
+    @property
+    def is_ready(self) -> bool:
+        """Whether startup has finished and writes can proceed."""
+        return self._ready.is_set()
+    
+    def wait_until_ready(self, timeout: Optional[float] = None) -> bool:
+        """Block until startup has finished (True) or the timeout expires (False)."""
+        return self._ready.wait(timeout)
+    
+    def register_metrics(self):
+        """Expose this server's evaluation queue and archive size through the shared metrics gauges."""
+        def queue_depth():
+            return {cls: stats["queued"] for cls, stats in self.evaluation_scheduler.stats()["classes"].items()}
+
+        def running():
+            return sum(stats["running"] for stats in self.evaluation_scheduler.stats()["classes"].values())
+
+        EVALUATION_QUEUE_DEPTH.set_function(queue_depth)
+        EVALUATIONS_RUNNING.set_function(running)
+        ARCHIVE_CONTRIBUTIONS.set_function(lambda: len(self.archive.contributions))
+    
+    def add_evaluation_listener(self, listener: Callable[[Dict], None]):
+        """Call listener with the archived contribution whenever an evaluation result is stored."""
+        self.evaluation_listeners.append(listener)
+
+    def _notify_evaluation_listeners(self, submission_hash: str):
+        if not self.evaluation_listeners:
+            return
+        contribution = self.archive.get_contribution(submission_hash)
+        if not contribution:
+            return
+        for listener in self.evaluation_listeners:
+            try:
+                listener(contribution)
+            except Exception as e:
+                logger.warning(f"Evaluation listener failed for {submission_hash}: {e}")
+
+    def get_startup_status(self) -> Dict:
+        """Readiness, per-stage startup timings and LLM provider check result."""
+        return {
+            "ready": self.is_ready,
+            "llm_provider": self.llm_provider_status,
+            "timings": {stage: round(seconds, 4) for stage, seconds in self.startup_timings.items()},
+        }
+    
+    def _init_llm_clients(self, groq_api_key: Optional[str]):
+        """Initialize the Grok API client and the evaluation provider router."""
         # Initialize Grok API client
         self.groq_api_key = groq_api_key or load_groq_api_key()
         if not self.groq_api_key:
@@ -54,32 +224,45 @@ class PoCServer:
         
         try:
             from openai import OpenAI
+            # Connectivity is checked in the background once startup has finished
             self.groq_client = OpenAI(
                 api_key=self.groq_api_key,
-                base_url="https://api.groq.com/openai/v1"
+                base_url=get_groq_base_url()
             )
-            self.groq_client.models.list()
-            logger.info("Grok API initialized successfully")
         except Exception as e:
             raise ValueError(f"Failed to initialize Grok API client: {e}")
-        
-        self.output_dir = Path(output_dir)
-        self.output_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Initialize components
-        self.tokenomics = TokenomicsState(state_file=tokenomics_state_file)
-        self.archive = PoCArchive(archive_file=archive_file)
-        self.sandbox_map = SandboxMap(self.archive)
-        self.zenodo = ZenodoIntegration()
-        self.recognition = RecognitionSystem()
-
-        logger.info("PoC Archive initialized")
-        logger.info("Syntheverse Sandbox Map initialized")
 
-        # Run initial cleanup of any existing test submissions
-        cleanup_result = self.cleanup_test_submissions()
-        if cleanup_result.get("cleaned_count", 0) > 0:
-            logger.info(f"Cleaned up {cleanup_result['cleaned_count']} existing test submissions")
+        # Route evaluations through Groq, hedging to an optional secondary
+        # OpenAI-compatible provider when Groq is slower than its p95
+        self.llm_router = ProviderRouter()
+        self.llm_router.add_provider(openai_chat_provider(
+            "groq", self.groq_client, "llama-3.1-8b-instant",
+            hedge_after=env_int("POC_LLM_HEDGE_AFTER", 60)
+        ))
+        secondary_url = os.getenv("POC_SECONDARY_LLM_BASE_URL")
+        secondary_key = os.getenv("POC_SECONDARY_LLM_API_KEY")
+        if secondary_url and not secondary_key and secondary_url.rstrip("/") == get_groq_base_url().rstrip("/"):
+            # A second Groq route (e.g. another model) may share the Groq key
+            secondary_key = self.groq_api_key
+        if secondary_url and not secondary_key:
+            # Never send the Groq key to another endpoint
+            logger.warning("POC_SECONDARY_LLM_BASE_URL is set without POC_SECONDARY_LLM_API_KEY - "
+                           "secondary evaluation provider disabled")
+        elif secondary_url:
+            try:
+                from openai import OpenAI
+                secondary_client = OpenAI(
+                    api_key=secondary_key,
+                    base_url=secondary_url
+                )
+                self.llm_router.add_provider(openai_chat_provider(
+                    "secondary", secondary_client,
+                    os.getenv("POC_SECONDARY_LLM_MODEL") or "llama-3.1-8b-instant",
+                    hedge_after=env_int("POC_LLM_HEDGE_AFTER", 60)
+                ))
+                logger.info(f"Secondary evaluation provider configured: {secondary_url}")
+            except Exception as e:
+                logger.warning(f"Secondary evaluation provider not available: {e}")
     
     def submit_contribution(
         self,
@@ -90,12 +273,17 @@ class PoCServer:
         pdf_path: Optional[str] = None,
         category: Optional[str] = None,
         is_test: bool = False,
-        progress_callback: Optional[Callable[[str, str], None]] = None
+        progress_callback: Optional[Callable[[str, str], None]] = None,
+        force: bool = False
     ) -> Dict:
         """
         Submit a contribution for evaluation.
         Archive-first: Immediately adds to archive as DRAFT.
         
+        Submissions are idempotent per submission hash: resubmitting the same
+        content attaches to the evaluation in flight or returns the finished
+        one instead of evaluating again.
+        
         Args:
             submission_hash: Unique submission identifier
             title: Contribution title
@@ -104,66 +292,100 @@ class PoCServer:
             pdf_path: Path to PDF file (if available)
             category: Category (scientific/tech/alignment)
             progress_callback: Optional progress callback function
+            force: Re-add and re-evaluate even if the submission was already evaluated
         
         Returns:
             Submission result
         """
-        if progress_callback:
-            progress_callback("submitting", "Submitting contribution to archive...")
+        with self.tracer.span("submit", submission_hash=submission_hash, pdf=bool(pdf_path)) as span:
+            result = self._submit_contribution(
+                submission_hash, title, contributor, text_content, pdf_path,
+                category, is_test, progress_callback, force
+            )
+            span.set_attribute("status", result.get("status"))
+            return result
+
+    def _submit_contribution(
+        self,
+        submission_hash: str,
+        title: str,
+        contributor: str,
+        text_content: Optional[str],
+        pdf_path: Optional[str],
+        category: Optional[str],
+        is_test: bool,
+        progress_callback: Optional[Callable[[str, str], None]],
+        force: bool
+    ) -> Dict:
+        """Submission pipeline behind submit_contribution (runs inside its trace span)."""
+        # Writes wait for the background startup stage (archive save after cleanup)
+        with self.tracer.span("submit.wait_ready"):
+            self.wait_until_ready()
+        self._report_progress(submission_hash, "submitting", "Submitting contribution to archive...", progress_callback)
         
         # Extract text from PDF if needed
         if not text_content and pdf_path:
-            text_content = self._extract_text_from_pdf(pdf_path)
+            with self.tracer.span("submit.extract_text") as span:
+                text_content = self._extract_text_from_pdf(pdf_path)
+                span.set_attribute("chars", len(text_content or ""))
             if not text_content:
-                return {
-                    "success": False,
-                    "error": "Failed to extract text from PDF"
-                }
+                return self._submission_failed(submission_hash, "Failed to extract text from PDF", progress_callback)
         
         if not text_content:
-            return {
-                "success": False,
-                "error": "No text content or PDF path provided"
-            }
+            return self._submission_failed(submission_hash, "No text content or PDF path provided", progress_callback)
         
-        # Add to archive as DRAFT (archive-first rule)
-        contribution = self.archive.add_contribution(
-            submission_hash=submission_hash,
-            title=title,
-            contributor=contributor,
-            text_content=text_content,
-            status=ContributionStatus.DRAFT,
-            category=category,
-            is_test=is_test
-        )
-        
-        # Update status to PENDING
-        self.archive.update_contribution(
-            submission_hash,
-            status=ContributionStatus.PENDING
+        # A repeated submission of the same content keeps its archive entry
+        contribution = self.archive.get_contribution(submission_hash)
+        resubmission = (
+            not force
+            and contribution is not None
+            and contribution["content_hash"] == self.archive.calculate_content_hash(text_content)
         )
 
-        # Record for recognition system (Blueprint §1.4)
-        try:
-            self.recognition.record_contribution_for_recognition(
-                contributor=contributor,
-                submission_hash=submission_hash,
-                category=category or "general",
-                coherence_score=0.0  # Will be updated after evaluation
-            )
-        except Exception as e:
-            # Don't fail submission if recognition recording fails
-            print(f"Warning: Failed to record contribution for recognition: {e}")
+        if not resubmission:
+            with self.tracer.span("submit.archive_write"):
+                # Add to archive as DRAFT (archive-first rule)
+                contribution = self.archive.add_contribution(
+                    submission_hash=submission_hash,
+                    title=title,
+                    contributor=contributor,
+                    text_content=text_content,
+                    status=ContributionStatus.DRAFT,
+                    category=category,
+                    is_test=is_test
+                )
+                
+                # Update status to PENDING
+                self.archive.update_contribution(
+                    submission_hash,
+                    status=ContributionStatus.PENDING
+                )
+
+            # Record for recognition system (Blueprint §1.4)
+            with self.tracer.span("submit.recognition_update"):
+                try:
+                    self.recognition.record_contribution_for_recognition(
+                        contributor=contributor,
+                        submission_hash=submission_hash,
+                        category=category or "general",
+                        coherence_score=0.0  # Will be updated after evaluation
+                    )
+                except Exception as e:
+                    # Don't fail submission if recognition recording fails
+                    print(f"Warning: Failed to record contribution for recognition: {e}")
+        else:
+            logger.info(f"Resubmission of {submission_hash[:16]}; reusing archive entry")
 
         # Automatically evaluate the contribution
-        if progress_callback:
-            progress_callback("evaluating", "Automatically evaluating contribution...")
+        self._report_progress(submission_hash, "evaluating", "Automatically evaluating contribution...", progress_callback)
 
         try:
-            evaluation_result = self.evaluate_contribution(
-                submission_hash=submission_hash,
-                progress_callback=progress_callback
-            )
+            with self.tracer.span("submit.evaluation"):
+                evaluation_result = self.schedule_evaluation(
+                    submission_hash,
+                    progress_callback=progress_callback,
+                    force=force
+                ).wait()
 
             if evaluation_result.get("success"):
                 return {
@@ -192,6 +414,172 @@ class PoCServer:
                 "archive_entry": contribution
             }
     
+    def schedule_evaluation(
+        self,
+        submission_hash: str,
+        priority: Optional[PriorityClass] = None,
+        admin: bool = False,
+        progress_callback: Optional[Callable[[str, str], None]] = None,
+        force: bool = False
+    ) -> EvaluationTicket:
+        """
+        Queue a contribution for evaluation on the evaluation scheduler.
+        
+        Requests for a submission that is already queued or running attach to
+        that evaluation. A submission with a finished evaluation gets the stored
+        result back unless force is set.
+        
+        Args:
+            submission_hash: Submission identifier
+            priority: Priority class (derived from the contribution if not given)
+            admin: Whether an administrator requested the (re-)evaluation
+            progress_callback: Optional progress callback
+            force: Re-evaluate even if a finished evaluation exists
+        
+        Returns:
+            EvaluationTicket; wait() returns the evaluate_contribution result
+        """
+        contribution = self.archive.get_contribution(submission_hash) or {}
+        if not force and not self.evaluation_scheduler.is_scheduled(submission_hash):
+            stored = self.get_completed_evaluation(submission_hash)
+            record_cache("evaluation_result", stored is not None)
+            if stored is not None:
+                logger.info(f"Reusing finished evaluation of {submission_hash[:16]}")
+                # Terminal event for streams opened before the resubmission
+                self._report_progress(submission_hash, "completed", "✅ Evaluation already complete", progress_callback)
+                return EvaluationTicket.resolved(submission_hash, contribution.get("contributor", ""), stored)
+        if priority is None:
+            priority = self._evaluation_priority(contribution, admin)
+        return self.evaluation_scheduler.submit(
+            submission_hash,
+            contribution.get("contributor", ""),
+            priority=priority,
+            progress_callback=progress_callback,
+            trace_parent=self.tracer.current_span(),
+            enqueued_at=time.perf_counter()
+        )
+    
+    def get_completed_evaluation(self, submission_hash: str) -> Optional[Dict]:
+        """
+        Result of a submission's finished evaluation, rebuilt from the archive.
+        
+        Failed evaluations (e.g. LLM errors) are not considered finished so they
+        are retried.
+        
+        Args:
+            submission_hash: Submission identifier
+        
+        Returns:
+            Result shaped like evaluate_contribution's (with "reused": True),
+            or None if the submission has no finished evaluation
+        """
+        contribution = self.archive.get_contribution(submission_hash)
+        if not contribution or contribution["status"] not in (
+            ContributionStatus.QUALIFIED.value, ContributionStatus.UNQUALIFIED.value
+        ):
+            return None
+
+        metadata = contribution.get("metadata") or {}
+        evaluation_status = metadata.get("evaluation_status")
+        if evaluation_status == "duplicate":
+            first_submission = metadata.get("first_submission", "")
+            return {
+                "success": False,
+                "error": f"Duplicate contribution. First submission: {first_submission[:16]}...",
+                "duplicate_info": {
+                    "first_submission": first_submission,
+                    "reason": "Archive-first rule: Duplicate detected against entire archive"
+                },
+                "reused": True
+            }
+        if evaluation_status != "completed":
+            return None
+
+        evaluation = {
+            k: v for k, v in metadata.items()
+            if k not in ("allocations", "prompt_stats", "redundancy_report", "grok_raw_response", "evaluation_status")
+        }
+        return {
+            "success": True,
+            "submission_hash": submission_hash,
+            "evaluation": evaluation,
+            "status": contribution["status"],
+            "qualified": contribution["status"] == ContributionStatus.QUALIFIED.value,
+            "metals": [MetalType(m) if isinstance(m, str) else m for m in contribution.get("metals", [])],
+            "allocations": metadata.get("allocations", []),
+            "redundancy_report": metadata.get("redundancy_report", {}),
+            "prompt_stats": metadata.get("prompt_stats", {}),
+            "reused": True
+        }
+    
+    def _evaluation_priority(self, contribution: Dict, admin: bool = False) -> PriorityClass:
+        """
+        Admin requests first, then founder-epoch candidates, then everything else.
+
+        Density is only known after an evaluation, so a submission is a founder-epoch
+        candidate (while that epoch is open) when its own previous evaluation or an
+        earlier evaluation of its contributor reached the Founder threshold. The first
+        submission of a new contributor is scheduled as standard.
+        """
+        if admin:
+            return PriorityClass.ADMIN
+        if Epoch.FOUNDER not in self.tokenomics.get_open_epochs():
+            return PriorityClass.STANDARD
+        threshold = TokenomicsState.EPOCH_THRESHOLDS[Epoch.FOUNDER]
+        evaluated = [contribution]
+        contributor = contribution.get("contributor")
+        if contributor:
+            evaluated += self.archive.get_all_contributions(contributor=contributor)
+        for record in evaluated:
+            density = (record.get("metadata") or {}).get("density")
+            if isinstance(density, (int, float)) and density >= threshold:
+                return PriorityClass.FOUNDER
+        return PriorityClass.STANDARD
+    
+    def _run_scheduled_evaluation(
+        self,
+        submission_hash: str,
+        progress_callback: Optional[Callable[[str, str], None]] = None,
+        trace_parent=None,
+        enqueued_at: Optional[float] = None
+    ) -> Dict:
+        """Scheduler entry point (looked up at call time so evaluate_contribution can be replaced)."""
+        # Continue the requester's trace on this worker thread
+        with self.tracer.span("evaluate.scheduled", parent=trace_parent) as span:
+            if enqueued_at is not None:
+                span.set_attribute("queue_wait_ms", round((time.perf_counter() - enqueued_at) * 1000, 3))
+            return self.evaluate_contribution(submission_hash=submission_hash, progress_callback=progress_callback)
+    
+    def _submission_failed(
+        self,
+        submission_hash: str,
+        error: str,
+        progress_callback: Optional[Callable[[str, str], None]] = None
+    ) -> Dict:
+        """Failed submission result; also ends progress streams already open for the submission."""
+        self._report_progress(submission_hash, "failed", f"❌ {error}", progress_callback)
+        return {
+            "success": False,
+            "error": error
+        }
+    
+    def _report_progress(
+        self,
+        submission_hash: str,
+        stage: str,
+        message: str,
+        progress_callback: Optional[Callable[[str, str], None]] = None,
+        **data
+    ):
+        """Publish evaluation progress on the progress bus and to the caller's callback."""
+        self.progress_bus.publish(submission_hash, stage, message, **data)
+        if progress_callback:
+            progress_callback(stage, message)
+    
+    def get_queue_position(self, submission_hash: str) -> Optional[Dict]:
+        """Queue state and estimated wait for a scheduled evaluation (None if not scheduled)."""
+        return self.evaluation_scheduler.position(submission_hash)
+    
     def evaluate_contribution(
         self,
         submission_hash: str,
@@ -207,33 +595,54 @@ class PoCServer:
         Returns:
             Evaluation result with multi-metal support
         """
+        with self.tracer.span("evaluate", submission_hash=submission_hash) as span:
+            result = self._evaluate_contribution(submission_hash, progress_callback)
+            span.set_attribute("success", result.get("success"))
+            span.set_attribute("status", result.get("status"))
+            return result
+
+    def _evaluate_contribution(
+        self,
+        submission_hash: str,
+        progress_callback: Optional[Callable[[str, str], None]]
+    ) -> Dict:
+        """Evaluation pipeline behind evaluate_contribution (runs inside its trace span)."""
+        started = time.perf_counter()
+        self.wait_until_ready()
+
         # Get contribution from archive
         contribution = self.archive.get_contribution(submission_hash)
         if not contribution:
+            self._report_progress(submission_hash, "failed", "Contribution not found in archive", progress_callback)
             return {
                 "success": False,
                 "error": "Contribution not found in archive"
             }
         
         # Update status to EVALUATING
-        self.archive.update_contribution(
-            submission_hash,
-            status=ContributionStatus.EVALUATING
-        )
+        with self.tracer.span("evaluate.archive_write", step="evaluating"):
+            self.archive.update_contribution(
+                submission_hash,
+                status=ContributionStatus.EVALUATING
+            )
         
-        if progress_callback:
-            progress_callback("evaluating", "Evaluating contribution with archive-first redundancy check...")
+        self._report_progress(
+            submission_hash, "evaluating", "Evaluating contribution with archive-first redundancy check...", progress_callback
+        )
         
         # Archive-first redundancy check
         # Get ALL contributions from archive for redundancy comparison
-        all_archive_content = self.archive.get_all_content_for_redundancy_check()
+        with self.tracer.span("evaluate.archive_scan") as span:
+            all_archive_content = self.archive.get_all_content_for_redundancy_check()
+            span.set_attribute("archive_size", len(all_archive_content))
 
         # For first submission, set redundancy to 0
         is_first_submission = len([c for c in all_archive_content if c["submission_hash"] != submission_hash]) == 0
 
         # Check for exact duplicates
         content_hash = contribution["content_hash"]
-        duplicate_history = self.archive.get_content_hash_history(content_hash)
+        with self.tracer.span("evaluate.duplicate_check"):
+            duplicate_history = self.archive.get_content_hash_history(content_hash)
         
         if len(duplicate_history) > 1:
             # Multiple contributions with same content hash
@@ -249,6 +658,11 @@ class PoCServer:
                         "reason": "Exact duplicate of existing contribution"
                     }
                 )
+                self._notify_evaluation_listeners(submission_hash)
+                self._report_progress(
+                    submission_hash, "failed", "Exact duplicate of existing contribution", progress_callback,
+                    status=ContributionStatus.UNQUALIFIED.value
+                )
                 return {
                     "success": False,
                     "error": f"Duplicate contribution. First submission: {first_contrib['submission_hash'][:16]}...",
@@ -259,49 +673,51 @@ class PoCServer:
                 }
         
         # Get redundancy report from sandbox map
-        redundancy_report = self.sandbox_map.get_redundancy_report(submission_hash)
+        with self.tracer.span("evaluate.redundancy_report"):
+            redundancy_report = self.sandbox_map.get_redundancy_report(submission_hash)
         
-        # Prepare evaluation query with archive context
-        evaluation_query = self._prepare_evaluation_query(
-            contribution,
-            all_archive_content,
-            redundancy_report
+        # Prepare evaluation query with relevance-ranked archive context
+        with self.tracer.span("evaluate.prompt_build") as span:
+            evaluation_query, prompt_stats = self._build_evaluation_prompt(
+                contribution,
+                all_archive_content,
+                redundancy_report
+            )
+            span.set_attribute("total_tokens", prompt_stats["total_tokens"])
+        logger.info(
+            f"Evaluation prompt for {submission_hash[:16]}: {prompt_stats['total_tokens']} tokens "
+            f"(content {prompt_stats['content_tokens']}, archive {prompt_stats['archive_tokens']} "
+            f"from {prompt_stats['archive_entries']} entries, instructions {prompt_stats['instruction_tokens']})"
         )
         
         # Call Grok API for evaluation
-        if progress_callback:
-            progress_callback("calling_llm", "Calling Grok API for HHFE evaluation...")
+        self._report_progress(submission_hash, "calling_llm", "Calling Grok API for HHFE evaluation...", progress_callback)
         
+        llm_started = time.perf_counter()
         try:
             logger.info(f"Starting Grok API evaluation for {submission_hash}")
 
-            # Update status to show evaluation is in progress
-            self.archive.update_contribution(
-                submission_hash,
-                metadata={"evaluation_status": "preparing_evaluation", "progress": "🤖 Preparing evaluation data for Grok AI..."}
-            )
-
-            # Prepare evaluation context
-            self.archive.update_contribution(
-                submission_hash,
-                metadata={"evaluation_status": "analyzing_archive", "progress": "🔍 Analyzing archive for redundancy detection..."}
-            )
+            self._report_progress(submission_hash, "preparing_evaluation", "🤖 Preparing evaluation data for Grok AI...")
+            self._report_progress(submission_hash, "analyzing_archive", "🔍 Analyzing archive for redundancy detection...")
 
-            evaluation_result = self._call_grok_api(evaluation_query)
+            with self.tracer.span("evaluate.llm_call", prompt_chars=len(evaluation_query)):
+                evaluation_result = self._call_grok_api(evaluation_query)
+            llm_finished = time.perf_counter()
             logger.info(f"Grok API evaluation completed for {submission_hash}")
 
-            # Store the raw Grok response for user display
-            self.archive.update_contribution(
-                submission_hash,
-                metadata={
-                    "evaluation_status": "grok_response_received",
-                    "progress": "📨 Grok AI response received - processing evaluation...",
-                    "grok_raw_response": evaluation_result
-                }
+            self._report_progress(
+                submission_hash, "grok_response_received", "📨 Grok AI response received - processing evaluation..."
             )
 
         except Exception as e:
             logger.error(f"Grok API evaluation failed for {submission_hash}: {e}")
+            if self.trace_recorder:
+                failed_at = time.perf_counter()
+                self.trace_recorder.record(
+                    contribution, evaluation_query, None,
+                    {"prepare": llm_started - started, "llm": failed_at - llm_started, "total": failed_at - started},
+                    success=False, error=str(e)
+                )
             self.archive.update_contribution(
                 submission_hash,
                 status=ContributionStatus.UNQUALIFIED,
@@ -312,18 +728,22 @@ class PoCServer:
                     "progress": f"Evaluation failed: {str(e)[:50]}..."
                 }
             )
+            self._report_progress(
+                submission_hash, "failed", f"Evaluation failed: {str(e)[:50]}...", progress_callback,
+                status=ContributionStatus.UNQUALIFIED.value
+            )
             return {
                 "success": False,
                 "error": f"AI evaluation failed: {str(e)[:100]}..."
             }
         
         # Parse evaluation result (extract scores and metals)
-        self.archive.update_contribution(
-            submission_hash,
-            metadata={"evaluation_status": "extracting_scores", "progress": "📊 Extracting coherence, density, and redundancy scores..."}
+        self._report_progress(
+            submission_hash, "extracting_scores", "📊 Extracting coherence, density, and redundancy scores..."
         )
 
-        parsed_evaluation = self._parse_evaluation_result(evaluation_result, contribution)
+        with self.tracer.span("evaluate.parse", response_chars=len(evaluation_result or "")):
+            parsed_evaluation = self._parse_evaluation_result(evaluation_result, contribution)
 
         # Override redundancy for first submission
         if is_first_submission:
@@ -331,49 +751,71 @@ class PoCServer:
             parsed_evaluation["redundancy_analysis"] = "First submission in archive - zero redundancy"
 
         # Determine qualification status
-        self.archive.update_contribution(
-            submission_hash,
-            metadata={"evaluation_status": "determining_qualification", "progress": "⚖️ Determining contribution qualification and metal assignment..."}
+        self._report_progress(
+            submission_hash, "determining_qualification", "⚖️ Determining contribution qualification and metal assignment..."
         )
 
         qualified = self._determine_qualification(parsed_evaluation)
         status = ContributionStatus.QUALIFIED if qualified else ContributionStatus.UNQUALIFIED
         
         # Calculate allocations for each metal (multi-metal support)
-        self.archive.update_contribution(
-            submission_hash,
-            metadata={"evaluation_status": "calculating_rewards", "progress": "💰 Calculating SYNTH token rewards based on evaluation scores..."}
+        self._report_progress(
+            submission_hash, "calculating_rewards", "💰 Calculating SYNTH token rewards based on evaluation scores..."
         )
 
         allocations = []
-        if qualified and parsed_evaluation.get("metals"):
-            for metal in parsed_evaluation["metals"]:
-                allocation = self._calculate_allocation_for_metal(
-                    submission_hash,
-                    parsed_evaluation,
-                    metal
-                )
-                if allocation:
-                    allocations.append(allocation)
-
-                    # Record the allocation in tokenomics state
-                    self.tokenomics.record_allocation(
-                        submission_hash=submission_hash,
-                        contributor=contribution["contributor"],
-                        allocation=allocation["allocation"],
-                        coherence=parsed_evaluation.get("coherence", 0)
+        with self.tracer.span("evaluate.allocation", qualified=qualified):
+            if qualified and parsed_evaluation.get("metals"):
+                for metal in parsed_evaluation["metals"]:
+                    allocation = self._calculate_allocation_for_metal(
+                        submission_hash,
+                        parsed_evaluation,
+                        metal
                     )
+                    if allocation:
+                        allocations.append(allocation)
+
+                        # Record the allocation in tokenomics state
+                        self.tokenomics.record_allocation(
+                            submission_hash=submission_hash,
+                            contributor=contribution["contributor"],
+                            allocation=allocation["allocation"],
+                            coherence=parsed_evaluation.get("coherence", 0)
+                        )
 
         # Store allocations in metadata for frontend access
         evaluation_with_allocations = parsed_evaluation.copy()
         evaluation_with_allocations["allocations"] = allocations
+        evaluation_with_allocations["prompt_stats"] = prompt_stats
+        # Kept so a reused evaluation does not recompute the archive comparison
+        evaluation_with_allocations["redundancy_report"] = redundancy_report
+        # Raw Grok response for user display
+        evaluation_with_allocations["grok_raw_response"] = evaluation_result
+        evaluation_with_allocations["evaluation_status"] = "completed"
 
         # Update archive with evaluation results and allocations
-        self.archive.update_contribution(
-            submission_hash,
-            status=status,
-            metals=parsed_evaluation.get("metals", []),
-            metadata=evaluation_with_allocations
+        with self.tracer.span("evaluate.archive_write", step="result"):
+            self.archive.update_contribution(
+                submission_hash,
+                status=status,
+                metals=parsed_evaluation.get("metals", []),
+                metadata=evaluation_with_allocations
+            )
+        self._notify_evaluation_listeners(submission_hash)
+
+        finished = time.perf_counter()
+        timings = {
+            "prepare": llm_started - started,
+            "llm": llm_finished - llm_started,
+            "post": finished - llm_finished,
+            "total": finished - started,
+        }
+        if self.trace_recorder:
+            self.trace_recorder.record(contribution, evaluation_query, evaluation_result, timings, success=True)
+
+        self._report_progress(
+            submission_hash, "completed", "✅ Evaluation complete", progress_callback,
+            status=status.value, qualified=qualified
         )
 
         return {
@@ -384,7 +826,9 @@ class PoCServer:
             "qualified": qualified,
             "metals": parsed_evaluation.get("metals", []),
             "allocations": allocations,
-            "redundancy_report": redundancy_report
+            "redundancy_report": redundancy_report,
+            "prompt_stats": prompt_stats,
+            "timings": timings
         }
     
     def _prepare_evaluation_query(
@@ -394,32 +838,69 @@ class PoCServer:
         redundancy_report: Dict
     ) -> str:
         """Prepare evaluation query with archive context."""
-        # Build archive history text for redundancy context
-        archive_history = []
-        for arch_contrib in archive_content[:50]:  # Limit to 50 for token management
-            if arch_contrib["submission_hash"] != contribution["submission_hash"]:
-                archive_history.append({
-                    "hash": arch_contrib["submission_hash"][:16] + "...",
-                    "title": arch_contrib["title"],
-                    "status": arch_contrib["status"],
-                    "metals": arch_contrib.get("metals", [])
-                })
-        
-        archive_text = "\n".join([
-            f"- {h['title']} ({h['hash']}) [{','.join(h['metals'])}] - {h['status']}"
-            for h in archive_history
-        ])
-        
+        query, _ = self._build_evaluation_prompt(contribution, archive_content, redundancy_report)
+        return query
+
+    def _build_evaluation_prompt(
+        self,
+        contribution: Dict,
+        archive_content: List[Dict],
+        redundancy_report: Dict
+    ) -> Tuple[str, Dict]:
+        """
+        Build the evaluation prompt and measure its size per stage.
+
+        The archive section lists the archived contributions most similar to this
+        one (not the first N in archive order), packed under
+        archive_context_token_budget tokens.
+
+        Returns:
+            Tuple of (prompt text, prompt stats with token counts per stage)
+        """
+        # Keep the similarity index in step with the archive (only new entries are indexed)
+        self.similarity_index.sync(archive_content)
+        archive_lookup = {c["submission_hash"]: c for c in archive_content}
+        archive_text, context_stats = build_archive_context(
+            contribution,
+            archive_lookup,
+            self.similarity_index,
+            k=self.archive_context_k,
+            token_budget=self.archive_context_token_budget
+        )
+
+        content = truncate_to_tokens(contribution['text_content'], self.content_token_budget)
+        prompt = self._render_evaluation_prompt(contribution, content, archive_text, len(archive_content), redundancy_report)
+
+        content_tokens = count_tokens(content)
+        total_tokens = count_tokens(prompt)
+        prompt_stats = {
+            "content_tokens": content_tokens,
+            "content_truncated": len(content) < len(contribution['text_content']),
+            **context_stats,
+            "instruction_tokens": max(0, total_tokens - content_tokens - context_stats["archive_tokens"]),
+            "total_tokens": total_tokens,
+        }
+        return prompt, prompt_stats
+
+    def _render_evaluation_prompt(
+        self,
+        contribution: Dict,
+        content: str,
+        archive_text: str,
+        archive_size: int,
+        redundancy_report: Dict
+    ) -> str:
+        """Render the evaluation prompt template."""
         return f"""
 EVALUATE THIS CONTRIBUTION (Proof of Contribution):
 
 Title: {contribution['title']}
-Content: {contribution['text_content'][:8000]}...
+Content: {content}...
 
 ---
 ARCHIVE CONTEXT (Archive-First Redundancy Check):
-Total contributions in archive: {len(archive_content)}
-Recent archive entries for redundancy comparison:
+Total contributions in archive: {archive_size}
+Most similar archive entries for redundancy comparison:
 {archive_text if archive_text else "No previous contributions"}
 
 Redundancy Report:
@@ -469,60 +950,42 @@ EVALUATION REQUIREMENTS:
 
         logger.debug(f"Calling Grok API with evaluation query (length: {len(query)} characters)")
 
+        if self.llm_responder is not None:
+            return self.llm_responder(query)
+
         try:
             logger.debug("Sending evaluation request to Grok AI")
 
-            response = self.groq_client.chat.completions.create(
-                model="llama-3.1-8b-instant",
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": query}
-                ],
-                temperature=0.0,  # Deterministic evaluation for consistency
-                max_tokens=2000,
-                timeout=300  # 5 minute timeout for complex evaluations - let Grok finish
+            content = self.llm_router.call(
+                {
+                    "messages": [
+                        {"role": "system", "content": system_prompt},
+                        {"role": "user", "content": query}
+                    ],
+                    "temperature": 0.0,  # Deterministic evaluation for consistency
+                    "max_tokens": 2000,
+                    "timeout": 300  # 5 minute timeout for complex evaluations - let Grok finish
+                },
+                timeout=300
             )
 
             logger.info("Grok AI evaluation completed")
-            logger.debug(f"Response length: {len(response.choices[0].message.content)} characters")
+            logger.debug(f"Response length: {len(content)} characters")
 
-            return response.choices[0].message.content
-        except Exception as e:
+            return content
+        except ProviderError as e:
             logger.error(f"Grok API call failed: {e}")
             raise e
     
     def _parse_evaluation_result(self, result: str, contribution: Dict) -> Dict:
         """Parse Grok API evaluation result."""
-        # Try to extract JSON from response - look for JSON within markdown code blocks first
-        import re
+        # JSON from a ```json block if present, otherwise the first JSON object in the response
+        eval_dict = extract_evaluation_json(result)
 
-        # Try to find JSON within ```json ... ``` blocks
-        json_block_match = re.search(r'```json\s*\n(.*?)\n\s*```', result, re.DOTALL)
-        if json_block_match:
-            json_str = json_block_match.group(1).strip()
-            json_match = re.search(r'\{.*\}', json_str, re.DOTALL)
-        else:
-            # Fallback to finding any JSON object
-            json_match = re.search(r'\{.*\}', result, re.DOTALL)
-        
-        if json_match:
+        if eval_dict is not None:
             try:
-                eval_dict = json.loads(json_match.group(0))
-                
-                # Extract metals
-                metals = []
-                metals_raw = eval_dict.get("metals", [])
-                if isinstance(metals_raw, list):
-                    for m in metals_raw:
-                        m_lower = m.lower()
-                        if "gold" in m_lower:
-                            metals.append(MetalType.GOLD)
-                        if "silver" in m_lower:
-                            metals.append(MetalType.SILVER)
-                        if "copper" in m_lower:
-                            metals.append(MetalType.COPPER)
-                
-                # Ensure at least one metal
+                # Extract metals (ensure at least one)
+                metals = [MetalType(name) for name in normalize_metals(eval_dict.get("metals", []))]
                 if not metals:
                     metals = [MetalType.GOLD]  # Default
                 
@@ -545,7 +1008,7 @@ EVALUATION REQUIREMENTS:
                     "status": eval_dict.get("status", "rejected"),
                     "raw_response": result
                 }
-            except json.JSONDecodeError:
+            except (TypeError, ValueError):
                 pass
         
         # Fallback parsing
@@ -622,24 +1085,15 @@ EVALUATION REQUIREMENTS:
         
         return None
     
-    def _extract_text_from_pdf(self, pdf_path: str) -> Optional[str]:
-        """Extract text from PDF file and clean up formatting."""
+    def _extract_text_from_pdf(self, pdf_path: str, digest: Optional[str] = None) -> Optional[str]:
+        """Extract text from PDF file and clean up formatting (digest: file SHA-256, if known)."""
         try:
-            import PyPDF2
-            with open(pdf_path, "rb") as f:
-                reader = PyPDF2.PdfReader(f)
-                text = "\n".join([page.extract_text() for page in reader.pages])
-                if not text.strip():
-                    return None
-        except Exception:
-            try:
-                import pdfplumber
-                with pdfplumber.open(pdf_path) as pdf:
-                    text = "\n".join([page.extract_text() for page in pdf.pages])
-                    if not text.strip():
-                        return None
-            except Exception:
-                return None
+            text = self.pdf_extractor.extract_text(pdf_path, digest=digest)
+        except (PDFExtractionError, OSError) as e:
+            logger.warning(f"PDF text extraction failed for {pdf_path}: {e}")
+            return None
+        if text is None:
+            return None
 
         # Clean up the extracted text formatting
         import re
@@ -677,85 +1131,32 @@ EVALUATION REQUIREMENTS:
         """Get tokenomics statistics."""
         return self.tokenomics.get_statistics()
 
-    def cleanup_test_submissions(self) -> Dict:
+    def cleanup_test_submissions(self, save: bool = True) -> Dict:
         """
         Clean up test submissions from the archive.
         Removes all contributions marked as test submissions.
 
+        Only the archive's test submission index is visited (submissions are
+        indexed when added, marked or detected by patterns), so cleanup does
+        not scan the whole archive.
+
+        Args:
+            save: Save the archive afterwards (if anything was removed)
+
         Returns:
             Cleanup statistics
         """
-        test_submissions = []
-
-        # Find all test submissions (marked or detected by patterns)
-        for submission_hash, contribution in self.archive.archive["contributions"].items():
-            is_test = contribution.get("is_test", False)
-
-            # Also detect by patterns (for existing submissions)
-            if not is_test:
-                title = contribution.get("title", "").lower()
-                contributor = contribution.get("contributor", "").lower()
-                is_test = (
-                    'test' in title or 'test' in contributor or
-                    'demo' in title or 'demo' in contributor or
-                    submission_hash.endswith('-test-123') or
-                    submission_hash.endswith('-123') or
-                    'blockchain-test' in submission_hash
-                )
-
-            if is_test:
-                test_submissions.append(submission_hash)
-
         cleaned_count = 0
-        for submission_hash in test_submissions:
+        for submission_hash in self.archive.get_test_submissions():
             try:
-                # Remove from all indexes
-                contribution = self.archive.archive["contributions"].get(submission_hash)
-                if contribution:
-                    content_hash = contribution.get("content_hash")
-                    contributor = contribution.get("contributor")
-                    metals = contribution.get("metals", [])
-                    status = contribution.get("status")
-
-                    # Remove from content hash index
-                    if content_hash and content_hash in self.archive.archive["content_hashes"]:
-                        if submission_hash in self.archive.archive["content_hashes"][content_hash]:
-                            self.archive.archive["content_hashes"][content_hash].remove(submission_hash)
-                            if not self.archive.archive["content_hashes"][content_hash]:
-                                del self.archive.archive["content_hashes"][content_hash]
-
-                    # Remove from status index
-                    if status and status in self.archive.archive["by_status"]:
-                        if submission_hash in self.archive.archive["by_status"][status]:
-                            self.archive.archive["by_status"][status].remove(submission_hash)
-
-                    # Remove from contributor index
-                    if contributor and contributor in self.archive.archive["by_contributor"]:
-                        if submission_hash in self.archive.archive["by_contributor"][contributor]:
-                            self.archive.archive["by_contributor"][contributor].remove(submission_hash)
-                            if not self.archive.archive["by_contributor"][contributor]:
-                                del self.archive.archive["by_contributor"][contributor]
-
-                    # Remove from metal indexes
-                    for metal in metals:
-                        if metal in self.archive.archive["by_metal"]:
-                            if submission_hash in self.archive.archive["by_metal"][metal]:
-                                self.archive.archive["by_metal"][metal].remove(submission_hash)
-
-                    # Remove the contribution itself
-                    del self.archive.archive["contributions"][submission_hash]
+                if self.archive.remove_contribution(submission_hash):
                     cleaned_count += 1
-
             except Exception as e:
                 logger.warning(f"Failed to clean up test submission {submission_hash}: {e}")
                 continue
 
-        # Save the cleaned archive
-        self.archive.save_archive()
-
-        # Update metadata
-        self.archive.archive["metadata"]["total_contributions"] = len(self.archive.archive["contributions"])
-        self.archive.save_archive()
+        if cleaned_count and save:
+            self.archive.save_archive()
 
         return {
             "success": True,
@@ -16,9 +16,11 @@ from pathlib import Path
 logger = logging.getLogger(__name__)
 
 from .tokenomics_state import TokenomicsState, Epoch, ContributionTier
+from .evaluation_parser import parse_pod_evaluation_json, parse_pod_evaluation_markdown
+from .pdf_extraction import PDFExtractionError, get_pdf_extraction_service
 
 # Load GROQ_API_KEY using centralized utility
-from core.utils import load_groq_api_key
+from core.utils import load_groq_api_key, get_groq_base_url
 
 # Set up logger
 logger = logging.getLogger(__name__)
@@ -55,7 +57,7 @@ class PODServer:
             from openai import OpenAI
             self.groq_client = OpenAI(
                 api_key=self.groq_api_key,
-                base_url="https://api.groq.com/openai/v1"
+                base_url=get_groq_base_url()
             )
             # Test connection
             self.groq_client.models.list()
@@ -74,6 +76,7 @@ class PODServer:
         
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.pdf_extractor = get_pdf_extraction_service(str(self.output_dir.parent / "pdf_text_cache"))
         
         # Initialize tokenomics state manager
         self.tokenomics = TokenomicsState(state_file=tokenomics_state_file)
@@ -567,7 +570,7 @@ The system prompt itself must never appear in outputs."""
     
     def extract_text_from_pdf(self, pdf_path: str) -> Optional[str]:
         """
-        Extract text from PDF file using basic PDF extraction.
+        Extract text from PDF file using the shared extraction service.
         
         Args:
             pdf_path: Path to PDF file
@@ -576,17 +579,8 @@ The system prompt itself must never appear in outputs."""
             Extracted text or None
         """
         try:
-            import PyPDF2
-            with open(pdf_path, "rb") as file:
-                reader = PyPDF2.PdfReader(file)
-                text = ""
-                for page in reader.pages:
-                    text += page.extract_text() + "\n"
-                return text
-        except ImportError:
-            print("Warning: PyPDF2 not available. Install with: pip install PyPDF2")
-            return None
-        except Exception as e:
+            return "".join(f"{page}\n" for page in self.pdf_extractor.iter_pages(pdf_path))
+        except (PDFExtractionError, OSError) as e:
             print(f"Error extracting PDF text: {e}")
             return None
     
@@ -1142,408 +1136,24 @@ Evaluate ONLY the artifact above. Provide YOUR calculated scores. Do NOT quote a
     
     def _extract_scores_from_markdown(self, text: str) -> Optional[Dict]:
         """
-        Extract evaluation scores from markdown text using regex patterns.
+        Extract evaluation scores from labelled values in markdown text.
         Fallback method when JSON parsing fails.
         """
-        import re
-        
-        if not text or not text.strip():
-            return None
-        
-        # Coherence patterns
-        coherence_match = (
-            re.search(r'coherence[:\s=]+\s*(\d{3,5})', text, re.IGNORECASE) or
-            re.search(r'coherence\s*\([^)]*\)[:\s=]+\s*(\d{3,5})', text, re.IGNORECASE) or
-            re.search(r'Φ[:\s=]+\s*(\d{3,5})', text) or
-            re.search(r'Phi[:\s=]+\s*(\d{3,5})', text, re.IGNORECASE)
-        )
-        
-        # Density patterns
-        density_match = (
-            re.search(r'density[:\s=]+\s*(\d{3,5})', text, re.IGNORECASE) or
-            re.search(r'density\s*\([^)]*\)[:\s=]+\s*(\d{3,5})', text, re.IGNORECASE) or
-            re.search(r'ρ[:\s=]+\s*(\d{3,5})', text) or
-            re.search(r'rho[:\s=]+\s*(\d{3,5})', text, re.IGNORECASE)
-        )
-        
-        # Redundancy patterns
-        redundancy_match = (
-            re.search(r'redundancy[:\s=]+\s*([\d.]+)', text, re.IGNORECASE) or
-            re.search(r'R[:\s=]+\s*([\d.]+)', text)
-        )
-        
-        # Pod score patterns
-        pod_score_match = (
-            re.search(r'pod[_\s]?score[:\s=]+\s*([\d.]+)', text, re.IGNORECASE) or
-            re.search(r'PoD[_\s]?Score[:\s=]+\s*([\d.]+)', text) or
-            re.search(r'S[:\s=]+\s*(\d{3,5})', text)
-        )
-        
-        # Tier patterns
-        tier_match = (
-            re.search(r'tier[:\s=]+\s*"?(\w+)"?', text, re.IGNORECASE) or
-            re.search(r'classif[ied]*\s+as\s+(\w+)', text, re.IGNORECASE)
-        )
-        
-        # Epoch patterns
-        epoch_match = (
-            re.search(r'epoch[:\s=]+\s*"?(\w+)"?', text, re.IGNORECASE) or
-            re.search(r'qualif[ied]*\s+for\s+(\w+)', text, re.IGNORECASE)
-        )
-        
-        # Status patterns
-        status_match = re.search(r'(approved|rejected)', text, re.IGNORECASE)
-        
-        if coherence_match and density_match:
-            coherence_val = int(coherence_match.group(1))
-            density_val = int(density_match.group(1))
-            
-            # Ensure values are in valid range
-            coherence_val = max(0, min(10000, coherence_val))
-            density_val = max(0, min(10000, density_val))
-            
-            redundancy_val = float(redundancy_match.group(1)) if redundancy_match else 0.1
-            if redundancy_val > 1.0:
-                redundancy_val = redundancy_val / 100.0  # Normalize if given as percentage
-            
-            pod_score_val = float(pod_score_match.group(1)) if pod_score_match else 0.0
-            if pod_score_val == 0:
-                # Calculate from other values
-                pod_score_val = (coherence_val / 10000) * (density_val / 10000) * (1 - redundancy_val) * 1.0 * 10000
-            
-            tier_str = tier_match.group(1).lower() if tier_match else "copper"
-            if tier_str not in ["gold", "silver", "copper"]:
-                # Infer from scores
-                if density_val >= 8000:
-                    tier_str = "gold"
-                elif density_val >= 6000:
-                    tier_str = "silver"
-                else:
-                    tier_str = "copper"
-            
-            epoch_str = epoch_match.group(1).lower() if epoch_match else None
-            if not epoch_str:
-                if density_val >= 8000:
-                    epoch_str = "founder"
-                elif density_val >= 6000:
-                    epoch_str = "pioneer"
-                elif density_val >= 4000:
-                    epoch_str = "community"
-                else:
-                    epoch_str = "ecosystem"
-            
-            status_str = status_match.group(1).lower() if status_match else ("approved" if density_val >= 4000 else "rejected")
-            
-            return {
-                "coherence": coherence_val,
-                "density": density_val,
-                "redundancy": redundancy_val,
-                "epoch_weight": 1.0,
-                "pod_score": pod_score_val,
-                "tier": tier_str,
-                "epoch": epoch_str,
-                "tier_justification": f"Extracted from markdown evaluation",
-                "redundancy_analysis": f"Redundancy: {redundancy_val:.3f}",
-                "epoch_justification": f"Density {density_val} qualifies for {epoch_str} epoch",
-                "reasoning": text[:1000],
-                "status": status_str,
-                "rejection_reason": None if status_str == "approved" else "Density below threshold"
-            }
-        
-        return None
+        return parse_pod_evaluation_markdown(text)
     
     def _parse_evaluation_text(self, text: str) -> Dict:
         """
         Parse evaluation response from Grok API.
         Expects markdown report followed by JSON code block.
         """
-        import re
-        
         if not text or not text.strip():
             print("Warning: Empty response from Grok API")
             return None
         
-        # Look for JSON code block (```json ... ```)
-        json_patterns = [
-            r'```json\s*(\{.*?\})\s*```',  # JSON code block
-            r'```\s*(\{.*?"coherence".*?\})\s*```',  # Generic code block with JSON
-        ]
-        
-        json_str = None
-        for pattern in json_patterns:
-            json_match = re.search(pattern, text, re.DOTALL)
-            if json_match:
-                json_str = json_match.group(1)
-                print(f"Found JSON in code block")
-                break
-        
-        # If no code block, try to find JSON object directly
-        if not json_str:
-            start = text.find('{')
-            if start != -1:
-                brace_count = 0
-                end = start
-                for i, char in enumerate(text[start:], start):
-                    if char == '{':
-                        brace_count += 1
-                    elif char == '}':
-                        brace_count -= 1
-                        if brace_count == 0:
-                            end = i + 1
-                            json_str = text[start:end]
-                            print(f"Found JSON object at position {start}-{end}")
-                            break
-        
-        if not json_str:
-            print("Warning: No JSON found in response")
-            return None
-        
-        try:
-            eval_dict = json.loads(json_str)
-            
-            # Validate required fields
-            coherence = eval_dict.get("coherence")
-            density = eval_dict.get("density")
-            
-            if coherence is None or density is None:
-                print(f"Warning: JSON missing required fields. Got: {list(eval_dict.keys())}")
-                return None
-            
-            return {
-                "coherence": float(coherence),
-                "density": float(density),
-                "redundancy": float(eval_dict.get("redundancy", 0.0)),
-                "epoch_weight": float(eval_dict.get("epoch_weight", 1.0)),
-                "pod_score": float(eval_dict.get("pod_score", 0.0)),
-                "tier": eval_dict.get("tier", "gold"),
-                "epoch": eval_dict.get("epoch"),
-                "tier_justification": eval_dict.get("tier_justification", ""),
-                "redundancy_analysis": eval_dict.get("redundancy_analysis", ""),
-                "epoch_justification": eval_dict.get("epoch_justification", ""),
-                "retroactive_mining": eval_dict.get("retroactive_mining"),
-                "reasoning": eval_dict.get("reasoning", ""),
-                "status": eval_dict.get("status", "approved"),
-                "rejection_reason": eval_dict.get("rejection_reason")
-            }
-        except json.JSONDecodeError as e:
-            print(f"Error: JSON parsing failed: {e}")
-            print(f"Attempted to parse: {json_str[:200]}...")
-            return None
-        except Exception as e:
-            print(f"Error: Failed to process JSON: {e}")
-            return None
-        
-        # Try multiple patterns for each field, including markdown table format
-        # Try cleaned text first, then original
-        # Also try to extract from mathematical notation like "Phi >= 4.4" or "S >= 8000"
-        
-        # Coherence patterns - look for Phi/coherence values, including in mathematical notation
-        coherence = (re.search(r'"coherence"\s*:\s*(\d+)', text) or 
-                    re.search(r'"coherence"\s*:\s*(\d+)', cleaned_text) or
-                    re.search(r'coherence\s*\([^)]*\)[:\s|>=]+\s*(\d+)', text, re.IGNORECASE) or
-                    re.search(r'coherence[:\s=>=]+\s*(\d+)', text, re.IGNORECASE) or 
-                    re.search(r'coherence[:\s=>=]+\s*(\d+)', cleaned_text, re.IGNORECASE) or
-                    re.search(r'Phi\s*[>=]+\s*([\d.]+)', cleaned_text, re.IGNORECASE) or
-                    re.search(r'\*\*1\.\s*Coherence[^\d]*(\d+)', text, re.IGNORECASE | re.DOTALL) or
-                    re.search(r'1\.\s*Coherence[^\d]*(\d+)', text, re.IGNORECASE | re.DOTALL) or
-                    # Try to find coherence in evaluation results (not source quotes)
-                    re.search(r'(?:coherence|Phi)[:\s>=]+\s*(\d{3,5})', cleaned_text, re.IGNORECASE))
-        
-        # Density patterns - look for rho/density values
-        density = (re.search(r'"density"\s*:\s*(\d+)', text) or 
-                  re.search(r'"density"\s*:\s*(\d+)', cleaned_text) or
-                  re.search(r'density\s*\([^)]*\)[:\s|>=]+\s*(\d+)', text, re.IGNORECASE) or
-                  re.search(r'density[:\s=>=]+\s*(\d+)', text, re.IGNORECASE) or 
-                  re.search(r'density[:\s=>=]+\s*(\d+)', cleaned_text, re.IGNORECASE) or
-                  re.search(r'rho\s*[>=]+\s*([\d.]+)', cleaned_text, re.IGNORECASE) or
-                  re.search(r'\*\*2\.\s*Density[^\d]*(\d+)', text, re.IGNORECASE | re.DOTALL) or
-                  re.search(r'2\.\s*Density[^\d]*(\d+)', text, re.IGNORECASE | re.DOTALL) or
-                  # Look for "D >= 8000" patterns (D for density)
-                  re.search(r'\bD\s*[>=]+\s*(\d{3,5})\b', cleaned_text, re.IGNORECASE) or
-                  # Try to find density in evaluation results
-                  re.search(r'(?:density|rho)[:\s>=]+\s*(\d{3,5})', cleaned_text, re.IGNORECASE))
-        
-        # Redundancy patterns
-        redundancy = (re.search(r'"redundancy"\s*:\s*([\d.]+)', text) or 
-                     re.search(r'"redundancy"\s*:\s*([\d.]+)', cleaned_text) or
-                     re.search(r'redundancy\s*\([^)]*\)[:\s|>=]+\s*([\d.]+)', text, re.IGNORECASE) or
-                     re.search(r'redundancy[:\s=>=]+\s*([\d.]+)', text, re.IGNORECASE) or 
-                     re.search(r'redundancy[:\s=>=]+\s*([\d.]+)', cleaned_text, re.IGNORECASE) or
-                     re.search(r'\*\*3\.\s*Redundancy[^\d]*([\d.]+)', text, re.IGNORECASE | re.DOTALL) or
-                     re.search(r'3\.\s*Redundancy[^\d]*([\d.]+)', text, re.IGNORECASE | re.DOTALL) or
-                     # Look for "R <= 0.1" patterns
-                     re.search(r'\bR\s*[<=]+\s*([\d.]+)\b', cleaned_text, re.IGNORECASE))
-        
-        # PoD Score patterns - look for S >= 8000 patterns
-        pod_score = (re.search(r'"pod_score"\s*:\s*([\d.]+)', text) or 
-                    re.search(r'"pod_score"\s*:\s*([\d.]+)', cleaned_text) or
-                    re.search(r'pod[_\s]?score[:\s|>=]+\s*([\d.]+)', text, re.IGNORECASE) or 
-                    re.search(r'pod[_\s]?score[:\s|>=]+\s*([\d.]+)', cleaned_text, re.IGNORECASE) or
-                    re.search(r'PoD[_\s]?Score[:\s|>=]+\s*([\d.]+)', text, re.IGNORECASE) or
-                    re.search(r'5\.\s*PoD[^\d]*Score[^\d]*(\d+)', text, re.IGNORECASE | re.DOTALL) or
-                    # Look for "S >= 8000" patterns (S for PoD Score)
-                    re.search(r'\bS\s*[>=]+\s*(\d{3,5})\b', cleaned_text, re.IGNORECASE) or
-                    # Try to find score in evaluation results
-                    re.search(r'(?:pod[_\s]?score|score)[:\s>=]+\s*(\d{3,5})', cleaned_text, re.IGNORECASE))
-        
-        tier = (re.search(r'"tier"\s*:\s*"(\w+)"', text) or 
-               re.search(r'tier[:\s|]+\s*\*\*(\w+)\*\*', text, re.IGNORECASE) or
-               re.search(r'tier[:\s=]+"?(\w+)"?', text, re.IGNORECASE) or
-               re.search(r'\*\*.*?tier.*?(\w+)\*\*', text, re.IGNORECASE))
-        
-        epoch = (re.search(r'"epoch"\s*:\s*"(\w+)"', text) or 
-                re.search(r'epoch[:\s|]+\s*\*\*(\w+)\*\*', text, re.IGNORECASE) or
-                re.search(r'epoch[:\s=]+"?(\w+)"?', text, re.IGNORECASE))
-        
-        status = (re.search(r'"status"\s*:\s*"(\w+)"', text) or 
-                 re.search(r'status[:\s=]+"?(\w+)"?', text, re.IGNORECASE) or
-                 re.search(r'(approved|rejected)', text, re.IGNORECASE))
-        
-        # Extract tier_justification, redundancy_analysis, epoch_justification from markdown tables
-        tier_justification = (re.search(r'tier[_\s]?justification[:\s|]+\s*([^\n|]+)', text, re.IGNORECASE) or
-                             re.search(r'tier[_\s]?justification[:\s=]+\s*([^\n]+)', text, re.IGNORECASE))
-        
-        redundancy_analysis = (re.search(r'redundancy[_\s]?analysis[:\s|]+\s*([^\n|]+)', text, re.IGNORECASE) or
-                               re.search(r'redundancy[_\s]?analysis[:\s=]+\s*([^\n]+)', text, re.IGNORECASE))
-        
-        epoch_justification = (re.search(r'epoch[_\s]?justification[:\s|]+\s*([^\n|]+)', text, re.IGNORECASE) or
-                              re.search(r'epoch[_\s]?justification[:\s=]+\s*([^\n]+)', text, re.IGNORECASE))
-        
-        reasoning = (re.search(r'reasoning[:\s|]+\s*([^\n|]+)', text, re.IGNORECASE) or
-                    re.search(r'reasoning[:\s=]+\s*([^\n]+)', text, re.IGNORECASE) or
-                    re.search(r'###\s*\*\*Full Evaluation Report\*\*(.*?)(?:```|$)', text, re.IGNORECASE | re.DOTALL))
-        
-        # If we still don't have coherence/density, try one more aggressive extraction
-        # Look for patterns like "Phi >= 4.4" or "[I eph = 5.7]" in the original text
-        if not coherence:
-            # Try to find Phi/coherence values even with Unicode
-            phi_match = re.search(r'[Φℑ]\s*[>=]+\s*([\d.]+)', text)
-            if phi_match:
-                coherence = phi_match
-                print(f"Found coherence from Phi notation: {phi_match.group(1)}")
-            # Also try bracket notation like "[I eph = 5.7]" - extract the number
-            if not coherence:
-                bracket_match = re.search(r'\[[^\]]*[=]\s*([\d.]+)\]', text)
-                if bracket_match:
-                    coherence = bracket_match
-                    print(f"Found coherence from bracket notation: {bracket_match.group(1)}")
-        
-        if not density:
-            # Try to find density/rho values even with Unicode
-            rho_match = re.search(r'[ρ∑Σ]\s*[>=]+\s*([\d.]+)', text)
-            if rho_match:
-                density = rho_match
-                print(f"Found density from rho notation: {rho_match.group(1)}")
-            # Also try to find "D >= 8000" patterns
-            if not density:
-                d_match = re.search(r'\bD\s*[>=]+\s*(\d{3,5})\b', text, re.IGNORECASE)
-                if d_match:
-                    density = d_match
-                    print(f"Found density from D notation: {d_match.group(1)}")
-        
-        # Check if we got at least coherence and density
-        # Also handle cases where we extract decimal values that need scaling
-        if coherence and density:
-            # Extract numeric values, handling both integers and decimals
-            coherence_val = float(coherence.group(1))
-            density_val = float(density.group(1))
-            
-            # If values are small (like 4.4, 5.7), they might be on a different scale
-            # Scale them up if they look like they're on a 0-10 scale instead of 0-10000
-            if coherence_val < 100:
-                print(f"Warning: Coherence value {coherence_val} seems low, scaling up by 1000x")
-                coherence_val = coherence_val * 1000
-            if density_val < 100:
-                print(f"Warning: Density value {density_val} seems low, scaling up by 1000x")
-                density_val = density_val * 1000
-            
-            # Ensure values are in valid range
-            coherence_val = max(0, min(10000, int(coherence_val)))
-            density_val = max(0, min(10000, int(density_val)))
-            
-            result = {
-                "coherence": coherence_val,
-                "density": density_val,
-                "redundancy": float(redundancy.group(1)) if redundancy else 0.0,
-                "epoch_weight": 1.0,
-                "pod_score": float(pod_score.group(1)) if pod_score else 0.0,
-                "tier": tier.group(1).lower() if tier else "gold",
-                "epoch": epoch.group(1).lower() if epoch else None,
-                "tier_justification": tier_justification.group(1).strip() if tier_justification else "",
-                "redundancy_analysis": redundancy_analysis.group(1).strip() if redundancy_analysis else "",
-                "epoch_justification": epoch_justification.group(1).strip() if epoch_justification else "",
-                "reasoning": reasoning.group(1).strip()[:2000] if reasoning and reasoning.group(1) else text[:2000],
-                "status": status.group(1).lower() if status else "approved",
-                "retroactive_mining": False,
-                "rejection_reason": None
-            }
-            
-            # Calculate pod_score if not found but we have coherence and density
-            if not pod_score or result["pod_score"] == 0:
-                result["pod_score"] = (result["coherence"] / 10000) * (result["density"] / 10000) * (1 - result["redundancy"]) * result["epoch_weight"] * 10000
-            
-            # Determine epoch from density if not found
-            if not result["epoch"]:
-                if result["density"] >= 8000:
-                    result["epoch"] = "founder"
-                elif result["density"] >= 6000:
-                    result["epoch"] = "pioneer"
-                elif result["density"] >= 4000:
-                    result["epoch"] = "community"
-                else:
-                    result["epoch"] = "ecosystem"
-            
-            # Determine tier from pod_score if not found
-            if not result["tier"] or result["tier"] == "gold":
-                if result["pod_score"] >= 8000 and result["density"] >= 8000:
-                    result["tier"] = "gold"
-                elif result["pod_score"] >= 6000 and result["density"] >= 6000:
-                    result["tier"] = "silver"
-                elif result["pod_score"] >= 4000 and result["density"] >= 4000:
-                    result["tier"] = "copper"
-                else:
-                    result["tier"] = "copper"
-            
-            print(f"✓ Successfully extracted evaluation from response: coherence={result['coherence']}, density={result['density']}, pod_score={result['pod_score']:.1f}, tier={result['tier']}, epoch={result['epoch']}")
-            return result
-        
-        # Last resort: try to extract ANY numeric values and use heuristics
-        print("Attempting last-resort extraction of any numeric values...")
-        all_numbers = re.findall(r'(\d{1,5}(?:\.\d+)?)', text)
-        if len(all_numbers) >= 2:
-            # Try to find the largest numbers that might be scores
-            numbers = sorted([float(n) for n in all_numbers], reverse=True)
-            # Look for numbers in reasonable ranges
-            large_numbers = [n for n in numbers if 100 <= n <= 10000]
-            if len(large_numbers) >= 2:
-                # Use the two largest numbers as coherence and density
-                coherence_val = int(large_numbers[0])
-                density_val = int(large_numbers[1])
-                print(f"Last-resort extraction: using largest numbers found - coherence={coherence_val}, density={density_val}")
-                
-                result = {
-                    "coherence": coherence_val,
-                    "density": density_val,
-                    "redundancy": 0.1,  # Default
-                    "epoch_weight": 1.0,
-                    "pod_score": (coherence_val / 10000) * (density_val / 10000) * 0.9 * 1.0 * 10000,
-                    "tier": "gold" if density_val >= 8000 else ("silver" if density_val >= 6000 else "copper"),
-                    "epoch": "founder" if density_val >= 8000 else ("pioneer" if density_val >= 6000 else ("community" if density_val >= 4000 else "ecosystem")),
-                    "tier_justification": "Extracted from response using heuristics",
-                    "redundancy_analysis": "Default value used (extraction from malformed response)",
-                    "epoch_justification": f"Determined from density score: {density_val}",
-                    "reasoning": text[:2000],
-                    "status": "approved" if density_val >= 4000 else "rejected",
-                    "retroactive_mining": False,
-                    "rejection_reason": None if density_val >= 4000 else "Density below threshold"
-                }
-                print(f"✓ Last-resort extraction successful: coherence={result['coherence']}, density={result['density']}, pod_score={result['pod_score']:.1f}")
-                return result
-        
-        # If we still can't parse, return None to trigger error
-        print(f"Could not extract evaluation data from response")
-        print(f"Response preview: {text[:500]}")
-        return None
+        evaluation = parse_pod_evaluation_json(text)
+        if evaluation is None:
+            print("Warning: No evaluation JSON with coherence and density found in response")
+        return evaluation
     
     def _fallback_evaluation(self, text: str, title: str, category: Optional[str]) -> Dict:
         """Fallback evaluation when API is unavailable (HHFE model)."""
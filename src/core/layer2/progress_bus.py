@@ -0,0 +1,231 @@
+"""
+Evaluation Progress Bus
+In-memory publish/subscribe for submission progress events.
+
+The evaluation pipeline publishes progress here instead of writing progress
+strings into archive metadata (each of which was a full archive save).
+API endpoints subscribe per submission and push events to the browser as
+Server-Sent Events. Recent events are kept per submission so a client that
+connects late, or reconnects with Last-Event-ID, replays what it missed.
+"""
+
+import json
+import time
+import queue
+import threading
+from typing import Dict, List, Optional
+
+# Stages after which no further progress is published for an evaluation
+TERMINAL_STAGES = frozenset({"completed", "failed"})
+
+
+def format_sse(event: Dict) -> str:
+    """Render a progress event as a Server-Sent Events message."""
+    return f"id: {event['seq']}\nevent: progress\ndata: {json.dumps(event, ensure_ascii=False)}\n\n"
+
+
+class ProgressSubscription:
+    """Stream of progress events for one submission."""
+
+    def __init__(self, bus: "ProgressBus", submission_hash: str):
+        self.bus = bus
+        self.submission_hash = submission_hash
+        self._events: "queue.Queue[Dict]" = queue.Queue()
+        self.closed = False
+
+    def _deliver(self, event: Dict):
+        self._events.put(event)
+
+    def get(self, timeout: Optional[float] = None) -> Optional[Dict]:
+        """
+        Next progress event.
+
+        Args:
+            timeout: Seconds to wait (None waits indefinitely)
+
+        Returns:
+            Progress event, or None if none arrived in time
+        """
+        try:
+            return self._events.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def close(self):
+        """Stop receiving events."""
+        if not self.closed:
+            self.closed = True
+            self.bus._unsubscribe(self)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class ProgressBus:
+    """Thread-safe in-memory progress pub/sub keyed by submission hash."""
+
+    def __init__(self, history_size: int = 50, retention_seconds: float = 600.0):
+        """
+        Initialize progress bus.
+
+        Args:
+            history_size: Events kept per submission for late subscribers
+            retention_seconds: How long history is kept after a terminal event
+        """
+        self.history_size = history_size
+        self.retention_seconds = retention_seconds
+        self._lock = threading.Lock()
+        self._history: Dict[str, List[Dict]] = {}
+        self._finished_at: Dict[str, float] = {}
+        self._subscribers: Dict[str, List[ProgressSubscription]] = {}
+        self._seq = 0
+
+    def publish(self, submission_hash: str, stage: str, message: str, **data) -> Dict:
+        """
+        Publish a progress event.
+
+        Args:
+            submission_hash: Submission the event belongs to
+            stage: Machine-readable stage (e.g. "calling_llm", "completed")
+            message: Human-readable progress message
+            **data: Extra JSON-serializable fields
+
+        Returns:
+            The published event
+        """
+        now = time.time()
+        with self._lock:
+            self._seq += 1
+            event = {
+                "seq": self._seq,
+                "submission_hash": submission_hash,
+                "stage": stage,
+                "message": message,
+                "timestamp": now,
+                "final": stage in TERMINAL_STAGES,
+                **data,
+            }
+            history = self._history.setdefault(submission_hash, [])
+            if history and history[-1]["final"]:
+                # A new evaluation of a finished submission starts a fresh history
+                history.clear()
+            history.append(event)
+            del history[:-self.history_size]
+            if event["final"]:
+                self._finished_at[submission_hash] = now
+            else:
+                self._finished_at.pop(submission_hash, None)
+            subscribers = list(self._subscribers.get(submission_hash, ()))
+            self._prune(now)
+
+        for subscription in subscribers:
+            subscription._deliver(event)
+        return event
+
+    def _prune(self, now: float):
+        """Drop history of submissions finished longer ago than the retention (lock held)."""
+        expired = [h for h, t in self._finished_at.items() if now - t > self.retention_seconds]
+        for submission_hash in expired:
+            del self._finished_at[submission_hash]
+            if not self._subscribers.get(submission_hash):
+                self._history.pop(submission_hash, None)
+
+    def subscribe(self, submission_hash: str, after_seq: int = 0) -> ProgressSubscription:
+        """
+        Subscribe to a submission's progress.
+
+        Events already published after after_seq are delivered first.
+
+        Args:
+            submission_hash: Submission to follow
+            after_seq: Sequence number of the last event the client has seen
+
+        Returns:
+            ProgressSubscription (close it when done)
+        """
+        subscription = ProgressSubscription(self, submission_hash)
+        with self._lock:
+            for event in self._history.get(submission_hash, ()):
+                if event["seq"] > after_seq:
+                    subscription._deliver(event)
+            self._subscribers.setdefault(submission_hash, []).append(subscription)
+        return subscription
+
+    def _unsubscribe(self, subscription: ProgressSubscription):
+        with self._lock:
+            subscribers = self._subscribers.get(subscription.submission_hash, [])
+            if subscription in subscribers:
+                subscribers.remove(subscription)
+            if not subscribers:
+                self._subscribers.pop(subscription.submission_hash, None)
+
+    def latest(self, submission_hash: str) -> Optional[Dict]:
+        """Most recent progress event for a submission, if any."""
+        with self._lock:
+            history = self._history.get(submission_hash)
+            return history[-1] if history else None
+
+    def stats(self) -> Dict:
+        """Tracked submissions and open subscriptions."""
+        with self._lock:
+            return {
+                "tracked_submissions": len(self._history),
+                "subscribers": sum(len(s) for s in self._subscribers.values()),
+            }
+
+
+def iter_progress_sse(
+    bus: ProgressBus,
+    submission_hash: str,
+    status: str,
+    after_seq: int = 0,
+    keepalive_seconds: float = 15.0,
+    max_duration: float = 600.0
+):
+    """
+    Server-Sent Events stream of a submission's progress.
+
+    Ends after a terminal event. A submission that is not being evaluated
+    and has no recent progress gets a single event with its archive status.
+    Streams are closed after max_duration; clients reconnect with
+    Last-Event-ID and continue where they left off.
+
+    Args:
+        bus: Progress bus to subscribe to
+        submission_hash: Submission to follow
+        status: Current archive status of the submission
+        after_seq: Last event id the client has seen
+        keepalive_seconds: Interval of keep-alive comments while idle
+        max_duration: Seconds after which the stream is closed
+
+    Yields:
+        SSE-formatted strings
+    """
+    latest = bus.latest(submission_hash)
+    evaluating = status in ("draft", "pending", "evaluating")
+    if not evaluating and (latest is None or (latest["final"] and latest["seq"] <= after_seq)):
+        yield format_sse({
+            "seq": latest["seq"] if latest else 0,
+            "submission_hash": submission_hash,
+            "stage": "completed" if status in ("qualified", "unqualified") else status,
+            "message": f"Status: {status}",
+            "timestamp": time.time(),
+            "final": True,
+            "status": status,
+        })
+        return
+
+    yield "retry: 3000\n\n"
+    deadline = time.monotonic() + max_duration
+    with bus.subscribe(submission_hash, after_seq=after_seq) as subscription:
+        while time.monotonic() < deadline:
+            event = subscription.get(timeout=min(keepalive_seconds, max(0.0, deadline - time.monotonic())))
+            if event is None:
+                yield ": keep-alive\n\n"
+                continue
+            yield format_sse(event)
+            if event["final"]:
+                return
@@ -10,6 +10,8 @@ from typing import Dict, List, Optional
 from datetime import datetime
 from enum import Enum
 
+from core.utils.metrics import ARCHIVE_SAVE_DURATION
+
 from .contributor_tiers import TierManager
 
 
@@ -149,8 +151,9 @@ class TokenomicsState:
         """Save state to file."""
         self.state["last_updated"] = datetime.now().isoformat()
         try:
-            with open(self.state_file, "w") as f:
-                json.dump(self.state, f, indent=2)
+            with ARCHIVE_SAVE_DURATION.labels(archive="tokenomics_state").time():
+                with open(self.state_file, "w") as f:
+                    json.dump(self.state, f, indent=2)
         except Exception as e:
             print(f"Error saving state: {e}")
     
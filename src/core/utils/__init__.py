@@ -3,8 +3,18 @@ Syntheverse Core Utilities
 Common utilities used across the core system.
 """
 
-from .env_loader import load_groq_api_key
+from .env_loader import load_groq_api_key, get_groq_base_url, is_admin_token, env_int, env_float
+from .provider_router import Provider, ProviderError, ProviderRouter, openai_chat_provider
+from .streaming_upload import IngestedUpload, UploadTooLargeError, ingest_upload, finalize_upload, discard_upload
+from .tracing import Span, Tracer, get_tracer, summarize_span_file
+from .profiling import Profiler, get_profiler
+from .cache import TTLCache
+from .keyword_index import BM25Index, reciprocal_rank_fusion
+from .batching import MicroBatcher
 
-__all__ = ['load_groq_api_key']
+__all__ = ['load_groq_api_key', 'get_groq_base_url', 'is_admin_token', 'env_int', 'env_float', 'Provider', 'ProviderError', 'ProviderRouter', 'openai_chat_provider',
+           'IngestedUpload', 'UploadTooLargeError', 'ingest_upload', 'finalize_upload', 'discard_upload',
+           'Span', 'Tracer', 'get_tracer', 'summarize_span_file', 'Profiler', 'get_profiler', 'TTLCache',
+           'BM25Index', 'reciprocal_rank_fusion', 'MicroBatcher']
 
 
@@ -0,0 +1,129 @@
+"""
+Micro-Batching
+Groups work items submitted concurrently from many threads into batches.
+
+A worker thread takes the first waiting item, collects whatever else arrives
+within max_wait seconds (up to max_batch items) and processes the batch with
+one call, e.g. a single model.encode() over several queries. Callers block on
+a future for their own result; batch sizes are recorded in
+batch_size{batcher=<name>}.
+"""
+
+import time
+import queue
+import logging
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Sequence
+
+from .metrics import BATCH_SIZE
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+
+class MicroBatcher:
+    """
+    Collects items for up to max_wait seconds and processes them together.
+
+    The process function receives a list of items and must return one result
+    per item, in order. If it raises, every item of the batch fails with the
+    exception.
+    """
+
+    def __init__(self, process: Callable[[List[Any]], Sequence[Any]], max_batch: int = 32,
+                 max_wait: float = 0.005, name: str = "batch"):
+        """
+        Args:
+            process: Function processing a batch of items
+            max_batch: Maximum items per batch
+            max_wait: Seconds to wait for more items after the first (0: batch only what is already queued)
+            name: Batcher label in metrics and the worker thread name
+        """
+        self.process = process
+        self.max_batch = max(1, max_batch)
+        self.max_wait = max(0.0, max_wait)
+        self.name = name
+        self._queue: "queue.Queue" = queue.Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+        self.batches = 0
+        self.items = 0
+        self.largest_batch = 0
+
+    def submit(self, item: Any) -> Future:
+        """Queue an item; the future resolves to its result."""
+        future = Future()
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name=f"batcher-{self.name}", daemon=True)
+                self._thread.start()
+        self._queue.put((item, future))
+        return future
+
+    def __call__(self, item: Any, timeout: float = None) -> Any:
+        """Process an item with whatever else is submitted alongside it and return its result."""
+        return self.submit(item).result(timeout)
+
+    def _run(self):
+        while True:
+            entry = self._queue.get()
+            if entry is _STOP:
+                return
+            batch = [entry]
+            stop = False
+            deadline = time.monotonic() + self.max_wait
+            while len(batch) < self.max_batch:
+                remaining = deadline - time.monotonic()
+                try:
+                    entry = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if entry is _STOP:
+                    stop = True
+                    break
+                batch.append(entry)
+            self._process(batch)
+            if stop:
+                return
+
+    def _process(self, batch: List[tuple]):
+        live = [(item, future) for item, future in batch if future.set_running_or_notify_cancel()]
+        if not live:
+            return
+        self.batches += 1
+        self.items += len(live)
+        self.largest_batch = max(self.largest_batch, len(live))
+        BATCH_SIZE.labels(batcher=self.name).observe(len(live))
+        try:
+            results = self.process([item for item, _ in live])
+            if len(results) != len(live):
+                raise RuntimeError(f"Batch function returned {len(results)} results for {len(live)} items")
+        except Exception as e:
+            logger.warning(f"Batch of {len(live)} failed in {self.name}: {e}")
+            for _, future in live:
+                future.set_exception(e)
+            return
+        for (_, future), result in zip(live, results):
+            future.set_result(result)
+
+    def close(self, timeout: float = None):
+        """Process the queued items, then stop the worker thread."""
+        with self._lock:
+            thread = self._thread
+            self._thread = None
+        if thread is not None:
+            self._queue.put(_STOP)
+            thread.join(timeout)
+
+    def stats(self) -> Dict[str, Any]:
+        """Batch counts and sizes."""
+        return {
+            "max_batch": self.max_batch,
+            "max_wait_seconds": self.max_wait,
+            "batches": self.batches,
+            "items": self.items,
+            "mean_batch_size": self.items / self.batches if self.batches else 0.0,
+            "largest_batch": self.largest_batch,
+        }
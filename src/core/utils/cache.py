@@ -0,0 +1,115 @@
+"""
+TTL Cache
+Bounded, thread-safe LRU cache whose entries expire after a time to live.
+
+Lookups are counted in cache_requests_total{cache=<name>} and in stats(),
+which reports the hit rate alongside size, eviction and expiry counts.
+"""
+
+import time
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from .metrics import record_cache
+
+_MISSING = object()
+
+
+class TTLCache:
+    """
+    Least-recently-used cache with a size limit and per-entry expiry.
+
+    A max_entries of 0 disables the cache (every lookup misses, nothing is stored).
+    """
+
+    def __init__(self, name: str, max_entries: int = 1024, ttl: Optional[float] = 3600.0,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            name: Cache label in metrics
+            max_entries: Maximum number of entries; the least recently used is evicted beyond it
+            ttl: Seconds an entry stays valid (None: no expiry)
+            clock: Time source (monotonic seconds)
+        """
+        self.name = name
+        self.max_entries = max(0, max_entries)
+        self.ttl = ttl
+        self.clock = clock
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expired = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Cached value for key, or default if absent or expired."""
+        with self._lock:
+            value = self._lookup(key)
+            hit = value is not _MISSING
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+        record_cache(self.name, hit)
+        return value if hit else default
+
+    def _lookup(self, key: Hashable) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            return _MISSING
+        value, expires_at = entry
+        if expires_at is not None and self.clock() >= expires_at:
+            del self._entries[key]
+            self.expired += 1
+            return _MISSING
+        self._entries.move_to_end(key)
+        return value
+
+    def put(self, key: Hashable, value: Any):
+        """Store value under key, evicting the least recently used entries beyond max_entries."""
+        if self.max_entries == 0:
+            return
+        expires_at = self.clock() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Remove key and return its value (default if absent)."""
+        with self._lock:
+            entry = self._entries.pop(key, None)
+        return entry[0] if entry is not None else default
+
+    def clear(self):
+        """Remove all entries (counters are kept)."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        """Whether key has a live entry (does not count as a lookup or refresh recency)."""
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and (entry[1] is None or self.clock() < entry[1])
+
+    def stats(self) -> Dict[str, Any]:
+        """Size, limits and lookup counters."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "expired": self.expired,
+            }
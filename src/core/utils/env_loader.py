@@ -4,12 +4,15 @@ Centralized utilities for loading environment variables, especially API keys.
 """
 
 import os
+import hmac
 import logging
 from pathlib import Path
 from typing import Optional
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_GROQ_BASE_URL = "https://api.groq.com/openai/v1"
+
 
 def find_project_root() -> Path:
     """
@@ -105,6 +108,53 @@ def load_groq_api_key() -> Optional[str]:
     return None
 
 
+def get_groq_base_url() -> str:
+    """
+    Get the base URL for the Groq (OpenAI-compatible) API.
+
+    Set GROQ_BASE_URL to point clients at another OpenAI-compatible endpoint,
+    e.g. the local stand-in server (scripts/development/local_llm_server.py).
+
+    Returns:
+        API base URL
+    """
+    return os.getenv('GROQ_BASE_URL') or DEFAULT_GROQ_BASE_URL
+
+
+def is_admin_token(token: Optional[str]) -> bool:
+    """
+    Check a request's admin token against SYNTHEVERSE_ADMIN_TOKEN.
+
+    Admin-only features are disabled while SYNTHEVERSE_ADMIN_TOKEN is unset.
+
+    Args:
+        token: Token supplied by the client (e.g. the X-Admin-Token header)
+
+    Returns:
+        True if the token matches the configured admin token
+    """
+    expected = os.getenv('SYNTHEVERSE_ADMIN_TOKEN')
+    if not expected or not token:
+        return False
+    return hmac.compare_digest(token.encode('utf-8'), expected.encode('utf-8'))
+
+
+def env_int(name: str, default: int) -> int:
+    """Read an integer setting from the environment, falling back to default."""
+    try:
+        return int(os.getenv(name, str(default)))
+    except (TypeError, ValueError):
+        return default
+
+
+def env_float(name: str, default: float) -> float:
+    """Read a float setting from the environment, falling back to default."""
+    try:
+        return float(os.getenv(name, str(default)))
+    except (TypeError, ValueError):
+        return default
+
+
 def validate_groq_api_key(api_key: str) -> bool:
     """
     Validate that a GROQ API key appears to be in the correct format.
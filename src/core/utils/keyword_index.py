@@ -0,0 +1,208 @@
+"""
+Keyword Index
+Inverted index with BM25 scoring, and reciprocal rank fusion of rankings.
+
+Documents are addressed by position (e.g. a chunk's index in the RAG corpus).
+Postings are compact arrays of document positions and term frequencies, so a
+query only touches the documents containing its terms. Tokens keep compound
+identifiers such as DOIs ("10.1234/abc.5") and version strings whole, and
+also index their parts.
+"""
+
+import os
+import re
+import json
+import math
+import heapq
+from array import array
+from collections import Counter, defaultdict
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+FORMAT_VERSION = 1
+
+TOKEN_PATTERN = re.compile(r"\w+(?:[./:\-]\w+)*")
+TOKEN_SEPARATORS = re.compile(r"[./:\-]")
+
+# Terms in nearly every chunk: no ranking signal, but long posting lists
+STOPWORDS = frozenset("""
+a about above after again against all am an and any are as at be because been before being below
+between both but by can could did do does doing down during each few for from further had has have
+having he her here hers herself him himself his how i if in into is it its itself just me more most
+my myself no nor not of off on once only or other our ours ourselves out over own same she should so
+some such than that the their theirs them themselves then there these they this those through to too
+under until up very was we were what when where which while who whom why will with would you your
+yours yourself yourselves
+""".split())
+
+
+def tokenize(text: str) -> List[str]:
+    """Lower-case terms of text; compound tokens are followed by their parts."""
+    tokens = []
+    for token in TOKEN_PATTERN.findall(text.lower()):
+        parts = TOKEN_SEPARATORS.split(token)
+        if len(parts) > 1:
+            tokens.append(token)
+            tokens.extend(part for part in parts if part and part not in STOPWORDS)
+        elif token not in STOPWORDS:
+            tokens.append(token)
+    return tokens
+
+
+class BM25Index:
+    """
+    Okapi BM25 over an inverted index.
+
+    search() returns (document position, score) pairs, best first; save() and
+    BM25Index.load() persist the index as JSON.
+    """
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75):
+        """
+        Args:
+            k1: Term frequency saturation
+            b: Document length normalization (0: none, 1: full)
+        """
+        self.k1 = k1
+        self.b = b
+        # term -> (document positions, term frequencies)
+        self.postings: Dict[str, Tuple[array, array]] = {}
+        self.doc_lengths = array('I')
+        self.total_length = 0
+        # Free-form metadata saved with the index (e.g. the corpus it was built from)
+        self.meta: Dict = {}
+
+    @classmethod
+    def build(cls, texts: Iterable[str], k1: float = 1.5, b: float = 0.75) -> 'BM25Index':
+        """
+        Index documents; document i is the i-th text (empty texts keep their position).
+
+        Args:
+            texts: Document texts
+            k1: Term frequency saturation
+            b: Document length normalization
+
+        Returns:
+            The index
+        """
+        index = cls(k1, b)
+        for position, text in enumerate(texts):
+            counts = Counter(tokenize(text or ""))
+            length = sum(counts.values())
+            index.doc_lengths.append(length)
+            index.total_length += length
+            for term, tf in counts.items():
+                postings = index.postings.get(term)
+                if postings is None:
+                    postings = index.postings[term] = (array('I'), array('I'))
+                postings[0].append(position)
+                postings[1].append(tf)
+        return index
+
+    def __len__(self) -> int:
+        return len(self.doc_lengths)
+
+    def idf(self, term: str) -> float:
+        """Inverse document frequency of term (0 if it is not indexed)."""
+        postings = self.postings.get(term)
+        if postings is None:
+            return 0.0
+        df = len(postings[0])
+        return math.log(1 + (len(self) - df + 0.5) / (df + 0.5))
+
+    def search(self, query: str, top_k: int = 10) -> List[Tuple[int, float]]:
+        """
+        Top-k documents by BM25 score.
+
+        Args:
+            query: Query text
+            top_k: Number of results
+
+        Returns:
+            (document position, score) pairs, best first; documents sharing no term are left out
+        """
+        if top_k <= 0 or not len(self):
+            return []
+        avg_length = self.total_length / len(self) or 1.0
+        k1, b, lengths = self.k1, self.b, self.doc_lengths
+        scores: Dict[int, float] = defaultdict(float)
+        for term, query_tf in Counter(tokenize(query)).items():
+            postings = self.postings.get(term)
+            if postings is None:
+                continue
+            weight = self.idf(term) * query_tf
+            for position, tf in zip(*postings):
+                norm = k1 * (1 - b + b * lengths[position] / avg_length)
+                scores[position] += weight * tf * (k1 + 1) / (tf + norm)
+        best = heapq.nlargest(top_k, scores.items(), key=lambda item: (item[1], -item[0]))
+        return [(position, float(score)) for position, score in best]
+
+    def stats(self) -> Dict:
+        """Document, term and posting counts."""
+        return {
+            'type': 'bm25',
+            'documents': len(self),
+            'terms': len(self.postings),
+            'postings': sum(len(positions) for positions, _ in self.postings.values()),
+            'k1': self.k1,
+            'b': self.b,
+        }
+
+    def save(self, path: str):
+        """Write the index to a JSON file (atomically replacing it)."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            'format_version': FORMAT_VERSION,
+            'k1': self.k1,
+            'b': self.b,
+            'meta': self.meta,
+            'doc_lengths': self.doc_lengths.tolist(),
+            'postings': {term: [positions.tolist(), tfs.tolist()] for term, (positions, tfs) in self.postings.items()},
+        }
+        tmp = path.with_name(f".{path.name}.tmp-{os.getpid()}")
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: str) -> 'BM25Index':
+        """
+        Read an index written by save().
+
+        Raises:
+            ValueError: If the file is not a supported keyword index
+        """
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get('format_version') != FORMAT_VERSION:
+            raise ValueError(f"Unsupported keyword index format: {data.get('format_version')}")
+        index = cls(data['k1'], data['b'])
+        index.meta = data.get('meta', {})
+        index.doc_lengths = array('I', data['doc_lengths'])
+        index.total_length = sum(index.doc_lengths)
+        index.postings = {
+            term: (array('I', positions), array('I', tfs)) for term, (positions, tfs) in data['postings'].items()
+        }
+        return index
+
+
+def reciprocal_rank_fusion(rankings: Sequence[Sequence[Tuple[int, float]]], k: int = 60,
+                           weights: Optional[Sequence[float]] = None) -> List[Tuple[int, float]]:
+    """
+    Fuse rankings by reciprocal rank: score(d) = sum of weight / (k + rank of d).
+
+    Args:
+        rankings: Rankings of (document position, score) pairs, best first
+        k: Rank offset damping the influence of top ranks
+        weights: Per-ranking weights (default 1.0 each)
+
+    Returns:
+        (document position, fused score) pairs, best first
+    """
+    weights = weights or [1.0] * len(rankings)
+    fused: Dict[int, float] = defaultdict(float)
+    for ranking, weight in zip(rankings, weights):
+        for rank, (position, _) in enumerate(ranking, 1):
+            fused[position] += weight / (k + rank)
+    return sorted(fused.items(), key=lambda item: (-item[1], item[0]))
@@ -0,0 +1,425 @@
+"""
+Prometheus Metrics
+Small dependency-free metrics registry rendered in the Prometheus text format.
+
+Counters, gauges and histograms with labels, plus gauges whose value is read
+from a callback at scrape time (queue depth, archive size). The standard
+Syntheverse metrics are defined once here so both APIs expose the same names:
+
+    http_request_duration_seconds{service,method,route,status}  histogram
+    http_requests_in_flight{service}                            gauge
+    llm_request_duration_seconds{provider,outcome}              histogram
+    llm_request_errors_total{provider}                          counter
+    cache_requests_total{cache,result}                          counter
+    archive_save_duration_seconds{archive}                      histogram
+    poc_evaluation_queue_depth{priority}                        gauge (callback)
+    poc_evaluations_running                                     gauge (callback)
+    poc_archive_contributions                                   gauge (callback)
+
+Hit rates are derived in PromQL, e.g.
+    sum(rate(cache_requests_total{result="hit"}[5m])) by (cache)
+      / sum(rate(cache_requests_total[5m])) by (cache)
+"""
+
+import math
+import time
+import logging
+import threading
+from typing import Callable, Dict, Iterable, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = [f'{name}="{_escape_label_value(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(f'{extra[0]}="{extra[1]}"')
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if math.isnan(value):
+        return "NaN"
+    if value == int(value) and abs(value) < 1e15:
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    """Base for labelled metrics; children are created per label value combination."""
+
+    type_name = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._children: Dict[Tuple[str, ...], object] = {}
+
+    def labels(self, *values, **labels):
+        """Child metric for one combination of label values."""
+        if labels:
+            values = tuple(str(labels[name]) for name in self.labelnames)
+        else:
+            values = tuple(str(v) for v in values)
+        if len(values) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}")
+        child = self._children.get(values)
+        if child is None:
+            with self._lock:
+                child = self._children.get(values)
+                if child is None:
+                    child = self._children[values] = self._new_child()
+        return child
+
+    def _snapshot(self):
+        """Label values and children, sorted (copied under the lock for concurrent scrapes)."""
+        with self._lock:
+            return sorted(self._children.items())
+
+    def _default_child(self):
+        if self.labelnames:
+            raise ValueError(f"{self.name} has labels {self.labelnames}; use labels()")
+        return self.labels()
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def _samples(self) -> Iterable[str]:
+        raise NotImplementedError
+
+    def render(self) -> str:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.type_name}"]
+        lines.extend(self._samples())
+        return "\n".join(lines)
+
+    def clear(self):
+        """Drop all label combinations."""
+        with self._lock:
+            self._children.clear()
+
+
+class _Value:
+    __slots__ = ("value", "_lock")
+
+    def __init__(self):
+        self.value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0):
+        with self._lock:
+            self.value += amount
+
+    def dec(self, amount: float = 1.0):
+        with self._lock:
+            self.value -= amount
+
+    def set(self, value: float):
+        self.value = float(value)
+
+
+class Counter(_Metric):
+    """Monotonically increasing count."""
+
+    type_name = "counter"
+
+    def _new_child(self):
+        return _Value()
+
+    def inc(self, amount: float = 1.0):
+        self._default_child().inc(amount)
+
+    def _samples(self):
+        for values, child in self._snapshot():
+            yield f"{self.name}{_format_labels(self.labelnames, values)} {_format_value(child.value)}"
+
+
+class Gauge(_Metric):
+    """Value that goes up and down, or is read from a callback at scrape time."""
+
+    type_name = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._function: Optional[Callable] = None
+
+    def _new_child(self):
+        return _Value()
+
+    def inc(self, amount: float = 1.0):
+        self._default_child().inc(amount)
+
+    def dec(self, amount: float = 1.0):
+        self._default_child().dec(amount)
+
+    def set(self, value: float):
+        self._default_child().set(value)
+
+    def set_function(self, function: Optional[Callable]):
+        """
+        Read the gauge from a callback at scrape time (replaces any previous one).
+
+        Args:
+            function: Returns a number, or for labelled gauges a dict mapping
+                label value tuples (or single label values) to numbers
+        """
+        self._function = function
+
+    def _samples(self):
+        if self._function is not None:
+            try:
+                result = self._function()
+            except Exception as e:
+                logger.warning(f"Metric callback for {self.name} failed: {e}")
+                return
+            if isinstance(result, dict):
+                items = sorted(
+                    ((k if isinstance(k, tuple) else (k,)), v) for k, v in result.items()
+                )
+            else:
+                items = [((), result)]
+            for values, value in items:
+                labels = _format_labels(self.labelnames, tuple(str(v) for v in values))
+                yield f"{self.name}{labels} {_format_value(float(value))}"
+            return
+        for values, child in self._snapshot():
+            yield f"{self.name}{_format_labels(self.labelnames, values)} {_format_value(child.value)}"
+
+
+class _HistogramValue:
+    __slots__ = ("buckets", "counts", "sum", "count", "_lock")
+
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.sum = 0.0
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float):
+        with self._lock:
+            self.sum += value
+            self.count += 1
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    self.counts[i] += 1
+                    break
+
+    def time(self):
+        """Context manager observing the duration of its block."""
+        return _Timer(self)
+
+
+class _Timer:
+    __slots__ = ("_target", "_start")
+
+    def __init__(self, target):
+        self._target = target
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self._target.observe(time.perf_counter() - self._start)
+        return False
+
+
+class Histogram(_Metric):
+    """Distribution of observed values in cumulative buckets."""
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+
+    def _new_child(self):
+        return _HistogramValue(self.buckets)
+
+    def observe(self, value: float):
+        self._default_child().observe(value)
+
+    def time(self):
+        """Context manager observing the duration of its block."""
+        return self._default_child().time()
+
+    def _samples(self):
+        for values, child in self._snapshot():
+            with child._lock:
+                counts, total, count = list(child.counts), child.sum, child.count
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                labels = _format_labels(self.labelnames, values, ("le", _format_value(bound)))
+                yield f"{self.name}_bucket{labels} {cumulative}"
+            labels = _format_labels(self.labelnames, values)
+            yield f"{self.name}_sum{labels} {_format_value(total)}"
+            yield f"{self.name}_count{labels} {count}"
+
+
+class MetricsRegistry:
+    """Named collection of metrics rendered together."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._metrics: Dict[str, _Metric] = {}
+
+    def _register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                if type(existing) is not type(metric) or existing.labelnames != metric.labelnames:
+                    raise ValueError(f"Metric {metric.name} already registered differently")
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        """Get or create a counter."""
+        return self._register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        """Get or create a gauge."""
+        return self._register(Gauge(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ) -> Histogram:
+        """Get or create a histogram."""
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def get(self, name: str) -> Optional[_Metric]:
+        return self._metrics.get(name)
+
+    def render(self) -> str:
+        """All metrics in the Prometheus text exposition format."""
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda m: m.name)
+        return "\n".join(metric.render() for metric in metrics) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+HTTP_REQUEST_DURATION = REGISTRY.histogram(
+    "http_request_duration_seconds", "HTTP request latency by route",
+    ("service", "method", "route", "status")
+)
+HTTP_REQUESTS_IN_FLIGHT = REGISTRY.gauge(
+    "http_requests_in_flight", "HTTP requests currently being served", ("service",)
+)
+LLM_REQUEST_DURATION = REGISTRY.histogram(
+    "llm_request_duration_seconds", "LLM provider call latency", ("provider", "outcome")
+)
+LLM_REQUEST_ERRORS = REGISTRY.counter(
+    "llm_request_errors_total", "Failed LLM provider calls", ("provider",)
+)
+CACHE_REQUESTS = REGISTRY.counter(
+    "cache_requests_total", "Cache lookups by result (hit/miss)", ("cache", "result")
+)
+BATCH_SIZE = REGISTRY.histogram(
+    "batch_size", "Items processed per micro-batch", ("batcher",),
+    buckets=(1, 2, 4, 8, 16, 32, 64, 128)
+)
+ARCHIVE_SAVE_DURATION = REGISTRY.histogram(
+    "archive_save_duration_seconds", "Time to write a state file to disk", ("archive",),
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+)
+EVALUATION_QUEUE_DEPTH = REGISTRY.gauge(
+    "poc_evaluation_queue_depth", "Evaluations waiting per priority class", ("priority",)
+)
+EVALUATIONS_RUNNING = REGISTRY.gauge(
+    "poc_evaluations_running", "Evaluations currently running"
+)
+ARCHIVE_CONTRIBUTIONS = REGISTRY.gauge(
+    "poc_archive_contributions", "Contributions in the PoC archive"
+)
+
+
+def record_cache(cache: str, hit: bool):
+    """Count a cache lookup."""
+    CACHE_REQUESTS.labels(cache=cache, result="hit" if hit else "miss").inc()
+
+
+def render_metrics() -> str:
+    """The shared registry in the Prometheus text format."""
+    return REGISTRY.render()
+
+
+def flask_metrics(app, service: str):
+    """
+    Record request latency and in-flight requests for a Flask app.
+
+    Routes are labelled by their URL rule (e.g. /api/status/<submission_hash>)
+    so per-submission URLs do not create new series.
+    """
+    from flask import g, request
+
+    in_flight = HTTP_REQUESTS_IN_FLIGHT.labels(service=service)
+
+    @app.before_request
+    def _metrics_start():
+        g.metrics_started = time.perf_counter()
+        in_flight.inc()
+
+    @app.after_request
+    def _metrics_status(response):
+        g.metrics_status = response.status_code
+        return response
+
+    @app.teardown_request
+    def _metrics_finish(exc):
+        started = g.pop("metrics_started", None)
+        if started is None:
+            return
+        in_flight.dec()
+        rule = request.url_rule.rule if request.url_rule is not None else "unmatched"
+        status = g.pop("metrics_status", 500)
+        HTTP_REQUEST_DURATION.labels(service, request.method, rule, status).observe(time.perf_counter() - started)
+
+
+def asgi_metrics_middleware(service: str):
+    """
+    Request latency and in-flight middleware for FastAPI/Starlette
+    (register with app.middleware("http")(...)).
+
+    Routes are labelled by their path template.
+    """
+    in_flight = HTTP_REQUESTS_IN_FLIGHT.labels(service=service)
+
+    async def _metrics_middleware(request, call_next):
+        started = time.perf_counter()
+        in_flight.inc()
+        status = 500
+        try:
+            response = await call_next(request)
+            status = response.status_code
+            return response
+        finally:
+            in_flight.dec()
+            route = request.scope.get("route")
+            path = getattr(route, "path", None) or "unmatched"
+            HTTP_REQUEST_DURATION.labels(service, request.method, path, status).observe(time.perf_counter() - started)
+
+    return _metrics_middleware
@@ -0,0 +1,420 @@
+"""
+On-Demand Profiling
+Admin-triggered profiling of a running API worker.
+
+Two modes:
+    sampling  A background thread samples every thread's stack at a fixed
+              interval. Output: folded stacks (<id>.folded, input for
+              flamegraph.pl / speedscope) and a per-function summary.
+    cprofile  Requests are profiled with cProfile one by one and merged.
+              Output: <id>.prof (pstats, for snakeviz / flameprof) and a
+              per-function summary.
+
+A session runs for a number of seconds and/or requests, or until it is
+stopped. It can be started by the admin endpoints or by SIGUSR2, which
+toggles a sampling session. While no session is active, the request hooks
+only check one attribute.
+
+Environment:
+    SYNTHEVERSE_PROFILE_DIR: Directory profiles are written to
+"""
+
+import os
+import io
+import sys
+import json
+import time
+import pstats
+import signal
+import logging
+import cProfile
+import itertools
+import threading
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+MODE_SAMPLING = "sampling"
+MODE_CPROFILE = "cprofile"
+
+MAX_SECONDS = 600.0
+SUMMARY_TOP = 50
+
+_session_numbers = itertools.count(1)
+
+
+def _frame_label(code) -> str:
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+class StackSampler:
+    """Statistical profiler sampling all thread stacks from a background thread."""
+
+    def __init__(self, interval: float = 0.005):
+        """
+        Args:
+            interval: Seconds between samples
+        """
+        self.interval = max(0.001, interval)
+        self.stacks: Counter = Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+
+    def _run(self):
+        me = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident == me:
+                    continue
+                stack = []
+                while frame is not None:
+                    stack.append(_frame_label(frame.f_code))
+                    frame = frame.f_back
+                stack.append(names.get(ident, f"thread-{ident}"))
+                stack.reverse()
+                self.stacks[";".join(stack)] += 1
+            self.samples += 1
+
+    def folded(self) -> str:
+        """Samples in folded-stack format ("root;caller;callee count" per line)."""
+        return "".join(f"{stack} {count}\n" for stack, count in self.stacks.most_common())
+
+    def summary(self, top: int = SUMMARY_TOP) -> List[Dict]:
+        """Functions by self samples, with inclusive samples and share of all stack samples."""
+        own: Counter = Counter()
+        inclusive: Counter = Counter()
+        for stack, count in self.stacks.items():
+            frames = stack.split(";")[1:]  # drop the thread name
+            if not frames:
+                continue
+            own[frames[-1]] += count
+            for function in set(frames):
+                inclusive[function] += count
+        total = sum(self.stacks.values()) or 1
+        return [
+            {
+                "function": function,
+                "self_samples": own[function],
+                "total_samples": inclusive[function],
+                "self_pct": round(100.0 * own[function] / total, 2),
+                "total_pct": round(100.0 * inclusive[function] / total, 2),
+            }
+            for function in sorted(inclusive, key=lambda f: (-own[f], -inclusive[f]))[:top]
+        ]
+
+
+class ProfileSession:
+    """One profiling run and its outputs."""
+
+    def __init__(self, mode: str, output_dir: Path, seconds: Optional[float], requests: Optional[int], interval: float):
+        self.id = f"{datetime.now().strftime('%Y%m%d-%H%M%S')}-{os.getpid()}-{next(_session_numbers)}-{mode}"
+        self.mode = mode
+        self.output_dir = output_dir
+        self.seconds = seconds
+        self.requests = requests
+        self.requests_seen = 0
+        self.started_at = time.time()
+        self.sampler = StackSampler(interval) if mode == MODE_SAMPLING else None
+        self.profiles: List[cProfile.Profile] = []
+        self.files: Dict[str, str] = {}
+
+    def info(self) -> Dict:
+        return {
+            "id": self.id,
+            "mode": self.mode,
+            "started_at": self.started_at,
+            "seconds": self.seconds,
+            "requests": self.requests,
+            "requests_seen": self.requests_seen,
+            "files": self.files,
+        }
+
+    def write(self) -> Dict[str, str]:
+        """Write profile outputs; returns the file paths by kind."""
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        base = self.output_dir / self.id
+        meta = {**self.info(), "finished_at": time.time()}
+
+        if self.sampler is not None:
+            folded = base.with_suffix(".folded")
+            folded.write_text(self.sampler.folded(), encoding="utf-8")
+            self.files["folded"] = str(folded)
+            meta["samples"] = self.sampler.samples
+            meta["functions"] = self.sampler.summary()
+        else:
+            meta["functions"] = []
+            if self.profiles:
+                stats = pstats.Stats(self.profiles[0])
+                for profile in self.profiles[1:]:
+                    stats.add(profile)
+                prof = base.with_suffix(".prof")
+                stats.dump_stats(str(prof))
+                self.files["pstats"] = str(prof)
+
+                text = io.StringIO()
+                pstats.Stats(str(prof), stream=text).sort_stats("cumulative").print_stats(SUMMARY_TOP)
+                report = base.with_suffix(".txt")
+                report.write_text(text.getvalue(), encoding="utf-8")
+                self.files["report"] = str(report)
+
+                rows = sorted(stats.stats.items(), key=lambda item: -item[1][2])[:SUMMARY_TOP]
+                meta["functions"] = [
+                    {
+                        "function": f"{name} ({os.path.basename(filename)}:{line})",
+                        "calls": calls,
+                        "self_seconds": round(tottime, 6),
+                        "total_seconds": round(cumtime, 6),
+                    }
+                    for (filename, line, name), (_, calls, tottime, cumtime, _) in rows
+                ]
+
+        summary = base.with_suffix(".summary.json")
+        self.files["summary"] = str(summary)
+        meta["files"] = self.files
+        summary.write_text(json.dumps(meta, indent=2), encoding="utf-8")
+        return dict(self.files)
+
+
+class Profiler:
+    """Process-wide switch for profiling sessions (one at a time)."""
+
+    def __init__(self, output_dir: str):
+        """
+        Args:
+            output_dir: Directory profile files are written to
+        """
+        self.output_dir = Path(output_dir)
+        self.session: Optional[ProfileSession] = None
+        self.last_files: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._timer: Optional[threading.Timer] = None
+
+    @property
+    def active(self) -> bool:
+        return self.session is not None
+
+    def start(
+        self,
+        mode: str = MODE_SAMPLING,
+        seconds: Optional[float] = 30.0,
+        requests: Optional[int] = None,
+        interval: float = 0.005
+    ) -> Dict:
+        """
+        Start a profiling session.
+
+        Args:
+            mode: "sampling" (whole process) or "cprofile" (per request)
+            seconds: Stop after this many seconds (default and cap: MAX_SECONDS)
+            requests: Stop after this many requests have finished
+            interval: Sampling interval in seconds (sampling mode)
+
+        Returns:
+            Session info
+
+        Raises:
+            ValueError: For an unknown mode
+            RuntimeError: If a session is already running
+        """
+        if mode not in (MODE_SAMPLING, MODE_CPROFILE):
+            raise ValueError(f"Unknown profiling mode: {mode}")
+        # Every session ends on its own, even if the requests it waits for never come
+        seconds = MAX_SECONDS if seconds is None else min(float(seconds), MAX_SECONDS)
+
+        with self._lock:
+            if self.session is not None:
+                raise RuntimeError(f"Profiling session {self.session.id} is already running")
+            session = ProfileSession(mode, self.output_dir, seconds, requests, interval)
+            if session.sampler is not None:
+                session.sampler.start()
+            self._timer = threading.Timer(seconds, self._expire, args=(session,))
+            self._timer.daemon = True
+            self._timer.start()
+            self.session = session
+        logger.info(f"Profiling session {session.id} started ({mode}, seconds={seconds}, requests={requests})")
+        return session.info()
+
+    def _expire(self, session: ProfileSession):
+        if self.session is session:
+            self.stop()
+
+    def stop(self) -> Dict:
+        """
+        Stop the running session and write its outputs.
+
+        Returns:
+            Session info with the written files (empty if nothing was running)
+        """
+        with self._lock:
+            session, self.session = self.session, None
+            timer, self._timer = self._timer, None
+        if session is None:
+            return {}
+        if timer is not None and timer is not threading.current_thread():
+            timer.cancel()
+        if session.sampler is not None:
+            session.sampler.stop()
+        try:
+            self.last_files = session.write()
+            logger.info(f"Profiling session {session.id} written to {self.output_dir}")
+        except Exception as e:
+            logger.error(f"Failed to write profile {session.id}: {e}")
+        return session.info()
+
+    def begin_request(self):
+        """
+        Request hook: call when a request starts.
+
+        Returns:
+            Handle for end_request (None while not profiling)
+        """
+        session = self.session
+        if session is None:
+            return None
+        profile = None
+        if session.mode == MODE_CPROFILE:
+            profile = cProfile.Profile()
+            try:
+                profile.enable()
+            except ValueError:
+                # Another profiler is active on this thread
+                profile = None
+        return (session, profile)
+
+    def end_request(self, handle):
+        """Request hook: call with begin_request's handle when the request finishes."""
+        if handle is None:
+            return
+        session, profile = handle
+        if profile is not None:
+            profile.disable()
+        with self._lock:
+            if profile is not None:
+                session.profiles.append(profile)
+            session.requests_seen += 1
+            done = session.requests is not None and session.requests_seen >= session.requests
+        if done and self.session is session:
+            self.stop()
+
+    def command(self, payload: Dict) -> Dict:
+        """
+        Apply an admin command.
+
+        Args:
+            payload: {"action": "start" | "stop" | "status", "mode", "seconds", "requests", "interval"}
+
+        Returns:
+            Profiler status after the command
+
+        Raises:
+            ValueError: For an unknown action or mode, or non-numeric limits
+            RuntimeError: When starting while a session is running
+        """
+        action = payload.get("action", "status")
+        if action == "start":
+            requests = payload.get("requests")
+            self.start(
+                mode=payload.get("mode", MODE_SAMPLING),
+                seconds=payload.get("seconds", 30.0),
+                requests=int(requests) if requests is not None else None,
+                interval=float(payload.get("interval", 0.005))
+            )
+        elif action == "stop":
+            self.stop()
+        elif action != "status":
+            raise ValueError(f"Unknown profiling action: {action}")
+        return self.status()
+
+    def status(self) -> Dict:
+        """Running session (if any) and the files of the last finished one."""
+        session = self.session
+        return {
+            "active": session is not None,
+            "session": session.info() if session else None,
+            "output_dir": str(self.output_dir),
+            "last_files": self.last_files,
+        }
+
+    def install_signal_handler(self, seconds: float = 30.0) -> bool:
+        """
+        Toggle a sampling session on SIGUSR2 (main thread only).
+
+        Returns:
+            True if the handler was installed
+        """
+        if not hasattr(signal, "SIGUSR2") or threading.current_thread() is not threading.main_thread():
+            return False
+
+        def _toggle(signum, frame):
+            # Start/stop off the signal handler so locks are never taken re-entrantly
+            if self.active:
+                threading.Thread(target=self.stop, name="profile-stop", daemon=True).start()
+            else:
+                threading.Thread(
+                    target=self.start, kwargs={"mode": MODE_SAMPLING, "seconds": seconds},
+                    name="profile-start", daemon=True
+                ).start()
+
+        signal.signal(signal.SIGUSR2, _toggle)
+        return True
+
+
+_profiler: Optional[Profiler] = None
+_profiler_lock = threading.Lock()
+
+
+def get_profiler(output_dir: Optional[str] = None) -> Profiler:
+    """
+    Process-wide profiler.
+
+    Args:
+        output_dir: Profile directory used when the profiler is first created
+            (default: SYNTHEVERSE_PROFILE_DIR or test_outputs/profiles)
+    """
+    global _profiler
+    if _profiler is None:
+        with _profiler_lock:
+            if _profiler is None:
+                _profiler = Profiler(
+                    output_dir or os.getenv("SYNTHEVERSE_PROFILE_DIR") or "test_outputs/profiles"
+                )
+    return _profiler
+
+
+def flask_profiling(app, profiler: Profiler):
+    """Profile Flask requests while a session is active."""
+    from flask import g
+
+    @app.before_request
+    def _profile_start():
+        g.profile_handle = profiler.begin_request()
+
+    @app.teardown_request
+    def _profile_finish(exc):
+        profiler.end_request(g.pop("profile_handle", None))
+
+
+def asgi_profiling_middleware(profiler: Profiler):
+    """Profiling middleware for FastAPI/Starlette (register with app.middleware("http")(...))."""
+    async def _profiling_middleware(request, call_next):
+        handle = profiler.begin_request()
+        try:
+            return await call_next(request)
+        finally:
+            profiler.end_request(handle)
+
+    return _profiling_middleware
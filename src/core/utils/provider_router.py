@@ -0,0 +1,500 @@
+"""
+LLM Provider Router
+Failover and hedged requests across LLM providers with latency tracking and circuit breakers.
+
+Providers are tried in priority order. When the active request runs past the
+provider's observed p95 latency, a hedged duplicate is sent to the next
+healthy provider and the first valid response wins; the slower request is
+cancelled (or, if already running, abandoned and its result discarded).
+Providers that fail repeatedly are skipped until their circuit breaker
+cools down.
+
+ProviderRouter.acall() is the asyncio counterpart of call(): providers with an
+async call are awaited on the event loop (and truly cancelled when they lose),
+the others run in the router's thread pool. ProviderRouter.astream() streams a
+response in chunks, failing over only until the first chunk is sent.
+"""
+
+import time
+import asyncio
+import logging
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import AsyncIterator, Awaitable, Callable, Dict, List, Optional
+
+from .metrics import LLM_REQUEST_DURATION, LLM_REQUEST_ERRORS
+
+logger = logging.getLogger(__name__)
+
+
+class ProviderError(Exception):
+    """Raised when no provider produced a valid response."""
+
+
+class LatencyTracker:
+    """Rolling window of successful call latencies for one provider."""
+
+    def __init__(self, window: int = 200):
+        self._samples = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float):
+        with self._lock:
+            self._samples.append(seconds)
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def percentile(self, pct: float) -> Optional[float]:
+        """
+        Get a latency percentile.
+
+        Args:
+            pct: Percentile in [0, 100]
+
+        Returns:
+            Latency in seconds, or None if no samples were recorded yet
+        """
+        with self._lock:
+            samples = sorted(self._samples)
+        if not samples:
+            return None
+        rank = min(len(samples) - 1, max(0, int(round(pct / 100.0 * (len(samples) - 1)))))
+        return samples[rank]
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker.
+
+    Opens after failure_threshold consecutive failures and lets a single
+    trial request through once reset_timeout seconds have passed.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 3, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state_locked()
+
+    def _state_locked(self) -> str:
+        if self._opened_at is None:
+            return self.CLOSED
+        if time.monotonic() - self._opened_at >= self.reset_timeout:
+            return self.HALF_OPEN
+        return self.OPEN
+
+    def allow_request(self) -> bool:
+        """Check whether a request may be sent (claims the trial slot when half-open)."""
+        with self._lock:
+            state = self._state_locked()
+            if state == self.CLOSED:
+                return True
+            if state == self.HALF_OPEN and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_in_flight = False
+
+    def release(self):
+        """Give back a trial slot whose request never produced an outcome."""
+        with self._lock:
+            self._trial_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            self._trial_in_flight = False
+            if self._opened_at is not None or self._failures >= self.failure_threshold:
+                # Open (or re-open after a failed trial)
+                self._opened_at = time.monotonic()
+
+
+class Provider:
+    """
+    A single LLM provider registered with the router.
+
+    The call function receives the request payload and a threading.Event that
+    is set when the router no longer needs the result; long-running providers
+    may check it to stop early. The optional async_call coroutine function
+    receives the request payload and is used by ProviderRouter.acall(); the
+    optional stream_call returns an async iterator of response text chunks
+    and is used by ProviderRouter.astream().
+    """
+
+    def __init__(
+        self,
+        name: str,
+        call: Callable[[Dict, threading.Event], str],
+        hedge_after: float = 10.0,
+        failure_threshold: int = 3,
+        reset_timeout: float = 30.0,
+        async_call: Optional[Callable[[Dict], Awaitable[str]]] = None,
+        stream_call: Optional[Callable[[Dict], AsyncIterator[str]]] = None
+    ):
+        """
+        Args:
+            name: Provider name (used in logs and stats)
+            call: Function performing the request
+            hedge_after: Hedge delay in seconds used until enough latency samples exist
+            failure_threshold: Consecutive failures before the circuit opens
+            reset_timeout: Seconds before an open circuit allows a trial request
+            async_call: Coroutine function performing the request without blocking the event loop
+            stream_call: Function returning an async iterator over the response text
+        """
+        self.name = name
+        self.call = call
+        self.async_call = async_call
+        self.stream_call = stream_call
+        self.hedge_after = hedge_after
+        self.latency = LatencyTracker()
+        self.breaker = CircuitBreaker(failure_threshold, reset_timeout)
+        self.successes = 0
+        self.failures = 0
+        self.hedges_won = 0
+
+
+class ProviderRouter:
+    """Routes requests across providers with failover, hedging and circuit breaking."""
+
+    def __init__(
+        self,
+        providers: Optional[List[Provider]] = None,
+        min_samples: int = 5,
+        validator: Optional[Callable[[str], bool]] = None,
+        max_workers: int = 8
+    ):
+        """
+        Initialize router.
+
+        Args:
+            providers: Providers in priority order
+            min_samples: Latency samples required before p95 is used as the hedge delay
+            validator: Returns True for acceptable responses (default: non-empty text)
+            max_workers: Thread pool size for in-flight provider calls
+        """
+        self.providers: List[Provider] = list(providers or [])
+        self.min_samples = min_samples
+        self.validator = validator or (lambda result: isinstance(result, str) and bool(result.strip()))
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="provider-router")
+
+    def add_provider(self, provider: Provider):
+        """Register a provider at the lowest priority."""
+        self.providers.append(provider)
+
+    def get_provider(self, name: str) -> Optional[Provider]:
+        for provider in self.providers:
+            if provider.name == name:
+                return provider
+        return None
+
+    def hedge_delay(self, provider: Provider) -> float:
+        """Seconds to wait on provider before hedging: its p95 once known, else its default."""
+        if len(provider.latency) >= self.min_samples:
+            return provider.latency.percentile(95)
+        return provider.hedge_after
+
+    def _candidates(self, preferred: Optional[str]) -> List[Provider]:
+        candidates = list(self.providers)
+        if preferred:
+            candidates.sort(key=lambda p: p.name != preferred)
+        return candidates
+
+    def _settle(self, future, provider: Provider, started: float, hedge: bool, errors: List[str]) -> Optional[str]:
+        """Record the outcome of a finished request; returns its result if valid, else None."""
+        elapsed = time.monotonic() - started
+        try:
+            result = future.result()
+            if not self.validator(result):
+                raise ProviderError("invalid response")
+        except Exception as e:
+            self._record_failure(provider, elapsed, e, errors)
+            return None
+        self._record_success(provider, elapsed, hedge)
+        return result
+
+    @staticmethod
+    def _record_failure(provider: Provider, elapsed: float, error: Exception, errors: List[str]):
+        provider.failures += 1
+        provider.breaker.record_failure()
+        LLM_REQUEST_ERRORS.labels(provider=provider.name).inc()
+        LLM_REQUEST_DURATION.labels(provider=provider.name, outcome="error").observe(elapsed)
+        errors.append(f"{provider.name}: {error}")
+        logger.warning(f"Provider {provider.name} failed after {elapsed:.2f}s: {error}")
+
+    @staticmethod
+    def _record_success(provider: Provider, elapsed: float, hedge: bool = False):
+        provider.successes += 1
+        provider.latency.record(elapsed)
+        LLM_REQUEST_DURATION.labels(provider=provider.name, outcome="success").observe(elapsed)
+        provider.breaker.record_success()
+        if hedge:
+            provider.hedges_won += 1
+        logger.debug(f"Provider {provider.name} answered in {elapsed:.2f}s")
+
+    def _wait_time(self, in_flight: Dict, candidates: List[Provider], deadline: Optional[float]) -> Optional[float]:
+        """Seconds until the newest request passes its hedge delay, or the deadline."""
+        newest_provider, newest_start, _ = list(in_flight.values())[-1]
+        wait_for = None
+        if candidates:
+            wait_for = max(0.0, newest_start + self.hedge_delay(newest_provider) - time.monotonic())
+        if deadline is not None:
+            remaining = max(0.0, deadline - time.monotonic())
+            wait_for = remaining if wait_for is None else min(wait_for, remaining)
+        return wait_for
+
+    def call(self, request: Dict, timeout: Optional[float] = None, preferred: Optional[str] = None) -> str:
+        """
+        Send a request, hedging to the next provider when the current one is slow.
+
+        Args:
+            request: Provider-specific request payload (passed to each provider's call)
+            timeout: Overall deadline in seconds (None waits for the last provider)
+            preferred: Name of the provider to try first
+
+        Returns:
+            First valid response
+
+        Raises:
+            ProviderError: If every provider failed, was unavailable or the deadline passed
+        """
+        candidates = self._candidates(preferred)
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        cancel_event = threading.Event()
+        in_flight = {}  # future -> (provider, start time, launched as hedge)
+        errors = []
+
+        def launch_next() -> bool:
+            while candidates:
+                provider = candidates.pop(0)
+                if not provider.breaker.allow_request():
+                    logger.debug(f"Skipping provider {provider.name}: circuit {provider.breaker.state}")
+                    continue
+                hedge = bool(in_flight)
+                if hedge:
+                    logger.info(f"Hedging request to provider {provider.name}")
+                future = self._executor.submit(provider.call, request, cancel_event)
+                in_flight[future] = (provider, time.monotonic(), hedge)
+                return True
+            return False
+
+        if not launch_next():
+            raise ProviderError("No LLM provider available (all circuits open)")
+
+        try:
+            while in_flight:
+                done, _ = wait(list(in_flight), timeout=self._wait_time(in_flight, candidates, deadline),
+                               return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    result = self._settle(future, *in_flight.pop(future), errors)
+                    if result is not None:
+                        return result
+
+                if deadline is not None and time.monotonic() >= deadline:
+                    errors.append(f"deadline of {timeout}s exceeded")
+                    break
+
+                # Hedge when the newest request is slow; fail over when nothing is left in flight
+                if (not done or not in_flight) and not launch_next() and not in_flight:
+                    break
+        finally:
+            # Losers: cancel if not started yet, otherwise signal them and discard their results
+            cancel_event.set()
+            for future, (provider, started, _) in list(in_flight.items()):
+                future.cancel()
+                future.add_done_callback(self._record_late_outcome(provider, started))
+
+        raise ProviderError("All LLM providers failed: " + "; ".join(errors))
+
+    async def acall(self, request: Dict, timeout: Optional[float] = None, preferred: Optional[str] = None) -> str:
+        """
+        Async call(): same failover, hedging and circuit breaking without blocking the event loop.
+
+        Args:
+            request: Provider-specific request payload
+            timeout: Overall deadline in seconds (None waits for the last provider)
+            preferred: Name of the provider to try first
+
+        Returns:
+            First valid response
+
+        Raises:
+            ProviderError: If every provider failed, was unavailable or the deadline passed
+        """
+        loop = asyncio.get_running_loop()
+        candidates = self._candidates(preferred)
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        cancel_event = threading.Event()
+        in_flight = {}  # task -> (provider, start time, launched as hedge)
+        errors = []
+
+        def launch_next() -> bool:
+            while candidates:
+                provider = candidates.pop(0)
+                if not provider.breaker.allow_request():
+                    logger.debug(f"Skipping provider {provider.name}: circuit {provider.breaker.state}")
+                    continue
+                hedge = bool(in_flight)
+                if hedge:
+                    logger.info(f"Hedging request to provider {provider.name}")
+                if provider.async_call is not None:
+                    task = asyncio.ensure_future(provider.async_call(request))
+                else:
+                    task = loop.run_in_executor(self._executor, provider.call, request, cancel_event)
+                in_flight[task] = (provider, time.monotonic(), hedge)
+                return True
+            return False
+
+        if not launch_next():
+            raise ProviderError("No LLM provider available (all circuits open)")
+
+        try:
+            while in_flight:
+                done, _ = await asyncio.wait(list(in_flight), timeout=self._wait_time(in_flight, candidates, deadline),
+                                             return_when=asyncio.FIRST_COMPLETED)
+
+                for task in done:
+                    result = self._settle(task, *in_flight.pop(task), errors)
+                    if result is not None:
+                        return result
+
+                if deadline is not None and time.monotonic() >= deadline:
+                    errors.append(f"deadline of {timeout}s exceeded")
+                    break
+
+                if (not done or not in_flight) and not launch_next() and not in_flight:
+                    break
+        finally:
+            # Losers are cancelled (async providers stop at their next await)
+            cancel_event.set()
+            for task, (provider, started, _) in list(in_flight.items()):
+                task.cancel()
+                task.add_done_callback(self._record_late_outcome(provider, started))
+
+        raise ProviderError("All LLM providers failed: " + "; ".join(errors))
+
+    async def astream(self, request: Dict, preferred: Optional[str] = None) -> AsyncIterator[str]:
+        """
+        Stream a response in text chunks from the first provider that produces one.
+
+        Providers without a stream call send their whole response as one chunk.
+        A provider failing before its first chunk is replaced by the next one; once
+        chunks have been sent there is no failover (and no hedging).
+
+        Args:
+            request: Provider-specific request payload
+            preferred: Name of the provider to try first
+
+        Yields:
+            Non-empty response text chunks
+
+        Raises:
+            ProviderError: If every provider failed or was unavailable, or the
+                streaming provider failed after sending chunks
+        """
+        errors = []
+        for provider in self._candidates(preferred):
+            if not provider.breaker.allow_request():
+                logger.debug(f"Skipping provider {provider.name}: circuit {provider.breaker.state}")
+                continue
+            started = time.monotonic()
+            sent = False
+            try:
+                chunks = provider.stream_call(request) if provider.stream_call is not None \
+                    else self._single_chunk(provider, request)
+                async for chunk in chunks:
+                    if chunk:
+                        sent = True
+                        yield chunk
+                if not sent:
+                    raise ProviderError("empty response")
+            except (GeneratorExit, asyncio.CancelledError):
+                # The consumer went away: no outcome to hold against the provider
+                provider.breaker.release()
+                raise
+            except Exception as e:
+                self._record_failure(provider, time.monotonic() - started, e, errors)
+                if sent:
+                    raise ProviderError(f"Provider {provider.name} failed mid-stream: {e}") from e
+                continue
+            self._record_success(provider, time.monotonic() - started)
+            return
+
+        raise ProviderError("All LLM providers failed: " + ("; ".join(errors) or "no provider available"))
+
+    async def _single_chunk(self, provider: Provider, request: Dict) -> AsyncIterator[str]:
+        if provider.async_call is not None:
+            yield await provider.async_call(request)
+        else:
+            yield await asyncio.get_running_loop().run_in_executor(
+                self._executor, provider.call, request, threading.Event()
+            )
+
+    @staticmethod
+    def _record_late_outcome(provider: Provider, started: float) -> Callable:
+        """Keep latency stats and breakers accurate for abandoned requests that still finish."""
+        def _callback(future):
+            if not future.cancelled() and future.exception() is None:
+                provider.latency.record(time.monotonic() - started)
+                provider.breaker.record_success()
+            else:
+                # Errors after cancel_event was set are not held against the provider
+                provider.breaker.release()
+        return _callback
+
+    def stats(self) -> Dict[str, Dict]:
+        """Per-provider latency percentiles, outcome counts and circuit state."""
+        return {
+            provider.name: {
+                "p50_seconds": provider.latency.percentile(50),
+                "p95_seconds": provider.latency.percentile(95),
+                "samples": len(provider.latency),
+                "successes": provider.successes,
+                "failures": provider.failures,
+                "hedges_won": provider.hedges_won,
+                "circuit": provider.breaker.state,
+            }
+            for provider in self.providers
+        }
+
+
+def openai_chat_provider(name: str, client, model: str, hedge_after: float = 10.0, **breaker_kwargs) -> Provider:
+    """
+    Create a provider for an OpenAI-compatible chat completions client.
+
+    The request payload holds chat.completions.create arguments (messages,
+    temperature, max_tokens, timeout); the provider fills in its own model.
+
+    Args:
+        name: Provider name
+        client: OpenAI-compatible client instance
+        model: Model name to request
+        hedge_after: Hedge delay in seconds until latency samples exist
+        **breaker_kwargs: failure_threshold / reset_timeout overrides
+
+    Returns:
+        Provider returning the first choice's message content
+    """
+    def _call(request: Dict, cancel_event: threading.Event) -> str:
+        response = client.chat.completions.create(model=model, **request)
+        return response.choices[0].message.content
+
+    return Provider(name, _call, hedge_after=hedge_after, **breaker_kwargs)
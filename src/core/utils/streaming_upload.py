@@ -0,0 +1,110 @@
+"""
+Streaming Upload Ingestion
+Save uploaded files to disk in fixed-size chunks while hashing them.
+
+The upload is read once: each chunk is written to a temporary file in the
+upload directory and fed to the hashes as it passes, and the size limit is
+checked per chunk so oversized uploads are rejected before they are fully
+read. Memory per upload is bounded by the chunk size.
+"""
+
+import os
+import hashlib
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO, Optional
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
+class UploadTooLargeError(ValueError):
+    """Raised when an upload exceeds the configured size limit."""
+
+    def __init__(self, max_bytes: int):
+        super().__init__(f"Upload exceeds the {max_bytes // (1024 * 1024)} MB limit")
+        self.max_bytes = max_bytes
+
+
+@dataclass
+class IngestedUpload:
+    """A streamed upload saved to disk."""
+    path: str
+    size: int
+    content_sha256: str    # SHA-256 of the file bytes (PDF extraction cache key)
+    submission_hash: str   # SHA-256 of the hash prefix followed by the file bytes
+
+
+def ingest_upload(
+    stream: BinaryIO,
+    upload_dir: str,
+    hash_prefix: bytes = b"",
+    max_bytes: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> IngestedUpload:
+    """
+    Stream an upload to a temporary file in upload_dir, hashing it on the way.
+
+    Args:
+        stream: Readable binary stream of the upload
+        upload_dir: Directory to write the file to
+        hash_prefix: Bytes hashed before the file content for submission_hash
+        max_bytes: Reject uploads larger than this (None for no limit)
+        chunk_size: Bytes read per chunk
+
+    Returns:
+        IngestedUpload; the caller moves the file with finalize_upload()
+
+    Raises:
+        UploadTooLargeError: If the upload exceeds max_bytes (nothing is kept on disk)
+    """
+    Path(upload_dir).mkdir(parents=True, exist_ok=True)
+    content_hash = hashlib.sha256()
+    submission_hash = hashlib.sha256(hash_prefix)
+    size = 0
+
+    fd, tmp_path = tempfile.mkstemp(dir=upload_dir, prefix=".upload_", suffix=".part")
+    try:
+        with os.fdopen(fd, "wb") as out:
+            while True:
+                chunk = stream.read(chunk_size)
+                if not chunk:
+                    break
+                size += len(chunk)
+                if max_bytes is not None and size > max_bytes:
+                    raise UploadTooLargeError(max_bytes)
+                content_hash.update(chunk)
+                submission_hash.update(chunk)
+                out.write(chunk)
+    except BaseException:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
+
+    return IngestedUpload(
+        path=tmp_path,
+        size=size,
+        content_sha256=content_hash.hexdigest(),
+        submission_hash=submission_hash.hexdigest()
+    )
+
+
+def finalize_upload(upload: IngestedUpload, filename: str) -> IngestedUpload:
+    """
+    Move an ingested upload to its final name in the same directory.
+
+    Args:
+        upload: Result of ingest_upload()
+        filename: Final file name (already sanitized)
+
+    Returns:
+        IngestedUpload pointing at the final path
+    """
+    final_path = str(Path(upload.path).with_name(filename))
+    os.replace(upload.path, final_path)
+    upload.path = final_path
+    return upload
+
+
+def discard_upload(upload: IngestedUpload):
+    """Remove an ingested upload that will not be used."""
+    Path(upload.path).unlink(missing_ok=True)
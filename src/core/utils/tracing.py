@@ -0,0 +1,293 @@
+"""
+Span Tracing
+Lightweight nested timing spans for the submission and evaluation pipeline.
+
+A span times one stage (e.g. "evaluate.llm_call") and carries attributes.
+Spans opened inside another span on the same thread become its children; a
+span can also be parented explicitly to continue a trace on another thread
+(e.g. an evaluation worker). Finished spans are appended to a JSON-lines file
+(if configured) and their durations are kept in a bounded window per span
+name for p50/p95/p99 summaries.
+
+Tracing is switched on and off at runtime. While disabled, span() returns a
+shared no-op span, so instrumented code costs one attribute check per stage.
+
+Environment:
+    SYNTHEVERSE_TRACING: Enable tracing at startup (1/true/yes)
+    SYNTHEVERSE_TRACE_FILE: JSON-lines file finished spans are appended to
+"""
+
+import os
+import json
+import time
+import logging
+import itertools
+import threading
+import contextvars
+from collections import deque
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+PERCENTILES = (50, 95, 99)
+
+_current_span: contextvars.ContextVar = contextvars.ContextVar("syntheverse_current_span", default=None)
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile (0 for an empty list)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = min(len(ordered) - 1, max(0, int(round(pct / 100.0 * (len(ordered) - 1)))))
+    return ordered[rank]
+
+
+def summarize_durations(samples: Dict[str, Iterable[float]]) -> Dict[str, Dict[str, float]]:
+    """
+    Per-stage latency summary.
+
+    Args:
+        samples: Span durations in seconds keyed by span name
+
+    Returns:
+        count, mean, p50, p95, p99 and max (milliseconds) per span name
+    """
+    summary = {}
+    for name in sorted(samples):
+        values = list(samples[name])
+        if not values:
+            continue
+        entry = {"count": len(values), "mean_ms": round(sum(values) / len(values) * 1000, 3)}
+        for pct in PERCENTILES:
+            entry[f"p{pct}_ms"] = round(percentile(values, pct) * 1000, 3)
+        entry["max_ms"] = round(max(values) * 1000, 3)
+        summary[name] = entry
+    return summary
+
+
+def load_spans(span_file: str) -> Iterator[Dict]:
+    """Read spans from a JSON-lines span file (malformed lines are skipped)."""
+    with open(span_file, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                logger.warning(f"Skipping malformed span line in {span_file}")
+
+
+def summarize_span_file(span_file: str) -> Dict[str, Dict[str, float]]:
+    """Per-stage latency summary of every span in a JSON-lines span file."""
+    samples: Dict[str, List[float]] = {}
+    for span in load_spans(span_file):
+        samples.setdefault(span["name"], []).append(span["duration_ms"] / 1000.0)
+    return summarize_durations(samples)
+
+
+class Span:
+    """A timed stage with attributes. Use as a context manager."""
+
+    __slots__ = ("tracer", "name", "attributes", "trace_id", "span_id", "parent_id",
+                 "start_time", "_start", "duration", "error", "_token")
+
+    def __init__(self, tracer: "Tracer", name: str, parent: Optional["Span"], attributes: Dict[str, Any]):
+        self.tracer = tracer
+        self.name = name
+        self.attributes = attributes
+        self.span_id = tracer._next_id()
+        self.parent_id = parent.span_id if parent is not None else None
+        self.trace_id = parent.trace_id if parent is not None else self.span_id
+        self.start_time = 0.0
+        self._start = 0.0
+        self.duration: Optional[float] = None
+        self.error: Optional[str] = None
+        self._token = None
+
+    def set_attribute(self, key: str, value: Any):
+        """Attach an attribute (JSON-serializable) to the span."""
+        self.attributes[key] = value
+
+    def __enter__(self) -> "Span":
+        self._token = _current_span.set(self)
+        self.start_time = time.time()
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.duration = time.perf_counter() - self._start
+        if exc_type is not None:
+            self.error = f"{exc_type.__name__}: {exc}"
+        try:
+            _current_span.reset(self._token)
+        except ValueError:
+            # Closed from another context (e.g. a framework teardown hook)
+            _current_span.set(None)
+        self.tracer._finish(self)
+        return False
+
+    def to_dict(self) -> Dict:
+        """JSON-serializable span record."""
+        record = {
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "start_time": self.start_time,
+            "duration_ms": round(self.duration * 1000, 3),
+            "attributes": self.attributes,
+        }
+        if self.error:
+            record["error"] = self.error
+        return record
+
+
+class _NoopSpan:
+    """Span returned while tracing is disabled."""
+
+    __slots__ = ()
+
+    def set_attribute(self, key: str, value: Any):
+        pass
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+class Tracer:
+    """Thread-safe span tracer with JSON-lines export and per-stage percentiles."""
+
+    def __init__(self, enabled: bool = False, span_file: Optional[str] = None, window: int = 2048):
+        """
+        Initialize tracer.
+
+        Args:
+            enabled: Whether spans are recorded
+            span_file: JSON-lines file finished spans are appended to (None keeps them in memory only)
+            window: Durations kept per span name for percentile summaries
+        """
+        self.enabled = enabled
+        self.window = window
+        self.span_file: Optional[Path] = None
+        self._handle = None
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self._durations: Dict[str, deque] = {}
+        self._errors: Dict[str, int] = {}
+        if span_file:
+            self.set_span_file(span_file)
+
+    def _next_id(self) -> int:
+        return next(self._ids)
+
+    def span(self, name: str, parent: Optional[Span] = None, **attributes) -> Span:
+        """
+        Open a span (use with `with`).
+
+        Args:
+            name: Stage name, dotted by convention (e.g. "evaluate.llm_call")
+            parent: Explicit parent span, e.g. one captured on another thread
+                (default: the innermost open span of the current context)
+            **attributes: Span attributes
+
+        Returns:
+            Span, or a no-op span while tracing is disabled
+        """
+        if not self.enabled:
+            return NOOP_SPAN
+        if parent is None or isinstance(parent, _NoopSpan):
+            parent = _current_span.get()
+        return Span(self, name, parent, attributes)
+
+    def current_span(self) -> Optional[Span]:
+        """Innermost open span of the current context (None while disabled)."""
+        return _current_span.get() if self.enabled else None
+
+    def _finish(self, span: Span):
+        with self._lock:
+            durations = self._durations.get(span.name)
+            if durations is None:
+                durations = self._durations[span.name] = deque(maxlen=self.window)
+            durations.append(span.duration)
+            if span.error:
+                self._errors[span.name] = self._errors.get(span.name, 0) + 1
+            if self.span_file is not None:
+                try:
+                    if self._handle is None:
+                        # Opened on first use so a configured but unused file is never created
+                        self.span_file.parent.mkdir(parents=True, exist_ok=True)
+                        self._handle = open(self.span_file, "a", encoding="utf-8", buffering=1)
+                    self._handle.write(json.dumps(span.to_dict(), default=str) + "\n")
+                except (OSError, ValueError) as e:
+                    logger.warning(f"Failed to write span to {self.span_file}: {e}")
+
+    def enable(self, span_file: Optional[str] = None):
+        """Start recording spans (optionally switching the export file)."""
+        if span_file:
+            self.set_span_file(span_file)
+        self.enabled = True
+
+    def disable(self):
+        """Stop recording spans; summaries collected so far are kept."""
+        self.enabled = False
+        with self._lock:
+            if self._handle is not None:
+                self._handle.flush()
+
+    def set_span_file(self, span_file: Optional[str]):
+        """Export finished spans to span_file (None stops exporting)."""
+        with self._lock:
+            if self._handle is not None:
+                self._handle.close()
+                self._handle = None
+            # Line buffered on open, so every span is on disk once it finishes
+            self.span_file = Path(span_file) if span_file else None
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Per-stage count, mean, p50/p95/p99 and max (ms) over the recent window."""
+        with self._lock:
+            samples = {name: list(durations) for name, durations in self._durations.items()}
+            errors = dict(self._errors)
+        summary = summarize_durations(samples)
+        for name, count in errors.items():
+            if name in summary:
+                summary[name]["errors"] = count
+        return summary
+
+    def status(self) -> Dict:
+        """Whether tracing is enabled, the export file and the stage summary."""
+        return {
+            "enabled": self.enabled,
+            "span_file": str(self.span_file) if self.span_file else None,
+            "stages": self.summary(),
+        }
+
+    def reset(self):
+        """Clear collected durations."""
+        with self._lock:
+            self._durations.clear()
+            self._errors.clear()
+
+
+_tracer: Optional[Tracer] = None
+_tracer_lock = threading.Lock()
+
+
+def get_tracer() -> Tracer:
+    """Process-wide tracer, configured from SYNTHEVERSE_TRACING and SYNTHEVERSE_TRACE_FILE."""
+    global _tracer
+    if _tracer is None:
+        with _tracer_lock:
+            if _tracer is None:
+                enabled = os.getenv("SYNTHEVERSE_TRACING", "").strip().lower() in ("1", "true", "yes")
+                _tracer = Tracer(enabled=enabled, span_file=os.getenv("SYNTHEVERSE_TRACE_FILE") or None)
+    return _tracer
@@ -11,7 +11,6 @@ export default function SubmissionPage() {
   const router = useRouter()
   const [loading, setLoading] = useState(false)
   const [evaluating, setEvaluating] = useState(false)
-  const [grokResponse, setGrokResponse] = useState<string | null>(null)
   const [error, setError] = useState<string | null>(null)
   const [success, setSuccess] = useState<string | null>(null)
 
@@ -62,36 +61,31 @@ export default function SubmissionPage() {
         submissionData.text_content = formData.textContent.trim()
       }
 
-      // Submit contribution
-      const result = await api.submitContribution(submissionData)
-
-      setSuccess(`Contribution submitted! Waiting for evaluation... Hash: ${result.submission_hash.slice(0, 16)}...`)
-      setLoading(false)
-      setEvaluating(true)
-
-      // Wait for evaluation to complete
-      const maxWaitTime = 60000 // 60 seconds max wait
+      // Progress is pushed over Server-Sent Events. The stream is opened on the client-chosen
+      // hash before submitting, because /api/submit only returns once the evaluation is done;
+      // polling is only used if the stream cannot be opened.
       const pollInterval = 2000 // Poll every 2 seconds
       const startTime = Date.now()
+      let message = `Submitting contribution... Hash: ${submissionHash.slice(0, 16)}...`
+      let submitted = false
+      let finished = false
+      let streamFailed = false
+
+      const showResults = () => router.push(`/submission/${submissionHash}`)
 
       const waitForEvaluation = async () => {
         try {
-          const contribution = await api.getContribution(result.submission_hash)
+          const status = await api.getStatus(submissionHash)
 
-          // Update progress display with actual evaluation status from metadata
-          if (contribution.metadata?.progress) {
-            setSuccess(`${success.split(' - ')[0]} - ${contribution.metadata.progress}`)
-          }
-
-          // If we have the raw Grok response, show it
-          if (contribution.metadata?.grok_raw_response) {
-            setGrokResponse(contribution.metadata.grok_raw_response)
+          // Update progress display with the latest evaluation progress event
+          if (status.progress) {
+            setSuccess(`${message} - ${status.progress.message}`)
           }
 
           // Check if evaluation is complete
-          if (contribution.status !== 'submitted' && contribution.status !== 'evaluating') {
+          if (status.progress?.final || !['draft', 'pending', 'evaluating'].includes(status.status)) {
             // Evaluation complete, redirect to results
-            router.push(`/submission/${result.submission_hash}`)
+            showResults()
             return
           }
 
@@ -105,12 +99,52 @@ export default function SubmissionPage() {
           }
         } catch (err) {
           // On error, redirect anyway
-          router.push(`/submission/${result.submission_hash}`)
+          showResults()
+        }
+      }
+
+      const closeStream = api.streamProgress(
+        submissionHash,
+        (event) => {
+          setSuccess(`${message} - ${event.message}`)
+          if (event.final) {
+            finished = true
+            if (submitted) {
+              showResults()
+            }
+          }
+        },
+        () => {
+          streamFailed = true
+          if (submitted) {
+            setTimeout(waitForEvaluation, pollInterval)
+          }
         }
+      )
+      setSuccess(message)
+      setEvaluating(true)
+
+      // Submit contribution
+      let result
+      try {
+        result = await api.submitContribution(submissionData)
+      } catch (err) {
+        closeStream()
+        setEvaluating(false)
+        throw err
       }
 
-      // Start waiting for evaluation
-      setTimeout(waitForEvaluation, pollInterval)
+      submitted = true
+      message = `Contribution submitted! Hash: ${result.submission_hash.slice(0, 16)}...`
+      setLoading(false)
+
+      if (finished) {
+        showResults()
+      } else if (streamFailed) {
+        setTimeout(waitForEvaluation, pollInterval)
+      } else {
+        setSuccess(`${message} - Waiting for evaluation...`)
+      }
     } catch (err) {
       setError(err instanceof Error ? err.message : 'Failed to submit contribution')
       setLoading(false)
@@ -284,15 +318,6 @@ export default function SubmissionPage() {
                       </div>
                     </div>
 
-                    {grokResponse && (
-                      <div className="bg-purple-50 p-3 rounded text-xs space-y-2 border border-purple-200">
-                        <p className="font-medium text-purple-800">🤖 Grok AI Evaluation Response:</p>
-                        <div className="bg-white p-2 rounded text-xs font-mono max-h-40 overflow-y-auto border">
-                          <pre className="whitespace-pre-wrap text-gray-800">{grokResponse}</pre>
-                        </div>
-                        <p className="text-purple-600 italic">Processing scores from Grok's evaluation...</p>
-                      </div>
-                    )}
                     <p className="text-xs opacity-60">
                       This may take up to 5 minutes for complex content. The page will automatically redirect when evaluation is complete.
                     </p>
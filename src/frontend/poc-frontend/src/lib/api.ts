@@ -121,6 +121,25 @@ export interface TokenomicsStatistics {
   total_allocations: number
 }
 
+export interface EvaluationProgressEvent {
+  seq: number
+  submission_hash: string
+  stage: string
+  message: string
+  timestamp: number
+  final: boolean
+  status?: string
+}
+
+export interface SubmissionStatus {
+  submission_hash: string
+  status: string
+  metals: string[]
+  updated_at?: string
+  queue?: Record<string, any>
+  progress?: EvaluationProgressEvent
+}
+
 class PoCApi {
   private baseUrl: string
 
@@ -235,6 +254,35 @@ class PoCApi {
     })
   }
 
+  // Status and latest progress event of a submission (polling fallback to streamProgress)
+  async getStatus(submissionHash: string): Promise<SubmissionStatus> {
+    return this.fetch(`/api/status/${submissionHash}`)
+  }
+
+  // Live evaluation progress (Server-Sent Events). Returns a function that closes the stream.
+  // The stream can be opened before the submission is sent, so no progress is missed.
+  streamProgress(
+    submissionHash: string,
+    onEvent: (event: EvaluationProgressEvent) => void,
+    onError?: () => void
+  ): () => void {
+    const source = new EventSource(`${this.baseUrl}/api/status/${submissionHash}/stream`)
+    source.addEventListener('progress', (message) => {
+      const event: EvaluationProgressEvent = JSON.parse((message as MessageEvent).data)
+      onEvent(event)
+      if (event.final) {
+        source.close()
+      }
+    })
+    source.onerror = () => {
+      // EventSource reconnects on its own while CONNECTING; CLOSED means it gave up
+      if (source.readyState === EventSource.CLOSED && onError) {
+        onError()
+      }
+    }
+    return () => source.close()
+  }
+
   // Sandbox Map
   async getSandboxMap(): Promise<SandboxMap> {
     return this.fetch('/api/sandbox-map')
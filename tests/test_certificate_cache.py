@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+Certificate Cache Test Suite
+Tests for content-hash-keyed certificate PDFs:
+- Rendering once per certificate input set
+- Background pre-rendering when a contribution qualifies
+- Eviction of stale and least recently served certificates
+
+Dependencies: Pure Python (the PDF generator is replaced by a stub renderer).
+Services: None - no API calls.
+Isolation: Uses temporary directories for state and cache files with automatic cleanup.
+"""
+
+import sys
+import json
+import time
+import shutil
+import tempfile
+import threading
+from pathlib import Path
+
+# Add test framework to path
+test_dir = Path(__file__).parent
+sys.path.insert(0, str(test_dir))
+
+from test_framework import SyntheverseTestCase, TestUtils
+
+from layer2.certificate_cache import CertificateCache, CertificateError, certificate_inputs, certificate_key
+from layer2.poc_server import PoCServer
+
+EVALUATION_RESPONSE = json.dumps({
+    "coherence": 8200,
+    "density": 7600,
+    "redundancy": 1200,
+    "metals": ["gold"],
+    "pod_score": 6952,
+    "tier_justification": "Coherent fractal grammar",
+    "redundancy_analysis": "Little overlap",
+    "status": "approved"
+})
+
+
+def qualified_contribution(submission_hash: str, reward: float = 1000.0) -> dict:
+    return {
+        "submission_hash": submission_hash,
+        "title": "Fractal Grammar",
+        "contributor": "alice",
+        "category": "scientific",
+        "status": "qualified",
+        "created_at": "2025-01-01T00:00:00",
+        "metadata": {
+            "pod_score": 6952,
+            "allocations": [{"allocation": {"epoch": "founder", "tier": "gold", "reward": reward}}],
+        },
+    }
+
+
+class StubRenderer:
+    """Writes a small PDF-like file per call, like PODPDFGenerator.generate_certificate_pdf."""
+
+    def __init__(self, output_dir: Path, delay: float = 0.0):
+        self.output_dir = output_dir
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.delay = delay
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, submission_data, allocation_data):
+        with self._lock:
+            self.calls += 1
+            call = self.calls
+        time.sleep(self.delay)
+        path = self.output_dir / f"certificate_{submission_data['submission_hash']}_{call}.pdf"
+        path.write_text(f"%PDF {submission_data['title']} {allocation_data['reward']}", encoding="utf-8")
+        return str(path)
+
+
+class TestCertificateCache(SyntheverseTestCase):
+    """Test certificate caching, pre-rendering and eviction."""
+
+    def get_category(self) -> str:
+        """Return test category for reporting"""
+        return "unit"
+
+    def setUp(self):
+        super().setUp()
+        self.work_dir = Path(tempfile.mkdtemp(prefix="certificate_cache_"))
+        self.renderer = StubRenderer(self.work_dir / "pdf_reports")
+
+    def tearDown(self):
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+        super().tearDown()
+
+    def _cache(self, **kwargs) -> CertificateCache:
+        cache = CertificateCache(str(self.work_dir / "certificates"), self.renderer, **kwargs)
+        self.addCleanup(cache.shutdown)
+        return cache
+
+    def test_inputs(self):
+        """Only qualified contributions with allocations are certified"""
+        submission, allocation = certificate_inputs(qualified_contribution("abc"))
+        self.assertEqual(submission["submission_hash"], "abc")
+        self.assertEqual(allocation["reward"], 1000.0)
+        self.assertEqual(allocation["pod_score"], 6952)
+
+        unqualified = dict(qualified_contribution("abc"), status="unqualified")
+        with self.assertRaises(CertificateError):
+            certificate_inputs(unqualified)
+        no_allocations = qualified_contribution("abc")
+        no_allocations["metadata"]["allocations"] = []
+        with self.assertRaises(CertificateError):
+            certificate_inputs(no_allocations)
+
+        other = certificate_inputs(qualified_contribution("abc", reward=5.0))
+        self.assertNotEqual(certificate_key(submission, allocation), certificate_key(*other))
+
+    def test_render_once(self):
+        """A certificate is rendered once and then served from the cache"""
+        cache = self._cache()
+        inputs = certificate_inputs(qualified_contribution("abc"))
+        first = cache.get(*inputs)
+        second = cache.get(*inputs)
+
+        self.assertEqual(first, second)
+        self.assertEqual(first.parent, cache.cache_dir)
+        self.assertTrue(first.read_text(encoding="utf-8").startswith("%PDF"))
+        self.assertEqual(self.renderer.calls, 1)
+        # The rendered file is moved into the cache
+        self.assertEqual(list(self.renderer.output_dir.iterdir()), [])
+        stats = cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"], stats["renders"]), (1, 1, 1))
+
+    def test_download_waits_for_background_render(self):
+        """A download during a queued render shares it"""
+        self.renderer.delay = 0.2
+        cache = self._cache()
+        contribution = qualified_contribution("abc")
+        future = cache.schedule_contribution(contribution)
+        path = cache.get(*certificate_inputs(contribution), timeout=5)
+
+        self.assertEqual(future.result(5), path)
+        self.assertEqual(self.renderer.calls, 1)
+
+    def test_stale_and_capacity_eviction(self):
+        """Changed inputs replace the old certificate and the cache stays within its cap"""
+        cache = self._cache(max_entries=2)
+        old = cache.get(*certificate_inputs(qualified_contribution("abc")))
+        new = cache.get(*certificate_inputs(qualified_contribution("abc", reward=2000.0)))
+        self.assertNotEqual(old, new)
+        self.assertFalse(old.exists())
+        self.assertTrue(new.exists())
+
+        b = cache.get(*certificate_inputs(qualified_contribution("b")))
+        time.sleep(0.01)
+        new.touch()  # served more recently than b
+        cache.get(*certificate_inputs(qualified_contribution("c")))
+        self.assertFalse(b.exists())
+        self.assertTrue(new.exists())
+        self.assertEqual(len(list(cache.cache_dir.glob("*.pdf"))), 2)
+
+        # A contribution that is no longer qualified loses its certificate
+        self.assertIsNone(cache.schedule_contribution(dict(qualified_contribution("abc"), status="unqualified")))
+        self.assertFalse(new.exists())
+
+        # Entries survive a restart
+        restarted = self._cache(max_entries=2)
+        self.assertEqual(restarted.stats()["entries"], 1)
+        restarted.get(*certificate_inputs(qualified_contribution("c")))
+        self.assertEqual(restarted.stats()["hits"], 1)
+
+    def test_prerender_on_qualification(self):
+        """Evaluating a contribution to qualified queues its certificate"""
+        cache = self._cache()
+        server = PoCServer(
+            output_dir=str(self.work_dir / "poc_reports"),
+            tokenomics_state_file=str(self.work_dir / "l2_tokenomics_state.json"),
+            archive_file=str(self.work_dir / "poc_archive.json"),
+            llm_responder=lambda prompt: EVALUATION_RESPONSE
+        )
+        self.addCleanup(server.evaluation_scheduler.shutdown, False)
+        self.assertTrue(server.wait_until_ready(10))
+        server.add_evaluation_listener(cache.schedule_contribution)
+
+        server.archive.add_contribution("paper-a", "Fractal Grammar", "alice", "Hydrogen holographic fractal grammar.")
+        result = server.evaluate_contribution("paper-a")
+        self.assertTrue(result["qualified"])
+
+        contribution = server.archive.get_contribution("paper-a")
+        deadline = time.time() + 5
+        while cache.lookup(*certificate_inputs(contribution)) is None and time.time() < deadline:
+            time.sleep(0.01)
+        self.assertIsNotNone(cache.lookup(*certificate_inputs(contribution)))
+        cache.get(*certificate_inputs(contribution))
+        self.assertEqual(self.renderer.calls, 1)
+
+
+def run_certificate_cache_tests():
+    """Run certificate cache tests with framework"""
+    TestUtils.print_test_header(
+        "Certificate Cache Test Suite",
+        "Testing certificate PDF caching, pre-rendering and eviction"
+    )
+
+    import unittest
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestCertificateCache)
+    runner = unittest.TextTestRunner(verbosity=2)
+    result = runner.run(suite)
+    return result.wasSuccessful()
+
+
+if __name__ == "__main__":
+    import unittest
+    unittest.main()
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Embedding Store Test Suite
+Tests for the memory-mapped binary embedding store:
+- Round trip of texts, metadata and normalized embeddings
+- Memory-mapped loading and float16 storage
+- JSON conversion and export in the vectorizer's file layout
+- Lazy chunk views and dictionary-encoded metadata columns
+- Vector indexes built directly on the mapped matrix
+
+Dependencies: numpy.
+Services: None - no API calls.
+Isolation: Uses temporary directories for stores and JSON files with automatic cleanup.
+"""
+
+import sys
+import json
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+# Add test framework to path
+test_dir = Path(__file__).parent
+sys.path.insert(0, str(test_dir))
+sys.path.insert(0, str(test_dir.parent / "src" / "api"))
+
+from test_framework import SyntheverseTestCase, TestUtils
+
+from rag_api.analysis.embedding_store import EmbeddingStore, convert_json_to_store, is_embedding_store
+from rag_api.analysis.vector_index import ExactVectorIndex, build_vector_index
+from rag_api.analysis.utils import load_embeddings_from_dir
+
+
+def sample_chunks(n_chunks: int = 30, dim: int = 16, seed: int = 5):
+    rng = np.random.default_rng(seed)
+    return [
+        {
+            "text": f"Hydrogen holographic chunk {i} — ψ",
+            "embedding": rng.normal(0, 1, dim).tolist(),
+            "metadata": {"page": i // 3, "source": f"paper_{i % 3}.pdf"} if i % 4 else {},
+            "chunk_index": i // 3,
+            "pdf_filename": f"paper_{i % 3}",
+        }
+        for i in range(n_chunks)
+    ]
+
+
+class TestEmbeddingStore(SyntheverseTestCase):
+    """Test writing, mapping, converting and indexing embedding stores."""
+
+    def get_category(self) -> str:
+        """Return test category for reporting"""
+        return "unit"
+
+    def setUp(self):
+        super().setUp()
+        self.work_dir = Path(tempfile.mkdtemp(prefix="embedding_store_"))
+        self.chunks = sample_chunks()
+
+    def tearDown(self):
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+        super().tearDown()
+
+    def test_round_trip(self):
+        """Texts, metadata, positions and normalized embeddings survive a write"""
+        store = EmbeddingStore.write(str(self.work_dir / "store"), self.chunks)
+        self.assertTrue(is_embedding_store(str(self.work_dir / "store")))
+        self.assertEqual(len(store), len(self.chunks))
+        self.assertEqual(store.dim, 16)
+        self.assertEqual(store.pdfs, ["paper_0", "paper_1", "paper_2"])
+
+        for i, original in enumerate(self.chunks):
+            chunk = store.chunk(i)
+            self.assertEqual(chunk["text"], original["text"])
+            self.assertEqual(chunk["metadata"], original["metadata"])
+            self.assertEqual(chunk["chunk_index"], original["chunk_index"])
+            self.assertEqual(chunk["pdf_filename"], original["pdf_filename"])
+            expected = np.array(original["embedding"]) / np.linalg.norm(original["embedding"])
+            np.testing.assert_allclose(chunk["embedding"], expected, rtol=1e-5)
+
+    def test_memory_mapped(self):
+        """Opening maps the matrix read-only instead of reading it"""
+        EmbeddingStore.write(str(self.work_dir / "store"), self.chunks)
+        store = EmbeddingStore(str(self.work_dir / "store"))
+        self.assertIsInstance(store.embeddings, np.memmap)
+        self.assertFalse(store.embeddings.flags["WRITEABLE"])
+        self.assertEqual(store.embeddings.dtype, np.float32)
+
+        in_memory = EmbeddingStore(str(self.work_dir / "store"), mmap=False)
+        self.assertNotIsInstance(in_memory.embeddings, np.memmap)
+        self.assertEqual(in_memory.chunk(7)["text"], store.chunk(7)["text"])
+
+    def test_float16(self):
+        """Half precision halves the matrix and keeps rankings"""
+        store32 = EmbeddingStore.write(str(self.work_dir / "store32"), self.chunks)
+        store16 = EmbeddingStore.write(str(self.work_dir / "store16"), self.chunks, dtype="float16")
+        self.assertEqual(store16.embeddings.dtype, np.float16)
+        self.assertEqual(store16.embeddings.nbytes * 2, store32.embeddings.nbytes)
+        np.testing.assert_allclose(store16.embeddings, store32.embeddings, atol=1e-3)
+        with self.assertRaises(ValueError):
+            EmbeddingStore.write(str(self.work_dir / "bad"), self.chunks, dtype="int8")
+
+    def test_json_conversion(self):
+        """JSON files convert to a store and export back in the same layout"""
+        json_dir = self.work_dir / "embeddings"
+        json_dir.mkdir()
+        for pdf in ("paper_0", "paper_1", "paper_2"):
+            file_chunks = [{k: v for k, v in c.items() if k != "pdf_filename"}
+                           for c in self.chunks if c["pdf_filename"] == pdf]
+            with open(json_dir / f"{pdf}.json", "w", encoding="utf-8") as f:
+                json.dump(file_chunks, f)
+
+        store = convert_json_to_store(str(json_dir), str(self.work_dir / "store"))
+        self.assertEqual(len(store), len(self.chunks))
+        # Analysis tools read stores and JSON directories alike
+        self.assertEqual(len(load_embeddings_from_dir(str(self.work_dir / "store"))), len(self.chunks))
+
+        export_dir = self.work_dir / "export"
+        self.assertEqual(store.export_json(str(export_dir)), 3)
+        with open(json_dir / "paper_1.json", encoding="utf-8") as f:
+            original = json.load(f)
+        with open(export_dir / "paper_1.json", encoding="utf-8") as f:
+            exported = json.load(f)
+        self.assertEqual([c["text"] for c in exported], [c["text"] for c in original])
+        self.assertEqual([c["metadata"] for c in exported], [c["metadata"] for c in original])
+        self.assertEqual(set(exported[0]), {"text", "embedding", "metadata", "chunk_index"})
+
+    def test_lazy_chunks(self):
+        """Lazy views decode chunks on access and group them by PDF"""
+        store = EmbeddingStore.write(str(self.work_dir / "store"), self.chunks)
+        chunks = store.lazy_chunks()
+        self.assertEqual(len(chunks), len(self.chunks))
+        self.assertEqual(chunks[4]["text"], self.chunks[4]["text"])
+        self.assertEqual(chunks[-1]["text"], self.chunks[-1]["text"])
+        self.assertEqual([c["text"] for c in chunks[2:5]], [c["text"] for c in self.chunks[2:5]])
+        self.assertEqual(sum(1 for _ in chunks), len(self.chunks))
+        with self.assertRaises(IndexError):
+            chunks[len(self.chunks)]
+        self.assertNotIn("embedding", store.lazy_chunks(include_embeddings=False)[0])
+
+        by_pdf = store.chunks_by_pdf()
+        self.assertEqual(list(by_pdf), ["paper_0", "paper_1", "paper_2"])
+        self.assertEqual(len(by_pdf["paper_1"]), 10)
+        self.assertEqual({c["pdf_filename"] for c in by_pdf["paper_1"]}, {"paper_1"})
+        with self.assertRaises(KeyError):
+            by_pdf["missing"]
+
+    def test_metadata_columns(self):
+        """Metadata values repeated across chunks are stored once per key"""
+        store = EmbeddingStore.write(str(self.work_dir / "store"), self.chunks)
+        self.assertEqual(store.metadata_keys, ["page", "source"])
+        self.assertEqual(store.metadata_codes.shape, (len(self.chunks), 2))
+        self.assertEqual(len(store._metadata_values[1]), 3)
+        self.assertEqual(store.metadata(0), {})
+        self.assertEqual(store.metadata(5), {"page": 1, "source": "paper_2.pdf"})
+
+    def test_rewrite_replaces_store(self):
+        """Writing over a store replaces it and leaves no temporary directories"""
+        path = str(self.work_dir / "store")
+        EmbeddingStore.write(path, self.chunks)
+        store = EmbeddingStore.write(path, self.chunks[:10] + [{"text": "no embedding"}])
+        self.assertEqual(len(store), 10)
+        self.assertEqual(sorted(p.name for p in self.work_dir.iterdir()), ["store"])
+        with self.assertRaises(ValueError):
+            EmbeddingStore(str(self.work_dir))
+
+    def test_index_on_mapped_matrix(self):
+        """Indexes search the mapped matrix directly with the same results as from chunks"""
+        store = EmbeddingStore.write(str(self.work_dir / "store"), self.chunks)
+        index = build_vector_index(None, kind="exact", embeddings=store.embeddings, normalized=True)
+        self.assertTrue(np.shares_memory(index.matrix, store.embeddings))
+
+        reference = ExactVectorIndex.from_chunks(self.chunks)
+        query = np.random.default_rng(2).normal(0, 1, 16)
+        self.assertEqual([i for i, _ in index.search(query, 5)], [i for i, _ in reference.search(query, 5)])
+
+
+def run_embedding_store_tests():
+    """Run embedding store tests with framework"""
+    TestUtils.print_test_header(
+        "Embedding Store Test Suite",
+        "Testing the memory-mapped binary embedding store"
+    )
+
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestEmbeddingStore)
+    runner = unittest.TextTestRunner(verbosity=2)
+    result = runner.run(suite)
+    return result.wasSuccessful()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Evaluation Context Unit Test Suite
+Tests for relevance-ranked, token-budgeted archive context in PoC evaluation prompts:
+- Local token counting and token-budget truncation
+- Incremental archive similarity index (add, sync, stale removal)
+- Archive context selection by similarity within a token budget
+
+Dependencies: Pure Python (tiktoken used for token counts when installed).
+Services: None - no API calls.
+"""
+
+import sys
+from pathlib import Path
+
+# Add test framework to path
+test_dir = Path(__file__).parent
+sys.path.insert(0, str(test_dir))
+sys.path.insert(0, str(test_dir.parent / "src" / "core"))
+
+from test_framework import SyntheverseTestCase, TestUtils
+
+from layer2.evaluation_context import (
+    ArchiveSimilarityIndex,
+    build_archive_context,
+    count_tokens,
+    truncate_to_tokens,
+)
+
+
+def _contribution(submission_hash: str, title: str, text: str, status: str = "qualified") -> dict:
+    return {
+        "submission_hash": submission_hash,
+        "title": title,
+        "text_content": text,
+        "content_hash": f"content-{submission_hash}",
+        "status": status,
+        "metals": ["gold"],
+    }
+
+
+class TestTokenBudget(SyntheverseTestCase):
+    """Test local token counting and truncation to a token budget."""
+
+    def get_category(self) -> str:
+        """Return test category for reporting"""
+        return "unit"
+
+    def test_count_tokens_empty_and_growing(self):
+        """Token count is zero for empty text and grows with text length"""
+        self.assertEqual(count_tokens(""), 0)
+        short = count_tokens("hydrogen holographic fractal")
+        longer = count_tokens("hydrogen holographic fractal " * 10)
+        self.assertGreater(short, 0)
+        self.assertGreater(longer, short)
+
+    def test_truncate_within_budget(self):
+        """Truncated text fits the budget and is a prefix of the original"""
+        text = "Fractal coherence across recursive scales. " * 500
+        truncated = truncate_to_tokens(text, 100)
+
+        self.assertLessEqual(count_tokens(truncated), 100)
+        self.assertTrue(text.startswith(truncated))
+        self.assertGreater(len(truncated), 0)
+
+    def test_truncate_short_text_unchanged(self):
+        """Text already within budget is returned unchanged"""
+        text = "Short contribution"
+        self.assertEqual(truncate_to_tokens(text, 100), text)
+        self.assertEqual(truncate_to_tokens(text, 0), "")
+
+
+class TestArchiveSimilarityIndex(SyntheverseTestCase):
+    """Test incremental indexing and similarity ranking of archive contributions."""
+
+    def get_category(self) -> str:
+        """Return test category for reporting"""
+        return "unit"
+
+    def setUp(self):
+        """Set up a small archive"""
+        super().setUp()
+        self.archive = [
+            _contribution("a" * 64, "Hydrogen Holography", "hydrogen holographic lattice fractal resonance " * 20),
+            _contribution("b" * 64, "Token Economics", "token supply epoch allocation reward treasury " * 20),
+            _contribution("c" * 64, "Fractal Grammar", "fractal grammar recursion coherence closure " * 20),
+        ]
+        self.index = ArchiveSimilarityIndex()
+
+    def test_sync_is_incremental(self):
+        """Sync indexes new entries once and drops removed ones"""
+        self.assertEqual(self.index.sync(self.archive), 3)
+        self.assertEqual(self.index.sync(self.archive), 0)
+
+        self.assertEqual(self.index.sync(self.archive[:2]), 0)
+        self.assertEqual(len(self.index), 2)
+        self.assertNotIn("c" * 64, self.index)
+
+    def test_most_similar_ranking(self):
+        """Most similar archive entry ranks first and the query itself is excluded"""
+        self.index.sync(self.archive)
+
+        results = self.index.most_similar(
+            "hydrogen holographic resonance in a fractal lattice",
+            k=3,
+            exclude="c" * 64
+        )
+
+        self.assertGreater(len(results), 0)
+        self.assertEqual(results[0][0], "a" * 64)
+        self.assertNotIn("c" * 64, [h for h, _ in results])
+
+    def test_archive_context_respects_budget(self):
+        """Archive context lists the most similar entries first within the token budget"""
+        self.index.sync(self.archive)
+        lookup = {c["submission_hash"]: c for c in self.archive}
+        contribution = _contribution("d" * 64, "Holographic Hydrogen", "hydrogen holographic lattice " * 10)
+
+        text, stats = build_archive_context(contribution, lookup, self.index, k=20, token_budget=1500)
+        self.assertTrue(text.startswith("- Hydrogen Holography"))
+        self.assertLessEqual(stats["archive_tokens"], 1500)
+
+        text, stats = build_archive_context(contribution, lookup, self.index, k=20, token_budget=5)
+        self.assertEqual(text, "")
+        self.assertEqual(stats["archive_entries"], 0)
+
+
+def run_evaluation_context_tests():
+    """Run evaluation context tests with framework"""
+    TestUtils.print_test_header(
+        "Evaluation Context Unit Test Suite",
+        "Testing token budgets and relevance-ranked archive context"
+    )
+
+    import unittest
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestTokenBudget)
+    suite.addTests(unittest.TestLoader().loadTestsFromTestCase(TestArchiveSimilarityIndex))
+
+    runner = unittest.TextTestRunner(verbosity=2)
+    result = runner.run(suite)
+    return result.wasSuccessful()
+
+
+if __name__ == "__main__":
+    import unittest
+    unittest.main()
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Evaluation Deduplication Test Suite
+Tests for single-flight, idempotent PoC evaluations:
+- Concurrent requests for one submission share a single evaluation
+- Finished evaluations are reused unless a re-evaluation is forced
+- Resubmissions of the same content do not evaluate again
+- Failed evaluations are retried
+- Founder priority from earlier evaluations of the submission or its contributor
+
+Dependencies: Pure Python (LLM calls are replaced by an injected responder).
+Services: None - no API calls.
+Isolation: Uses temporary directories for state files with automatic cleanup.
+"""
+
+import sys
+import json
+import shutil
+import tempfile
+import threading
+from pathlib import Path
+
+# Add test framework to path
+test_dir = Path(__file__).parent
+sys.path.insert(0, str(test_dir))
+
+from test_framework import SyntheverseTestCase, TestUtils
+
+from layer2.poc_server import PoCServer
+from layer2.evaluation_scheduler import PriorityClass
+
+EVALUATION_RESPONSE = json.dumps({
+    "coherence": 8200,
+    "density": 7600,
+    "redundancy": 1200,
+    "metals": ["gold"],
+    "pod_score": 6952,
+    "tier_justification": "Coherent fractal grammar",
+    "redundancy_analysis": "Little overlap",
+    "status": "approved"
+})
+
+
+class CountingResponder:
+    """LLM responder that counts calls and can be held or made to fail."""
+
+    def __init__(self):
+        self.calls = 0
+        self.failures = 0
+        self.release = threading.Event()
+        self.release.set()
+        self.started = threading.Event()
+        self._lock = threading.Lock()
+
+    def __call__(self, prompt):
+        with self._lock:
+            self.calls += 1
+            fail = self.failures > 0
+            if fail:
+                self.failures -= 1
+        self.started.set()
+        self.release.wait(10)
+        if fail:
+            raise RuntimeError("provider unavailable")
+        return EVALUATION_RESPONSE
+
+
+class TestEvaluationDedup(SyntheverseTestCase):
+    """Test coalescing and reuse of PoC evaluations."""
+
+    def get_category(self) -> str:
+        """Return test category for reporting"""
+        return "unit"
+
+    def setUp(self):
+        super().setUp()
+        self.work_dir = Path(tempfile.mkdtemp(prefix="poc_dedup_"))
+        self.responder = CountingResponder()
+        self.server = PoCServer(
+            output_dir=str(self.work_dir / "poc_reports"),
+            tokenomics_state_file=str(self.work_dir / "l2_tokenomics_state.json"),
+            archive_file=str(self.work_dir / "poc_archive.json"),
+            llm_responder=self.responder
+        )
+        self.addCleanup(self.server.evaluation_scheduler.shutdown, False)
+        self.assertTrue(self.server.wait_until_ready(10))
+
+    def tearDown(self):
+        self.responder.release.set()
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+        super().tearDown()
+
+    def _add(self, submission_hash, text="Hydrogen holographic fractal grammar closes recursively."):
+        self.server.archive.add_contribution(submission_hash, "Fractal Grammar", "alice", text)
+
+    def test_concurrent_requests_share_one_evaluation(self):
+        """Requests for an in-flight submission attach to it"""
+        self._add("paper-a")
+        self.responder.release.clear()
+        first = self.server.schedule_evaluation("paper-a")
+        self.assertTrue(self.responder.started.wait(5))
+
+        others = [self.server.schedule_evaluation("paper-a", force=True) for _ in range(3)]
+        self.responder.release.set()
+
+        results = [first.wait(10)] + [ticket.wait(10) for ticket in others]
+        self.assertEqual(self.responder.calls, 1)
+        self.assertTrue(all(ticket is first for ticket in others))
+        self.assertTrue(all(result["success"] for result in results))
+        self.assertEqual(self.server.evaluation_scheduler.stats()["coalesced"], 3)
+
+    def test_finished_evaluation_is_reused(self):
+        """A finished evaluation is returned unless forced"""
+        self._add("paper-a")
+        fresh = self.server.schedule_evaluation("paper-a").wait(10)
+        seq = self.server.progress_bus.latest("paper-a")["seq"]
+        reused = self.server.schedule_evaluation("paper-a").wait(10)
+
+        # Streams opened for the resubmission still get a terminal event
+        latest = self.server.progress_bus.latest("paper-a")
+        self.assertGreater(latest["seq"], seq)
+        self.assertTrue(latest["final"])
+
+        self.assertEqual(self.responder.calls, 1)
+        self.assertTrue(reused["reused"])
+        self.assertNotIn("reused", fresh)
+        for key in ("status", "qualified", "metals", "allocations", "prompt_stats", "redundancy_report"):
+            self.assertEqual(reused[key], fresh[key], key)
+        self.assertEqual(reused["evaluation"]["coherence"], fresh["evaluation"]["coherence"])
+
+        forced = self.server.schedule_evaluation("paper-a", force=True).wait(10)
+        self.assertEqual(self.responder.calls, 2)
+        self.assertNotIn("reused", forced)
+
+    def test_resubmission_is_idempotent(self):
+        """Submitting the same content twice evaluates once"""
+        text = "Recursive awareness emerges from hydrogen holography."
+        first = self.server.submit_contribution("paper-b", "Recursive Awareness", "bob", text_content=text)
+        second = self.server.submit_contribution("paper-b", "Recursive Awareness", "bob", text_content=text)
+
+        self.assertEqual(self.responder.calls, 1)
+        self.assertEqual(first["status"], "evaluated")
+        self.assertTrue(second["evaluation"]["reused"])
+        self.assertEqual(second["evaluation"]["status"], first["evaluation"]["status"])
+
+        # Changed content or force evaluates again
+        self.server.submit_contribution("paper-b", "Recursive Awareness", "bob", text_content=text + " Revised.")
+        self.assertEqual(self.responder.calls, 2)
+        self.server.submit_contribution("paper-b", "Recursive Awareness", "bob", text_content=text + " Revised.", force=True)
+        self.assertEqual(self.responder.calls, 3)
+
+    def test_failed_evaluation_is_retried(self):
+        """LLM failures are not reused"""
+        self._add("paper-c")
+        self.responder.failures = 1
+        failed = self.server.schedule_evaluation("paper-c").wait(10)
+        retried = self.server.schedule_evaluation("paper-c").wait(10)
+
+        self.assertFalse(failed["success"])
+        self.assertTrue(retried["success"])
+        self.assertEqual(self.responder.calls, 2)
+        self.assertIsNone(self.server.get_completed_evaluation("unknown"))
+
+    def test_founder_priority(self):
+        """Founder priority needs a Founder-density evaluation of the submission or its contributor"""
+        archive = self.server.archive
+        archive.add_contribution("new", "First Paper", "carol", "Fractal seeds.")
+        self.assertEqual(self.server._evaluation_priority(archive.get_contribution("new")), PriorityClass.STANDARD)
+        self.assertEqual(self.server._evaluation_priority(archive.get_contribution("new"), admin=True), PriorityClass.ADMIN)
+
+        # Re-evaluation of a submission that reached Founder density
+        archive.add_contribution("dense", "Dense Paper", "dave", "Holographic density.", metadata={"density": 8400})
+        self.assertEqual(self.server._evaluation_priority(archive.get_contribution("dense")), PriorityClass.FOUNDER)
+
+        # First submission of a contributor whose earlier work reached Founder density
+        archive.add_contribution("follow-up", "Follow-up", "dave", "Recursive follow-up.")
+        self.assertEqual(self.server._evaluation_priority(archive.get_contribution("follow-up")), PriorityClass.FOUNDER)
+
+        # Lower densities do not qualify
+        archive.add_contribution("pioneer", "Pioneer Paper", "erin", "Pioneer grammar.", metadata={"density": 7000})
+        archive.add_contribution("pioneer-2", "Pioneer Paper 2", "erin", "More pioneer grammar.")
+        self.assertEqual(self.server._evaluation_priority(archive.get_contribution("pioneer-2")), PriorityClass.STANDARD)
+
+
+def run_evaluation_dedup_tests():
+    """Run evaluation deduplication tests with framework"""
+    TestUtils.print_test_header(
+        "Evaluation Deduplication Test Suite",
+        "Testing single-flight and idempotent PoC evaluations"
+    )
+
+    import unittest
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestEvaluationDedup)
+    runner = unittest.TextTestRunner(verbosity=2)
+    result = runner.run(suite)
+    return result.wasSuccessful()
+
+
+if __name__ == "__main__":
+    import unittest
+    unittest.main()
@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+Evaluation Parser Test Suite
+Tests for the shared single-pass LLM evaluation output parser:
+- JSON block extraction (```json blocks, generic fences, inline objects)
+- Labelled score extraction from markdown reports and tables
+- Metal normalization
+- Fuzzing with random and adversarial responses under a time bound
+- Benchmark over a response corpus (embedded samples, or a recorded
+  evaluation trace via EVALUATION_PARSER_CORPUS=<trace.jsonl>)
+
+Dependencies: Pure Python.
+Services: None - no API calls.
+"""
+
+import os
+import sys
+import time
+import json
+import random
+from pathlib import Path
+
+# Add test framework to path
+test_dir = Path(__file__).parent
+sys.path.insert(0, str(test_dir))
+
+from test_framework import SyntheverseTestCase, TestUtils
+
+from layer2.evaluation_parser import (
+    MAX_PARSE_CHARS,
+    extract_evaluation_json,
+    normalize_metals,
+    parse_pod_evaluation_json,
+    parse_pod_evaluation_markdown,
+    scan_evaluation_output,
+)
+
+# Representative response shapes seen from the evaluation models
+SAMPLE_RESPONSES = {
+    "poc_json_block": """Here is my evaluation of the contribution.
+
+```json
+{
+    "coherence": 8200,
+    "density": 7600,
+    "redundancy": 1200,
+    "metals": ["Gold", "silver"],
+    "pod_score": 6963.2,
+    "tier_justification": "Strong {structural} consistency.",
+    "redundancy_analysis": "Little overlap with the archive.",
+    "status": "approved"
+}
+```""",
+    "pod_markdown_then_json": """### **Full Evaluation Report**
+
+**1. Coherence (Φ):** 8700 - fractal grammar closure is complete.
+**2. Density (ρ):** 9100 - foundational definitions.
+**3. Redundancy:** 0.05
+
+```json
+{"coherence": 8700, "density": 9100, "redundancy": 0.05, "epoch_weight": 1.0, "pod_score": 7520.0,
+ "tier": "gold", "epoch": "founder", "status": "approved", "reasoning": "Defines core HHFE terms."}
+```""",
+    "generic_fence": """Result:
+```
+{"coherence": 6100, "density": 6400, "redundancy": 0.2, "tier": "silver", "epoch": "pioneer"}
+```""",
+    "inline_object": 'Scores follow. {"coherence": 5100, "density": 4300, "redundancy": 0.3} End of evaluation.',
+    "markdown_table": """| Metric | Score |
+|---|---|
+| Coherence (Φ) | 7400 |
+| Density (ρ) | 6800 |
+| Redundancy | 15 |
+| PoD Score | 5100 |
+
+Tier: **Silver**
+Epoch: pioneer
+The contribution is approved.""",
+    "prose_only": "The coherence and density are unclear, so no scores can be given. Rejected.",
+}
+
+
+class TestEvaluationParser(SyntheverseTestCase):
+    """Test JSON and markdown extraction from evaluation responses."""
+
+    def get_category(self) -> str:
+        """Return test category for reporting"""
+        return "unit"
+
+    def test_json_block_preferred(self):
+        """A ```json block is used and braces inside strings are handled"""
+        data = extract_evaluation_json(SAMPLE_RESPONSES["poc_json_block"])
+
+        self.assertEqual(data["coherence"], 8200)
+        self.assertEqual(data["tier_justification"], "Strong {structural} consistency.")
+        self.assertEqual(normalize_metals(data["metals"]), ["gold", "silver"])
+
+        # Results are copies: mutating one does not change later parses of the same text
+        data["coherence"] = 0
+        data["metals"].clear()
+        again = extract_evaluation_json(SAMPLE_RESPONSES["poc_json_block"])
+        self.assertEqual(again["coherence"], 8200)
+        self.assertEqual(normalize_metals(again["metals"]), ["gold", "silver"])
+
+    def test_pod_json_evaluation(self):
+        """PoD JSON parsing returns normalized fields"""
+        evaluation = parse_pod_evaluation_json(SAMPLE_RESPONSES["pod_markdown_then_json"])
+        self.assertEqual(evaluation["coherence"], 8700.0)
+        self.assertEqual(evaluation["tier"], "gold")
+        self.assertEqual(evaluation["epoch"], "founder")
+
+        generic = parse_pod_evaluation_json(SAMPLE_RESPONSES["generic_fence"])
+        self.assertEqual(generic["density"], 6400.0)
+
+        inline = parse_pod_evaluation_json(SAMPLE_RESPONSES["inline_object"])
+        self.assertEqual(inline["coherence"], 5100.0)
+
+        self.assertIsNone(parse_pod_evaluation_json(SAMPLE_RESPONSES["markdown_table"]))
+        self.assertIsNone(parse_pod_evaluation_json('{"tier": "gold"}'))
+
+    def test_markdown_evaluation(self):
+        """Labelled scores are extracted from markdown tables and text"""
+        evaluation = parse_pod_evaluation_markdown(SAMPLE_RESPONSES["markdown_table"])
+
+        self.assertEqual(evaluation["coherence"], 7400)
+        self.assertEqual(evaluation["density"], 6800)
+        self.assertAlmostEqual(evaluation["redundancy"], 0.15)
+        self.assertEqual(evaluation["pod_score"], 5100.0)
+        self.assertEqual(evaluation["tier"], "silver")
+        self.assertEqual(evaluation["epoch"], "pioneer")
+        self.assertEqual(evaluation["status"], "approved")
+
+    def test_markdown_label_priority(self):
+        """Numeric labels win over earlier prose and aliases"""
+        text = "The coherence and density look fine. Φ: 6000. coherence: 9000, density = 8800"
+        evaluation = parse_pod_evaluation_markdown(text)
+
+        self.assertEqual(evaluation["coherence"], 9000)
+        self.assertEqual(evaluation["density"], 8800)
+        self.assertEqual(evaluation["epoch"], "founder")
+
+        self.assertIsNone(parse_pod_evaluation_markdown(SAMPLE_RESPONSES["prose_only"]))
+        self.assertIsNone(parse_pod_evaluation_markdown(""))
+
+    def test_metals_from_markdown(self):
+        """Metals listed in markdown are normalized"""
+        scan = scan_evaluation_output("Metals: Gold + Copper\nCoherence: 8000")
+        self.assertEqual(scan.metals, ["gold", "copper"])
+        self.assertEqual(normalize_metals("SILVER"), ["silver"])
+        self.assertEqual(normalize_metals(None), [])
+
+
+class TestEvaluationParserRobustness(SyntheverseTestCase):
+    """Fuzz and benchmark the parser for bounded worst-case time."""
+
+    # Generous bound for a MAX_PARSE_CHARS response on slow CI machines
+    MAX_SECONDS = 2.0
+
+    def get_category(self) -> str:
+        """Return test category for reporting"""
+        return "performance"
+
+    def _timed(self, text: str) -> float:
+        start = time.perf_counter()
+        scan_evaluation_output(text)
+        parse_pod_evaluation_json(text)
+        parse_pod_evaluation_markdown(text)
+        return time.perf_counter() - start
+
+    def test_adversarial_inputs(self):
+        """Pathological responses are parsed within the time bound"""
+        adversarial = [
+            "{" * MAX_PARSE_CHARS,
+            '{"a":' * 50000,
+            '{"a": [' * 40000,
+            "```" * 70000,
+            "coherence: " * 30000,
+            "coherence (" * 50000,
+            "Φ (" + "x" * 150000,
+            "metals: " + "gold, " * 40000,
+            '{"coherence": "' + "9" * 180000,
+            "1" * MAX_PARSE_CHARS * 2,
+        ]
+        for text in adversarial:
+            elapsed = self._timed(text)
+            self.assertLess(elapsed, self.MAX_SECONDS, f"Parsing took {elapsed:.2f}s for input starting {text[:20]!r}")
+
+    def test_random_fuzz(self):
+        """Random mixes of response fragments never raise"""
+        rng = random.Random(1234)
+        fragments = [
+            "coherence", "density", "Φ", "ρ", "redundancy", "pod_score", "tier", "epoch", "status",
+            ":", "=", "|", "**", '"', "{", "}", "[", "]", "```", "```json", "\n", " ",
+            "8500", "0.05", "gold", "silver", "approved", "rejected", "metals", "(", ")",
+        ]
+        fragments.extend(SAMPLE_RESPONSES.values())
+
+        for _ in range(300):
+            text = "".join(rng.choice(fragments) for _ in range(rng.randint(1, 200)))
+            scan_evaluation_output(text)
+            evaluation = parse_pod_evaluation_markdown(text)
+            if evaluation is not None:
+                self.assertTrue(0 <= evaluation["coherence"] <= 10000)
+                self.assertTrue(0 <= evaluation["density"] <= 10000)
+            parse_pod_evaluation_json(text)
+
+    def test_corpus_benchmark(self):
+        """Benchmark parsing over the response corpus"""
+        corpus = list(SAMPLE_RESPONSES.values())
+        corpus_file = os.getenv("EVALUATION_PARSER_CORPUS")
+        if corpus_file and Path(corpus_file).exists():
+            with open(corpus_file, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        response = json.loads(line).get("response")
+                    except json.JSONDecodeError:
+                        continue
+                    if response:
+                        corpus.append(response)
+
+        # Vary the texts so the scan cache does not hide the parsing cost
+        iterations = 50
+        start = time.perf_counter()
+        for i in range(iterations):
+            for response in corpus:
+                text = f"{response}\n<!-- {i} -->"
+                parse_pod_evaluation_json(text) or parse_pod_evaluation_markdown(text)
+        elapsed = time.perf_counter() - start
+
+        per_response_ms = elapsed / (iterations * len(corpus)) * 1000
+        self.log_info(f"Parsed {iterations * len(corpus)} responses, {per_response_ms:.3f} ms per response")
+        self.test_result.add_metric("per_response_ms", per_response_ms)
+        self.assertLess(per_response_ms, 50.0)
+
+
+def run_evaluation_parser_tests():
+    """Run evaluation parser tests with framework"""
+    TestUtils.print_test_header(
+        "Evaluation Parser Test Suite",
+        "Testing single-pass evaluation output parsing, fuzzing and benchmarks"
+    )
+
+    import unittest
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestEvaluationParser)
+    suite.addTests(unittest.TestLoader().loadTestsFromTestCase(TestEvaluationParserRobustness))
+
+    runner = unittest.TextTestRunner(verbosity=2)
+    result = runner.run(suite)
+    return result.wasSuccessful()
+
+
+if __name__ == "__main__":
+    import unittest
+    unittest.main()
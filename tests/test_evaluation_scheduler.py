@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Evaluation Scheduler Test Suite
+Tests for priority and fair-share evaluation scheduling:
+- Weighted fair queuing between contributors
+- Priority classes (admin, founder, standard) and per-class caps
+- Queue position estimates
+- Duplicate submissions and error propagation
+
+Dependencies: Pure Python.
+Services: None - no API calls.
+"""
+
+import sys
+import threading
+from pathlib import Path
+
+# Add test framework to path
+test_dir = Path(__file__).parent
+sys.path.insert(0, str(test_dir))
+
+from test_framework import SyntheverseTestCase, TestUtils
+
+from layer2.evaluation_scheduler import EvaluationScheduler, PriorityClass
+
+
+class RecordingRunner:
+    """Run function that records the evaluation order and can be held."""
+
+    def __init__(self):
+        self.order = []
+        self.release = threading.Event()
+        self.started = threading.Event()
+
+    def __call__(self, submission_hash, **kwargs):
+        self.started.set()
+        if submission_hash == "blocker":
+            self.release.wait(10)
+        self.order.append(submission_hash)
+        if submission_hash == "failing":
+            raise ValueError("evaluation failed")
+        return {"success": True, "submission_hash": submission_hash, **kwargs}
+
+
+class TestEvaluationScheduler(SyntheverseTestCase):
+    """Test scheduling order, priorities and queue positions."""
+
+    def get_category(self) -> str:
+        """Return test category for reporting"""
+        return "unit"
+
+    def _scheduler(self, **kwargs):
+        runner = RecordingRunner()
+        scheduler = EvaluationScheduler(runner, workers=1, **kwargs)
+        self.addCleanup(scheduler.shutdown)
+        self.addCleanup(runner.release.set)
+        # Occupy the single worker so the queue builds up
+        blocker = scheduler.submit("blocker", "someone", priority=PriorityClass.ADMIN)
+        self.assertTrue(runner.started.wait(5))
+        return scheduler, runner, blocker
+
+    def test_fair_share_between_contributors(self):
+        """A bulk submitter does not starve later contributors"""
+        scheduler, runner, blocker = self._scheduler()
+        tickets = [scheduler.submit(f"bulk-{i}", "bulk") for i in range(5)]
+        tickets.append(scheduler.submit("alice-0", "alice"))
+        tickets.append(scheduler.submit("bob-0", "bob"))
+
+        runner.release.set()
+        for ticket in tickets:
+            ticket.wait(5)
+
+        self.assertEqual(runner.order[:4], ["blocker", "bulk-0", "alice-0", "bob-0"])
+        self.assertEqual(runner.order[4:], ["bulk-1", "bulk-2", "bulk-3", "bulk-4"])
+
+    def test_weights(self):
+        """A heavier contributor gets proportionally more turns"""
+        scheduler, runner, blocker = self._scheduler()
+        tickets = [scheduler.submit(f"light-{i}", "light") for i in range(3)]
+        tickets += [scheduler.submit(f"heavy-{i}", "heavy", weight=2.0) for i in range(4)]
+
+        runner.release.set()
+        for ticket in tickets:
+            ticket.wait(5)
+
+        self.assertEqual(
+            runner.order[1:],
+            ["heavy-0", "light-0", "heavy-1", "heavy-2", "light-1", "heavy-3", "light-2"]
+        )
+
+    def test_priority_classes(self):
+        """Admin and founder work runs before standard work"""
+        scheduler, runner, blocker = self._scheduler()
+        standard = scheduler.submit("standard", "alice")
+        founder = scheduler.submit("founder", "bob", priority=PriorityClass.FOUNDER)
+        admin = scheduler.submit("admin", "carol", priority=PriorityClass.ADMIN)
+
+        runner.release.set()
+        for ticket in (standard, founder, admin):
+            ticket.wait(5)
+
+        self.assertEqual(runner.order, ["blocker", "admin", "founder", "standard"])
+
+    def test_class_caps(self):
+        """Standard work leaves a worker free for priority work"""
+        runner = RecordingRunner()
+        scheduler = EvaluationScheduler(runner, workers=2)
+        self.addCleanup(scheduler.shutdown)
+        self.addCleanup(runner.release.set)
+
+        scheduler.submit("blocker", "bulk")
+        self.assertTrue(runner.started.wait(5))
+        queued = scheduler.submit("standard", "alice")
+        admin = scheduler.submit("admin", "carol", priority=PriorityClass.ADMIN)
+
+        self.assertEqual(admin.wait(5)["submission_hash"], "admin")
+        self.assertFalse(queued.done())
+        self.assertEqual(scheduler.position("standard")["state"], "queued")
+
+        runner.release.set()
+        queued.wait(5)
+
+    def test_queue_position(self):
+        """Positions and wait estimates follow the dispatch order"""
+        scheduler, runner, blocker = self._scheduler(initial_service_time=10.0)
+        scheduler.submit("bulk-0", "bulk")
+        scheduler.submit("bulk-1", "bulk")
+        scheduler.submit("alice-0", "alice")
+
+        self.assertEqual(scheduler.position("blocker")["state"], "running")
+        self.assertEqual(scheduler.position("bulk-0")["position"], 1)
+        self.assertEqual(scheduler.position("alice-0")["position"], 2)
+        self.assertEqual(scheduler.position("bulk-1")["position"], 3)
+        self.assertEqual(scheduler.position("bulk-1")["estimated_wait_seconds"], 30.0)
+        self.assertIsNone(scheduler.position("unknown"))
+
+        # Promotion moves a queued submission ahead
+        scheduler.submit("bulk-1", "bulk", priority=PriorityClass.FOUNDER)
+        self.assertEqual(scheduler.position("bulk-1")["position"], 1)
+        self.assertEqual(scheduler.position("bulk-1")["priority"], "founder")
+
+        stats = scheduler.stats()
+        self.assertEqual(stats["classes"]["standard"]["queued"], 2)
+        self.assertEqual(stats["classes"]["admin"]["running"], 1)
+
+    def test_duplicates_and_errors(self):
+        """Queued submissions are not duplicated and errors reach the caller"""
+        scheduler, runner, blocker = self._scheduler()
+        first = scheduler.submit("paper", "alice", note="first")
+        second = scheduler.submit("paper", "alice", note="second")
+        failing = scheduler.submit("failing", "bob")
+
+        self.assertIs(first, second)
+        runner.release.set()
+        self.assertEqual(first.wait(5)["note"], "first")
+        with self.assertRaises(ValueError):
+            failing.wait(5)
+        self.assertEqual(runner.order.count("paper"), 1)
+        self.assertIsNone(scheduler.position("paper"))
+
+
+def run_evaluation_scheduler_tests():
+    """Run evaluation scheduler tests with framework"""
+    TestUtils.print_test_header(
+        "Evaluation Scheduler Test Suite",
+        "Testing priority classes and fair-share evaluation scheduling"
+    )
+
+    import unittest
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestEvaluationScheduler)
+    runner = unittest.TextTestRunner(verbosity=2)
+    result = runner.run(suite)
+    return result.wasSuccessful()
+
+
+if __name__ == "__main__":
+    import unittest
+    unittest.main()
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Evaluation Trace Unit Test Suite
+Tests for recording and replaying PoC evaluation traffic:
+- JSONL trace recording of prompts, responses and timings
+- Trace loading (skipping failed and malformed records)
+- Replay responder prompt matching and pacing
+
+Dependencies: Pure Python.
+Services: None - no API calls.
+Isolation: Uses temporary directories for trace files with automatic cleanup.
+"""
+
+import sys
+import time
+import shutil
+import tempfile
+from pathlib import Path
+
+# Add test framework to path
+test_dir = Path(__file__).parent
+sys.path.insert(0, str(test_dir))
+
+from test_framework import SyntheverseTestCase, TestUtils
+
+from layer2.evaluation_trace import (
+    PACE_RECORDED,
+    EvaluationTraceRecorder,
+    ReplayResponder,
+    load_trace,
+)
+
+
+class TestEvaluationTrace(SyntheverseTestCase):
+    """Test trace recording and replay responses."""
+
+    def get_category(self) -> str:
+        """Return test category for reporting"""
+        return "unit"
+
+    def setUp(self):
+        """Set up a temporary trace file"""
+        super().setUp()
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.trace_file = self.temp_dir / "trace.jsonl"
+        self.contribution = {
+            "submission_hash": "a" * 64,
+            "title": "Hydrogen Holography",
+            "contributor": "alice",
+            "category": "scientific",
+            "text_content": "hydrogen holographic fractal",
+        }
+
+    def tearDown(self):
+        """Remove the trace file"""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        super().tearDown()
+
+    def test_record_and_load(self):
+        """Recorded evaluations load back; failed ones are skipped by default"""
+        recorder = EvaluationTraceRecorder(str(self.trace_file))
+        recorder.record(self.contribution, "prompt one", '{"coherence": 8000}', {"prepare": 0.01, "llm": 1.5}, success=True)
+        recorder.record(self.contribution, "prompt two", None, {"llm": 2.0}, success=False, error="timeout")
+        with open(self.trace_file, "a") as f:
+            f.write("not json\n")
+
+        records = load_trace(str(self.trace_file))
+        self.assertEqual(len(records), 1)
+        self.assertEqual(records[0]["response"], '{"coherence": 8000}')
+        self.assertEqual(records[0]["text_content"], "hydrogen holographic fractal")
+        self.assertEqual(records[0]["timings"]["llm"], 1.5)
+
+        self.assertEqual(len(load_trace(str(self.trace_file), include_failed=True)), 2)
+
+    def test_replay_matches_prompt(self):
+        """Replay answers exact prompts directly and falls back to the expected record"""
+        recorder = EvaluationTraceRecorder(str(self.trace_file))
+        recorder.record(self.contribution, "prompt one", "response one", {"llm": 0.0}, success=True)
+        recorder.record(self.contribution, "prompt two", "response two", {"llm": 0.0}, success=True)
+        records = load_trace(str(self.trace_file))
+
+        responder = ReplayResponder(records)
+        self.assertEqual(responder("prompt two"), "response two")
+
+        with self.assertRaises(KeyError):
+            responder("changed prompt")
+
+        responder.expect(records[0])
+        self.assertEqual(responder("changed prompt"), "response one")
+        self.assertEqual(responder.prompt_matches, 1)
+        self.assertEqual(responder.prompt_mismatches, 1)
+
+    def test_replay_recorded_pace(self):
+        """Recorded pace waits for the recorded LLM time"""
+        recorder = EvaluationTraceRecorder(str(self.trace_file))
+        recorder.record(self.contribution, "prompt", "response", {"llm": 0.2}, success=True)
+
+        responder = ReplayResponder(load_trace(str(self.trace_file)), pace=PACE_RECORDED)
+        start = time.time()
+        responder("prompt")
+        self.assertGreaterEqual(time.time() - start, 0.2)
+
+        with self.assertRaises(ValueError):
+            ReplayResponder([], pace="slow")
+
+
+def run_evaluation_trace_tests():
+    """Run evaluation trace tests with framework"""
+    TestUtils.print_test_header(
+        "Evaluation Trace Unit Test Suite",
+        "Testing evaluation record/replay"
+    )
+
+    import unittest
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestEvaluationTrace)
+
+    runner = unittest.TextTestRunner(verbosity=2)
+    result = runner.run(suite)
+    return result.wasSuccessful()
+
+
+if __name__ == "__main__":
+    import unittest
+    unittest.main()
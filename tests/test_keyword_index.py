@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Keyword Index Test Suite
+Tests for the RAG API's keyword retrieval:
+- Tokenization of compound identifiers (DOIs, versions) and stopwords
+- BM25 ranking over the inverted index
+- Saving and loading the index
+- Reciprocal rank fusion of vector and keyword rankings
+
+Dependencies: Pure Python.
+Services: None - no API calls.
+Isolation: Synthetic documents; index files in a temporary directory.
+"""
+
+import sys
+import time
+import random
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add test framework to path
+test_dir = Path(__file__).parent
+sys.path.insert(0, str(test_dir))
+sys.path.insert(0, str(test_dir.parent / "src"))
+
+from test_framework import SyntheverseTestCase, TestUtils
+
+from core.utils.keyword_index import BM25Index, reciprocal_rank_fusion, tokenize
+
+DOCUMENTS = [
+    "Hydrogen holography encodes the fractal grammar of awareness.",
+    "The HHFE model is described in doi 10.5281/zenodo.17009840 by the Syntheverse team.",
+    "Proof of contribution scores submissions for novelty, density and coherence.",
+    "Hydrogen hydrogen hydrogen: a hydrogen-rich note on hydrogen.",
+    "",
+]
+
+
+class TestKeywordIndex(SyntheverseTestCase):
+    """Test tokenization and BM25 ranking."""
+
+    def get_category(self) -> str:
+        """Return test category for reporting"""
+        return "unit"
+
+    def setUp(self):
+        super().setUp()
+        self.index = BM25Index.build(DOCUMENTS)
+
+    def test_tokenize(self):
+        """Compound tokens are kept whole and split; stopwords are dropped"""
+        tokens = tokenize("The DOI is 10.5281/zenodo.17009840 for HHFE v1.2")
+        self.assertIn("10.5281/zenodo.17009840", tokens)
+        self.assertIn("zenodo", tokens)
+        self.assertIn("hhfe", tokens)
+        self.assertIn("v1.2", tokens)
+        self.assertNotIn("the", tokens)
+        self.assertNotIn("is", tokens)
+
+    def test_ranking(self):
+        """Exact terms rank the documents containing them; others are left out"""
+        results = self.index.search("HHFE", top_k=5)
+        self.assertEqual([position for position, _ in results], [1])
+
+        results = self.index.search("10.5281/zenodo.17009840", top_k=5)
+        self.assertEqual(results[0][0], 1)
+
+        results = self.index.search("hydrogen holography", top_k=5)
+        self.assertEqual(results[0][0], 0)  # Both terms beat one repeated term
+        self.assertEqual({position for position, _ in results}, {0, 3})
+        self.assertGreater(results[0][1], results[1][1])
+
+        self.assertEqual(self.index.search("blockchain", top_k=5), [])
+        self.assertEqual(self.index.search("the and of", top_k=5), [])
+        self.assertEqual(len(self.index), len(DOCUMENTS))
+
+    def test_idf(self):
+        """Rare terms weigh more than common ones"""
+        index = BM25Index.build(["fractal hydrogen", "fractal grammar", "fractal awareness"])
+        self.assertGreater(index.idf("grammar"), index.idf("fractal"))
+        self.assertEqual(index.idf("missing"), 0.0)
+
+    def test_save_load(self):
+        """A saved index loads with the same results and metadata"""
+        self.index.meta = {"corpus_chunks": len(DOCUMENTS)}
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "bm25.json"
+            self.index.save(str(path))
+            loaded = BM25Index.load(str(path))
+
+            self.assertEqual(loaded.meta, {"corpus_chunks": len(DOCUMENTS)})
+            self.assertEqual(loaded.stats(), self.index.stats())
+            for query in ("hydrogen holography", "HHFE", "novelty coherence"):
+                self.assertEqual(loaded.search(query, 3), self.index.search(query, 3))
+
+            path.write_text('{"format_version": 0}')
+            with self.assertRaises(ValueError):
+                BM25Index.load(str(path))
+
+    def test_search_time(self):
+        """Keyword queries over thousands of chunks take milliseconds"""
+        rng = random.Random(7)
+        vocabulary = [f"term{i}" for i in range(5000)]
+        texts = [" ".join(rng.choices(vocabulary, k=120)) for _ in range(5000)]
+        index = BM25Index.build(texts)
+
+        started = time.perf_counter()
+        for i in range(20):
+            index.search(f"term{i} term{i + 100} term{i + 200}", top_k=10)
+        per_query = (time.perf_counter() - started) / 20
+        self.assertLess(per_query, 0.05)
+
+
+class TestReciprocalRankFusion(SyntheverseTestCase):
+    """Test fusion of rankings."""
+
+    def get_category(self) -> str:
+        """Return test category for reporting"""
+        return "unit"
+
+    def test_fusion(self):
+        """Documents ranked well in both rankings come first"""
+        vector = [(1, 0.9), (2, 0.8), (3, 0.7)]
+        keyword = [(3, 12.0), (1, 8.0), (4, 2.0)]
+        fused = reciprocal_rank_fusion([vector, keyword], k=60)
+
+        self.assertEqual([position for position, _ in fused], [1, 3, 2, 4])
+        self.assertAlmostEqual(fused[0][1], 1 / 61 + 1 / 62)
+        self.assertEqual(reciprocal_rank_fusion([]), [])
+
+    def test_weights(self):
+        """Weights shift the fused order toward a ranking"""
+        vector = [(1, 0.9), (2, 0.8)]
+        keyword = [(2, 5.0), (1, 4.0)]
+        self.assertEqual(reciprocal_rank_fusion([vector, keyword], weights=[2.0, 1.0])[0][0], 1)
+        self.assertEqual(reciprocal_rank_fusion([vector, keyword], weights=[1.0, 2.0])[0][0], 2)
+
+
+def run_keyword_index_tests():
+    """Run keyword index tests with framework"""
+    TestUtils.print_test_header(
+        "Keyword Index Test Suite",
+        "Testing BM25 keyword search and rank fusion"
+    )
+
+    suite = unittest.TestSuite()
+    for case in (TestKeywordIndex, TestReciprocalRankFusion):
+        suite.addTests(unittest.TestLoader().loadTestsFromTestCase(case))
+    runner = unittest.TextTestRunner(verbosity=2)
+    result = runner.run(suite)
+    return result.wasSuccessful()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Local LLM Stand-in Test Suite
+Tests for the OpenAI-compatible local stand-in server used for load testing:
+- Model listing and chat completions over HTTP
+- Valid HHFE score JSON for evaluation prompts
+- Token streaming and injected rate limits
+
+Dependencies: requests (stand-in server is pure Python).
+Services: Starts the stand-in server in-process on a free port.
+"""
+
+import re
+import sys
+import json
+import threading
+from pathlib import Path
+
+# Add test framework to path
+test_dir = Path(__file__).parent
+sys.path.insert(0, str(test_dir))
+sys.path.insert(0, str(test_dir.parent / "scripts" / "development"))
+
+import requests
+
+from test_framework import SyntheverseTestCase, TestUtils
+
+from local_llm_server import StandInConfig, create_server, parse_latency
+
+
+class TestLocalLLMServer(SyntheverseTestCase):
+    """Test the local stand-in server over HTTP."""
+
+    def get_category(self) -> str:
+        """Return test category for reporting"""
+        return "integration"
+
+    def _start(self, **config_kwargs) -> str:
+        config_kwargs.setdefault("latency", "fixed:0")
+        config_kwargs.setdefault("tokens_per_second", 0)
+        server = create_server(port=0, config=StandInConfig(seed=7, **config_kwargs))
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        return f"http://127.0.0.1:{server.server_address[1]}/v1"
+
+    def test_models_and_evaluation_json(self):
+        """Evaluation prompts get parseable HHFE score JSON"""
+        base_url = self._start()
+
+        models = requests.get(f"{base_url}/models", timeout=5).json()
+        self.assertIn("llama-3.1-8b-instant", [m["id"] for m in models["data"]])
+
+        messages = [
+            {"role": "system", "content": "You are Syntheverse PoC Reviewer evaluating contributions using the HHFE."},
+            {"role": "user", "content": "EVALUATE THIS CONTRIBUTION (Proof of Contribution):\nTitle: Test"}
+        ]
+        response = requests.post(f"{base_url}/chat/completions", json={"model": "llama-3.1-8b-instant", "messages": messages}, timeout=5)
+        self.assertEqual(response.status_code, 200)
+
+        content = response.json()["choices"][0]["message"]["content"]
+        scores = json.loads(re.search(r"\{.*\}", content, re.DOTALL).group(0))
+        for key in ("coherence", "density", "redundancy", "pod_score", "metals", "status"):
+            self.assertIn(key, scores)
+        self.assertTrue(0 <= scores["coherence"] <= 10000)
+
+        # Same prompt, same scores
+        again = requests.post(f"{base_url}/chat/completions", json={"messages": messages}, timeout=5).json()
+        self.assertEqual(again["choices"][0]["message"]["content"], content)
+
+    def test_streaming(self):
+        """Streaming responses are server-sent chunks ending with [DONE]"""
+        base_url = self._start()
+
+        response = requests.post(
+            f"{base_url}/chat/completions",
+            json={"messages": [{"role": "user", "content": "What is the Syntheverse?"}], "stream": True},
+            stream=True,
+            timeout=5
+        )
+        lines = [line.decode("utf-8") for line in response.iter_lines() if line]
+
+        self.assertEqual(lines[-1], "data: [DONE]")
+        text = "".join(json.loads(line[6:])["choices"][0]["delta"].get("content", "") for line in lines[:-1])
+        self.assertIn("Syntheverse", text)
+
+    def test_injected_rate_limit(self):
+        """Rate limit injection answers 429 with Retry-After"""
+        base_url = self._start(rate_limit_probability=1.0)
+
+        response = requests.post(f"{base_url}/chat/completions", json={"messages": [{"role": "user", "content": "hi"}]}, timeout=5)
+        self.assertEqual(response.status_code, 429)
+        self.assertIn("Retry-After", response.headers)
+
+    def test_latency_specs(self):
+        """Latency specs parse and invalid specs are rejected"""
+        import random
+        rng = random.Random(1)
+        self.assertEqual(parse_latency("fixed:0.5")(rng), 0.5)
+        self.assertTrue(0.1 <= parse_latency("uniform:0.1,0.2")(rng) <= 0.2)
+        self.assertGreater(parse_latency("lognormal:-1,0.5")(rng), 0)
+        with self.assertRaises(ValueError):
+            parse_latency("pareto:1")
+
+
+def run_local_llm_server_tests():
+    """Run local LLM stand-in tests with framework"""
+    TestUtils.print_test_header(
+        "Local LLM Stand-in Test Suite",
+        "Testing the OpenAI-compatible stand-in server"
+    )
+
+    import unittest
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestLocalLLMServer)
+
+    runner = unittest.TextTestRunner(verbosity=2)
+    result = runner.run(suite)
+    return result.wasSuccessful()
+
+
+if __name__ == "__main__":
+    import unittest
+    unittest.main()
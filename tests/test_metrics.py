@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Metrics Test Suite
+Tests for the shared Prometheus metrics module:
+- Counter, gauge and histogram rendering in the text exposition format
+- Scrape-time callback gauges
+- ASGI request middleware
+- LLM provider, cache and archive save instrumentation
+
+Dependencies: Pure Python.
+Services: None - no API calls.
+Isolation: Uses temporary directories with automatic cleanup.
+"""
+
+import sys
+import json
+import shutil
+import asyncio
+import tempfile
+import threading
+from pathlib import Path
+
+# Add test framework to path
+test_dir = Path(__file__).parent
+sys.path.insert(0, str(test_dir))
+
+from test_framework import SyntheverseTestCase, TestUtils
+
+from core.utils import Provider, ProviderRouter
+from core.utils.metrics import (
+    MetricsRegistry, REGISTRY, HTTP_REQUEST_DURATION, LLM_REQUEST_ERRORS,
+    asgi_metrics_middleware, record_cache, render_metrics
+)
+from layer2.poc_server import PoCServer
+
+
+def sample_value(text: str, series: str) -> float:
+    """Value of one series line in rendered metrics."""
+    for line in text.splitlines():
+        if line.startswith(series + " "):
+            return float(line.rsplit(" ", 1)[1])
+    raise AssertionError(f"{series} not found in metrics")
+
+
+class FakeRequest:
+    def __init__(self, method, route_path):
+        self.method = method
+        self.scope = {"route": type("Route", (), {"path": route_path})()} if route_path else {}
+
+
+class FakeResponse:
+    status_code = 201
+
+
+class TestMetrics(SyntheverseTestCase):
+    """Test metric types, rendering and pipeline instrumentation."""
+
+    def get_category(self) -> str:
+        """Return test category for reporting"""
+        return "unit"
+
+    def test_rendering(self):
+        """Metrics render in the Prometheus text format"""
+        registry = MetricsRegistry()
+        requests = registry.counter("requests_total", "Requests", ("route",))
+        requests.labels(route='/a"b').inc()
+        requests.labels(route='/a"b').inc(2)
+        latency = registry.histogram("latency_seconds", "Latency", buckets=(0.1, 1.0))
+        for value in (0.05, 0.5, 5.0):
+            latency.observe(value)
+        registry.gauge("depth", "Depth").set(3)
+
+        text = registry.render()
+        self.assertIn("# TYPE requests_total counter", text)
+        self.assertEqual(sample_value(text, 'requests_total{route="/a\\"b"}'), 3)
+        self.assertEqual(sample_value(text, 'latency_seconds_bucket{le="0.1"}'), 1)
+        self.assertEqual(sample_value(text, 'latency_seconds_bucket{le="1"}'), 2)
+        self.assertEqual(sample_value(text, 'latency_seconds_bucket{le="+Inf"}'), 3)
+        self.assertEqual(sample_value(text, "latency_seconds_count"), 3)
+        self.assertAlmostEqual(sample_value(text, "latency_seconds_sum"), 5.55)
+        self.assertEqual(sample_value(text, "depth"), 3)
+        self.assertTrue(text.endswith("\n"))
+
+        # Re-registering returns the same metric; conflicting definitions are refused
+        self.assertIs(registry.counter("requests_total", "Requests", ("route",)), requests)
+        with self.assertRaises(ValueError):
+            registry.gauge("requests_total", "Requests")
+        with self.assertRaises(ValueError):
+            requests.inc()
+
+    def test_callback_gauge(self):
+        """Callback gauges are read at scrape time"""
+        registry = MetricsRegistry()
+        depth = registry.gauge("queue_depth", "Queue depth", ("priority",))
+        queue = {"admin": 0, "standard": 4}
+        depth.set_function(lambda: dict(queue))
+        self.assertEqual(sample_value(registry.render(), 'queue_depth{priority="standard"}'), 4)
+        queue["standard"] = 1
+        self.assertEqual(sample_value(registry.render(), 'queue_depth{priority="standard"}'), 1)
+
+        depth.set_function(lambda: 1 / 0)
+        self.assertNotIn("queue_depth{", registry.render())
+
+    def test_concurrent_updates(self):
+        """Counters are exact under concurrent increments"""
+        registry = MetricsRegistry()
+        counter = registry.counter("hits_total", "Hits", ("worker",))
+
+        def work():
+            for _ in range(2000):
+                counter.labels(worker="w").inc()
+
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(sample_value(registry.render(), 'hits_total{worker="w"}'), 16000)
+
+    def test_asgi_middleware(self):
+        """The ASGI middleware labels requests by route template"""
+        middleware = asgi_metrics_middleware("test-api")
+
+        async def call_next(request):
+            return FakeResponse()
+
+        async def failing_call_next(request):
+            raise RuntimeError("boom")
+
+        asyncio.run(middleware(FakeRequest("GET", "/api/status/{submission_hash}"), call_next))
+        with self.assertRaises(RuntimeError):
+            asyncio.run(middleware(FakeRequest("POST", None), failing_call_next))
+
+        text = render_metrics()
+        self.assertGreaterEqual(sample_value(
+            text, 'http_request_duration_seconds_count{service="test-api",method="GET",'
+                  'route="/api/status/{submission_hash}",status="201"}'
+        ), 1)
+        self.assertGreaterEqual(sample_value(
+            text, 'http_request_duration_seconds_count{service="test-api",method="POST",route="unmatched",status="500"}'
+        ), 1)
+        self.assertEqual(sample_value(text, 'http_requests_in_flight{service="test-api"}'), 0)
+
+    def test_provider_metrics(self):
+        """LLM calls record latency per provider and errors"""
+        def failing(request, cancel_event):
+            raise RuntimeError("rate limited")
+
+        router = ProviderRouter([
+            Provider("metrics-flaky", failing, hedge_after=5.0),
+            Provider("metrics-ok", lambda request, cancel_event: "answer", hedge_after=5.0),
+        ])
+        errors_before = LLM_REQUEST_ERRORS.labels(provider="metrics-flaky").value
+        self.assertEqual(router.call({}), "answer")
+
+        text = render_metrics()
+        self.assertEqual(LLM_REQUEST_ERRORS.labels(provider="metrics-flaky").value, errors_before + 1)
+        self.assertGreaterEqual(sample_value(
+            text, 'llm_request_duration_seconds_count{provider="metrics-ok",outcome="success"}'
+        ), 1)
+
+    def test_pipeline_metrics(self):
+        """Archive saves, cache lookups and queue gauges are exported"""
+        work_dir = Path(tempfile.mkdtemp(prefix="metrics_"))
+        self.addCleanup(shutil.rmtree, work_dir, True)
+        server = PoCServer(
+            output_dir=str(work_dir / "poc_reports"),
+            tokenomics_state_file=str(work_dir / "l2_tokenomics_state.json"),
+            archive_file=str(work_dir / "poc_archive.json"),
+            llm_responder=lambda prompt: json.dumps({"coherence": 8000, "density": 7000, "redundancy": 1000})
+        )
+        self.addCleanup(server.evaluation_scheduler.shutdown, False)
+        server.register_metrics()
+
+        hits_before = REGISTRY.get("cache_requests_total").labels(cache="evaluation_result", result="hit").value
+        server.archive.add_contribution("paper-a", "Fractal Grammar", "alice", "Recursive hydrogen holography.")
+        server.schedule_evaluation("paper-a").wait(10)
+        server.schedule_evaluation("paper-a").wait(10)
+        record_cache("pdf_text", False)
+
+        text = render_metrics()
+        self.assertGreaterEqual(sample_value(text, 'archive_save_duration_seconds_count{archive="poc_archive"}'), 2)
+        self.assertEqual(
+            REGISTRY.get("cache_requests_total").labels(cache="evaluation_result", result="hit").value,
+            hits_before + 1
+        )
+        self.assertEqual(sample_value(text, "poc_archive_contributions"), 1)
+        self.assertEqual(sample_value(text, 'poc_evaluation_queue_depth{priority="standard"}'), 0)
+        self.assertEqual(sample_value(text, "poc_evaluations_running"), 0)
+        self.assertIn("# TYPE http_request_duration_seconds histogram", text)
+        self.assertIs(REGISTRY.get("http_request_duration_seconds"), HTTP_REQUEST_DURATION)
+
+
+def run_metrics_tests():
+    """Run metrics tests with framework"""
+    TestUtils.print_test_header(
+        "Metrics Test Suite",
+        "Testing Prometheus metrics rendering and instrumentation"
+    )
+
+    import unittest
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestMetrics)
+    runner = unittest.TextTestRunner(verbosity=2)
+    result = runner.run(suite)
+    return result.wasSuccessful()
+
+
+if __name__ == "__main__":
+    import unittest
+    unittest.main()
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Micro-Batching Test Suite
+Tests for the micro-batcher in front of RAG query embedding and search:
+- Concurrent submissions processed together, up to the batch size
+- Results delivered to each caller in order
+- Batch failures propagated to every caller
+- Batch counters and the batch_size metric
+
+Dependencies: Pure Python.
+Services: None - no API calls.
+Isolation: In-process batch functions; batchers are closed after each test.
+"""
+
+import sys
+import time
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Add test framework to path
+test_dir = Path(__file__).parent
+sys.path.insert(0, str(test_dir))
+sys.path.insert(0, str(test_dir.parent / "src"))
+
+from test_framework import SyntheverseTestCase, TestUtils
+
+from core.utils.batching import MicroBatcher
+from core.utils.metrics import render_metrics
+
+
+def batch_count(batcher: str) -> float:
+    series = f'batch_size_count{{batcher="{batcher}"}}'
+    for line in render_metrics().splitlines():
+        if line.startswith(series + " "):
+            return float(line.rsplit(" ", 1)[1])
+    return 0.0
+
+
+class TestMicroBatcher(SyntheverseTestCase):
+    """Test grouping of concurrent submissions."""
+
+    def get_category(self) -> str:
+        """Return test category for reporting"""
+        return "unit"
+
+    def setUp(self):
+        super().setUp()
+        self.batches = []
+        self.lock = threading.Lock()
+
+    def encode(self, items):
+        with self.lock:
+            self.batches.append(list(items))
+        time.sleep(0.01)  # Model call cost
+        return [item.upper() for item in items]
+
+    def test_concurrent_items_are_batched(self):
+        """Concurrent submissions share batches and each caller gets its own result"""
+        batcher = MicroBatcher(self.encode, max_batch=8, max_wait=0.05, name="test_concurrent")
+        queries = [f"query {i}" for i in range(16)]
+        try:
+            with ThreadPoolExecutor(max_workers=16) as pool:
+                results = list(pool.map(batcher, queries))
+        finally:
+            batcher.close()
+
+        self.assertEqual(results, [query.upper() for query in queries])
+        self.assertLess(len(self.batches), len(queries))
+        self.assertTrue(all(len(batch) <= 8 for batch in self.batches))
+        stats = batcher.stats()
+        self.assertEqual(stats["items"], 16)
+        self.assertEqual(stats["batches"], len(self.batches))
+        self.assertGreater(stats["mean_batch_size"], 1.0)
+
+    def test_single_item_waits_at_most_max_wait(self):
+        """A lone submission is processed after the wait window"""
+        batcher = MicroBatcher(self.encode, max_batch=8, max_wait=0.005, name="test_single")
+        try:
+            start = time.perf_counter()
+            self.assertEqual(batcher("hhfe"), "HHFE")
+            self.assertLess(time.perf_counter() - start, 0.5)
+        finally:
+            batcher.close()
+        self.assertEqual(self.batches, [["hhfe"]])
+
+    def test_failure_reaches_every_caller(self):
+        """An exception in the batch function fails all items of the batch"""
+        def broken(items):
+            raise RuntimeError("model unavailable")
+
+        batcher = MicroBatcher(broken, max_batch=4, max_wait=0.05, name="test_failure")
+        try:
+            futures = [batcher.submit(i) for i in range(3)]
+            for future in futures:
+                with self.assertRaises(RuntimeError):
+                    future.result(timeout=2)
+        finally:
+            batcher.close()
+
+    def test_result_count_checked(self):
+        """A batch function returning the wrong number of results fails the batch"""
+        batcher = MicroBatcher(lambda items: items[:1], max_batch=4, max_wait=0.05, name="test_count")
+        try:
+            futures = [batcher.submit(i) for i in range(2)]
+            with self.assertRaises(RuntimeError):
+                futures[1].result(timeout=2)
+        finally:
+            batcher.close()
+
+    def test_metrics(self):
+        """Each batch is observed in batch_size"""
+        before = batch_count("test_metrics")
+        batcher = MicroBatcher(self.encode, max_batch=4, max_wait=0.0, name="test_metrics")
+        try:
+            batcher("a")
+            batcher("b")
+        finally:
+            batcher.close()
+        self.assertEqual(batch_count("test_metrics") - before, 2)
+
+    def test_close_processes_queued_items(self):
+        """Items queued before close() are still processed"""
+        batcher = MicroBatcher(self.encode, max_batch=2, max_wait=0.05, name="test_close")
+        futures = [batcher.submit(f"q{i}") for i in range(5)]
+        batcher.close(timeout=5)
+        self.assertEqual([future.result(timeout=1) for future in futures], ["Q0", "Q1", "Q2", "Q3", "Q4"])
+
+
+def run_micro_batching_tests():
+    """Run micro-batching tests with framework"""
+    TestUtils.print_test_header(
+        "Micro-Batching Test Suite",
+        "Testing batched processing of concurrent queries"
+    )
+
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestMicroBatcher)
+    runner = unittest.TextTestRunner(verbosity=2)
+    result = runner.run(suite)
+    return result.wasSuccessful()
+
+
+if __name__ == "__main__":
+    unittest.main()
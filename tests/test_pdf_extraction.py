@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+PDF Extraction Service Test Suite
+Tests for parallel, cached PDF text extraction:
+- Page order across parallel page ranges
+- SHA-256 keyed disk cache (hits, content changes, no partial entries)
+- Per-document timeout with worker pool recovery, sparing concurrent documents
+- Inline extraction when no worker processes are configured
+- Workers not re-running the module-level code of the script that started them
+
+Dependencies: Pure Python (page parsing is replaced by plain-text fixtures,
+so PyPDF2 is not required).
+Services: None - no API calls.
+"""
+
+import sys
+import time
+import shutil
+import subprocess
+import tempfile
+import threading
+from pathlib import Path
+
+# Add test framework to path
+test_dir = Path(__file__).parent
+sys.path.insert(0, str(test_dir))
+
+from test_framework import SyntheverseTestCase, TestUtils
+
+from layer2.pdf_extraction import PDFExtractionError, PDFExtractionService, file_sha256
+
+PAGE_BREAK = "\f"
+
+
+# Module-level fixtures so worker processes can unpickle them
+def count_fixture_pages(path: str) -> int:
+    return len(Path(path).read_text(encoding="utf-8").split(PAGE_BREAK))
+
+
+def extract_fixture_pages(path: str, start: int, stop: int):
+    pages = Path(path).read_text(encoding="utf-8").split(PAGE_BREAK)
+    if any("SLOW" in page for page in pages[start:stop]):
+        time.sleep(30)
+    if any("WAIT" in page for page in pages[start:stop]):
+        time.sleep(1.5)
+    if any("BROKEN" in page for page in pages[start:stop]):
+        raise ValueError("corrupt page")
+    return pages[start:stop]
+
+
+class TestPDFExtraction(SyntheverseTestCase):
+    """Test parallel extraction, caching and timeouts."""
+
+    def get_category(self) -> str:
+        """Return test category for reporting"""
+        return "unit"
+
+    def setUp(self):
+        super().setUp()
+        self.work_dir = Path(tempfile.mkdtemp(prefix="pdf_extraction_"))
+        self.services = []
+
+    def tearDown(self):
+        for service in self.services:
+            service.close()
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+        super().tearDown()
+
+    def _service(self, **kwargs) -> PDFExtractionService:
+        kwargs.setdefault("cache_dir", str(self.work_dir / "cache"))
+        kwargs.setdefault("max_workers", 2)
+        kwargs.setdefault("pages_per_task", 3)
+        service = PDFExtractionService(
+            page_counter=count_fixture_pages,
+            page_extractor=extract_fixture_pages,
+            **kwargs
+        )
+        self.services.append(service)
+        return service
+
+    def _document(self, name: str, pages) -> str:
+        path = self.work_dir / name
+        path.write_text(PAGE_BREAK.join(pages), encoding="utf-8")
+        return str(path)
+
+    def test_pages_in_order(self):
+        """Pages extracted in parallel ranges are yielded in document order"""
+        pages = [f"page {i}" for i in range(20)]
+        service = self._service()
+
+        self.assertEqual(list(service.iter_pages(self._document("doc.pdf", pages))), pages)
+        self.assertEqual(service.extract_text(self._document("doc.pdf", pages)), "\n".join(pages))
+        self.assertIsNone(self._service(cache_dir=None).extract_text(self._document("blank.pdf", [" ", ""])))
+
+    def test_cache_by_content_hash(self):
+        """Identical files hit the cache; changed content is re-extracted"""
+        service = self._service()
+        first = self._document("a.pdf", ["alpha", "beta"])
+        copy = self._document("b.pdf", ["alpha", "beta"])
+
+        service.extract_text(first)
+        self.assertEqual(service.extract_text(copy), "alpha\nbeta")
+        self.assertEqual(service.stats["extracted"], 1)
+        self.assertEqual(service.stats["cache_hits"], 1)
+        self.assertTrue((self.work_dir / "cache" / f"{file_sha256(first)}.jsonl").exists())
+
+        changed = self._document("a.pdf", ["alpha", "gamma"])
+        self.assertEqual(service.extract_text(changed), "alpha\ngamma")
+        self.assertEqual(service.stats["extracted"], 2)
+
+    def test_failure_leaves_no_cache_entry(self):
+        """Failed extractions raise and are not cached"""
+        service = self._service()
+        path = self._document("broken.pdf", ["ok"] * 4 + ["BROKEN"])
+
+        with self.assertRaises(PDFExtractionError):
+            service.extract_text(path)
+        self.assertEqual(list((self.work_dir / "cache").iterdir()), [])
+
+    def test_timeout_recovers_pool(self):
+        """A stuck document times out and later documents still extract"""
+        service = self._service(timeout=1.0)
+        stuck = self._document("stuck.pdf", ["SLOW"])
+
+        start = time.perf_counter()
+        with self.assertRaises(PDFExtractionError):
+            service.extract_text(stuck)
+        self.assertLess(time.perf_counter() - start, 10)
+        self.assertEqual(service.stats["timeouts"], 1)
+
+        self.assertEqual(service.extract_text(self._document("fine.pdf", ["fine"])), "fine")
+
+    def test_timeout_spares_concurrent_documents(self):
+        """A document running when another times out still completes; the old pool is then terminated"""
+        service = self._service(timeout=3.0)
+        service.extract_text(self._document("warm.pdf", ["warm"]))  # Start the workers
+        stuck = self._document("stuck.pdf", ["SLOW"])
+        errors = []
+
+        def _extract_stuck():
+            try:
+                service.extract_text(stuck)
+            except PDFExtractionError as e:
+                errors.append(e)
+
+        thread = threading.Thread(target=_extract_stuck)
+        thread.start()
+        time.sleep(2.0)  # The healthy document is still running when the stuck one times out
+        self.assertEqual(service.extract_text(self._document("slow.pdf", ["WAIT"])), "WAIT")
+        thread.join()
+
+        self.assertEqual(len(errors), 1)
+        self.assertEqual(service.stats["timeouts"], 1)
+        self.assertEqual(service.stats["extracted"], 2)
+        self.assertEqual(service._retired, set())
+        self.assertEqual(service.extract_text(self._document("fine.pdf", ["fine"])), "fine")
+
+    def test_inline_extraction(self):
+        """max_workers=0 extracts on the calling thread"""
+        service = self._service(max_workers=0)
+        pages = [f"p{i}" for i in range(7)]
+
+        self.assertEqual(list(service.iter_pages(self._document("inline.pdf", pages))), pages)
+        self.assertIsNone(service._pool)
+
+    def test_workers_skip_entry_script(self):
+        """Starting the pool from a script does not run the script's module-level code in the workers"""
+        marker = self.work_dir / "module_runs.txt"
+        document = self._document("script.pdf", ["one", "two", "three"])
+        script = self.work_dir / "entry_script.py"
+        script.write_text(
+            "import os, sys\n"
+            f"sys.path[:0] = {[str(test_dir), str(test_dir.parent / 'src' / 'core'), str(test_dir.parent / 'src')]!r}\n"
+            "# Module-level setup, like app.py building its PoCServer\n"
+            f"with open({str(marker)!r}, 'a') as f:\n"
+            "    f.write(f'{os.getpid()}\\n')\n"
+            "from layer2.pdf_extraction import PDFExtractionService\n"
+            "from test_pdf_extraction import count_fixture_pages, extract_fixture_pages\n"
+            "service = PDFExtractionService(max_workers=2, pages_per_task=1,\n"
+            "                               page_counter=count_fixture_pages, page_extractor=extract_fixture_pages)\n"
+            f"print(service.extract_text({document!r}, separator='|'))\n"
+            "service.close()\n",
+            encoding="utf-8"
+        )
+
+        result = subprocess.run(
+            [sys.executable, str(script)], capture_output=True, text=True, timeout=60, cwd=str(self.work_dir)
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(result.stdout.strip(), "one|two|three")
+        self.assertEqual(len(marker.read_text().split()), 1)
+
+
+def run_pdf_extraction_tests():
+    """Run PDF extraction tests with framework"""
+    TestUtils.print_test_header(
+        "PDF Extraction Test Suite",
+        "Testing parallel, cached PDF text extraction"
+    )
+
+    import unittest
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestPDFExtraction)
+    runner = unittest.TextTestRunner(verbosity=2)
+    result = runner.run(suite)
+    return result.wasSuccessful()
+
+
+if __name__ == "__main__":
+    import unittest
+    unittest.main()
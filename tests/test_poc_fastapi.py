@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+PoC FastAPI Server Test Suite
+Tests for the FastAPI PoC server (src/api/poc-api/server.py) driven through its ASGI app:
+- Waiting for an evaluation does not block the event loop
+- Concurrent evaluation requests for one submission share a single evaluation
+- Progress streams opened before submitting deliver events while the evaluation runs
+
+Dependencies: fastapi, httpx, python-multipart (the FastAPI server's own dependencies).
+Services: None - requests go to the ASGI app in-process; LLM calls are replaced by an injected responder.
+Isolation: The server's PoCServer is replaced by one over temporary state files.
+"""
+
+import sys
+import json
+import time
+import shutil
+import asyncio
+import tempfile
+import unittest
+import importlib.util
+from pathlib import Path
+from unittest import mock
+
+# Add test framework to path
+test_dir = Path(__file__).parent
+sys.path.insert(0, str(test_dir))
+
+from test_framework import SyntheverseTestCase, TestUtils
+from test_evaluation_dedup import CountingResponder
+
+from layer2.poc_server import PoCServer
+
+SERVER_PATH = test_dir.parent / "src" / "api" / "poc-api" / "server.py"
+
+
+def load_server_module():
+    """Import server.py (its directory name is not a valid package name)."""
+    if "poc_fastapi_server" not in sys.modules:
+        spec = importlib.util.spec_from_file_location("poc_fastapi_server", SERVER_PATH)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        sys.modules["poc_fastapi_server"] = module
+    return sys.modules["poc_fastapi_server"]
+
+
+async def wait_until(condition, timeout: float = 5.0):
+    """Poll condition without blocking the event loop."""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not met in time")
+        await asyncio.sleep(0.01)
+
+
+async def open_stream(app, path: str, chunks: asyncio.Queue, disconnect: asyncio.Event):
+    """
+    GET path on an ASGI app, putting each response body chunk on chunks as it is sent.
+
+    httpx's ASGITransport only returns a response once the app has finished, so
+    streamed responses are driven directly.
+    """
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"poc-api"), (b"accept", b"text/event-stream")],
+        "client": ("127.0.0.1", 50000),
+        "server": ("poc-api", 80),
+    }
+
+    async def receive():
+        await disconnect.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            await chunks.put(message["status"])
+        elif message["type"] == "http.response.body" and message.get("body"):
+            await chunks.put(message["body"].decode())
+
+    await app(scope, receive, send)
+
+
+async def next_event(chunks: asyncio.Queue, timeout: float = 5.0) -> dict:
+    """Next progress event of an SSE stream (skipping retry and keep-alive lines)."""
+    while True:
+        chunk = await asyncio.wait_for(chunks.get(), timeout)
+        for line in chunk.splitlines():
+            if line.startswith("data: "):
+                return json.loads(line[len("data: "):])
+
+
+class TestPoCFastAPI(SyntheverseTestCase):
+    """Test the FastAPI PoC server's request handling."""
+
+    def get_category(self) -> str:
+        """Return test category for reporting"""
+        return "unit"
+
+    def setUp(self):
+        super().setUp()
+        self.ensure_dependency("httpx")
+        self.ensure_module("python_multipart", "python-multipart")  # Form parsing for /api/submit
+        import httpx
+        self.httpx = httpx
+        self.server_module = load_server_module()
+
+        self.work_dir = Path(tempfile.mkdtemp(prefix="poc_fastapi_"))
+        self.responder = CountingResponder()
+        self.poc_server = PoCServer(
+            output_dir=str(self.work_dir / "poc_reports"),
+            tokenomics_state_file=str(self.work_dir / "l2_tokenomics_state.json"),
+            archive_file=str(self.work_dir / "poc_archive.json"),
+            llm_responder=self.responder
+        )
+        self.addCleanup(self.poc_server.evaluation_scheduler.shutdown, False)
+        self.assertTrue(self.poc_server.wait_until_ready(10))
+
+        patcher = mock.patch.object(self.server_module, "poc_server", self.poc_server)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self.responder.release.set()
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+        super().tearDown()
+
+    def _client(self):
+        transport = self.httpx.ASGITransport(app=self.server_module.app)
+        return self.httpx.AsyncClient(transport=transport, base_url="http://poc-api")
+
+    def test_concurrent_evaluations_share_one(self):
+        """Two concurrent /api/evaluate requests run one evaluation while the server keeps answering"""
+        self.poc_server.archive.add_contribution(
+            "paper-a", "Fractal Grammar", "alice", "Hydrogen holographic fractal grammar closes recursively."
+        )
+        self.responder.release.clear()
+        scheduler = self.poc_server.evaluation_scheduler
+
+        async def _scenario():
+            async with self._client() as client:
+                first = asyncio.create_task(client.post("/api/evaluate/paper-a"))
+                second = asyncio.create_task(client.post("/api/evaluate/paper-a"))
+                # Both requests reach the scheduler while the evaluation is held
+                await wait_until(lambda: self.responder.started.is_set() and scheduler.stats()["coalesced"] == 1)
+                health = await client.get("/health")
+                self.responder.release.set()
+                return await asyncio.gather(first, second), health
+
+        (first, second), health = asyncio.run(_scenario())
+        self.assertEqual(health.status_code, 200)
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(first.json(), second.json())
+        self.assertTrue(first.json()["success"])
+        self.assertEqual(self.responder.calls, 1)
+
+    def test_submit_does_not_block(self):
+        """The server answers other requests while a submission is being evaluated"""
+        self.responder.release.clear()
+
+        async def _scenario():
+            async with self._client() as client:
+                submit = asyncio.create_task(client.post("/api/submit", data={
+                    "submission_hash": "paper-b",
+                    "title": "Fractal Grammar",
+                    "contributor": "alice",
+                    "text_content": "Hydrogen holographic fractal grammar closes recursively."
+                }))
+                await wait_until(self.responder.started.is_set)
+                health = await client.get("/health")
+                self.assertFalse(submit.done())
+                self.responder.release.set()
+                return await submit, health
+
+        submit, health = asyncio.run(_scenario())
+        self.assertEqual(health.status_code, 200)
+        self.assertEqual(submit.status_code, 200)
+        self.assertEqual(submit.json()["submission_hash"], "paper-b")
+        self.assertEqual(self.responder.calls, 1)
+
+    def test_progress_streamed_before_completion(self):
+        """A stream opened before submitting receives live progress, then the final event"""
+        self.responder.release.clear()
+
+        async def _scenario():
+            chunks, disconnect = asyncio.Queue(), asyncio.Event()
+            stream = asyncio.create_task(
+                open_stream(self.server_module.app, "/api/status/paper-c/stream", chunks, disconnect)
+            )
+            # Not archived yet: the stream opens instead of returning 404
+            self.assertEqual(await asyncio.wait_for(chunks.get(), 5), 200)
+
+            async with self._client() as client:
+                submit = asyncio.create_task(client.post("/api/submit", data={
+                    "submission_hash": "paper-c",
+                    "title": "Fractal Grammar",
+                    "contributor": "alice",
+                    "text_content": "Hydrogen holographic fractal grammar closes recursively."
+                }))
+                live = [await next_event(chunks)]
+                while live[-1]["stage"] != "calling_llm":
+                    live.append(await next_event(chunks))
+                self.assertFalse(submit.done())
+
+                self.responder.release.set()
+                final = await next_event(chunks)
+                while not final["final"]:
+                    final = await next_event(chunks)
+                response = await submit
+            disconnect.set()
+            await asyncio.wait_for(stream, 5)
+            return live, final, response
+
+        live, final, response = asyncio.run(_scenario())
+        self.assertEqual(live[0]["stage"], "submitting")
+        self.assertFalse(any(event["final"] for event in live))
+        self.assertEqual(final["stage"], "completed")
+        self.assertEqual(response.status_code, 200)
+
+    def test_status_polling(self):
+        """The status endpoint reports the latest progress event"""
+        self.poc_server.archive.add_contribution(
+            "paper-d", "Fractal Grammar", "alice", "Hydrogen holographic fractal grammar closes recursively."
+        )
+
+        async def _scenario():
+            async with self._client() as client:
+                await client.post("/api/evaluate/paper-d")
+                return await client.get("/api/status/paper-d"), await client.get("/api/status/missing")
+
+        status, missing = asyncio.run(_scenario())
+        self.assertEqual(status.status_code, 200)
+        self.assertTrue(status.json()["progress"]["final"])
+        self.assertEqual(status.json()["progress"]["stage"], "completed")
+        self.assertEqual(missing.status_code, 404)
+
+
+def run_poc_fastapi_tests():
+    """Run FastAPI PoC server tests with framework"""
+    TestUtils.print_test_header(
+        "PoC FastAPI Server Test Suite",
+        "Testing the FastAPI PoC server through its ASGI app"
+    )
+
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestPoCFastAPI)
+    runner = unittest.TextTestRunner(verbosity=2)
+    result = runner.run(suite)
+    return result.wasSuccessful()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+PoC Server Startup Test Suite
+Tests for staged PoCServer startup:
+- Readiness flag and startup timings
+- Incremental test submission cleanup via the archive's test index
+- Index migration for archives saved without it
+- Startup time with a large archive and no blocking provider check
+
+Dependencies: Pure Python (LLM calls are replaced by an injected responder).
+Services: None - no API calls.
+Isolation: Uses temporary directories for state files with automatic cleanup.
+"""
+
+import sys
+import json
+import time
+import shutil
+import tempfile
+from pathlib import Path
+
+# Add test framework to path
+test_dir = Path(__file__).parent
+sys.path.insert(0, str(test_dir))
+
+from test_framework import SyntheverseTestCase, TestUtils
+
+from layer2.poc_archive import PoCArchive
+from layer2.poc_server import PoCServer
+
+
+def legacy_contribution(submission_hash: str, title: str, contributor: str, is_test: bool = False) -> dict:
+    return {
+        "submission_hash": submission_hash,
+        "title": title,
+        "contributor": contributor,
+        "content_hash": f"content-{submission_hash}",
+        "text_content": f"Fractal contribution body {submission_hash} " * 20,
+        "status": "qualified",
+        "category": "scientific",
+        "metals": ["gold"],
+        "metadata": {"coherence": 8000, "density": 7000},
+        "is_test": is_test,
+        "created_at": "2025-01-01T00:00:00",
+        "updated_at": "2025-01-01T00:00:00",
+    }
+
+
+class TestPoCStartup(SyntheverseTestCase):
+    """Test staged startup and incremental cleanup."""
+
+    def get_category(self) -> str:
+        """Return test category for reporting"""
+        return "unit"
+
+    def setUp(self):
+        super().setUp()
+        self.work_dir = Path(tempfile.mkdtemp(prefix="poc_startup_"))
+        self.archive_file = self.work_dir / "poc_archive.json"
+
+    def tearDown(self):
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+        super().tearDown()
+
+    def _write_legacy_archive(self, contributions):
+        """Archive file as saved before the test submission index existed."""
+        archive = {
+            "contributions": {c["submission_hash"]: c for c in contributions},
+            "content_hashes": {c["content_hash"]: [c["submission_hash"]] for c in contributions},
+            "by_status": {"qualified": [c["submission_hash"] for c in contributions]},
+            "by_contributor": {},
+            "by_metal": {"gold": [c["submission_hash"] for c in contributions], "silver": [], "copper": []},
+            "metadata": {"total_contributions": len(contributions), "created_at": "", "last_updated": ""},
+        }
+        for c in contributions:
+            archive["by_contributor"].setdefault(c["contributor"], []).append(c["submission_hash"])
+        self.archive_file.write_text(json.dumps(archive), encoding="utf-8")
+
+    def _server(self) -> PoCServer:
+        return PoCServer(
+            output_dir=str(self.work_dir / "poc_reports"),
+            tokenomics_state_file=str(self.work_dir / "l2_tokenomics_state.json"),
+            archive_file=str(self.archive_file),
+            llm_responder=lambda prompt: "{}"
+        )
+
+    def test_legacy_archive_index_and_cleanup(self):
+        """Test submissions of an unindexed archive are detected once and cleaned"""
+        self._write_legacy_archive([
+            legacy_contribution("real-1", "Fractal Grammar", "alice"),
+            legacy_contribution("marked", "Hydrogen Holography", "bob", is_test=True),
+            legacy_contribution("pattern", "Demo upload", "carol"),
+            legacy_contribution("real-2", "Recursive Awareness", "dave"),
+        ])
+
+        server = self._server()
+        self.assertTrue(server.wait_until_ready(10))
+
+        self.assertEqual(sorted(server.archive.contributions), ["real-1", "real-2"])
+        self.assertEqual(server.archive.get_test_submissions(), [])
+        self.assertEqual(server.archive.archive["by_contributor"], {"alice": ["real-1"], "dave": ["real-2"]})
+        self.assertEqual(server.archive.archive["by_metal"]["gold"], ["real-1", "real-2"])
+
+        # The cleanup was persisted by the background startup stage
+        saved = json.loads(self.archive_file.read_text(encoding="utf-8"))
+        self.assertEqual(sorted(saved["contributions"]), ["real-1", "real-2"])
+        self.assertEqual(saved["test_submissions"], [])
+
+    def test_incremental_cleanup(self):
+        """New test submissions are indexed and only those are removed"""
+        archive = PoCArchive(archive_file=str(self.archive_file))
+        archive.add_contribution("keep", "Fractal Grammar", "alice", "Body one")
+        archive.add_contribution("flagged", "Hydrogen Holography", "bob", "Body two", is_test=True)
+        archive.add_contribution("x-test-123", "Recursive Awareness", "carol", "Body three")
+
+        self.assertEqual(archive.get_test_submissions(), ["flagged", "x-test-123"])
+
+        server = self._server()
+        self.assertTrue(server.wait_until_ready(10))
+        self.assertEqual(list(server.archive.contributions), ["keep"])
+
+        result = server.cleanup_test_submissions()
+        self.assertEqual(result["cleaned_count"], 0)
+        self.assertEqual(result["remaining_contributions"], 1)
+
+    def test_readiness_and_timings(self):
+        """Startup reports readiness and per-stage timings"""
+        server = self._server()
+        self.assertTrue(server.wait_until_ready(10))
+
+        status = server.get_startup_status()
+        self.assertTrue(status["ready"])
+        self.assertEqual(status["llm_provider"], "injected")
+        for stage in ("llm_clients", "state_files", "test_cleanup", "init", "ready"):
+            self.assertIn(stage, status["timings"])
+
+    def test_large_archive_startup(self):
+        """A large archive is served within a second of construction"""
+        self._write_legacy_archive([
+            legacy_contribution(f"paper{i:05d}", f"Fractal paper {i}", f"contributor-{i % 97}")
+            for i in range(5000)
+        ] + [legacy_contribution("test-paper", "Test paper", "tester")])
+
+        start = time.perf_counter()
+        server = self._server()
+        elapsed = time.perf_counter() - start
+
+        self.log_info(f"Constructed PoCServer over 5001 contributions in {elapsed:.3f}s")
+        self.assertLess(elapsed, 1.0)
+        self.assertEqual(len(server.archive.contributions), 5000)
+        self.assertTrue(server.wait_until_ready(30))
+
+
+def run_poc_startup_tests():
+    """Run PoC startup tests with framework"""
+    TestUtils.print_test_header(
+        "PoC Server Startup Test Suite",
+        "Testing staged startup, readiness and incremental cleanup"
+    )
+
+    import unittest
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestPoCStartup)
+    runner = unittest.TextTestRunner(verbosity=2)
+    result = runner.run(suite)
+    return result.wasSuccessful()
+
+
+if __name__ == "__main__":
+    import unittest
+    unittest.main()
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Profiling Test Suite
+Tests for on-demand profiling of API workers:
+- Sampling sessions writing folded stacks and per-function summaries
+- cProfile sessions limited to the next N requests
+- Time limits, admin commands and the SIGUSR2 toggle
+- Request hooks doing nothing while profiling is off
+
+Dependencies: Pure Python.
+Services: None - no API calls.
+Isolation: Uses temporary directories for profile files with automatic cleanup.
+"""
+
+import os
+import sys
+import json
+import time
+import signal
+import shutil
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+# Add test framework to path
+test_dir = Path(__file__).parent
+sys.path.insert(0, str(test_dir))
+
+from test_framework import SyntheverseTestCase, TestUtils
+
+from core.utils.profiling import Profiler, MODE_CPROFILE, MODE_SAMPLING
+
+
+def busy_fractal_work(seconds: float) -> int:
+    """CPU-bound function the profiles should name."""
+    total = 0
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        total += sum(i * i for i in range(200))
+    return total
+
+
+def wait_for(condition, timeout: float = 5.0) -> bool:
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return condition()
+
+
+class TestProfiling(SyntheverseTestCase):
+    """Test profiling sessions, outputs and switches."""
+
+    def get_category(self) -> str:
+        """Return test category for reporting"""
+        return "unit"
+
+    def setUp(self):
+        super().setUp()
+        self.work_dir = Path(tempfile.mkdtemp(prefix="profiling_"))
+        self.profiler = Profiler(str(self.work_dir))
+
+    def tearDown(self):
+        self.profiler.stop()
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+        super().tearDown()
+
+    def _summary(self, info) -> dict:
+        return json.loads(Path(info["files"]["summary"]).read_text(encoding="utf-8"))
+
+    def test_sampling_session(self):
+        """A sampling session writes folded stacks and names the busy function"""
+        self.profiler.start(MODE_SAMPLING, seconds=30, interval=0.002)
+        worker = threading.Thread(target=busy_fractal_work, args=(0.3,), name="worker")
+        worker.start()
+        worker.join()
+        info = self.profiler.stop()
+
+        folded = Path(info["files"]["folded"]).read_text(encoding="utf-8")
+        self.assertTrue(folded)
+        for line in folded.splitlines():
+            stack, count = line.rsplit(" ", 1)
+            self.assertGreater(int(count), 0)
+        self.assertIn("worker;", folded)
+        self.assertIn("busy_fractal_work", folded)
+
+        summary = self._summary(info)
+        self.assertGreater(summary["samples"], 0)
+        functions = [row["function"] for row in summary["functions"]]
+        self.assertTrue(any(f.startswith("busy_fractal_work (test_profiling.py") for f in functions))
+        self.assertFalse(self.profiler.active)
+
+    def test_cprofile_request_limit(self):
+        """A cProfile session stops by itself after N requests"""
+        self.profiler.start(MODE_CPROFILE, requests=2)
+        for _ in range(2):
+            handle = self.profiler.begin_request()
+            self.assertIsNotNone(handle)
+            busy_fractal_work(0.02)
+            self.profiler.end_request(handle)
+
+        self.assertFalse(self.profiler.active)
+        files = self.profiler.status()["last_files"]
+        self.assertTrue(Path(files["pstats"]).exists())
+        self.assertIn("busy_fractal_work", Path(files["report"]).read_text(encoding="utf-8"))
+
+        summary = json.loads(Path(files["summary"]).read_text(encoding="utf-8"))
+        self.assertEqual(summary["requests_seen"], 2)
+        busy = [row for row in summary["functions"] if row["function"].startswith("busy_fractal_work")]
+        self.assertEqual(busy[0]["calls"], 2)
+
+    def test_off_by_default(self):
+        """Hooks are no-ops while no session is running"""
+        self.assertFalse(self.profiler.active)
+        self.assertIsNone(self.profiler.begin_request())
+        self.profiler.end_request(None)
+        self.assertEqual(self.profiler.stop(), {})
+        self.assertEqual(list(self.work_dir.iterdir()), [])
+
+    def test_single_session(self):
+        """Only one session runs at a time and modes are validated"""
+        self.profiler.start(MODE_SAMPLING, seconds=30)
+        with self.assertRaises(RuntimeError):
+            self.profiler.start(MODE_CPROFILE)
+        self.profiler.stop()
+        with self.assertRaises(ValueError):
+            self.profiler.start("perf")
+
+    def test_time_limit(self):
+        """A session ends after its time limit"""
+        self.profiler.start(MODE_SAMPLING, seconds=0.1)
+        self.assertTrue(wait_for(lambda: "folded" in self.profiler.status()["last_files"]))
+        self.assertFalse(self.profiler.active)
+
+    def test_commands(self):
+        """Admin commands start and stop sessions"""
+        status = self.profiler.command({"action": "start", "mode": "cprofile", "requests": "3"})
+        self.assertTrue(status["active"])
+        self.assertEqual(status["session"]["requests"], 3)
+        status = self.profiler.command({"action": "stop"})
+        self.assertFalse(status["active"])
+        self.assertIn("summary", status["last_files"])
+        with self.assertRaises(ValueError):
+            self.profiler.command({"action": "restart"})
+
+    @unittest.skipUnless(hasattr(signal, "SIGUSR2"), "SIGUSR2 not available")
+    def test_signal_toggle(self):
+        """SIGUSR2 toggles a sampling session"""
+        previous = signal.getsignal(signal.SIGUSR2)
+        try:
+            self.assertTrue(self.profiler.install_signal_handler(seconds=30))
+            os.kill(os.getpid(), signal.SIGUSR2)
+            self.assertTrue(wait_for(lambda: self.profiler.active))
+            self.assertEqual(self.profiler.session.mode, MODE_SAMPLING)
+            os.kill(os.getpid(), signal.SIGUSR2)
+            # Stopped and written on a helper thread
+            self.assertTrue(wait_for(lambda: "folded" in self.profiler.status()["last_files"]))
+            self.assertFalse(self.profiler.active)
+        finally:
+            signal.signal(signal.SIGUSR2, previous)
+
+
+def run_profiling_tests():
+    """Run profiling tests with framework"""
+    TestUtils.print_test_header(
+        "Profiling Test Suite",
+        "Testing on-demand sampling and cProfile sessions"
+    )
+
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestProfiling)
+    runner = unittest.TextTestRunner(verbosity=2)
+    result = runner.run(suite)
+    return result.wasSuccessful()
+
+
+if __name__ == "__main__":
+    unittest.main()
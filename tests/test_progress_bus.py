@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Progress Bus Test Suite
+Tests for in-memory evaluation progress pub/sub and its SSE stream:
+- Publishing to live subscribers across threads
+- History replay for late and reconnecting subscribers
+- Terminal events, retention and stream rendering
+
+Dependencies: Pure Python.
+Services: None - no API calls.
+"""
+
+import sys
+import json
+import time
+import threading
+from pathlib import Path
+
+# Add test framework to path
+test_dir = Path(__file__).parent
+sys.path.insert(0, str(test_dir))
+
+from test_framework import SyntheverseTestCase, TestUtils
+
+from layer2.progress_bus import ProgressBus, format_sse, iter_progress_sse
+
+
+def parse_sse(chunks):
+    """Decode the progress events of an SSE stream."""
+    events = []
+    for chunk in chunks:
+        for line in chunk.splitlines():
+            if line.startswith("data: "):
+                events.append(json.loads(line[len("data: "):]))
+    return events
+
+
+class TestProgressBus(SyntheverseTestCase):
+    """Test progress publishing, subscription and SSE streaming."""
+
+    def get_category(self) -> str:
+        """Return test category for reporting"""
+        return "unit"
+
+    def test_live_delivery(self):
+        """Events published from another thread reach subscribers"""
+        bus = ProgressBus()
+        with bus.subscribe("abc") as subscription:
+            publisher = threading.Thread(target=lambda: bus.publish("abc", "calling_llm", "Calling LLM"))
+            publisher.start()
+            event = subscription.get(timeout=2)
+            publisher.join()
+
+        self.assertEqual(event["stage"], "calling_llm")
+        self.assertFalse(event["final"])
+        self.assertEqual(bus.stats()["subscribers"], 0)
+
+    def test_history_replay(self):
+        """Late subscribers replay history after the last seen event"""
+        bus = ProgressBus()
+        first = bus.publish("abc", "evaluating", "Evaluating")
+        bus.publish("abc", "calling_llm", "Calling LLM")
+        bus.publish("other", "evaluating", "Evaluating")
+
+        with bus.subscribe("abc") as subscription:
+            self.assertEqual([subscription.get(0.1)["stage"] for _ in range(2)], ["evaluating", "calling_llm"])
+            self.assertIsNone(subscription.get(0.05))
+
+        with bus.subscribe("abc", after_seq=first["seq"]) as subscription:
+            self.assertEqual(subscription.get(0.1)["stage"], "calling_llm")
+
+    def test_new_evaluation_resets_history(self):
+        """A re-evaluation after a terminal event starts a fresh history"""
+        bus = ProgressBus(retention_seconds=0.0)
+        bus.publish("abc", "evaluating", "Evaluating")
+        bus.publish("abc", "completed", "Done", status="qualified")
+        self.assertTrue(bus.latest("abc")["final"])
+        self.assertEqual(bus.latest("abc")["status"], "qualified")
+
+        bus.publish("abc", "evaluating", "Re-evaluating")
+        with bus.subscribe("abc") as subscription:
+            self.assertEqual(subscription.get(0.1)["message"], "Re-evaluating")
+            self.assertIsNone(subscription.get(0.05))
+
+        # Finished submissions are dropped after the retention period
+        bus.publish("abc", "failed", "Failed")
+        time.sleep(0.01)
+        bus.publish("other", "evaluating", "Evaluating")
+        self.assertIsNone(bus.latest("abc"))
+
+    def test_sse_stream(self):
+        """The SSE stream replays, follows live events and ends on a terminal event"""
+        bus = ProgressBus()
+        bus.publish("abc", "evaluating", "Evaluating")
+
+        def finish():
+            time.sleep(0.05)
+            bus.publish("abc", "calling_llm", "Calling LLM")
+            bus.publish("abc", "completed", "Done")
+
+        threading.Thread(target=finish).start()
+        chunks = list(iter_progress_sse(bus, "abc", "evaluating", keepalive_seconds=1.0, max_duration=5.0))
+        events = parse_sse(chunks)
+
+        self.assertEqual([e["stage"] for e in events], ["evaluating", "calling_llm", "completed"])
+        self.assertTrue(chunks[-1].startswith(f"id: {events[-1]['seq']}\n"))
+
+    def test_sse_finished_submission(self):
+        """A submission without live progress gets its archive status"""
+        bus = ProgressBus()
+        events = parse_sse(iter_progress_sse(bus, "abc", "qualified"))
+        self.assertEqual(len(events), 1)
+        self.assertEqual(events[0]["stage"], "completed")
+        self.assertEqual(events[0]["status"], "qualified")
+
+        # Keep-alives while waiting, closed after max_duration
+        chunks = list(iter_progress_sse(bus, "xyz", "evaluating", keepalive_seconds=0.02, max_duration=0.1))
+        self.assertIn(": keep-alive\n\n", chunks)
+        self.assertEqual(parse_sse(chunks), [])
+
+    def test_format_sse(self):
+        """Events render as id/event/data SSE messages"""
+        message = format_sse({"seq": 7, "stage": "completed", "message": "Fertig ✅"})
+        self.assertTrue(message.startswith("id: 7\nevent: progress\ndata: "))
+        self.assertTrue(message.endswith("\n\n"))
+        self.assertIn("✅", message)
+
+
+def run_progress_bus_tests():
+    """Run progress bus tests with framework"""
+    TestUtils.print_test_header(
+        "Progress Bus Test Suite",
+        "Testing in-memory progress pub/sub and Server-Sent Events"
+    )
+
+    import unittest
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestProgressBus)
+    runner = unittest.TextTestRunner(verbosity=2)
+    result = runner.run(suite)
+    return result.wasSuccessful()
+
+
+if __name__ == "__main__":
+    import unittest
+    unittest.main()
@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+"""
+Provider Router Unit Test Suite
+Tests for LLM provider failover and hedged requests:
+- Hedged request to the next provider when the primary exceeds its hedge delay
+- Failover on provider errors and invalid responses
+- Circuit breaker opening after repeated failures
+- Latency percentile tracking
+- Async routing: awaited async providers, threaded sync providers, cancelled losers
+- Streaming: chunks in order, failover before the first chunk only
+- PoC server secondary provider: never sent the Groq key of another endpoint
+
+Dependencies: Pure Python (uses in-process fake providers); openai for the PoC server tests.
+Services: None - no API calls.
+"""
+
+import sys
+import time
+import asyncio
+from pathlib import Path
+from unittest.mock import patch
+
+# Add test framework to path
+test_dir = Path(__file__).parent
+sys.path.insert(0, str(test_dir))
+sys.path.insert(0, str(test_dir.parent / "src"))
+
+from test_framework import SyntheverseTestCase, TestUtils
+
+from core.utils.provider_router import CircuitBreaker, LatencyTracker, Provider, ProviderError, ProviderRouter
+from core.layer2.poc_server import PoCServer
+
+
+def _responder(text: str, delay: float = 0.0):
+    def _call(request, cancel_event):
+        time.sleep(delay)
+        return text
+    return _call
+
+
+def _failing(request, cancel_event):
+    raise RuntimeError("provider down")
+
+
+def _async_responder(text: str, delay: float = 0.0, cancelled: list = None):
+    async def _call(request):
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            if cancelled is not None:
+                cancelled.append(text)
+            raise
+        return text
+    return _call
+
+
+class TestProviderRouter(SyntheverseTestCase):
+    """Test failover, hedging and circuit breaking across providers."""
+
+    def get_category(self) -> str:
+        """Return test category for reporting"""
+        return "unit"
+
+    def test_hedges_slow_primary(self):
+        """A slow primary is hedged and the faster response wins"""
+        router = ProviderRouter([
+            Provider("primary", _responder("slow", delay=1.0), hedge_after=0.05),
+            Provider("secondary", _responder("fast", delay=0.01)),
+        ])
+
+        start = time.time()
+        result = router.call({})
+
+        self.assertEqual(result, "fast")
+        self.assertLess(time.time() - start, 0.8)
+        self.assertEqual(router.stats()["secondary"]["hedges_won"], 1)
+
+    def test_fails_over_on_error(self):
+        """Errors and empty responses fail over to the next provider"""
+        router = ProviderRouter([
+            Provider("broken", _failing),
+            Provider("empty", _responder("   ")),
+            Provider("working", _responder("answer")),
+        ])
+
+        self.assertEqual(router.call({}), "answer")
+        self.assertEqual(router.stats()["broken"]["failures"], 1)
+        self.assertEqual(router.stats()["empty"]["failures"], 1)
+
+    def test_preferred_provider_first(self):
+        """The preferred provider is tried before higher-priority ones"""
+        router = ProviderRouter([
+            Provider("groq", _responder("groq")),
+            Provider("ollama", _responder("ollama")),
+        ])
+        self.assertEqual(router.call({}, preferred="ollama"), "ollama")
+
+    def test_circuit_opens_after_failures(self):
+        """A provider is skipped once its circuit opens"""
+        calls = []
+
+        def _counting_failure(request, cancel_event):
+            calls.append(1)
+            raise RuntimeError("provider down")
+
+        router = ProviderRouter([
+            Provider("flaky", _counting_failure, failure_threshold=2, reset_timeout=60),
+            Provider("backup", _responder("ok")),
+        ])
+        for _ in range(4):
+            self.assertEqual(router.call({}), "ok")
+
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(router.stats()["flaky"]["circuit"], CircuitBreaker.OPEN)
+
+    def test_all_providers_fail(self):
+        """ProviderError is raised when nothing answers in time"""
+        with self.assertRaises(ProviderError):
+            ProviderRouter([Provider("broken", _failing)]).call({})
+        with self.assertRaises(ProviderError):
+            ProviderRouter([Provider("slow", _responder("late", delay=1.0))]).call({}, timeout=0.05)
+
+    def test_latency_percentiles(self):
+        """Latency tracker reports percentiles over recorded samples"""
+        tracker = LatencyTracker()
+        self.assertIsNone(tracker.percentile(95))
+        for seconds in range(1, 101):
+            tracker.record(float(seconds))
+
+        self.assertAlmostEqual(tracker.percentile(50), 51.0, delta=1.0)
+        self.assertAlmostEqual(tracker.percentile(95), 95.0, delta=1.0)
+
+
+class TestAsyncProviderRouter(SyntheverseTestCase):
+    """Test the asyncio routing path."""
+
+    def get_category(self) -> str:
+        """Return test category for reporting"""
+        return "unit"
+
+    def test_async_hedge_cancels_loser(self):
+        """A slow async primary is hedged, and cancelled once the hedge answers"""
+        cancelled = []
+        router = ProviderRouter([
+            Provider("primary", _failing, hedge_after=0.05,
+                     async_call=_async_responder("slow", delay=5.0, cancelled=cancelled)),
+            Provider("secondary", _failing, async_call=_async_responder("fast", delay=0.01)),
+        ])
+
+        async def _run():
+            result = await router.acall({})
+            await asyncio.sleep(0)  # Let the cancelled task finish
+            return result
+
+        start = time.time()
+        self.assertEqual(asyncio.run(_run()), "fast")
+        self.assertLess(time.time() - start, 1.0)
+        self.assertEqual(cancelled, ["slow"])
+        self.assertEqual(router.stats()["secondary"]["hedges_won"], 1)
+
+    def test_sync_providers_run_in_threads(self):
+        """Providers without an async call run in the thread pool and fail over as usual"""
+        router = ProviderRouter([
+            Provider("broken", _failing),
+            Provider("working", _responder("answer", delay=0.01)),
+        ])
+        self.assertEqual(asyncio.run(router.acall({})), "answer")
+        self.assertEqual(router.stats()["broken"]["failures"], 1)
+
+    def test_concurrent_calls_do_not_block(self):
+        """Concurrent async calls overlap instead of running one after another"""
+        router = ProviderRouter([Provider("llm", _failing, async_call=_async_responder("ok", delay=0.2))])
+
+        async def _run():
+            return await asyncio.gather(*(router.acall({}) for _ in range(20)))
+
+        start = time.time()
+        self.assertEqual(asyncio.run(_run()), ["ok"] * 20)
+        self.assertLess(time.time() - start, 1.0)
+
+    def test_async_deadline(self):
+        """ProviderError is raised when the deadline passes"""
+        router = ProviderRouter([Provider("slow", _failing, async_call=_async_responder("late", delay=1.0))])
+        with self.assertRaises(ProviderError):
+            asyncio.run(router.acall({}, timeout=0.05))
+
+
+def _streamer(chunks, fail_after: int = None):
+    def _stream(request):
+        async def _chunks():
+            for i, chunk in enumerate(chunks):
+                if fail_after is not None and i == fail_after:
+                    raise RuntimeError("connection reset")
+                await asyncio.sleep(0)
+                yield chunk
+        return _chunks()
+    return _stream
+
+
+def _collect(router, **kwargs):
+    async def _run():
+        return [chunk async for chunk in router.astream({}, **kwargs)]
+    return asyncio.run(_run())
+
+
+class TestProviderStreaming(SyntheverseTestCase):
+    """Test streamed responses."""
+
+    def get_category(self) -> str:
+        """Return test category for reporting"""
+        return "unit"
+
+    def test_streams_chunks(self):
+        """Chunks arrive in order; empty chunks are skipped"""
+        router = ProviderRouter([Provider("groq", _failing, stream_call=_streamer(["Fractal", "", " grammar"]))])
+        self.assertEqual(_collect(router), ["Fractal", " grammar"])
+        self.assertEqual(router.stats()["groq"]["successes"], 1)
+
+    def test_fails_over_before_first_chunk(self):
+        """A provider failing before sending anything is replaced by the next"""
+        router = ProviderRouter([
+            Provider("broken", _failing, stream_call=_streamer(["never"], fail_after=0)),
+            Provider("empty", _failing, stream_call=_streamer([])),
+            Provider("sync", _responder("whole answer")),
+        ])
+        self.assertEqual(_collect(router), ["whole answer"])
+        self.assertEqual(router.stats()["broken"]["failures"], 1)
+        self.assertEqual(router.stats()["empty"]["failures"], 1)
+        self.assertEqual(_collect(router, preferred="sync"), ["whole answer"])
+
+    def test_no_failover_mid_stream(self):
+        """A failure after the first chunk ends the stream with ProviderError"""
+        router = ProviderRouter([
+            Provider("flaky", _failing, stream_call=_streamer(["Hydrogen", " holography"], fail_after=1)),
+            Provider("backup", _responder("backup answer")),
+        ])
+        received = []
+
+        async def _run():
+            async for chunk in router.astream({}):
+                received.append(chunk)
+
+        with self.assertRaises(ProviderError):
+            asyncio.run(_run())
+        self.assertEqual(received, ["Hydrogen"])
+        self.assertEqual(router.stats()["backup"]["successes"], 0)
+
+    def test_all_providers_fail(self):
+        """ProviderError is raised when no provider streams anything"""
+        with self.assertRaises(ProviderError):
+            _collect(ProviderRouter([Provider("broken", _failing)]))
+
+
+class TestSecondaryProvider(SyntheverseTestCase):
+    """Test the PoC server's optional secondary evaluation provider."""
+
+    def get_category(self) -> str:
+        """Return test category for reporting"""
+        return "unit"
+
+    def setUp(self):
+        super().setUp()
+        self.ensure_dependency("openai")
+
+    def _init_clients(self, env: dict):
+        """Provider names of the router and the API key each OpenAI client was built with."""
+        server = PoCServer.__new__(PoCServer)
+        env = {"GROQ_BASE_URL": "https://api.groq.com/openai/v1", **env}
+        with patch.dict("os.environ", env, clear=True), patch("openai.OpenAI") as mock_openai:
+            server._init_llm_clients("groq-key")
+        keys = {call.kwargs["base_url"]: call.kwargs["api_key"] for call in mock_openai.call_args_list}
+        return list(server.llm_router.stats()), keys
+
+    def test_other_endpoint_requires_its_own_key(self):
+        """Without its own key, a non-Groq secondary is disabled rather than sent the Groq key"""
+        providers, keys = self._init_clients({"POC_SECONDARY_LLM_BASE_URL": "https://llm.example.com/v1"})
+        self.assertEqual(providers, ["groq"])
+        self.assertNotIn("https://llm.example.com/v1", keys)
+
+        providers, keys = self._init_clients({
+            "POC_SECONDARY_LLM_BASE_URL": "https://llm.example.com/v1",
+            "POC_SECONDARY_LLM_API_KEY": "secondary-key",
+        })
+        self.assertEqual(providers, ["groq", "secondary"])
+        self.assertEqual(keys["https://llm.example.com/v1"], "secondary-key")
+
+    def test_groq_endpoint_shares_groq_key(self):
+        """A secondary route to Groq itself may reuse the Groq key"""
+        providers, keys = self._init_clients({"POC_SECONDARY_LLM_BASE_URL": "https://api.groq.com/openai/v1/"})
+        self.assertEqual(providers, ["groq", "secondary"])
+        self.assertEqual(keys["https://api.groq.com/openai/v1/"], "groq-key")
+
+
+def run_provider_router_tests():
+    """Run provider router tests with framework"""
+    TestUtils.print_test_header(
+        "Provider Router Unit Test Suite",
+        "Testing LLM provider failover, hedging and circuit breaking"
+    )
+
+    import unittest
+    suite = unittest.TestSuite()
+    for case in (TestProviderRouter, TestAsyncProviderRouter, TestProviderStreaming, TestSecondaryProvider):
+        suite.addTests(unittest.TestLoader().loadTestsFromTestCase(case))
+
+    runner = unittest.TextTestRunner(verbosity=2)
+    result = runner.run(suite)
+    return result.wasSuccessful()
+
+
+if __name__ == "__main__":
+    import unittest
+    unittest.main()
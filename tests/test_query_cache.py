@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Query Cache Test Suite
+Tests for the RAG API's query caches:
+- LRU eviction, expiry and hit-rate counters of the TTL cache
+- Cache lookups recorded in the Prometheus metrics
+- Semantic answer reuse within a similarity threshold and scope
+
+Dependencies: numpy.
+Services: None - no API calls.
+Isolation: In-memory caches with a fake clock.
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+# Add test framework to path
+test_dir = Path(__file__).parent
+sys.path.insert(0, str(test_dir))
+sys.path.insert(0, str(test_dir.parent / "src" / "api"))
+
+from test_framework import SyntheverseTestCase, TestUtils
+
+from core.utils.cache import TTLCache
+from core.utils.metrics import render_metrics
+from rag_api.analysis.semantic_cache import SemanticAnswerCache, normalize_query
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def cache_requests(cache: str, result: str) -> float:
+    series = f'cache_requests_total{{cache="{cache}",result="{result}"}}'
+    for line in render_metrics().splitlines():
+        if line.startswith(series + " "):
+            return float(line.rsplit(" ", 1)[1])
+    return 0.0
+
+
+class TestTTLCache(SyntheverseTestCase):
+    """Test the bounded LRU cache with expiry."""
+
+    def get_category(self) -> str:
+        """Return test category for reporting"""
+        return "unit"
+
+    def setUp(self):
+        super().setUp()
+        self.clock = FakeClock()
+
+    def test_lru_eviction(self):
+        """The least recently used entry is evicted beyond the size limit"""
+        cache = TTLCache("test_lru", max_entries=2, ttl=None, clock=self.clock)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        self.assertEqual(cache.get("a"), 1)  # a is now more recent than b
+        cache.put("c", 3)
+
+        self.assertNotIn("b", cache)
+        self.assertEqual(cache.get("a"), 1)
+        self.assertEqual(cache.get("c"), 3)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("b", "default"), "default")
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.stats()["evictions"], 1)
+
+    def test_expiry(self):
+        """Entries expire after the TTL"""
+        cache = TTLCache("test_ttl", max_entries=10, ttl=60.0, clock=self.clock)
+        cache.put("query", [0.1, 0.2])
+        self.clock.now += 59
+        self.assertEqual(cache.get("query"), [0.1, 0.2])
+        self.clock.now += 1
+        self.assertNotIn("query", cache)
+        self.assertIsNone(cache.get("query"))
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.stats()["expired"], 1)
+
+        # Storing again restarts the TTL
+        cache.put("query", [0.3])
+        self.clock.now += 30
+        self.assertEqual(cache.get("query"), [0.3])
+
+    def test_stats_and_metrics(self):
+        """Hits and misses feed the hit rate and cache_requests_total"""
+        before_hits = cache_requests("test_stats", "hit")
+        before_misses = cache_requests("test_stats", "miss")
+        cache = TTLCache("test_stats", max_entries=4, ttl=10.0, clock=self.clock)
+        cache.put("a", 1)
+        for key in ("a", "a", "a", "b"):
+            cache.get(key)
+
+        stats = cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (3, 1))
+        self.assertAlmostEqual(stats["hit_rate"], 0.75)
+        self.assertEqual(stats["entries"], 1)
+        self.assertEqual(cache_requests("test_stats", "hit") - before_hits, 3)
+        self.assertEqual(cache_requests("test_stats", "miss") - before_misses, 1)
+
+        self.assertEqual(cache.pop("a"), 1)
+        cache.put("b", 2)
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.stats()["hits"], 3)
+
+    def test_disabled(self):
+        """A size limit of 0 stores nothing"""
+        cache = TTLCache("test_disabled", max_entries=0, clock=self.clock)
+        cache.put("a", 1)
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(len(cache), 0)
+
+
+class TestSemanticAnswerCache(SyntheverseTestCase):
+    """Test answer reuse for semantically equivalent queries."""
+
+    def get_category(self) -> str:
+        """Return test category for reporting"""
+        return "unit"
+
+    def setUp(self):
+        super().setUp()
+        self.clock = FakeClock()
+        self.lookups = []
+        self.cache = SemanticAnswerCache(threshold=0.95, max_entries=3, ttl=600.0,
+                                         on_lookup=self.lookups.append, clock=self.clock)
+        rng = np.random.default_rng(4)
+        self.query = rng.normal(0, 1, 32)
+        self.paraphrase = self.query + rng.normal(0, 0.05, 32)  # cosine ~0.999
+        self.unrelated = rng.normal(0, 1, 32)
+
+    def test_threshold_and_scope(self):
+        """Close queries in the same scope hit; others miss"""
+        scope = ("groq", 5, 0.0, "")
+        self.assertIsNone(self.cache.lookup(self.query, scope))
+        self.cache.store(self.query, scope, {"answer": "Fractal grammar"})
+
+        self.assertEqual(self.cache.lookup(self.paraphrase, scope), {"answer": "Fractal grammar"})
+        self.assertEqual(self.cache.lookup(self.query * 3, scope), {"answer": "Fractal grammar"})
+        self.assertIsNone(self.cache.lookup(self.unrelated, scope))
+        self.assertIsNone(self.cache.lookup(self.query, ("groq", 10, 0.0, "")))
+        self.assertIsNone(self.cache.lookup(self.query, ("ollama", 5, 0.0, "")))
+
+        self.assertEqual(self.lookups, [False, True, True, False, False, False])
+        stats = self.cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (2, 4))
+        self.assertAlmostEqual(stats["hit_rate"], 2 / 6)
+
+    def test_expiry_and_eviction(self):
+        """Answers expire after the TTL and the oldest is evicted beyond the limit"""
+        scope = ("groq", 5, 0.0, "")
+        self.cache.store(self.query, scope, "first")
+        self.clock.now += 601
+        self.assertIsNone(self.cache.lookup(self.query, scope))
+        self.assertEqual(self.cache.stats()["expired"], 1)
+
+        rng = np.random.default_rng(9)
+        queries = [rng.normal(0, 1, 32) for _ in range(4)]
+        for i, query in enumerate(queries):
+            self.cache.store(query, scope, i)
+        self.assertEqual(len(self.cache), 3)
+        self.assertIsNone(self.cache.lookup(queries[0], scope))
+        self.assertEqual(self.cache.lookup(queries[3], scope), 3)
+
+    def test_normalize_query(self):
+        """Case and whitespace do not change the cache key"""
+        self.assertEqual(normalize_query("  What is  Hydrogen\nHolography? "), "what is hydrogen holography?")
+
+
+def run_query_cache_tests():
+    """Run query cache tests with framework"""
+    TestUtils.print_test_header(
+        "Query Cache Test Suite",
+        "Testing query embedding and semantic answer caches"
+    )
+
+    suite = unittest.TestSuite()
+    for case in (TestTTLCache, TestSemanticAnswerCache):
+        suite.addTests(unittest.TestLoader().loadTestsFromTestCase(case))
+    runner = unittest.TextTestRunner(verbosity=2)
+    result = runner.run(suite)
+    return result.wasSuccessful()
+
+
+if __name__ == "__main__":
+    unittest.main()
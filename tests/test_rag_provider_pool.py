@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+RAG Provider Connection Pool Test Suite
+Tests for the RAG engine's LLM provider connections:
+- One keep-alive session and async client per provider, reused across calls
+- Startup sets up cloud clients without contacting the providers
+- Provider health probed at most once per RAG_HEALTH_TTL
+- Failed Ollama model listings not cached
+- aclose() closing every pool
+
+Dependencies: fastapi, httpx, numpy, openai, requests (the RAG API's own dependencies).
+Services: None - provider calls are replaced by in-process fakes.
+Isolation: Lazily loaded engine over an empty temporary embeddings directory.
+"""
+
+import os
+import sys
+import shutil
+import asyncio
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+# Add test framework to path
+test_dir = Path(__file__).parent
+sys.path.insert(0, str(test_dir))
+sys.path.insert(0, str(test_dir.parent / "src"))
+sys.path.insert(0, str(test_dir.parent / "src" / "api"))
+
+from test_framework import SyntheverseTestCase, TestUtils
+
+from core.utils.cache import TTLCache
+from rag_api.api.rag_api import RAGEngine
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestProviderPools(SyntheverseTestCase):
+    """Test pooled provider connections and cached health checks."""
+
+    def get_category(self) -> str:
+        """Return test category for reporting"""
+        return "unit"
+
+    def setUp(self):
+        super().setUp()
+        self.work_dir = Path(tempfile.mkdtemp(prefix="rag_provider_pool_"))
+        self.env = mock.patch.dict(os.environ, {"RAG_HTTP_POOL_SIZE": "4"})
+        self.env.start()
+        self.engine = RAGEngine(embeddings_dir=str(self.work_dir), lazy_load=True)
+        self.clock = FakeClock()
+        self.engine.health_cache = TTLCache("test_provider_health", max_entries=16, ttl=60.0, clock=self.clock)
+
+    def tearDown(self):
+        asyncio.run(self.engine.aclose())
+        self.env.stop()
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+        super().tearDown()
+
+    def test_sessions_reused_per_provider(self):
+        """Each provider keeps one pooled session and one async client"""
+        ollama = self.engine._http_session("ollama")
+        self.assertIs(self.engine._http_session("ollama"), ollama)
+        self.assertIsNot(self.engine._http_session("huggingface"), ollama)
+        self.assertEqual(ollama.get_adapter("http://localhost:11434")._pool_maxsize, 4)
+
+        async def _clients():
+            first = self.engine._async_http("ollama")
+            return first, self.engine._async_http("ollama"), self.engine._async_http("huggingface")
+
+        first, again, other = asyncio.run(_clients())
+        self.assertIs(again, first)
+        self.assertIsNot(other, first)
+
+    def test_startup_makes_no_provider_requests(self):
+        """Cloud clients are set up from the keys alone, with pooled Groq connections"""
+        keys = {"GROQ_API_KEY": "groq-key", "HUGGINGFACE_API_KEY": "hf-key"}
+        with mock.patch.dict(os.environ, keys), \
+                mock.patch("requests.Session.request", side_effect=AssertionError("unexpected request")), \
+                mock.patch("httpx.Client.send", side_effect=AssertionError("unexpected request")):
+            self.engine._check_cloud_apis()
+
+        self.assertTrue(self.engine.groq_available)
+        self.assertTrue(self.engine.huggingface_available)
+        self.assertEqual(self.engine.groq_client.timeout.connect, RAGEngine.HTTP_CONNECT_TIMEOUT)
+        self.assertIsNotNone(self.engine.groq_async_client)
+
+    def test_health_probed_once_per_ttl(self):
+        """Provider health is probed again only after RAG_HEALTH_TTL"""
+        probes = []
+
+        async def _probe_ollama():
+            probes.append("ollama")
+
+        async def _probe_huggingface():
+            probes.append("huggingface")
+            raise RuntimeError("Hugging Face API returned error: 401")
+
+        self.engine.huggingface_key = "hf-key"
+        with mock.patch.object(self.engine, "_probe_ollama", _probe_ollama), \
+                mock.patch.object(self.engine, "_probe_huggingface", _probe_huggingface):
+            health = asyncio.run(self.engine.provider_health())
+            self.assertTrue(health["ollama"]["healthy"])
+            self.assertFalse(health["huggingface"]["healthy"])
+            self.assertIn("401", health["huggingface"]["error"])
+            self.assertEqual(sorted(probes), ["huggingface", "ollama"])
+
+            self.clock.now += 59
+            self.assertEqual(asyncio.run(self.engine.provider_health()), health)
+            self.assertEqual(len(probes), 2)
+
+            self.clock.now += 1
+            asyncio.run(self.engine.provider_health())
+            self.assertEqual(len(probes), 4)
+
+    def test_failed_model_listing_not_cached(self):
+        """Ollama models reappear on the next call after an outage"""
+        responses = [RuntimeError("All connection attempts failed"), ["llama3.1"]]
+
+        async def _fetch_ollama_models():
+            response = responses.pop(0)
+            if isinstance(response, Exception):
+                raise response
+            self.engine.health_cache.put("ollama_models", response)
+            return response
+
+        with mock.patch.object(self.engine, "_fetch_ollama_models", _fetch_ollama_models):
+            self.assertEqual(asyncio.run(self.engine.list_ollama_models()), [])
+            self.assertEqual(asyncio.run(self.engine.list_ollama_models()), ["llama3.1"])
+            self.assertEqual(asyncio.run(self.engine.list_ollama_models()), ["llama3.1"])
+        self.assertEqual(responses, [])
+
+    def test_aclose_closes_every_pool(self):
+        """aclose() closes the sessions, the async clients and the Groq clients"""
+        session = self.engine._http_session("ollama")
+        self.engine.groq_client = mock.Mock()
+        self.engine.groq_async_client = mock.Mock(close=mock.AsyncMock())
+
+        async def _close():
+            clients = [self.engine._async_http("ollama"), self.engine._async_http("huggingface")]
+            with mock.patch.object(session, "close", wraps=session.close) as close:
+                await self.engine.aclose()
+            return clients, close
+
+        clients, close = asyncio.run(_close())
+        close.assert_called_once()
+        self.assertTrue(all(client.is_closed for client in clients))
+        self.engine.groq_client.close.assert_called_once()
+        self.engine.groq_async_client.close.assert_awaited_once()
+        self.assertEqual(self.engine._http_sessions, {})
+        self.assertEqual(self.engine._async_http_clients, {})
+        self.engine.groq_client = self.engine.groq_async_client = None
+
+
+def run_rag_provider_pool_tests():
+    """Run RAG provider pool tests with framework"""
+    TestUtils.print_test_header(
+        "RAG Provider Connection Pool Test Suite",
+        "Testing pooled provider connections and cached health checks"
+    )
+
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestProviderPools)
+    runner = unittest.TextTestRunner(verbosity=2)
+    result = runner.run(suite)
+    return result.wasSuccessful()
+
+
+if __name__ == "__main__":
+    unittest.main()
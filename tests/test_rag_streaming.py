@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+RAG Query Streaming Test Suite
+Tests for the RAG API's /query/stream endpoint:
+- Event order: sources, then answer tokens, then done
+- Newline-delimited JSON by default, server-sent events on Accept: text/event-stream
+- Cached answers streamed as a single token
+- An error event when generation fails partway
+- Concurrent requests for different Ollama models answered and cached per model
+- Request validation (search mode, engine not initialized)
+
+Dependencies: fastapi, httpx, numpy (the RAG API's own dependencies).
+Services: None - retrieval and LLM providers are replaced by in-process fakes.
+Isolation: Lazily loaded engine over an empty temporary embeddings directory.
+"""
+
+import sys
+import json
+import shutil
+import asyncio
+import tempfile
+import unittest
+import zlib
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+from fastapi.testclient import TestClient
+
+# Add test framework to path
+test_dir = Path(__file__).parent
+sys.path.insert(0, str(test_dir))
+sys.path.insert(0, str(test_dir.parent / "src"))
+sys.path.insert(0, str(test_dir.parent / "src" / "api"))
+
+from test_framework import SyntheverseTestCase, TestUtils
+
+from core.utils.provider_router import Provider, ProviderRouter
+from rag_api.api import rag_api
+from rag_api.api.rag_api import RAGEngine
+
+SOURCES = [
+    {"text": "Hydrogen holography encodes the fractal grammar of awareness.", "pdf_filename": "hhfe.pdf", "score": 0.91},
+    {"text": "Proof of contribution scores novelty, density and coherence.", "pdf_filename": "poc.pdf", "score": 0.84},
+]
+
+
+class FakeEmbeddingSearch:
+    """Deterministic query embeddings: equal queries embed identically."""
+
+    query_batcher = None
+
+    def generate_query_embedding(self, query: str) -> np.ndarray:
+        return np.random.default_rng(zlib.crc32(query.encode())).normal(0, 1, 16)
+
+
+def _streamer(chunks, calls: list, fail_after: int = None):
+    def _stream(request):
+        async def _chunks():
+            calls.append(request["query"])
+            for i, chunk in enumerate(chunks):
+                if fail_after is not None and i == fail_after:
+                    raise RuntimeError("connection reset")
+                await asyncio.sleep(0)
+                yield chunk
+        return _chunks()
+    return _stream
+
+
+def _unused(request, cancel_event):
+    raise AssertionError("streaming providers should not be called whole")
+
+
+def parse_ndjson(body: str):
+    return [json.loads(line) for line in body.splitlines() if line.strip()]
+
+
+def parse_sse(body: str):
+    events = []
+    for block in body.split("\n\n"):
+        if not block.strip():
+            continue
+        fields = dict(line.split(": ", 1) for line in block.splitlines())
+        event = json.loads(fields["data"])
+        assert fields["event"] == event["type"]
+        events.append(event)
+    return events
+
+
+class TestQueryStream(SyntheverseTestCase):
+    """Test the streaming query endpoint."""
+
+    def get_category(self) -> str:
+        """Return test category for reporting"""
+        return "unit"
+
+    def setUp(self):
+        super().setUp()
+        self.work_dir = Path(tempfile.mkdtemp(prefix="rag_streaming_"))
+        self.engine = RAGEngine(embeddings_dir=str(self.work_dir), lazy_load=True)
+        self.engine._initialized = True
+        self.engine.embedding_search = FakeEmbeddingSearch()
+        self.engine.search = mock.Mock(return_value=list(SOURCES))
+        self.calls = []
+        self._use_stream(["Fractal", " grammar", " of awareness."])
+
+        patcher = mock.patch.object(rag_api, "rag_engine", self.engine)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.client = TestClient(rag_api.app)
+
+    def tearDown(self):
+        asyncio.run(self.engine.aclose())
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+        super().tearDown()
+
+    def _use_stream(self, chunks, fail_after: int = None):
+        self.engine.provider_router = ProviderRouter([
+            Provider("groq", _unused, stream_call=_streamer(chunks, self.calls, fail_after))
+        ])
+
+    def _stream(self, query: str = "What is hydrogen holography?", headers=None, **params):
+        return self.client.post("/query/stream", json={"query": query, **params}, headers=headers or {})
+
+    def test_event_order(self):
+        """Sources come first, then the answer tokens in order, then done"""
+        response = self._stream(top_k=2)
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.headers["content-type"].startswith("application/x-ndjson"))
+
+        events = parse_ndjson(response.text)
+        self.assertEqual([event["type"] for event in events], ["sources", "token", "token", "token", "done"])
+        self.assertEqual(events[0]["sources"], SOURCES)
+        self.assertEqual(events[0]["num_sources"], 2)
+        self.assertEqual("".join(event["text"] for event in events[1:-1]), "Fractal grammar of awareness.")
+        self.assertEqual(events[-1]["llm_model"], "groq")
+        self.assertFalse(events[-1]["cached"])
+        self.engine.search.assert_called_once_with("What is hydrogen holography?", 2, 0.0, self.engine.search_mode)
+
+    def test_server_sent_events(self):
+        """Clients accepting text/event-stream get the same events as SSE"""
+        response = self._stream(headers={"Accept": "text/event-stream"})
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.headers["content-type"].startswith("text/event-stream"))
+        self.assertEqual(response.headers["cache-control"], "no-cache")
+
+        events = parse_sse(response.text)
+        self.assertEqual([event["type"] for event in events], ["sources", "token", "token", "token", "done"])
+        self.assertEqual("".join(event["text"] for event in events[1:-1]), "Fractal grammar of awareness.")
+
+    def test_cached_answer(self):
+        """A repeated query streams the cached answer as one token without calling the LLM"""
+        first = parse_ndjson(self._stream().text)
+        second = parse_ndjson(self._stream().text)
+
+        self.assertEqual(self.calls, ["What is hydrogen holography?"])
+        self.assertEqual([event["type"] for event in second], ["sources", "token", "done"])
+        self.assertEqual(second[0]["sources"], first[0]["sources"])
+        self.assertEqual(second[1]["text"], "Fractal grammar of awareness.")
+        self.assertTrue(second[-1]["cached"])
+
+    def test_error_midway(self):
+        """A provider failing after the first token ends the stream with an error event"""
+        self._use_stream(["Hydrogen", " holography"], fail_after=1)
+        events = parse_ndjson(self._stream().text)
+
+        self.assertEqual([event["type"] for event in events], ["sources", "token", "error"])
+        self.assertEqual(events[1]["text"], "Hydrogen")
+        self.assertIn("Error processing query", events[-1]["detail"])
+
+        # The partial answer is not cached
+        self._use_stream(["Fractal grammar"])
+        events = parse_ndjson(self._stream().text)
+        self.assertEqual(events[-1]["type"], "done")
+        self.assertFalse(events[-1]["cached"])
+
+    def test_no_sources(self):
+        """Without relevant chunks the stream answers without calling the LLM"""
+        self.engine.search.return_value = []
+        events = parse_ndjson(self._stream().text)
+
+        self.assertEqual([event["type"] for event in events], ["sources", "token", "done"])
+        self.assertEqual(events[1]["text"], RAGEngine.NO_RESULTS_ANSWER)
+        self.assertEqual(self.calls, [])
+
+    def test_concurrent_ollama_models(self):
+        """Concurrent ollama:<model> requests are answered by their own model and cached per model"""
+        import httpx
+        b_started = asyncio.Event()
+
+        def _ollama_stream(request):
+            async def _chunks():
+                model = request["ollama_model"]
+                self.calls.append(model)
+                if model == "model-a":
+                    await asyncio.wait_for(b_started.wait(), 5)  # Answer A only once B has started
+                else:
+                    b_started.set()
+                yield f"answer from {model}"
+            return _chunks()
+
+        self.engine.provider_router = ProviderRouter([Provider("ollama", _unused, stream_call=_ollama_stream)])
+
+        async def _scenario():
+            transport = httpx.ASGITransport(app=rag_api.app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://rag-api") as client:
+                def _ask(model):
+                    return client.post("/query/stream", json={"query": "What is hydrogen holography?", "llm_model": model})
+                first, second = await asyncio.gather(_ask("ollama:model-a"), _ask("ollama:model-b"))
+                again = await _ask("ollama:model-a")
+            return [parse_ndjson(response.text) for response in (first, second, again)]
+
+        first, second, again = asyncio.run(_scenario())
+        self.assertEqual(first[1]["text"], "answer from model-a")
+        self.assertEqual(second[1]["text"], "answer from model-b")
+        self.assertEqual(again[1]["text"], "answer from model-a")
+        self.assertTrue(again[-1]["cached"])
+        self.assertEqual(sorted(self.calls), ["model-a", "model-b"])
+        self.assertIsNone(self.engine.ollama_model)
+
+    def test_validation(self):
+        """Invalid search modes are rejected and a missing engine is reported"""
+        self.assertEqual(self._stream(search_mode="semantic").status_code, 400)
+        with mock.patch.object(rag_api, "rag_engine", None):
+            self.assertEqual(self._stream().status_code, 503)
+
+
+def run_rag_streaming_tests():
+    """Run RAG query streaming tests with framework"""
+    TestUtils.print_test_header(
+        "RAG Query Streaming Test Suite",
+        "Testing the streaming query endpoint"
+    )
+
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestQueryStream)
+    runner = unittest.TextTestRunner(verbosity=2)
+    result = runner.run(suite)
+    return result.wasSuccessful()
+
+
+if __name__ == "__main__":
+    unittest.main()
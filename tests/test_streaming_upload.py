@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Streaming Upload Test Suite
+Tests for chunked upload ingestion:
+- Single-pass hashing matches hashing the whole file
+- Size limit enforced while streaming, with nothing left on disk
+- Reads bounded by the chunk size
+- Finalizing and discarding ingested uploads
+
+Dependencies: Pure Python.
+Services: None - no API calls.
+"""
+
+import io
+import sys
+import shutil
+import hashlib
+import tempfile
+from pathlib import Path
+
+# Add test framework to path
+test_dir = Path(__file__).parent
+sys.path.insert(0, str(test_dir))
+
+from test_framework import SyntheverseTestCase, TestUtils
+
+from core.utils import (
+    UploadTooLargeError,
+    discard_upload,
+    finalize_upload,
+    ingest_upload,
+)
+
+
+class RecordingStream(io.BytesIO):
+    """BytesIO that records the largest read size requested."""
+
+    def __init__(self, data: bytes):
+        super().__init__(data)
+        self.largest_read = 0
+
+    def read(self, size=-1):
+        self.largest_read = max(self.largest_read, size if size >= 0 else len(self.getvalue()))
+        return super().read(size)
+
+
+class TestStreamingUpload(SyntheverseTestCase):
+    """Test streaming ingestion of uploads."""
+
+    def get_category(self) -> str:
+        """Return test category for reporting"""
+        return "unit"
+
+    def setUp(self):
+        super().setUp()
+        self.upload_dir = Path(tempfile.mkdtemp(prefix="uploads_"))
+
+    def tearDown(self):
+        shutil.rmtree(self.upload_dir, ignore_errors=True)
+        super().tearDown()
+
+    def test_hashes_in_single_pass(self):
+        """Content and submission hashes match hashing the full bytes"""
+        data = b"%PDF-1.4\n" + bytes(range(256)) * 1000
+        prefix = b"Title\ncontributor\n"
+        stream = RecordingStream(data)
+
+        ingested = ingest_upload(stream, str(self.upload_dir), hash_prefix=prefix, chunk_size=4096)
+
+        self.assertEqual(ingested.size, len(data))
+        self.assertEqual(ingested.content_sha256, hashlib.sha256(data).hexdigest())
+        self.assertEqual(ingested.submission_hash, hashlib.sha256(prefix + data).hexdigest())
+        self.assertEqual(Path(ingested.path).read_bytes(), data)
+        self.assertLessEqual(stream.largest_read, 4096)
+
+    def test_size_limit(self):
+        """Oversized uploads are rejected without reading the rest"""
+        stream = RecordingStream(b"x" * 100000)
+
+        with self.assertRaises(UploadTooLargeError):
+            ingest_upload(stream, str(self.upload_dir), max_bytes=10000, chunk_size=1024)
+
+        self.assertLess(stream.tell(), 20000)
+        self.assertEqual(list(self.upload_dir.iterdir()), [])
+
+    def test_finalize_and_discard(self):
+        """Uploads are renamed in place or removed"""
+        ingested = ingest_upload(io.BytesIO(b"pdf bytes"), str(self.upload_dir))
+        finalize_upload(ingested, "abc_paper.pdf")
+
+        self.assertEqual(Path(ingested.path), self.upload_dir / "abc_paper.pdf")
+        self.assertEqual([p.name for p in self.upload_dir.iterdir()], ["abc_paper.pdf"])
+
+        discard_upload(ingested)
+        self.assertEqual(list(self.upload_dir.iterdir()), [])
+
+
+def run_streaming_upload_tests():
+    """Run streaming upload tests with framework"""
+    TestUtils.print_test_header(
+        "Streaming Upload Test Suite",
+        "Testing chunked upload ingestion with on-the-fly hashing"
+    )
+
+    import unittest
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestStreamingUpload)
+    runner = unittest.TextTestRunner(verbosity=2)
+    result = runner.run(suite)
+    return result.wasSuccessful()
+
+
+if __name__ == "__main__":
+    import unittest
+    unittest.main()
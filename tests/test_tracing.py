@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Span Tracing Test Suite
+Tests for per-stage latency instrumentation:
+- Nested spans, attributes and errors
+- Cross-thread parenting and JSON-lines export
+- Percentile summaries and runtime toggling
+- Disabled-tracing overhead
+- PoCServer pipeline stages
+
+Dependencies: Pure Python (LLM calls are replaced by an injected responder).
+Services: None - no API calls.
+Isolation: Uses temporary directories with automatic cleanup.
+"""
+
+import sys
+import json
+import time
+import shutil
+import tempfile
+import threading
+from pathlib import Path
+
+# Add test framework to path
+test_dir = Path(__file__).parent
+sys.path.insert(0, str(test_dir))
+
+from test_framework import SyntheverseTestCase, TestUtils
+
+from core.utils.tracing import Tracer, NOOP_SPAN, load_spans, summarize_durations, summarize_span_file
+from layer2.poc_server import PoCServer
+
+
+class TestTracing(SyntheverseTestCase):
+    """Test span recording, export and summaries."""
+
+    def get_category(self) -> str:
+        """Return test category for reporting"""
+        return "unit"
+
+    def setUp(self):
+        super().setUp()
+        self.work_dir = Path(tempfile.mkdtemp(prefix="tracing_"))
+        self.span_file = self.work_dir / "spans.jsonl"
+
+    def tearDown(self):
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+        super().tearDown()
+
+    def test_nested_spans_export(self):
+        """Child spans link to their parent and are written as JSON lines"""
+        tracer = Tracer(enabled=True, span_file=str(self.span_file))
+        with tracer.span("submit", submission_hash="abc") as parent:
+            with tracer.span("submit.archive_write") as child:
+                child.set_attribute("bytes", 42)
+            self.assertIs(tracer.current_span(), parent)
+        self.assertIsNone(tracer.current_span())
+
+        with self.assertRaises(ValueError):
+            with tracer.span("evaluate.parse"):
+                raise ValueError("bad json")
+
+        spans = {span["name"]: span for span in load_spans(str(self.span_file))}
+        self.assertEqual(spans["submit.archive_write"]["parent_id"], spans["submit"]["span_id"])
+        self.assertEqual(spans["submit.archive_write"]["trace_id"], spans["submit"]["trace_id"])
+        self.assertEqual(spans["submit.archive_write"]["attributes"], {"bytes": 42})
+        self.assertEqual(spans["submit"]["attributes"]["submission_hash"], "abc")
+        self.assertIsNone(spans["submit"]["parent_id"])
+        self.assertEqual(spans["evaluate.parse"]["error"], "ValueError: bad json")
+        self.assertEqual(tracer.summary()["evaluate.parse"]["errors"], 1)
+
+    def test_cross_thread_parent(self):
+        """A span captured on one thread parents spans on another"""
+        tracer = Tracer(enabled=True)
+        recorded = []
+        with tracer.span("submit") as parent:
+            def worker():
+                self.assertIsNone(tracer.current_span())
+                with tracer.span("evaluate", parent=parent) as span:
+                    recorded.append(span)
+            thread = threading.Thread(target=worker)
+            thread.start()
+            thread.join()
+
+        self.assertEqual(recorded[0].parent_id, parent.span_id)
+        self.assertEqual(recorded[0].trace_id, parent.trace_id)
+
+    def test_percentiles(self):
+        """Summaries report nearest-rank percentiles in milliseconds"""
+        summary = summarize_durations({"stage": [i / 1000.0 for i in range(1, 101)]})["stage"]
+        self.assertEqual(summary["count"], 100)
+        self.assertAlmostEqual(summary["p50_ms"], 51.0)
+        self.assertAlmostEqual(summary["p95_ms"], 95.0)
+        self.assertAlmostEqual(summary["p99_ms"], 99.0)
+        self.assertAlmostEqual(summary["max_ms"], 100.0)
+
+        tracer = Tracer(enabled=True, span_file=str(self.span_file))
+        for _ in range(5):
+            with tracer.span("evaluate.llm_call"):
+                pass
+        self.assertEqual(summarize_span_file(str(self.span_file))["evaluate.llm_call"]["count"], 5)
+
+    def test_runtime_toggle(self):
+        """Disabled tracing records nothing and creates no file"""
+        tracer = Tracer(enabled=False, span_file=str(self.span_file))
+        span = tracer.span("submit")
+        self.assertIs(span, NOOP_SPAN)
+        with span as s:
+            s.set_attribute("ignored", True)
+        self.assertEqual(tracer.summary(), {})
+        self.assertFalse(self.span_file.exists())
+
+        tracer.enable()
+        with tracer.span("submit"):
+            pass
+        tracer.disable()
+        with tracer.span("submit"):
+            pass
+        self.assertEqual(tracer.status()["stages"]["submit"]["count"], 1)
+        self.assertFalse(tracer.status()["enabled"])
+
+        tracer.reset()
+        self.assertEqual(tracer.summary(), {})
+
+    def test_disabled_overhead(self):
+        """A disabled span costs well under a microsecond-scale budget"""
+        tracer = Tracer(enabled=False)
+        iterations = 100000
+        start = time.perf_counter()
+        for _ in range(iterations):
+            with tracer.span("evaluate.parse", chars=10):
+                pass
+        per_span = (time.perf_counter() - start) / iterations
+        self.log_info(f"Disabled span overhead: {per_span * 1e9:.0f} ns")
+        self.assertLess(per_span, 5e-6)
+
+    def test_pipeline_stages(self):
+        """A traced submission records every pipeline stage under one trace"""
+        tracer = Tracer(enabled=True, span_file=str(self.span_file))
+        server = PoCServer(
+            output_dir=str(self.work_dir / "poc_reports"),
+            tokenomics_state_file=str(self.work_dir / "l2_tokenomics_state.json"),
+            archive_file=str(self.work_dir / "poc_archive.json"),
+            llm_responder=lambda prompt: json.dumps({
+                "coherence": 8000, "density": 7000, "redundancy": 1000, "metals": ["gold"]
+            }),
+            tracer=tracer
+        )
+        self.addCleanup(server.evaluation_scheduler.shutdown, False)
+        server.submit_contribution("paper-a", "Fractal Grammar", "alice", text_content="Recursive hydrogen holography.")
+
+        spans = list(load_spans(str(self.span_file)))
+        names = {span["name"] for span in spans}
+        for stage in (
+            "submit", "submit.archive_write", "submit.recognition_update", "submit.evaluation",
+            "evaluate.scheduled", "evaluate", "evaluate.archive_scan", "evaluate.duplicate_check",
+            "evaluate.redundancy_report", "evaluate.prompt_build", "evaluate.llm_call",
+            "evaluate.parse", "evaluate.allocation", "evaluate.archive_write"
+        ):
+            self.assertIn(stage, names)
+        self.assertEqual(len({span["trace_id"] for span in spans}), 1)
+
+        by_name = {span["name"]: span for span in spans}
+        self.assertEqual(by_name["evaluate.scheduled"]["parent_id"], by_name["submit.evaluation"]["span_id"])
+        self.assertIn("queue_wait_ms", by_name["evaluate.scheduled"]["attributes"])
+        self.assertIn(by_name["evaluate"]["attributes"]["status"], ("qualified", "unqualified"))
+
+
+def run_tracing_tests():
+    """Run tracing tests with framework"""
+    TestUtils.print_test_header(
+        "Span Tracing Test Suite",
+        "Testing per-stage latency spans, export and summaries"
+    )
+
+    import unittest
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestTracing)
+    runner = unittest.TextTestRunner(verbosity=2)
+    result = runner.run(suite)
+    return result.wasSuccessful()
+
+
+if __name__ == "__main__":
+    import unittest
+    unittest.main()
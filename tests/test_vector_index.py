@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+Vector Index Test Suite
+Tests for the vector indexes used by RAG search:
+- Top-k results matching the per-query cosine similarity path
+- Chunk positions preserved when chunks lack embeddings
+- Float32, contiguous, pre-normalized storage
+- IVF recall, exact fallback and save/load; HNSW and the fallback without hnswlib
+- Batched search of several queries matching per-query search
+
+Dependencies: numpy, hnswlib (installed if missing).
+Services: None - no API calls.
+Isolation: Uses temporary directories for saved indexes with automatic cleanup.
+"""
+
+import sys
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+
+# Add test framework to path
+test_dir = Path(__file__).parent
+sys.path.insert(0, str(test_dir))
+sys.path.insert(0, str(test_dir.parent / "src" / "api"))
+
+from test_framework import SyntheverseTestCase, TestUtils
+
+from rag_api.analysis import vector_index
+from rag_api.analysis.vector_index import (
+    ExactVectorIndex, IVFVectorIndex, HNSWVectorIndex, build_vector_index, load_vector_index, hnswlib
+)
+from rag_api.analysis.utils import extract_embeddings_array, compute_cosine_similarity_batch
+
+
+def sample_chunks(n_chunks: int = 200, dim: int = 64, seed: int = 7):
+    rng = np.random.default_rng(seed)
+    return [
+        {
+            "text": f"Fractal chunk {i}",
+            "embedding": rng.normal(0, 1, dim).tolist(),
+            "chunk_index": i,
+            "pdf_filename": f"paper_{i % 5}",
+        }
+        for i in range(n_chunks)
+    ]
+
+
+class TestExactVectorIndex(SyntheverseTestCase):
+    """Test the pre-normalized embedding matrix index."""
+
+    def get_category(self) -> str:
+        """Return test category for reporting"""
+        return "unit"
+
+    def test_matches_brute_force(self):
+        """Top-k equals a full sort of the per-query cosine similarities"""
+        chunks = sample_chunks()
+        index = ExactVectorIndex.from_chunks(chunks)
+        query = np.random.default_rng(1).normal(0, 1, 64)
+
+        expected = compute_cosine_similarity_batch(query, extract_embeddings_array(chunks))
+        expected_top = np.argsort(expected)[::-1][:10]
+
+        hits = index.search(query, top_k=10)
+        self.assertEqual([i for i, _ in hits], [int(i) for i in expected_top])
+        for (i, score), idx in zip(hits, expected_top):
+            self.assertAlmostEqual(score, float(expected[idx]), places=5)
+
+        # top_k beyond the corpus returns every chunk, best first
+        everything = index.search(query, top_k=1000)
+        self.assertEqual(len(everything), len(chunks))
+        scores = [score for _, score in everything]
+        self.assertEqual(scores, sorted(scores, reverse=True))
+
+    def test_storage(self):
+        """The matrix is float32, C-contiguous and row-normalized"""
+        index = ExactVectorIndex.from_chunks(sample_chunks(50, 32))
+        self.assertEqual(index.matrix.dtype, np.float32)
+        self.assertTrue(index.matrix.flags["C_CONTIGUOUS"])
+        np.testing.assert_allclose(np.linalg.norm(index.matrix, axis=1), 1.0, rtol=1e-5)
+        self.assertEqual(index.stats()["vectors"], 50)
+        self.assertEqual(index.stats()["dim"], 32)
+
+    def test_missing_embeddings_keep_positions(self):
+        """Results refer to positions in the original chunk list"""
+        chunks = sample_chunks(20, 16)
+        target = np.array(chunks[13]["embedding"])
+        chunks[2] = {"text": "no embedding"}
+        chunks[5]["embedding"] = [1.0, 2.0]  # wrong dimension
+
+        index = ExactVectorIndex.from_chunks(chunks)
+        self.assertEqual(len(index), 18)
+        best, score = index.search(target, top_k=1)[0]
+        self.assertEqual(best, 13)
+        self.assertAlmostEqual(score, 1.0, places=5)
+
+    def test_edge_cases(self):
+        """Empty corpora, zero queries and dimension mismatches"""
+        self.assertEqual(ExactVectorIndex.from_chunks([]).search(np.ones(8), top_k=5), [])
+
+        index = ExactVectorIndex.from_chunks(sample_chunks(10, 8))
+        self.assertEqual(index.search(np.ones(8), top_k=0), [])
+        zero_hits = index.search(np.zeros(8), top_k=3)
+        self.assertEqual([score for _, score in zero_hits], [0.0, 0.0, 0.0])
+        with self.assertRaises(ValueError):
+            index.search(np.ones(4), top_k=3)
+        with self.assertRaises(ValueError):
+            index.search(np.ones((2, 8)), top_k=3)
+
+
+def clustered_chunks(n_chunks: int = 3000, dim: int = 32, n_topics: int = 30, seed: int = 3):
+    """Chunks drawn around topic centers, like embeddings of papers on a few themes."""
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(0, 1, (n_topics, dim))
+    embeddings = centers[rng.integers(0, n_topics, n_chunks)] + rng.normal(0, 0.3, (n_chunks, dim))
+    return [{"text": f"Chunk {i}", "embedding": embedding.tolist()} for i, embedding in enumerate(embeddings)]
+
+
+def recall(index, exact, queries, top_k: int = 10, **params) -> float:
+    hits = 0
+    for query in queries:
+        expected = {i for i, _ in exact.search(query, top_k)}
+        hits += len(expected & {i for i, _ in index.search(query, top_k, **params)})
+    return hits / (top_k * len(queries))
+
+
+class TestApproximateIndexes(SyntheverseTestCase):
+    """Test IVF and HNSW indexes, persistence and index selection."""
+
+    def get_category(self) -> str:
+        """Return test category for reporting"""
+        return "unit"
+
+    def setUp(self):
+        super().setUp()
+        self.work_dir = Path(tempfile.mkdtemp(prefix="vector_index_"))
+        self.chunks = clustered_chunks()
+        self.exact = ExactVectorIndex.from_chunks(self.chunks)
+        rng = np.random.default_rng(11)
+        self.queries = self.exact.matrix[rng.choice(len(self.exact), 50, replace=False)] + rng.normal(0, 0.05, (50, 32))
+
+    def tearDown(self):
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+        super().tearDown()
+
+    def test_ivf_recall(self):
+        """More probed lists raise recall; probing every list is exact"""
+        index = build_vector_index(self.chunks, kind="ivf", n_lists=40, n_probe=4)
+        self.assertIsInstance(index, IVFVectorIndex)
+        self.assertEqual(index.n_lists, 40)
+        self.assertEqual(int(index.offsets[-1]), len(self.chunks))
+
+        low = recall(index, self.exact, self.queries, n_probe=1)
+        high = recall(index, self.exact, self.queries, n_probe=8)
+        self.log_info(f"IVF recall@10: n_probe=1 {low:.3f}, n_probe=8 {high:.3f}")
+        self.assertGreaterEqual(high, low)
+        self.assertGreaterEqual(high, 0.9)
+        self.assertEqual(recall(index, self.exact, self.queries, n_probe=40), 1.0)
+        self.assertEqual(index.search(self.queries[0], 10, n_probe=0), [])
+
+        # Scores are exact cosine similarities of the returned chunks
+        position, score = index.search(self.queries[0], 1)[0]
+        expected = dict(self.exact.search(self.queries[0], len(self.chunks)))[position]
+        self.assertAlmostEqual(score, expected, places=5)
+
+    def test_save_and_load(self):
+        """Saved indexes load with identical results and metadata"""
+        for kind, params in (("exact", {}), ("ivf", {"n_lists": 20})):
+            index = build_vector_index(self.chunks, kind=kind, **params)
+            index.meta["corpus_chunks"] = len(self.chunks)
+            path = self.work_dir / f"{kind}.npz"
+            index.save(str(path))
+
+            loaded = load_vector_index(str(path))
+            self.assertIs(type(loaded), type(index))
+            self.assertEqual(loaded.meta, {"corpus_chunks": len(self.chunks)})
+            self.assertEqual(loaded.stats(), index.stats())
+            for query in self.queries[:5]:
+                self.assertEqual(loaded.search(query, 10), index.search(query, 10))
+
+    def test_search_batch(self):
+        """Batched search returns the per-query results for every index type"""
+        indexes = [
+            self.exact,
+            build_vector_index(self.chunks, kind="ivf", n_lists=20, n_probe=4),
+            build_vector_index(self.chunks, kind="ivf", n_lists=20, n_probe=20),
+        ]
+        if hnswlib is not None:
+            indexes.append(build_vector_index(self.chunks, kind="hnsw"))
+        queries = self.queries[:8]
+        for index in indexes:
+            batched = index.search_batch(queries, 10)
+            self.assertEqual(len(batched), len(queries))
+            for query, hits in zip(queries, batched):
+                expected = index.search(query, 10)
+                self.assertEqual([i for i, _ in hits], [i for i, _ in expected])
+                np.testing.assert_allclose([score for _, score in hits], [score for _, score in expected], atol=1e-5)
+
+        self.assertEqual(self.exact.search_batch(queries, 0), [[]] * len(queries))
+        with self.assertRaises(ValueError):
+            self.exact.search_batch(queries[0], 10)
+
+    def test_auto_selection(self):
+        """Small corpora use exact search; large ones an approximate index"""
+        self.assertIsInstance(build_vector_index(self.chunks), ExactVectorIndex)
+        self.assertNotIsInstance(build_vector_index(self.chunks), IVFVectorIndex)
+        large = build_vector_index(self.chunks, exact_threshold=1000)
+        self.assertIsInstance(large, HNSWVectorIndex if hnswlib is not None else IVFVectorIndex)
+        with self.assertRaises(ValueError):
+            build_vector_index(self.chunks, kind="lsh")
+
+    def test_hnsw(self):
+        """HNSW reaches high recall and round-trips through save/load"""
+        self.ensure_dependency("hnswlib")
+        import hnswlib as hnswlib_module
+
+        with mock.patch.object(vector_index, "hnswlib", hnswlib_module):
+            index = build_vector_index(self.chunks, kind="hnsw", ef_search=128)
+            self.assertGreaterEqual(recall(index, self.exact, self.queries), 0.9)
+
+            path = self.work_dir / "hnsw.npz"
+            index.save(str(path))
+            loaded = load_vector_index(str(path))
+        self.assertEqual(loaded.params(), index.params())
+        self.assertEqual([i for i, _ in loaded.search(self.queries[0], 10)],
+                         [i for i, _ in index.search(self.queries[0], 10)])
+
+    def test_hnsw_fallback(self):
+        """Without hnswlib, auto selection builds IVF and HNSW indexes fail clearly"""
+        with mock.patch.object(vector_index, "hnswlib", None):
+            large = build_vector_index(self.chunks, exact_threshold=1000)
+            self.assertIsInstance(large, IVFVectorIndex)
+            with self.assertRaises(ImportError):
+                build_vector_index(self.chunks, kind="hnsw")
+
+
+def run_vector_index_tests():
+    """Run vector index tests with framework"""
+    TestUtils.print_test_header(
+        "Vector Index Test Suite",
+        "Testing exact and approximate vector indexes"
+    )
+
+    suite = unittest.TestSuite()
+    for case in (TestExactVectorIndex, TestApproximateIndexes):
+        suite.addTests(unittest.TestLoader().loadTestsFromTestCase(case))
+    runner = unittest.TextTestRunner(verbosity=2)
+    result = runner.run(suite)
+    return result.wasSuccessful()
+
+
+if __name__ == "__main__":
+    unittest.main()